@@ -128,7 +128,8 @@ async def health_check():
         "services": {
             "analytics_collector": "operational",
             "performance_monitor": "operational" if performance_monitor._monitoring_active else "stopped"
-        }
+        },
+        "analytics_writer": analytics_collector.writer_stats()
     }
 
 @app.get("/analytics/predictions", response_model=Dict[str, Any])
@@ -13,6 +13,11 @@ Key Features:
 - User interaction analytics
 - Real-time system monitoring
 
+Writes never touch the disk on the caller's thread: records go onto a
+bounded queue and a background writer inserts them in batched transactions
+over one persistent WAL connection. When the queue is full, records are
+dropped according to ANALYTICS_DROP_POLICY and counted in writer_stats().
+
 Author: Vermont Deer Prediction System
 Version: 1.0.0
 """
@@ -20,8 +25,11 @@ Version: 1.0.0
 import sqlite3
 import json
 import logging
+import os
+import queue
 import time
 import threading
+import atexit
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional, Union
 from dataclasses import dataclass, field
@@ -38,6 +46,9 @@ from config_manager import get_config
 
 logger = logging.getLogger(__name__)
 
+# Queue marker that stops the background writer after a final flush.
+_STOP = object()
+
 @dataclass
 class PredictionRecord:
     """Record of a prediction request and its details"""
@@ -87,20 +98,110 @@ class ConfigurationChange:
     changed_by: str = "system"
     reason: str = ""
 
+_PREDICTION_INSERT = """
+    INSERT OR REPLACE INTO predictions (
+        prediction_id, timestamp, latitude, longitude, season,
+        weather_conditions, time_of_day, stand_rating, confidence_score,
+        mature_buck_score, response_time_ms, processing_time_ms,
+        config_version, config_environment, actual_success,
+        user_feedback_score, notes
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Metric ids are millisecond timestamps, so a clash only drops the repeat
+# instead of failing the whole batch.
+_METRIC_INSERT = """
+    INSERT OR IGNORE INTO performance_metrics (
+        metric_id, timestamp, metric_type, value, details
+    ) VALUES (?, ?, ?, ?, ?)
+"""
+
+DROP_NEWEST = "drop_newest"
+DROP_OLDEST = "drop_oldest"
+
+
+def _parse_positive_int(name: str, default: int) -> int:
+    raw = os.getenv(name, str(default))
+    try:
+        return max(1, int(raw))
+    except ValueError:
+        logger.warning("Invalid %s=%r — defaulting to %d", name, raw, default)
+        return default
+
+
+def _parse_flush_interval_seconds() -> float:
+    raw = os.getenv("ANALYTICS_FLUSH_INTERVAL_SECONDS", "1")
+    try:
+        return max(0.01, float(raw))
+    except ValueError:
+        logger.warning("Invalid ANALYTICS_FLUSH_INTERVAL_SECONDS=%r — defaulting to 1 second", raw)
+        return 1.0
+
+
+def _parse_drop_policy() -> str:
+    raw = os.getenv("ANALYTICS_DROP_POLICY", DROP_NEWEST).strip().lower()
+    if raw not in (DROP_NEWEST, DROP_OLDEST):
+        logger.warning("Invalid ANALYTICS_DROP_POLICY=%r — defaulting to %s", raw, DROP_NEWEST)
+        return DROP_NEWEST
+    return raw
+
+
+def _db_timestamp(value: datetime) -> str:
+    # Same text the sqlite3 default datetime adapter stored.
+    return value.isoformat(" ")
+
+
 class AnalyticsCollector:
     """
     Centralized analytics data collection system
     """
     
-    def __init__(self, db_path: str = None):
-        """Initialize analytics collector with database"""
+    def __init__(self,
+                 db_path: str = None,
+                 *,
+                 queue_size: Optional[int] = None,
+                 batch_size: Optional[int] = None,
+                 flush_interval_s: Optional[float] = None,
+                 drop_policy: Optional[str] = None):
+        """Initialize analytics collector with database and background writer"""
         self.db_path = db_path or self._get_default_db_path()
         self.config = get_config()
         self._lock = threading.RLock()
         
+        self.queue_size = queue_size or _parse_positive_int("ANALYTICS_QUEUE_SIZE", 10000)
+        self.batch_size = batch_size or _parse_positive_int("ANALYTICS_BATCH_SIZE", 500)
+        self.flush_interval_s = flush_interval_s or _parse_flush_interval_seconds()
+        self.drop_policy = drop_policy or _parse_drop_policy()
+        if self.drop_policy not in (DROP_NEWEST, DROP_OLDEST):
+            raise ValueError(f"Unknown analytics drop policy: {self.drop_policy}")
+        
+        # One connection for the collector's lifetime; WAL lets dashboard
+        # reads proceed while the writer commits.
+        self._conn = sqlite3.connect(self.db_path, timeout=30.0, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        
         # Initialize database
         self._init_database()
         
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=self.queue_size)
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            "enqueued": 0,
+            "written": 0,
+            "dropped": 0,
+            "batches": 0,
+            "write_errors": 0,
+            "max_queue_depth": 0,
+            "last_batch_size": 0,
+            "last_flush_ms": 0.0,
+        }
+        self._closed = False
+        self._writer = threading.Thread(target=self._writer_loop, name="analytics-writer", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+        
         logger.info(f"📊 Analytics Collector initialized with database: {self.db_path}")
     
     def _get_default_db_path(self) -> str:
@@ -113,8 +214,8 @@ class AnalyticsCollector:
     def _init_database(self):
         """Initialize analytics database with required tables"""
         with self._get_db_connection() as conn:
-            # Predictions table
-            conn.execute("""
+            conn.executescript("""
+                -- Predictions table
                 CREATE TABLE IF NOT EXISTS predictions (
                     prediction_id TEXT PRIMARY KEY,
                     timestamp DATETIME,
@@ -134,11 +235,9 @@ class AnalyticsCollector:
                     user_feedback_score INTEGER,
                     notes TEXT,
                     created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            
-            # Performance metrics table
-            conn.execute("""
+                );
+                
+                -- Performance metrics table
                 CREATE TABLE IF NOT EXISTS performance_metrics (
                     metric_id TEXT PRIMARY KEY,
                     timestamp DATETIME,
@@ -146,11 +245,9 @@ class AnalyticsCollector:
                     value REAL,
                     details TEXT,
                     created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            
-            # Configuration changes table
-            conn.execute("""
+                );
+                
+                -- Configuration changes table
                 CREATE TABLE IF NOT EXISTS configuration_changes (
                     change_id TEXT PRIMARY KEY,
                     timestamp DATETIME,
@@ -160,11 +257,9 @@ class AnalyticsCollector:
                     changed_by TEXT,
                     reason TEXT,
                     created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            
-            # Analytics summary table for quick access
-            conn.execute("""
+                );
+                
+                -- Analytics summary table for quick access
                 CREATE TABLE IF NOT EXISTS analytics_summary (
                     summary_date DATE PRIMARY KEY,
                     total_predictions INTEGER,
@@ -174,90 +269,185 @@ class AnalyticsCollector:
                     unique_users INTEGER,
                     config_changes INTEGER,
                     created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-                )
+                );
             """)
-            
-            conn.commit()
             logger.info("✅ Analytics database initialized successfully")
     
+    @contextmanager
     def _get_db_connection(self):
-        """Get database connection with proper error handling"""
-        conn = None
-        try:
-            conn = sqlite3.connect(self.db_path, timeout=30.0)
-            yield conn
-        except Exception as e:
-            if conn:
-                conn.rollback()
-            logger.error(f"Database error: {e}")
-            raise
-        finally:
-            if conn:
-                conn.close()
-    
-    def record_prediction(self, prediction_record: PredictionRecord):
-        """Record a prediction request and its results"""
+        """Shared database connection, held under the collector lock"""
         with self._lock:
             try:
-                with self._get_db_connection() as conn:
-                    conn.execute("""
-                        INSERT OR REPLACE INTO predictions (
-                            prediction_id, timestamp, latitude, longitude, season,
-                            weather_conditions, time_of_day, stand_rating, confidence_score,
-                            mature_buck_score, response_time_ms, processing_time_ms,
-                            config_version, config_environment, actual_success,
-                            user_feedback_score, notes
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        prediction_record.prediction_id,
-                        prediction_record.timestamp,
-                        prediction_record.latitude,
-                        prediction_record.longitude,
-                        prediction_record.season,
-                        json.dumps(prediction_record.weather_conditions),
-                        prediction_record.time_of_day,
-                        prediction_record.stand_rating,
-                        prediction_record.confidence_score,
-                        prediction_record.mature_buck_score,
-                        prediction_record.response_time_ms,
-                        prediction_record.processing_time_ms,
-                        prediction_record.config_version,
-                        prediction_record.config_environment,
-                        prediction_record.actual_success,
-                        prediction_record.user_feedback_score,
-                        prediction_record.notes
-                    ))
-                    conn.commit()
-                    
-                logger.debug(f"📊 Recorded prediction: {prediction_record.prediction_id}")
-                
+                yield self._conn
             except Exception as e:
-                logger.error(f"Failed to record prediction: {e}")
+                if self._conn.in_transaction:
+                    self._conn.rollback()
+                logger.error(f"Database error: {e}")
+                raise
     
-    def record_performance_metric(self, metric: PerformanceMetric):
-        """Record a system performance metric"""
-        with self._lock:
+    # ------------------------------------------------------------------
+    # Queued writes
+    # ------------------------------------------------------------------
+    def _enqueue(self, statement: str, params: tuple) -> bool:
+        """Queue one row for the writer without blocking; False if dropped"""
+        if self._closed:
+            self._count("dropped")
+            return False
+        try:
+            self._queue.put_nowait((statement, params))
+        except queue.Full:
+            if self.drop_policy == DROP_NEWEST:
+                self._count("dropped")
+                return False
+            # Make room by discarding the oldest queued row.
             try:
-                with self._get_db_connection() as conn:
-                    conn.execute("""
-                        INSERT INTO performance_metrics (
-                            metric_id, timestamp, metric_type, value, details
-                        ) VALUES (?, ?, ?, ?, ?)
-                    """, (
-                        metric.metric_id,
-                        metric.timestamp,
-                        metric.metric_type,
-                        metric.value,
-                        json.dumps(metric.details)
-                    ))
-                    conn.commit()
-                    
-                logger.debug(f"📈 Recorded performance metric: {metric.metric_type} = {metric.value}")
-                
-            except Exception as e:
-                logger.error(f"Failed to record performance metric: {e}")
+                old = self._queue.get_nowait()
+                if isinstance(old, tuple):
+                    self._count("dropped")
+                else:
+                    # A flush/stop marker must not be lost; put it back and
+                    # drop the new row instead.
+                    self._queue.put_nowait(old)
+                    self._count("dropped")
+                    return False
+                self._queue.put_nowait((statement, params))
+            except (queue.Empty, queue.Full):
+                self._count("dropped")
+                return False
+        depth = self._queue.qsize()
+        with self._stats_lock:
+            self._stats["enqueued"] += 1
+            if depth > self._stats["max_queue_depth"]:
+                self._stats["max_queue_depth"] = depth
+        return True
     
-
+    def _count(self, key: str, amount: int = 1) -> None:
+        with self._stats_lock:
+            self._stats[key] += amount
+    
+    def _writer_loop(self) -> None:
+        """Drain the queue, committing on batch size or flush interval"""
+        batch: List[tuple] = []
+        deadline = time.monotonic() + self.flush_interval_s
+        while True:
+            timeout = max(0.0, deadline - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+            if isinstance(item, tuple):
+                batch.append(item)
+                if len(batch) < self.batch_size:
+                    continue
+            # Size reached, interval elapsed, or a flush/stop marker.
+            if batch:
+                self._write_batch(batch)
+                batch = []
+            deadline = time.monotonic() + self.flush_interval_s
+            if isinstance(item, threading.Event):
+                item.set()
+            elif item is _STOP:
+                return
+    
+    def _write_batch(self, batch: List[tuple]) -> None:
+        started = time.perf_counter()
+        grouped: Dict[str, List[tuple]] = {}
+        for statement, params in batch:
+            grouped.setdefault(statement, []).append(params)
+        try:
+            with self._get_db_connection() as conn:
+                conn.execute("BEGIN IMMEDIATE")
+                for statement, rows in grouped.items():
+                    conn.executemany(statement, rows)
+                conn.execute("COMMIT")
+        except Exception as e:
+            logger.error(f"Failed to write {len(batch)} analytics rows: {e}")
+            self._count("write_errors")
+            self._count("dropped", len(batch))
+            return
+        with self._stats_lock:
+            self._stats["written"] += len(batch)
+            self._stats["batches"] += 1
+            self._stats["last_batch_size"] = len(batch)
+            self._stats["last_flush_ms"] = (time.perf_counter() - started) * 1000.0
+    
+    def flush(self, timeout: float = 10.0) -> bool:
+        """Wait until everything queued so far is committed"""
+        if self._closed or not self._writer.is_alive():
+            return False
+        done = threading.Event()
+        try:
+            self._queue.put(done, timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(timeout)
+    
+    def close(self, timeout: float = 10.0) -> None:
+        """Flush queued rows, stop the writer and close the database"""
+        if self._closed:
+            return
+        self._closed = True
+        if self._writer.is_alive():
+            try:
+                self._queue.put(_STOP, timeout=timeout)
+            except queue.Full:
+                logger.warning("Analytics queue still full at shutdown; stopping writer without final flush")
+            self._writer.join(timeout)
+        with self._lock:
+            self._conn.close()
+        stats = self.writer_stats()
+        if stats["dropped"]:
+            logger.warning(f"📊 Analytics writer dropped {stats['dropped']} rows")
+    
+    def writer_stats(self) -> Dict[str, Any]:
+        """Backpressure counters for the background writer"""
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats.update(
+            queue_depth=self._queue.qsize(),
+            queue_capacity=self.queue_size,
+            batch_size=self.batch_size,
+            flush_interval_s=self.flush_interval_s,
+            drop_policy=self.drop_policy,
+            writer_alive=self._writer.is_alive(),
+        )
+        return stats
+    
+    def record_prediction(self, prediction_record: PredictionRecord):
+        """Queue a prediction request and its results for recording"""
+        queued = self._enqueue(_PREDICTION_INSERT, (
+            prediction_record.prediction_id,
+            _db_timestamp(prediction_record.timestamp),
+            prediction_record.latitude,
+            prediction_record.longitude,
+            prediction_record.season,
+            json.dumps(prediction_record.weather_conditions),
+            prediction_record.time_of_day,
+            prediction_record.stand_rating,
+            prediction_record.confidence_score,
+            prediction_record.mature_buck_score,
+            prediction_record.response_time_ms,
+            prediction_record.processing_time_ms,
+            prediction_record.config_version,
+            prediction_record.config_environment,
+            prediction_record.actual_success,
+            prediction_record.user_feedback_score,
+            prediction_record.notes
+        ))
+        if queued:
+            logger.debug(f"📊 Queued prediction: {prediction_record.prediction_id}")
+    
+    def record_performance_metric(self, metric: PerformanceMetric):
+        """Queue a system performance metric for recording"""
+        queued = self._enqueue(_METRIC_INSERT, (
+            metric.metric_id,
+            _db_timestamp(metric.timestamp),
+            metric.metric_type,
+            metric.value,
+            json.dumps(metric.details)
+        ))
+        if queued:
+            logger.debug(f"📈 Queued performance metric: {metric.metric_type} = {metric.value}")
     
     def get_prediction_analytics(self, 
                                 days: int = 7, 
@@ -432,8 +622,6 @@ class AnalyticsCollector:
                         summary[4],  # unique_predictions (as proxy for users)
                         config_changes
                     ))
-                    
-                    conn.commit()
                     logger.info(f"📊 Updated daily summary for {date_str}")
                 
         except Exception as e:
@@ -23,7 +23,7 @@ from __future__ import annotations
 import logging
 import math
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import numpy as np
 
@@ -154,6 +154,7 @@ class CorridorEngine:
         canopy_pct: Optional[np.ndarray] = None,
         m_per_deg_lat: float = _M_PER_DEG_LAT,
         m_per_deg_lon: float = _M_PER_DEG_LON_44N,
+        cancel_check: Optional[Callable[[], None]] = None,
     ) -> CorridorResult:
         """Run corridor analysis on pre-computed metric grids.
 
@@ -171,6 +172,9 @@ class CorridorEngine:
             Season key for cost profile selection.
         canopy_pct :
             Optional canopy cover grid 0-100 from GEE.
+        cancel_check :
+            Optional callable invoked periodically while routing; it should
+            raise to abort the run (e.g. on user cancellation).
         """
         cell_m = self.config.cell_m
         rows, cols = slope_deg.shape
@@ -219,6 +223,7 @@ class CorridorEngine:
             cell_m=cell_m,
             max_pairs=self.config.max_node_pairs,
             weights=node_weights,
+            cancel_check=cancel_check,
         )
         logger.info(
             "CorridorEngine: %d paths found, corridor_coverage=%.1f%%",
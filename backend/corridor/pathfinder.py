@@ -7,7 +7,7 @@ Works on 2-D cost grids produced by :func:`cost_surface.compute_movement_cost`.
 from __future__ import annotations
 
 import heapq
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
 import numpy as np
 
@@ -25,17 +25,23 @@ _NEIGHBOURS = [
     (1, 1, _SQRT2),
 ]
 
+# Heap pops between cancel_check calls inside a single route.
+_CANCEL_CHECK_EVERY = 4096
+
 
 def dijkstra_path(
     cost: np.ndarray,
     start_rc: Tuple[int, int],
     end_rc: Tuple[int, int],
     cell_m: float = 10.0,
+    cancel_check: Optional[Callable[[], None]] = None,
 ) -> Tuple[float, List[Tuple[int, int]]]:
     """Find the least-cost path on *cost* from *start_rc* to *end_rc*.
 
     Uses Dijkstra with 8-connected neighbours.  Edge cost is the average
     of the two adjacent cells multiplied by real-world distance.
+    *cancel_check*, when given, is called every few thousand expansions
+    and may raise to abort the search.
 
     Returns ``(total_cost, path)`` where *path* is a list of ``(row, col)``
     indices.  Returns ``(inf, [])`` if no path exists.
@@ -56,9 +62,14 @@ def dijkstra_path(
     visited = np.zeros((rows, cols), dtype=bool)
 
     pq: list = [(0.0, sr, sc)]
+    pops = 0
 
     while pq:
         d, r, c = heapq.heappop(pq)
+        if cancel_check is not None:
+            pops += 1
+            if pops % _CANCEL_CHECK_EVERY == 0:
+                cancel_check()
         if visited[r, c]:
             continue
         visited[r, c] = True
@@ -132,6 +143,7 @@ def accumulate_corridors(
     cell_m: float = 10.0,
     max_pairs: int = 50,
     weights: Optional[List[float]] = None,
+    cancel_check: Optional[Callable[[], None]] = None,
 ) -> Tuple[np.ndarray, List[Dict]]:
     """Build a corridor probability raster by routing between node pairs.
 
@@ -148,6 +160,8 @@ def accumulate_corridors(
     max_pairs : cap on number of pairs to route (closest first).
     weights : optional per-node importance weight.  When two nodes are
         connected, the path gets ``min(w_i, w_j)`` weight.
+    cancel_check : optional callable run between routes (and periodically
+        inside each route); it may raise to abort the accumulation.
 
     Returns
     -------
@@ -176,7 +190,9 @@ def accumulate_corridors(
     pairs = pairs[:max_pairs]
 
     for _, i, j in pairs:
-        total_cost, path = dijkstra_path(cost, nodes[i], nodes[j], cell_m)
+        if cancel_check is not None:
+            cancel_check()
+        total_cost, path = dijkstra_path(cost, nodes[i], nodes[j], cell_m, cancel_check=cancel_check)
         if not path:
             continue
         path_weight = min(weights[i], weights[j])
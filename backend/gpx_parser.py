@@ -3,15 +3,19 @@
 GPX Parser for Deer Prediction App
 
 Safely parses GPX files and converts waypoints to scouting observations.
-Handles various GPX formats from hunting GPS devices and apps.
+Handles various GPX formats from hunting GPS devices and apps. Files are
+streamed with iterparse and each element is dropped once read, so large
+track archives do not have to fit in memory as a tree.
 
 Author: Vermont Deer Prediction System
 Version: 1.0.0
 """
 
+import io
 import xml.etree.ElementTree as ET
 from datetime import datetime, timezone
-from typing import List, Dict, Optional, Any
+from pathlib import Path
+from typing import BinaryIO, List, Dict, Optional, Any, Union
 import logging
 
 try:
@@ -168,18 +172,62 @@ class GPXParser:
         Returns:
             Dict with parsed waypoints and metadata
         """
-        try:
-            # Parse XML safely
-            root = ET.fromstring(file_content)
+        return self.parse_gpx_stream(io.StringIO(file_content))
+    
+    def parse_gpx_stream(self, source: Union[str, Path, BinaryIO, io.StringIO]) -> Dict[str, Any]:
+        """
+        Parse GPX from a file path or file object without building the full tree
+        
+        Args:
+            source: Path to a GPX file, or a file object positioned at its start
             
-            # Handle different GPX namespaces
-            namespace = self._detect_namespace(root)
+        Returns:
+            Dict with parsed waypoints and metadata (same shape as parse_gpx_file)
+        """
+        try:
+            if isinstance(source, Path):
+                source = str(source)
+            root: Optional[ET.Element] = None
+            namespace = ''
+            parents: List[ET.Element] = []
+            open_kept = 0  # open <wpt>/<metadata> elements whose children are still needed
+            waypoints: List[Dict] = []
+            metadata: Dict[str, Any] = {}
+            metadata_seen = False
             
-            # Extract waypoints
-            waypoints = self._extract_waypoints(root, namespace)
+            for event, elem in ET.iterparse(source, events=('start', 'end')):
+                if event == 'start':
+                    if root is None:
+                        root = elem
+                        # Handle different GPX namespaces
+                        namespace = self._detect_namespace(root)
+                    elif elem.tag == f'{namespace}wpt' or (len(parents) == 1 and elem.tag == f'{namespace}metadata'):
+                        open_kept += 1
+                    parents.append(elem)
+                    continue
+                
+                parents.pop()
+                if not parents:
+                    continue
+                if elem.tag == f'{namespace}wpt':
+                    open_kept -= 1
+                    try:
+                        waypoint = self._parse_waypoint(elem, namespace)
+                        if waypoint:
+                            waypoints.append(waypoint)
+                    except Exception as e:
+                        logger.warning(f"Failed to parse waypoint: {e}")
+                elif len(parents) == 1 and elem.tag == f'{namespace}metadata':
+                    open_kept -= 1
+                    if not metadata_seen:
+                        metadata.update(self._metadata_fields(elem, namespace))
+                        metadata_seen = True
+                if open_kept == 0:
+                    parents[-1].remove(elem)
             
-            # Extract metadata
-            metadata = self._extract_metadata(root, namespace)
+            # Creator info from root
+            metadata['creator'] = root.get('creator', 'Unknown')
+            metadata['version'] = root.get('version', '1.1')
             
             return {
                 'success': True,
@@ -237,21 +285,6 @@ class GPXParser:
             return tag.split('}')[0] + '}'
         return ''
     
-    def _extract_waypoints(self, root: ET.Element, namespace: str) -> List[Dict]:
-        """Extract waypoints from GPX"""
-        waypoints = []
-        
-        for wpt in root.findall(f'.//{namespace}wpt'):
-            try:
-                waypoint = self._parse_waypoint(wpt, namespace)
-                if waypoint:
-                    waypoints.append(waypoint)
-            except Exception as e:
-                logger.warning(f"Failed to parse waypoint: {e}")
-                continue
-        
-        return waypoints
-    
     def _parse_waypoint(self, wpt: ET.Element, namespace: str) -> Optional[Dict]:
         """Parse individual waypoint element"""
         try:
@@ -302,23 +335,14 @@ class GPXParser:
                 ext_data[tag] = child.text.strip()
         return ext_data
     
-    def _extract_metadata(self, root: ET.Element, namespace: str) -> Dict[str, Any]:
-        """Extract GPX file metadata"""
-        metadata = {}
-        
-        # Look for metadata element
-        meta = root.find(f'{namespace}metadata')
-        if meta is not None:
-            metadata['name'] = self._get_element_text(meta, f'{namespace}name')
-            metadata['description'] = self._get_element_text(meta, f'{namespace}desc')
-            metadata['author'] = self._get_element_text(meta, f'{namespace}author')
-            metadata['time'] = self._get_element_text(meta, f'{namespace}time')
-        
-        # Creator info from root
-        metadata['creator'] = root.get('creator', 'Unknown')
-        metadata['version'] = root.get('version', '1.1')
-        
-        return metadata
+    def _metadata_fields(self, meta: ET.Element, namespace: str) -> Dict[str, Any]:
+        """Extract GPX file metadata from the <metadata> element"""
+        return {
+            'name': self._get_element_text(meta, f'{namespace}name'),
+            'description': self._get_element_text(meta, f'{namespace}desc'),
+            'author': self._get_element_text(meta, f'{namespace}author'),
+            'time': self._get_element_text(meta, f'{namespace}time'),
+        }
     
     def _convert_waypoint_to_observation(self, waypoint: Dict) -> Optional[ScoutingObservation]:
         """Convert a waypoint dictionary to ScoutingObservation"""
@@ -52,7 +52,12 @@ logging.getLogger("uvicorn.access").addFilter(HealthCheckFilter())
 from backend.routers.config_router import config_router
 from backend.routers.camera_router import camera_router
 from backend.routers.scouting_router import scouting_router
-from backend.routers.max_accuracy_router import max_accuracy_router, run_startup_cleanup_jobs
+from backend.routers.max_accuracy_router import (
+    max_accuracy_router,
+    run_startup_cleanup_jobs,
+    shutdown_workers,
+)
+from backend.routers.jobs_router import jobs_router
 from backend.middleware.error_handling import ErrorHandlingMiddleware
 
 
@@ -88,6 +93,7 @@ else:
 async def app_lifespan(_: FastAPI):
     run_startup_cleanup_jobs()
     yield
+    shutdown_workers()
 
 
 app = FastAPI(
@@ -114,6 +120,7 @@ app.include_router(config_router)
 app.include_router(camera_router)
 app.include_router(scouting_router)
 app.include_router(max_accuracy_router)
+app.include_router(jobs_router)
 
 # Enhanced prediction system inclusion (preserving existing logic)
 if ENHANCED_PREDICTIONS_AVAILABLE:
@@ -0,0 +1,74 @@
+"""Cooperative cancellation for max-accuracy runs.
+
+The pipeline runs on a worker thread that cannot be interrupted from the
+outside, so it polls a ``CancellationToken`` at natural checkpoints (grid
+rows, terrain tiles, GEE futures, corridor routing) and unwinds with
+``RunCancelled`` once the token is cancelled or its deadline passes.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Optional
+
+DEADLINE_EXCEEDED = "deadline_exceeded"
+
+
+class RunCancelled(Exception):
+    """Raised at a pipeline checkpoint when the run's token is cancelled."""
+
+    def __init__(self, reason: str) -> None:
+        super().__init__(reason)
+        self.reason = reason
+
+
+class CancellationToken:
+    def __init__(self, deadline_s: Optional[float] = None, event: Any = None) -> None:
+        """
+        Args:
+            deadline_s: Seconds from now after which the token cancels
+                itself with reason ``"deadline_exceeded"``. None or <= 0
+                means no deadline.
+            event: Optional Event-like object (``set``/``is_set``) backing
+                the token — e.g. a multiprocessing manager Event, so a
+                token in a worker process sees cancellation from the API
+                process. Defaults to a private ``threading.Event``.
+        """
+        self._event = event if event is not None else threading.Event()
+        self._lock = threading.Lock()
+        self._reason: Optional[str] = None
+        self._deadline = time.monotonic() + deadline_s if deadline_s and deadline_s > 0 else None
+
+    def cancel(self, reason: str = "cancelled") -> None:
+        with self._lock:
+            if self._reason is None:
+                self._reason = reason
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        if self._event.is_set():
+            return True
+        if self._deadline is not None and time.monotonic() >= self._deadline:
+            self.cancel(DEADLINE_EXCEEDED)
+            return True
+        return False
+
+    @property
+    def reason(self) -> Optional[str]:
+        return self._reason
+
+    @property
+    def event(self) -> Any:
+        return self._event
+
+    def remaining_s(self) -> Optional[float]:
+        """Seconds until the deadline (None when there is none)."""
+        if self._deadline is None:
+            return None
+        return max(0.0, self._deadline - time.monotonic())
+
+    def raise_if_cancelled(self) -> None:
+        if self.cancelled:
+            raise RunCancelled(self._reason or "cancelled")
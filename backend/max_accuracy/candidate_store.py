@@ -0,0 +1,171 @@
+"""Columnar on-disk storage for max-accuracy terrain candidates.
+
+A report can carry tens of thousands of terrain candidates. Instead of
+embedding them in the report JSON, each scalar field is written as its own
+``.npy`` column under ``terrain_candidates/`` next to the report manifest.
+Readers memory-map only the columns they touch: a filter on bbox/score
+reads three columns, and a page of results reads ``limit`` rows of each.
+
+Nested fields (wind options, bedding criteria, narratives) only matter for
+the selected stands and bedding zones, which the manifest already carries
+in full, so they are not stored here.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+import shutil
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+CANDIDATES_DIRNAME = "terrain_candidates"
+SCHEMA_NAME = "schema.json"
+
+
+def _column_kind(values: Sequence[Any]) -> Optional[str]:
+    """Return 'bool', 'int', 'float' or 'str' for a storable column, else None."""
+    kind: Optional[str] = None
+    for value in values:
+        if value is None:
+            continue
+        if isinstance(value, (bool, np.bool_)):
+            current = "bool"
+        elif isinstance(value, (int, np.integer)):
+            current = "int"
+        elif isinstance(value, (float, np.floating)):
+            current = "float"
+        elif isinstance(value, str):
+            current = "str"
+        else:
+            return None
+        if kind is None or kind == current:
+            kind = current
+        elif {kind, current} <= {"bool", "int", "float"}:
+            kind = "float" if "float" in (kind, current) else "int"
+        else:
+            return None
+    return kind
+
+
+def write_candidates(directory: Path, candidates: List[Dict[str, Any]]) -> int:
+    """Write *candidates* as per-field ``.npy`` columns; return the row count.
+
+    The directory is built under a temporary name and renamed into place, so
+    readers never observe a half-written set of columns.
+    """
+    directory = Path(directory)
+    tmp_dir = directory.with_name(directory.name + ".tmp")
+    if tmp_dir.exists():
+        shutil.rmtree(tmp_dir)
+    tmp_dir.mkdir(parents=True)
+
+    keys: List[str] = []
+    seen = set()
+    for candidate in candidates:
+        for key in candidate:
+            if key not in seen:
+                seen.add(key)
+                keys.append(key)
+
+    schema: Dict[str, str] = {}
+    for key in keys:
+        if not key.isidentifier():
+            continue
+        values = [c.get(key) for c in candidates]
+        kind = _column_kind(values)
+        if kind in ("int", "bool") and any(v is None for v in values):
+            # Missing ints/booleans widen to float so None survives as NaN.
+            kind = "float"
+        if kind == "float":
+            column = np.array([np.nan if v is None else float(v) for v in values], dtype=np.float64)
+        elif kind == "int":
+            # No None left here: missing ints were widened to float above.
+            column = np.array([int(v) for v in values if v is not None], dtype=np.int64)
+        elif kind == "bool":
+            column = np.array(values, dtype=bool)
+        elif kind == "str":
+            column = np.array(["" if v is None else v for v in values], dtype=str)
+        else:
+            continue
+        np.save(tmp_dir / f"{key}.npy", column, allow_pickle=False)
+        schema[key] = kind
+
+    (tmp_dir / SCHEMA_NAME).write_text(
+        json.dumps({"rows": len(candidates), "columns": schema}, indent=2), encoding="utf-8"
+    )
+    if directory.exists():
+        shutil.rmtree(directory)
+    os.replace(tmp_dir, directory)
+    return len(candidates)
+
+
+def load_schema(directory: Path) -> Dict[str, Any]:
+    return json.loads((Path(directory) / SCHEMA_NAME).read_text(encoding="utf-8"))
+
+
+def _open_column(directory: Path, key: str) -> np.ndarray:
+    return np.load(Path(directory) / f"{key}.npy", mmap_mode="r", allow_pickle=False)
+
+
+def query_candidates(
+    directory: Path,
+    *,
+    offset: int = 0,
+    limit: int = 500,
+    bbox: Optional[Tuple[float, float, float, float]] = None,
+    min_score: Optional[float] = None,
+    score_field: Optional[str] = None,
+) -> Tuple[int, List[Dict[str, Any]]]:
+    """Return (matching row count, records) for one page of candidates.
+
+    Args:
+        bbox: ``(min_lat, min_lon, max_lat, max_lon)`` filter, inclusive.
+        min_score: Keep rows whose *score_field* is at least this value.
+        score_field: Column compared against *min_score*; defaults to
+            ``combined_score`` when present, else ``score``.
+
+    Rows keep their stored order (best combined score first).
+    """
+    schema = load_schema(directory)
+    columns: Dict[str, str] = schema["columns"]
+    total_rows = int(schema["rows"])
+    if total_rows == 0:
+        return 0, []
+
+    if bbox is None and min_score is None:
+        start = min(max(0, offset), total_rows)
+        rows: Any = slice(start, min(total_rows, start + max(0, limit)))
+        matching = total_rows
+    else:
+        mask = np.ones(total_rows, dtype=bool)
+        if bbox is not None:
+            min_lat, min_lon, max_lat, max_lon = bbox
+            lat = _open_column(directory, "lat")
+            lon = _open_column(directory, "lon")
+            mask &= (lat >= min_lat) & (lat <= max_lat) & (lon >= min_lon) & (lon <= max_lon)
+        if min_score is not None:
+            field = score_field or ("combined_score" if "combined_score" in columns else "score")
+            if field not in columns or columns[field] != "float":
+                raise ValueError(f"Unknown score field: {field}")
+            scores = _open_column(directory, field)
+            with np.errstate(invalid="ignore"):
+                mask &= scores >= float(min_score)
+        hits = np.flatnonzero(mask)
+        matching = int(hits.size)
+        rows = hits[max(0, offset):max(0, offset) + max(0, limit)]
+
+    data: Dict[str, List[Any]] = {}
+    for key, kind in columns.items():
+        values = np.asarray(_open_column(directory, key)[rows]).tolist()
+        if kind == "float":
+            values = [None if isinstance(v, float) and math.isnan(v) else v for v in values]
+        data[key] = values
+
+    count = len(next(iter(data.values()))) if data else 0
+    keys = list(data)
+    records = [{key: data[key][i] for key in keys} for i in range(count)]
+    return matching, records
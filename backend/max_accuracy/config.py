@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict
+from typing import Dict, Optional
 
 
 @dataclass
@@ -66,3 +66,18 @@ class MaxAccuracyConfig:
     # a 2048px quadrant covering the entire property.
     enable_tiling: bool = True
     tile_size_px: int = 512
+
+    # Streaming top-K: each tile pushes into a fixed-size heap instead of
+    # accumulating every scored point, so scoring memory depends on
+    # max_candidates and tile_size_px rather than property area. The grid
+    # points themselves are still held as numpy arrays (~40 bytes/point
+    # for coordinates, pixel indices and the tile ordering).
+    streaming_top_k: bool = True
+    # Bounded sample used for property-wide stats (elevation percentiles)
+    stats_reservoir_size: int = 4096
+
+    # Terrain source: "dem" computes metrics from the LiDAR DEM per run;
+    # "pyramid" samples the precomputed multi-resolution rasters built by
+    # tools/build_terrain_pyramid.py (falls back to "dem" when missing).
+    terrain_source: str = "dem"
+    pyramid_dir: Optional[str] = None  # default: MAX_ACCURACY_PYRAMID_DIR or data/lidar/pyramid
@@ -3,6 +3,10 @@ from __future__ import annotations
 import math
 from typing import Callable, List, Optional, Tuple
 
+import numpy as np
+
+from backend.utils.geo import points_in_polygon_mask
+
 
 def _wrap_lon(lon: float) -> float:
     if lon > 180:
@@ -12,27 +16,6 @@ def _wrap_lon(lon: float) -> float:
     return lon
 
 
-def _try_make_polygon(corners: List[Tuple[float, float]]):
-    try:
-        from shapely.geometry import Polygon  # type: ignore
-
-        ring = [(lon, lat) for lat, lon in corners]
-        return Polygon(ring)
-    except Exception:
-        return None
-
-
-def _point_in_polygon(lat: float, lon: float, polygon) -> bool:
-    if polygon is None:
-        return True
-    try:
-        from shapely.geometry import Point  # type: ignore
-
-        return bool(polygon.contains(Point(lon, lat)) or polygon.touches(Point(lon, lat)))
-    except Exception:
-        return True
-
-
 def generate_dense_grid(
     corners: List[Tuple[float, float]],
     spacing_m: int,
@@ -59,22 +42,28 @@ def generate_dense_grid(
     lat_step = spacing_m / meters_per_deg_lat
     lon_step = spacing_m / meters_per_deg_lon
 
-    polygon = _try_make_polygon(corners)
-
-    points: List[Tuple[float, float]] = []
-    total_rows = int(((max_lat - min_lat) / lat_step)) + 1 if lat_step > 0 else 0
-    row_idx = 0
+    # Row and column coordinates come from the same running sums as the
+    # original nested while-loops, then the whole lattice is masked at once.
+    lat_vals: List[float] = []
     lat = min_lat
     while lat <= max_lat:
-        lon = min_lon
-        while lon <= max_lon:
-            lon_w = _wrap_lon(lon)
-            if _point_in_polygon(lat, lon_w, polygon):
-                points.append((lat, lon_w))
-            lon += lon_step
-        row_idx += 1
-        if progress_callback and row_idx % 25 == 0:
-            progress_callback(row_idx, total_rows, len(points))
+        lat_vals.append(lat)
         lat += lat_step
+    lon_vals: List[float] = []
+    lon = min_lon
+    while lon <= max_lon:
+        lon_vals.append(_wrap_lon(lon))
+        lon += lon_step
+    if not lat_vals or not lon_vals:
+        return []
+
+    lat_grid, lon_grid = np.meshgrid(np.asarray(lat_vals), np.asarray(lon_vals), indexing="ij")
+    mask = points_in_polygon_mask(lat_grid, lon_grid, corners)
+
+    if progress_callback:
+        total_rows = int(((max_lat - min_lat) / lat_step)) + 1 if lat_step > 0 else 0
+        per_row = np.cumsum(mask.sum(axis=1))
+        for row_idx in range(25, len(lat_vals) + 1, 25):
+            progress_callback(row_idx, total_rows, int(per_row[row_idx - 1]))
 
-    return points
+    return list(zip(lat_grid[mask].tolist(), lon_grid[mask].tolist()))
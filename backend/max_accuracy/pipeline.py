@@ -26,10 +26,13 @@ from backend.utils.terrain_scoring import (
 )
 
 from .behavior import score_behavior
+from .cancellation import CancellationToken, RunCancelled
 from .config import MaxAccuracyConfig
 from .gee import get_gee_summary
 from .grid import generate_dense_grid
-from .terrain_metrics import compute_metrics
+from .pyramid import load_manifest, resolve_pyramid_dir, sample_pyramid, select_level
+from .streaming import Reservoir, TopKBuffer
+from .terrain_metrics import compute_metrics, score_terrain_arrays
 from .wind import build_wind_options, get_wind_data
 
 logger = logging.getLogger(__name__)
@@ -43,6 +46,13 @@ class MaxAccuracyPipeline:
         self.config = config or MaxAccuracyConfig()
         self._dem_manager = DEMFileManager()
         self._dem_path_cache: str | None = None
+        self._terrain_stats: Dict[str, Any] = {}
+        self._cancel_token: Optional[CancellationToken] = None
+
+    def _check_cancelled(self) -> None:
+        """Checkpoint: raise RunCancelled if this run's token was cancelled."""
+        if self._cancel_token is not None:
+            self._cancel_token.raise_if_cancelled()
 
     def _calculate_wind_rotation(
         self,
@@ -119,8 +129,16 @@ class MaxAccuracyPipeline:
         season: str,
         hunting_pressure: str,
         progress_callback: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+        cancel_token: Optional[CancellationToken] = None,
     ) -> Dict[str, Any]:
+        """Run the full pipeline and return the report dict.
+
+        *cancel_token* is polled between grid rows, terrain tiles, GEE
+        futures and corridor routes; once it is cancelled (or its deadline
+        passes) the run stops and returns ``{"error": reason, "cancelled": True}``.
+        """
         start_time = time.monotonic()
+        self._cancel_token = cancel_token
 
         # Parse date for rut phase classification and season gating
         try:
@@ -172,13 +190,17 @@ class MaxAccuracyPipeline:
                 return {"error": "rasterio_not_available"}
 
             dem_path = self._get_dem_path()
-            if not dem_path:
+            pyramid_path = (
+                self._get_pyramid_path() if self.config.terrain_source == "pyramid" else None
+            )
+            if not dem_path and not pyramid_path:
                 logger.error("MaxAccuracy: no lidar DEM files found")
                 report_progress("error", {"error": "no_lidar_files"})
                 return {"error": "no_lidar_files"}
 
             t0 = time.monotonic()
             def _grid_progress(row_idx: int, total_rows: int, points_count: int) -> None:
+                self._check_cancelled()
                 report_progress(
                     "grid_progress",
                     {
@@ -206,8 +228,16 @@ class MaxAccuracyPipeline:
                 },
             )
 
+            self._check_cancelled()
             t0 = time.monotonic()
-            terrain = self._score_terrain(points, dem_path, progress_callback=report_progress)
+            if pyramid_path:
+                terrain = self._score_terrain_from_pyramid(
+                    points, pyramid_path, progress_callback=report_progress,
+                )
+            else:
+                # Without a pyramid level a DEM path was required above.
+                assert dem_path is not None
+                terrain = self._score_terrain(points, dem_path, progress_callback=report_progress)
             logger.info(
                 "MaxAccuracy: scored %s terrain candidates in %.2fs",
                 len(terrain),
@@ -217,10 +247,12 @@ class MaxAccuracyPipeline:
                 "terrain_scored",
                 {
                     "count": len(terrain),
+                    "points_scored": self._terrain_stats.get("points_scored", len(terrain)),
                     "elapsed_s": round(time.monotonic() - t0, 2),
                 },
             )
 
+            self._check_cancelled()
             t0 = time.monotonic()
             enriched = self._enrich_with_gee(terrain)
             if self.config.enable_gee and self.config.gee_sample_k > 0:
@@ -265,9 +297,12 @@ class MaxAccuracyPipeline:
             )
 
             # ── Corridor analysis (M2) ──
+            self._check_cancelled()
             t0 = time.monotonic()
-            corridor_data = self._run_corridor_analysis(
-                dem_path, corners, bedding_zones, effective_season,
+            corridor_data = (
+                self._run_corridor_analysis(dem_path, corners, bedding_zones, effective_season)
+                if dem_path
+                else None
             )
             if corridor_data:
                 logger.info(
@@ -286,6 +321,7 @@ class MaxAccuracyPipeline:
             else:
                 logger.info("MaxAccuracy: corridor analysis skipped or failed")
 
+            self._check_cancelled()
             t0 = time.monotonic()
             stand_recommendations = self._select_stands(combined, corners, effective_season, bedding_zones)
             logger.info(
@@ -336,6 +372,7 @@ class MaxAccuracyPipeline:
                     "config": asdict(self.config),
                 },
                 "terrain_candidates": combined,
+                "terrain_stats": self._terrain_stats,
                 "bedding_zones": [
                     {
                         "lat": b["lat"],
@@ -357,6 +394,13 @@ class MaxAccuracyPipeline:
                 "stand_recommendations": stand_recommendations,
                 "corridors": corridor_data,
             }
+        except RunCancelled as exc:
+            logger.warning(
+                "MaxAccuracy: run cancelled (%s) after %.2fs",
+                exc.reason, time.monotonic() - start_time,
+            )
+            report_progress("cancelled", {"reason": exc.reason})
+            return {"error": exc.reason, "cancelled": True}
         except Exception as exc:
             logger.exception("MaxAccuracy: run failed")
             report_progress("error", {"error": str(exc)})
@@ -375,6 +419,97 @@ class MaxAccuracyPipeline:
         self._dem_path_cache = next(iter(lidar_files.values()), None) if lidar_files else None
         return self._dem_path_cache
 
+    def _get_pyramid_path(self) -> str | None:
+        """Resolve the pyramid level for this run, or None to use the DEM.
+
+        The pyramid is only usable when it was built with the same TPI
+        scales as this config; otherwise the metrics would not match.
+        """
+        pyramid_dir = resolve_pyramid_dir(self.config.pyramid_dir)
+        manifest = load_manifest(pyramid_dir)
+        if not manifest:
+            logger.warning("MaxAccuracy: terrain pyramid not found in %s — using DEM", pyramid_dir)
+            return None
+        if (
+            int(manifest.get("tpi_small_m", -1)) != int(self.config.tpi_small_m)
+            or int(manifest.get("tpi_large_m", -1)) != int(self.config.tpi_large_m)
+        ):
+            logger.warning(
+                "MaxAccuracy: terrain pyramid TPI scales (%s/%s m) differ from config (%s/%s m) — using DEM",
+                manifest.get("tpi_small_m"),
+                manifest.get("tpi_large_m"),
+                self.config.tpi_small_m,
+                self.config.tpi_large_m,
+            )
+            return None
+        levels = {int(k): v for k, v in (manifest.get("levels") or {}).items()}
+        level = select_level(sorted(levels), self.config.grid_spacing_m)
+        if level is None:
+            return None
+        path = pyramid_dir / levels[level]
+        if not path.exists():
+            logger.warning("MaxAccuracy: terrain pyramid level %s m missing at %s — using DEM", level, path)
+            return None
+        return str(path)
+
+    def _score_terrain_from_pyramid(
+        self,
+        points: List[Tuple[float, float]],
+        level_path: str,
+        progress_callback: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Score grid points by sampling precomputed pyramid rasters.
+
+        Metrics come straight from the raster; component scores are
+        recomputed here so config weights and the property-local elevation
+        range (ridge proximity) behave exactly as in the DEM path.
+        """
+        if not points:
+            return []
+
+        logger.info("MaxAccuracy: scoring terrain from pyramid %s", level_path)
+        if progress_callback:
+            progress_callback("terrain_scoring_started", {"pyramid_path": level_path})
+
+        lats, lons, bands = sample_pyramid(level_path, points)
+        valid = np.isfinite(bands["elevation_m"]) if lats.size else np.zeros(0, dtype=bool)
+        lats, lons = lats[valid], lons[valid]
+        bands = {name: arr[valid] for name, arr in bands.items()}
+
+        elevation_stats = Reservoir(self.config.stats_reservoir_size)
+        if lats.size == 0:
+            self._terrain_stats = {"points_scored": 0, "streaming": False, "source": "pyramid", "elevation_m": {}}
+            return []
+
+        e_arr = bands["elevation_m"]
+        comp = score_terrain_arrays(
+            e_arr, bands["slope_deg"], bands["aspect_deg"], bands["curvature"],
+            bands["tpi_small"], bands["tpi_large"], bands["relief_small"], bands["roughness"],
+            bands["ridgeline_score"], bands["drainage_score"],
+            elev_min=float(e_arr.min()), elev_max=float(e_arr.max()),
+            weights=self.config.weights,
+        )
+        columns = self._candidate_columns(
+            lats, lons, comp["score"],
+            e_arr, bands["slope_deg"], bands["aspect_deg"], bands["tpi_small"], bands["tpi_large"],
+            bands["relief_small"], bands["curvature"], bands["roughness"], comp,
+            bands["ridgeline_score"], bands["drainage_score"],
+        )
+        elevation_stats.add_many(e_arr)
+
+        top_k = TopKBuffer(self.config.max_candidates)
+        top_k.offer(comp["score"], lambda idx: self._candidate_records(columns, idx))
+        self._terrain_stats = {
+            "points_scored": top_k.seen,
+            "streaming": True,
+            "source": "pyramid",
+            "pyramid_path": level_path,
+            "elevation_m": elevation_stats.summary(),
+        }
+        if progress_callback:
+            progress_callback("terrain_tile", {"tile": 1, "tiles": 1, "points": top_k.seen})
+        return top_k.items()
+
     def _score_terrain(
         self,
         points: List[Tuple[float, float]],
@@ -387,10 +522,12 @@ class MaxAccuracyPipeline:
         if not points:
             return []
 
-        lats = [p[0] for p in points]
-        lons = [p[1] for p in points]
-        min_lat, max_lat = min(lats), max(lats)
-        min_lon, max_lon = min(lons), max(lons)
+        # Point coordinates are kept as float64 arrays (16 bytes/point);
+        # everything else below is per tile or bounded by max_candidates.
+        coords = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        pt_lats, pt_lons = coords[:, 0], coords[:, 1]
+        min_lat, max_lat = float(pt_lats.min()), float(pt_lats.max())
+        min_lon, max_lon = float(pt_lons.min()), float(pt_lons.max())
 
         logger.info("MaxAccuracy: scoring terrain using DEM %s", dem_path)
         if progress_callback:
@@ -428,14 +565,14 @@ class MaxAccuracyPipeline:
             large_px = max(1, int(self.config.tpi_large_m / max(1e-6, cell_m)))
             pad_px = max(small_px, large_px)
 
-            pt_lons = [p[1] for p in points]
-            pt_lats = [p[0] for p in points]
             xs_pts, ys_pts = transform("EPSG:4326", src.crs, pt_lons, pt_lats)
-            rows, cols = rasterio.transform.rowcol(
+            rows_raw, cols_raw = rasterio.transform.rowcol(
                 src.window_transform(window),
                 xs_pts,
                 ys_pts,
             )
+            rows = np.asarray(rows_raw, dtype=np.int64)
+            cols = np.asarray(cols_raw, dtype=np.int64)
 
             tile_size = self.config.tile_size_px
             if not self.config.enable_tiling:
@@ -446,17 +583,30 @@ class MaxAccuracyPipeline:
                 tile_size,
                 pad_px,
             )
-            tile_map: Dict[tuple[int, int], List[tuple[float, float, int, int]]] = {}
-            for (lat, lon), row, col in zip(points, rows, cols):
-                if row < 0 or col < 0 or row >= height or col >= width:
-                    continue
-                tr = int(row) // tile_size
-                tc = int(col) // tile_size
-                tile_map.setdefault((tr, tc), []).append((float(lat), float(lon), int(row), int(col)))
-
+            # Bucket points by tile with a stable argsort on a flat tile id:
+            # each tile is a contiguous slice of ``point_order`` (in input
+            # order), and tiles are visited in order of their first point.
+            inside = np.flatnonzero((rows >= 0) & (cols >= 0) & (rows < height) & (cols < width))
+            n_tile_cols = -(-width // tile_size)
+            tile_ids = (rows[inside] // tile_size) * n_tile_cols + cols[inside] // tile_size
+            by_tile = np.argsort(tile_ids, kind="stable")
+            point_order = inside[by_tile]
+            tile_ids_sorted, tile_starts = np.unique(tile_ids[by_tile], return_index=True)
+            tile_stops = np.append(tile_starts[1:], point_order.size)
+            tile_sequence = np.argsort(by_tile[tile_starts], kind="stable")
+
+            # Streaming mode keeps a fixed-size top-K heap instead of every
+            # scored point, so memory is bounded by max_candidates and tile
+            # size plus the compact per-point coordinate arrays above.
             scored: List[Dict[str, Any]] = []
-            total_tiles = len(tile_map)
-            for tile_idx, ((tr, tc), tile_points) in enumerate(tile_map.items(), start=1):
+            top_k = TopKBuffer(self.config.max_candidates) if self.config.streaming_top_k else None
+            elevation_stats = Reservoir(self.config.stats_reservoir_size)
+            points_scored = 0
+            total_tiles = int(tile_ids_sorted.size)
+            for tile_idx, tile_pos in enumerate(tile_sequence.tolist(), start=1):
+                tr, tc = divmod(int(tile_ids_sorted[tile_pos]), n_tile_cols)
+                tile_sel = point_order[tile_starts[tile_pos]:tile_stops[tile_pos]]
+                self._check_cancelled()
                 row0 = tr * tile_size
                 col0 = tc * tile_size
                 row1 = min(row0 + tile_size, height)
@@ -514,11 +664,10 @@ class MaxAccuracyPipeline:
                 # -------------------------------------------------------
                 # Vectorized per-point scoring (replaces Python for-loop)
                 # -------------------------------------------------------
-                tp_arr = np.array(tile_points)  # (N, 4): lat, lon, row, col
-                tile_lats_v = tp_arr[:, 0]
-                tile_lons_v = tp_arr[:, 1]
-                lr_v = tp_arr[:, 2].astype(np.int32) - row0_pad
-                lc_v = tp_arr[:, 3].astype(np.int32) - col0_pad
+                tile_lats_v = pt_lats[tile_sel]
+                tile_lons_v = pt_lons[tile_sel]
+                lr_v = rows[tile_sel] - row0_pad
+                lc_v = cols[tile_sel] - col0_pad
 
                 valid = (
                     (lr_v >= 0) & (lc_v >= 0)
@@ -529,7 +678,7 @@ class MaxAccuracyPipeline:
                 lr = lr_v[valid]
                 lc = lc_v[valid]
                 # Renamed tile_pt_* to avoid shadowing the outer pt_lats/pt_lons
-                # (the outer names are the full-property lists from rowcol();
+                # (the outer names are the full-property coordinate arrays;
                 #  these are the per-tile filtered subsets used in scoring below).
                 tile_pt_lats = tile_lats_v[valid]
                 tile_pt_lons = tile_lons_v[valid]
@@ -546,126 +695,100 @@ class MaxAccuracyPipeline:
                 ridge_arr   = ridgeline_grid[lr, lc].astype(np.float64)
                 drain_arr   = drainage_grid[lr, lc].astype(np.float64)
 
-                # Slope preference: plateau 5–22°
-                slope_pref = np.where(
-                    s_arr < 0.0, 0.0,
-                    np.where(s_arr < 5.0, 0.2 + 0.8 * (s_arr / 5.0),
-                    np.where(s_arr <= 22.0, 1.0,
-                    np.where(s_arr <= 35.0, np.maximum(0.0, 1.0 - (s_arr - 22.0) / 13.0),
-                    0.0))))
-
-                # Ridge proximity: upper-third preference
-                _elev_denom = max(1e-6, elev_max - elev_min)
-                elev_norm = (e_arr - elev_min) / _elev_denom
-                elev_pref = np.where(
-                    elev_norm < 0.3,
-                    np.maximum(0.1, elev_norm / 0.3 * 0.4),
-                    np.where(elev_norm < 0.6,
-                    0.4 + (elev_norm - 0.3) / 0.3 * 0.5,
-                    np.where(elev_norm <= 0.92,
-                    np.maximum(0.9, 1.0 - np.abs(elev_norm - 0.80) / 0.20),
-                    np.maximum(0.7, 1.0 - (elev_norm - 0.92) / 0.08 * 0.3))))
-
-                # Bench and saddle scores
-                relief_safe = np.maximum(relief_arr, 1.0)
-                tpi_s_norm  = np.abs(tpi_s_arr) / relief_safe
-                bench_v = (
-                    np.clip(1.0 - (np.abs(s_arr - 6.0) / 8.0), 0.0, 1.0)
-                    * np.clip(1.0 - tpi_s_norm, 0.0, 1.0)
+                comp = score_terrain_arrays(
+                    e_arr, s_arr, aspect_arr, curv_arr,
+                    tpi_s_arr, tpi_l_arr, relief_arr, rough_arr,
+                    ridge_arr, drain_arr,
+                    elev_min=elev_min, elev_max=elev_max,
+                    weights=self.config.weights,
                 )
-                saddle_v = (
-                    np.clip(relief_arr / 8.0, 0.0, 1.0)
-                    * np.clip(1.0 - tpi_s_norm, 0.0, 1.0)
-                    * np.clip(np.abs(curv_arr) / 0.08, 0.0, 1.0)
+                score_v = comp["score"]
+                columns = self._candidate_columns(
+                    tile_pt_lats, tile_pt_lons, score_v,
+                    e_arr, s_arr, aspect_arr, tpi_s_arr, tpi_l_arr,
+                    relief_arr, curv_arr, rough_arr, comp, ridge_arr, drain_arr,
                 )
 
-                # Corridor, shelter, roughness, curvature
-                corridor_v = (
-                    np.clip(1.0 - (np.abs(tpi_l_arr) / relief_safe), 0.0, 1.0)
-                    * np.clip(relief_arr / 10.0, 0.0, 1.0)
-                )
-                shelter_v = (
-                    np.clip(1.0 - (s_arr / 20.0), 0.0, 1.0)
-                    * np.clip((relief_arr - np.abs(tpi_s_arr)) / relief_safe, 0.0, 1.0)
-                )
-                roughness_v  = np.clip(rough_arr / 6.0, 0.0, 1.0)
-                curvature_v  = np.clip(np.abs(curv_arr) / 0.1, 0.0, 1.0)
-
-                # Aspect: prefer SE/south (170°), wider tolerance
-                _a_diff   = np.abs(aspect_arr - 170.0) % 360.0
-                aspect_v  = np.clip(1.0 - (np.minimum(_a_diff, 360.0 - _a_diff) / 100.0), 0.0, 1.0)
-
-                # Weighted composite score (array dot-product)
-                w = self.config.weights
-                score_v = (
-                    slope_pref   * w["slope_pref"]
-                    + elev_pref  * w["elev_pref"]
-                    + bench_v    * w["bench"]
-                    + saddle_v   * w["saddle"]
-                    + corridor_v * w["corridor"]
-                    + roughness_v * w["roughness"]
-                    + curvature_v * w["curvature"]
-                    + shelter_v  * w["shelter"]
-                    + aspect_v   * w["aspect"]
-                    + ridge_arr  * w.get("ridgeline", 0.04)
-                    + drain_arr  * w.get("drainage", 0.04)
-                )
+                def _build(idx: np.ndarray, columns=columns) -> List[Dict[str, Any]]:
+                    return self._candidate_records(columns, idx)
 
-                n_valid = int(valid.sum())
-                # Convert each metric array to a Python list once so the dict
-                # comprehension below does cheap list indexing instead of calling
-                # float(numpy_scalar) ~17× per point × N points.
-                _lats    = tile_pt_lats.tolist()
-                _lons    = tile_pt_lons.tolist()
-                _score   = score_v.tolist()
-                _elev    = e_arr.tolist()
-                _slope   = s_arr.tolist()
-                _aspect  = aspect_arr.tolist()
-                _tpi_s   = tpi_s_arr.tolist()
-                _tpi_l   = tpi_l_arr.tolist()
-                _relief  = relief_arr.tolist()
-                _curv    = curv_arr.tolist()
-                _rough   = rough_arr.tolist()
-                _bench   = bench_v.tolist()
-                _saddle  = saddle_v.tolist()
-                _corr    = corridor_v.tolist()
-                _shelter = shelter_v.tolist()
-                _asp_sc  = aspect_v.tolist()
-                _ridge   = ridge_arr.tolist()
-                _drain   = drain_arr.tolist()
-                scored.extend(
-                    {
-                        "lat":            _lats[i],
-                        "lon":            _lons[i],
-                        "score":          _score[i],
-                        "elevation_m":    _elev[i],
-                        "slope_deg":      _slope[i],
-                        "aspect_deg":     _aspect[i],
-                        "tpi_small":      _tpi_s[i],
-                        "tpi_large":      _tpi_l[i],
-                        "relief_small":   _relief[i],
-                        "curvature":      _curv[i],
-                        "roughness":      _rough[i],
-                        "bench_score":    _bench[i],
-                        "saddle_score":   _saddle[i],
-                        "corridor_score": _corr[i],
-                        "shelter_score":  _shelter[i],
-                        "aspect_score":   _asp_sc[i],
-                        "ridgeline_score": _ridge[i],
-                        "drainage_score":  _drain[i],
-                    }
-                    for i in range(n_valid)
-                )
+                elevation_stats.add_many(e_arr)
+                if top_k is not None:
+                    top_k.offer(score_v, _build)
+                    points_scored = top_k.seen
+                else:
+                    scored.extend(_build(np.arange(score_v.size)))
+                    points_scored = len(scored)
 
                 if progress_callback and (tile_idx % 10 == 0 or tile_idx == total_tiles):
                     progress_callback(
                         "terrain_tile",
-                        {"tile": tile_idx, "tiles": total_tiles, "points": len(scored)},
+                        {"tile": tile_idx, "tiles": total_tiles, "points": points_scored},
                     )
 
+        self._terrain_stats = {
+            "points_scored": top_k.seen if top_k is not None else len(scored),
+            "streaming": top_k is not None,
+            "source": "dem",
+            "elevation_m": elevation_stats.summary(),
+        }
+        if top_k is not None:
+            return top_k.items()
         scored.sort(key=lambda r: r["score"], reverse=True)
         return scored[: self.config.max_candidates]
 
+    @staticmethod
+    def _candidate_columns(
+        lats: np.ndarray,
+        lons: np.ndarray,
+        score: np.ndarray,
+        elev: np.ndarray,
+        slope: np.ndarray,
+        aspect: np.ndarray,
+        tpi_small: np.ndarray,
+        tpi_large: np.ndarray,
+        relief: np.ndarray,
+        curvature: np.ndarray,
+        roughness: np.ndarray,
+        comp: Dict[str, np.ndarray],
+        ridgeline: np.ndarray,
+        drainage: np.ndarray,
+    ) -> Dict[str, np.ndarray]:
+        """Map candidate record keys to their per-point arrays (report order)."""
+        return {
+            "lat":             lats,
+            "lon":             lons,
+            "score":           score,
+            "elevation_m":     elev,
+            "slope_deg":       slope,
+            "aspect_deg":      aspect,
+            "tpi_small":       tpi_small,
+            "tpi_large":       tpi_large,
+            "relief_small":    relief,
+            "curvature":       curvature,
+            "roughness":       roughness,
+            "bench_score":     comp["bench"],
+            "saddle_score":    comp["saddle"],
+            "corridor_score":  comp["corridor"],
+            "shelter_score":   comp["shelter"],
+            "aspect_score":    comp["aspect"],
+            "ridgeline_score": ridgeline,
+            "drainage_score":  drainage,
+        }
+
+    @staticmethod
+    def _candidate_records(columns: Dict[str, np.ndarray], idx: np.ndarray) -> List[Dict[str, Any]]:
+        """Materialise candidate dicts for the rows in *idx*.
+
+        Each column is converted to a Python list once so the zip below does
+        cheap list iteration instead of calling float(numpy_scalar) ~17× per
+        point. In streaming mode *idx* is only the handful of points that can
+        still make the top-K, not the whole tile.
+        """
+        keys = list(columns)
+        values = [columns[k][idx].tolist() for k in keys]
+        return [dict(zip(keys, row)) for row in zip(*values)]
+
     @staticmethod
     def _apply_gee_neutral_defaults(candidate: Dict[str, Any]) -> None:
         """Set neutral GEE values on a candidate that was not enriched.
@@ -696,12 +819,17 @@ class MaxAccuracyPipeline:
             return idx, get_gee_summary(lat, lon)
 
         failed = 0
-        with ThreadPoolExecutor(max_workers=_GEE_MAX_WORKERS) as pool:
+        pool = ThreadPoolExecutor(max_workers=_GEE_MAX_WORKERS)
+        cancelled = False
+        try:
             futures = {
                 pool.submit(_fetch, i, c["lat"], c["lon"]): i
                 for i, c in enumerate(to_enrich)
             }
             for future in as_completed(futures):
+                if self._cancel_token is not None and self._cancel_token.cancelled:
+                    cancelled = True
+                    raise RunCancelled(self._cancel_token.reason or "cancelled")
                 idx = futures[future]
                 try:
                     _, gee_data = future.result()
@@ -714,6 +842,10 @@ class MaxAccuracyPipeline:
                 done = len(results) + failed
                 if done % 50 == 0 or done == max_k:
                     logger.info("MaxAccuracy: GEE enrichment %s/%s done", done, max_k)
+        finally:
+            # On cancellation drop queued lookups and don't wait for the
+            # in-flight ones, so the worker thread is released right away.
+            pool.shutdown(wait=not cancelled, cancel_futures=cancelled)
 
         # Apply results; for failures or sentinel values, use neutral defaults
         for idx, candidate in enumerate(to_enrich):
@@ -1134,6 +1266,7 @@ class MaxAccuracyPipeline:
                 origin_lat=min_lat, origin_lon=min_lon,
                 nodes=nodes, season=season,
                 m_per_deg_lat=m_per_deg_lat, m_per_deg_lon=m_per_deg_lon,
+                cancel_check=self._check_cancelled,
             )
 
             summary = result.to_dict()
@@ -1144,6 +1277,8 @@ class MaxAccuracyPipeline:
             )
             return summary
 
+        except RunCancelled:
+            raise
         except Exception:
             logger.exception("CorridorAnalysis: failed")
             return None
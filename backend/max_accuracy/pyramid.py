@@ -0,0 +1,330 @@
+"""Precomputed multi-resolution terrain-score pyramid.
+
+The offline builder (``tools/build_terrain_pyramid.py``) walks the statewide
+DEM once per level, computes the max-accuracy terrain metrics at that cell
+size and writes them as a tiled multi-band Cloud-Optimized GeoTIFF.
+``MaxAccuracyPipeline`` with ``terrain_source="pyramid"`` then samples those
+rasters at grid points instead of recomputing metrics from the DEM.
+
+Layout under the pyramid directory::
+
+    pyramid.json          manifest (source DEM, TPI scales, levels, bands)
+    terrain_20m.tif       one multi-band COG per level
+    terrain_10m.tif
+    terrain_5m.tif
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import logging
+import math
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from backend.utils.terrain_scoring import detect_drainages, detect_ridgelines
+
+from .terrain_metrics import compute_metrics, score_terrain_arrays
+
+logger = logging.getLogger(__name__)
+
+PYRAMID_LEVELS_M: Tuple[int, ...] = (20, 10, 5)
+MANIFEST_NAME = "pyramid.json"
+
+# Band order in every level file. ``score`` uses the block-local elevation
+# range and is meant for visualisation; the pipeline re-scores from the raw
+# metrics so config weight overrides and property-local ridge proximity
+# still apply.
+BAND_NAMES: Tuple[str, ...] = (
+    "score",
+    "elevation_m",
+    "slope_deg",
+    "aspect_deg",
+    "curvature",
+    "tpi_small",
+    "tpi_large",
+    "relief_small",
+    "roughness",
+    "ridgeline_score",
+    "drainage_score",
+)
+
+
+def resolve_pyramid_dir(path: Optional[str] = None) -> Path:
+    """Return the pyramid directory (``MAX_ACCURACY_PYRAMID_DIR`` override)."""
+    base_dir = Path(__file__).resolve().parents[2]
+    pyramid_dir = Path(path or os.getenv("MAX_ACCURACY_PYRAMID_DIR") or "data/lidar/pyramid")
+    if not pyramid_dir.is_absolute():
+        pyramid_dir = base_dir / pyramid_dir
+    return pyramid_dir
+
+
+def level_filename(cell_m: int) -> str:
+    return f"terrain_{int(cell_m)}m.tif"
+
+
+def load_manifest(pyramid_dir: Path) -> Optional[Dict[str, Any]]:
+    manifest_path = Path(pyramid_dir) / MANIFEST_NAME
+    if not manifest_path.exists():
+        return None
+    try:
+        return json.loads(manifest_path.read_text(encoding="utf-8"))
+    except Exception:
+        logger.warning("TerrainPyramid: unreadable manifest %s", manifest_path, exc_info=True)
+        return None
+
+
+def select_level(levels: Sequence[int], spacing_m: float) -> Optional[int]:
+    """Pick the coarsest level that still resolves *spacing_m*.
+
+    Falls back to the finest available level when every level is coarser
+    than the requested grid spacing.
+    """
+    if not levels:
+        return None
+    fitting = [lvl for lvl in levels if lvl <= spacing_m]
+    return max(fitting) if fitting else min(levels)
+
+
+def build_level(
+    dem_path: str,
+    out_path: Path,
+    cell_m: float,
+    *,
+    tpi_small_m: int,
+    tpi_large_m: int,
+    weights: Dict[str, float],
+    block_px: int = 1024,
+    bounds: Optional[Tuple[float, float, float, float]] = None,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> Dict[str, Any]:
+    """Compute one pyramid level from *dem_path* and write it to *out_path*.
+
+    The DEM is read block by block (bilinear-resampled to *cell_m*) with a
+    padding of one large-TPI window so focal statistics are seamless across
+    block edges. *bounds* (left, bottom, right, top in DEM CRS) limits the
+    build to part of the DEM.
+    """
+    import rasterio  # type: ignore
+    import rasterio.shutil  # type: ignore
+    from rasterio.enums import Resampling  # type: ignore
+    from rasterio.transform import from_origin  # type: ignore
+    from rasterio.windows import Window, from_bounds  # type: ignore
+
+    out_path = Path(out_path)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = out_path.with_name(out_path.stem + ".tmp.tif")
+
+    with rasterio.open(dem_path) as src:
+        left, bottom, right, top = bounds or tuple(src.bounds)
+        width = max(1, int(math.ceil((right - left) / cell_m)))
+        height = max(1, int(math.ceil((top - bottom) / cell_m)))
+        out_transform = from_origin(left, top, cell_m, cell_m)
+        pad = max(1, int(math.ceil(tpi_large_m / cell_m)))
+
+        profile = {
+            "driver": "GTiff",
+            "width": width,
+            "height": height,
+            "count": len(BAND_NAMES),
+            "dtype": "float32",
+            "crs": src.crs,
+            "transform": out_transform,
+            "nodata": float("nan"),
+            "tiled": True,
+            "blockxsize": 512,
+            "blockysize": 512,
+            "compress": "deflate",
+            "predictor": 3,
+            "BIGTIFF": "IF_SAFER",
+        }
+
+        blocks = [
+            (r0, c0)
+            for r0 in range(0, height, block_px)
+            for c0 in range(0, width, block_px)
+        ]
+        with rasterio.open(tmp_path, "w", **profile) as dst:
+            for idx, (r0, c0) in enumerate(blocks, start=1):
+                r1 = min(r0 + block_px, height)
+                c1 = min(c0 + block_px, width)
+                pr0, pc0, pr1, pc1 = r0 - pad, c0 - pad, r1 + pad, c1 + pad
+
+                src_window = from_bounds(
+                    left + pc0 * cell_m,
+                    top - pr1 * cell_m,
+                    left + pc1 * cell_m,
+                    top - pr0 * cell_m,
+                    transform=src.transform,
+                )
+                try:
+                    elev = src.read(
+                        1,
+                        window=src_window,
+                        out_shape=(pr1 - pr0, pc1 - pc0),
+                        resampling=Resampling.bilinear,
+                        boundless=True,
+                        masked=True,
+                    ).astype("float32").filled(np.nan)
+                except Exception:
+                    logger.warning("TerrainPyramid: DEM read failed for block %s/%s — skipping", idx, len(blocks))
+                    continue
+
+                if np.isfinite(elev).any():
+                    stack = _score_block(
+                        elev, cell_m,
+                        tpi_small_m=tpi_small_m, tpi_large_m=tpi_large_m, weights=weights,
+                    )
+                    inner = stack[:, pad : pad + (r1 - r0), pad : pad + (c1 - c0)]
+                    dst.write(inner, window=Window(c0, r0, c1 - c0, r1 - r0))
+
+                if progress:
+                    progress(idx, len(blocks))
+
+            for band_idx, name in enumerate(BAND_NAMES, start=1):
+                dst.set_band_description(band_idx, name)
+
+    try:
+        rasterio.shutil.copy(
+            tmp_path, out_path, driver="COG",
+            compress="deflate", predictor=3, blocksize=512,
+            overview_resampling="average", bigtiff="IF_SAFER",
+        )
+        tmp_path.unlink(missing_ok=True)
+    except Exception:
+        # Older GDAL without the COG driver: the tiled GeoTIFF is still
+        # window-readable, just without internal overviews.
+        logger.warning("TerrainPyramid: COG driver unavailable — keeping tiled GeoTIFF", exc_info=True)
+        os.replace(tmp_path, out_path)
+
+    return {"cell_m": cell_m, "path": out_path.name, "shape": [height, width]}
+
+
+def _score_block(
+    elev: np.ndarray,
+    cell_m: float,
+    *,
+    tpi_small_m: int,
+    tpi_large_m: int,
+    weights: Dict[str, float],
+) -> np.ndarray:
+    nodata = ~np.isfinite(elev)
+    if nodata.any():
+        # Focal filters propagate NaN along whole rows, so fill nodata (and
+        # the boundless padding outside the DEM) with the nearest valid
+        # cell. That matches the filters' mode="nearest" edge handling.
+        from scipy.ndimage import distance_transform_edt  # type: ignore
+
+        nearest = distance_transform_edt(nodata, return_distances=False, return_indices=True)
+        elev = elev[tuple(nearest)]
+    metrics = compute_metrics(elev, cell_m, tpi_small_m, tpi_large_m)
+    ridgeline = detect_ridgelines(metrics["tpi_large"], metrics["slope_deg"], metrics["relief_small"])
+    drainage = detect_drainages(
+        metrics["tpi_small"], metrics["tpi_large"], metrics["curvature"], metrics["relief_small"]
+    )
+    comp = score_terrain_arrays(
+        elev, metrics["slope_deg"], metrics["aspect_deg"], metrics["curvature"],
+        metrics["tpi_small"], metrics["tpi_large"], metrics["relief_small"], metrics["roughness"],
+        ridgeline, drainage,
+        elev_min=float(np.nanmin(elev)), elev_max=float(np.nanmax(elev)),
+        weights=weights,
+    )
+    layers = {
+        "score": comp["score"],
+        "elevation_m": elev,
+        "ridgeline_score": ridgeline,
+        "drainage_score": drainage,
+        **{k: metrics[k] for k in ("slope_deg", "aspect_deg", "curvature", "tpi_small",
+                                   "tpi_large", "relief_small", "roughness")},
+    }
+    stack = np.stack([np.asarray(layers[name], dtype="float32") for name in BAND_NAMES])
+    stack[:, nodata] = np.nan
+    return stack
+
+
+def build_pyramid(
+    dem_path: str,
+    out_dir: Path,
+    *,
+    levels: Sequence[int] = PYRAMID_LEVELS_M,
+    tpi_small_m: int,
+    tpi_large_m: int,
+    weights: Dict[str, float],
+    block_px: int = 1024,
+    bounds: Optional[Tuple[float, float, float, float]] = None,
+    progress: Optional[Callable[[int, int, int], None]] = None,
+) -> Dict[str, Any]:
+    """Build every level and write the manifest. Returns the manifest."""
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    built: Dict[str, str] = {}
+    for cell_m in levels:
+        info = build_level(
+            dem_path,
+            out_dir / level_filename(cell_m),
+            float(cell_m),
+            tpi_small_m=tpi_small_m,
+            tpi_large_m=tpi_large_m,
+            weights=weights,
+            block_px=block_px,
+            bounds=bounds,
+            progress=functools.partial(progress, cell_m) if progress else None,
+        )
+        built[str(int(cell_m))] = info["path"]
+
+    manifest = {
+        "source_dem": str(dem_path),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "tpi_small_m": tpi_small_m,
+        "tpi_large_m": tpi_large_m,
+        "weights": dict(weights),
+        "bands": list(BAND_NAMES),
+        "levels": built,
+        "bounds": list(bounds) if bounds else None,
+    }
+    (out_dir / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    return manifest
+
+
+def sample_pyramid(
+    level_path: str,
+    points: List[Tuple[float, float]],
+) -> Tuple[np.ndarray, np.ndarray, Dict[str, np.ndarray]]:
+    """Gather every band at *points* from one pyramid level.
+
+    Reads a single window covering the points' bounding box and gathers
+    with fancy indexing. Returns ``(lats, lons, bands)`` for points that
+    fall inside the raster; ``bands`` maps band names to float64 arrays.
+    """
+    import rasterio  # type: ignore
+    from rasterio.warp import transform  # type: ignore
+    from rasterio.windows import Window  # type: ignore
+
+    lats = np.array([p[0] for p in points], dtype=np.float64)
+    lons = np.array([p[1] for p in points], dtype=np.float64)
+    empty: Dict[str, np.ndarray] = {name: np.empty(0) for name in BAND_NAMES}
+    if lats.size == 0:
+        return lats, lons, empty
+
+    with rasterio.open(level_path) as src:
+        xs, ys = transform("EPSG:4326", src.crs, lons.tolist(), lats.tolist())
+        rows, cols = rasterio.transform.rowcol(src.transform, xs, ys)
+        rows = np.asarray(rows, dtype=np.int64)
+        cols = np.asarray(cols, dtype=np.int64)
+        inside = (rows >= 0) & (cols >= 0) & (rows < src.height) & (cols < src.width)
+        if not inside.any():
+            return lats[:0], lons[:0], empty
+        rows, cols = rows[inside], cols[inside]
+        r0, c0 = int(rows.min()), int(cols.min())
+        window = Window(c0, r0, int(cols.max()) - c0 + 1, int(rows.max()) - r0 + 1)
+        data = src.read(window=window, masked=True).astype("float64").filled(np.nan)
+        names = [d or BAND_NAMES[i] for i, d in enumerate(src.descriptions)]
+
+    lr, lc = rows - r0, cols - c0
+    bands = {name: data[i][lr, lc] for i, name in enumerate(names)}
+    return lats[inside], lons[inside], bands
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import heapq
+import math
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+import numpy as np
+
+
+class TopKBuffer:
+    """Fixed-capacity buffer that keeps the ``k`` highest-scoring records.
+
+    Records are offered one tile at a time.  Only scores that can still enter
+    the buffer are materialised, so peak memory depends on ``k`` and the tile
+    size rather than the number of points scored.  Ties are broken by arrival
+    order (earlier wins), which reproduces a stable descending sort over the
+    full list.
+    """
+
+    def __init__(self, k: int) -> None:
+        self.k = max(0, int(k))
+        self.seen = 0
+        self._heap: List[Tuple[float, int, Dict[str, Any]]] = []
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    @property
+    def threshold(self) -> float:
+        """Score a new record must beat to enter the buffer."""
+        if len(self._heap) < self.k:
+            return -math.inf
+        return self._heap[0][0]
+
+    def admissible(self, scores: np.ndarray) -> np.ndarray:
+        """Return ascending indices of *scores* that could enter the buffer."""
+        if self.k <= 0 or scores.size == 0:
+            return np.empty(0, dtype=np.int64)
+        idx = np.flatnonzero(np.isfinite(scores) & (scores > self.threshold))
+        if idx.size > self.k:
+            # Stable sort keeps the earliest of equal scores, like list.sort.
+            order = np.argsort(-scores[idx], kind="stable")[: self.k]
+            idx = np.sort(idx[order])
+        return idx
+
+    def offer(
+        self,
+        scores: np.ndarray,
+        build: Callable[[np.ndarray], Sequence[Dict[str, Any]]],
+    ) -> None:
+        """Offer a batch of scores; ``build(idx)`` creates records for survivors."""
+        base = self.seen
+        self.seen += int(scores.size)
+        idx = self.admissible(scores)
+        if idx.size == 0:
+            return
+        records = build(idx)
+        for i, score, record in zip(idx.tolist(), scores[idx].tolist(), records):
+            # Negated sequence: among equal scores the later arrival is the
+            # heap minimum and is evicted first.
+            item = (score, -(base + i), record)
+            if len(self._heap) < self.k:
+                heapq.heappush(self._heap, item)
+            elif item > self._heap[0]:
+                heapq.heapreplace(self._heap, item)
+
+    def items(self) -> List[Dict[str, Any]]:
+        """Records sorted by score descending (arrival order on ties)."""
+        return [record for _, _, record in sorted(self._heap, key=lambda t: (-t[0], -t[1]))]
+
+
+class Reservoir:
+    """Bounded uniform sample of a numeric stream (Vitter's Algorithm R).
+
+    Used for property-wide statistics (e.g. elevation percentiles) that would
+    otherwise require every scored point to be kept in memory.
+    """
+
+    def __init__(self, capacity: int, seed: int = 0) -> None:
+        self.capacity = max(1, int(capacity))
+        self.seen = 0
+        self.min = math.inf
+        self.max = -math.inf
+        self._values = np.empty(self.capacity, dtype=np.float64)
+        self._rng = np.random.default_rng(seed)
+
+    def __len__(self) -> int:
+        return min(self.seen, self.capacity)
+
+    def add_many(self, values: np.ndarray) -> None:
+        values = np.asarray(values, dtype=np.float64).ravel()
+        values = values[np.isfinite(values)]
+        if values.size == 0:
+            return
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        fill = min(values.size, max(0, self.capacity - self.seen))
+        if fill:
+            self._values[self.seen : self.seen + fill] = values[:fill]
+        rest = values[fill:]
+        if rest.size:
+            positions = np.arange(self.seen + fill, self.seen + values.size, dtype=np.int64)
+            slots = self._rng.integers(0, positions + 1)
+            keep = slots < self.capacity
+            self._values[slots[keep]] = rest[keep]
+        self.seen += int(values.size)
+
+    def quantile(self, q: float) -> float:
+        if self.seen == 0:
+            return float("nan")
+        return float(np.quantile(self._values[: len(self)], q))
+
+    def summary(self, quantiles: Sequence[float] = (0.1, 0.25, 0.5, 0.75, 0.9)) -> Dict[str, float]:
+        if self.seen == 0:
+            return {}
+        sample = self._values[: len(self)]
+        out = {f"p{int(round(q * 100))}": round(float(np.quantile(sample, q)), 2) for q in quantiles}
+        # Extremes are tracked exactly, not estimated from the sample.
+        out["min"] = round(self.min, 2)
+        out["max"] = round(self.max, 2)
+        return out
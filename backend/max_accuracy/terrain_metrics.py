@@ -5,6 +5,8 @@ from typing import Dict, Tuple
 
 import numpy as np
 
+from backend.utils.terrain_scoring import ridge_proximity_preference_array, slope_preference_array
+
 
 def _safe_uniform_filter(data: np.ndarray, size: int) -> np.ndarray:
     try:
@@ -64,7 +66,10 @@ def compute_metrics(
     tpi_large = elev - mean_large
 
     # Local relief and roughness (mean_small already computed above for TPI)
-    rel_small = _safe_extrema_filter(elev, size=small_px, mode="max") - _safe_extrema_filter(elev, size=small_px, mode="min")
+    rel_small = (
+        _safe_extrema_filter(elev, size=small_px, mode="max")
+        - _safe_extrema_filter(elev, size=small_px, mode="min")
+    )
     mean_sq_small = _safe_uniform_filter(elev * elev, size=small_px)
     roughness = np.sqrt(np.maximum(mean_sq_small - mean_small * mean_small, 0.0))
 
@@ -99,6 +104,98 @@ def score_bench_saddle(
     bench = clamp01(1.0 - (abs(slope_deg - 6.0) / 8.0)) * clamp01(1.0 - (abs(tpi_small) / max(1.0, relief_small)))
 
     # Saddle: neutral TPI + surrounding relief + curvature variability
-    saddle = clamp01(relief_small / 8.0) * clamp01(1.0 - (abs(tpi_small) / max(1.0, relief_small))) * clamp01(abs(curvature) / 0.08)
+    saddle = (
+        clamp01(relief_small / 8.0)
+        * clamp01(1.0 - (abs(tpi_small) / max(1.0, relief_small)))
+        * clamp01(abs(curvature) / 0.08)
+    )
 
     return bench, saddle
+
+
+def score_terrain_arrays(
+    elev: np.ndarray,
+    slope_deg: np.ndarray,
+    aspect_deg: np.ndarray,
+    curvature: np.ndarray,
+    tpi_small: np.ndarray,
+    tpi_large: np.ndarray,
+    relief_small: np.ndarray,
+    roughness: np.ndarray,
+    ridgeline: np.ndarray,
+    drainage: np.ndarray,
+    *,
+    elev_min: float,
+    elev_max: float,
+    weights: Dict[str, float],
+) -> Dict[str, np.ndarray]:
+    """Vectorised terrain scoring for gathered points or whole rasters.
+
+    Shared by ``MaxAccuracyPipeline._score_terrain`` (DEM and pyramid
+    sources) and the offline pyramid builder so the formulas live in one
+    place. Inputs may be 1-D point arrays or 2-D grids of equal shape.
+    Returns the component scores plus the weighted ``score``.
+    """
+
+    s_arr = slope_deg
+    # Slope preference (plateau 5–22°) and ridge proximity (upper third)
+    slope_pref = slope_preference_array(s_arr)
+    elev_pref = ridge_proximity_preference_array(elev, elev_min, elev_max)
+
+    # Bench and saddle scores
+    relief_safe = np.maximum(relief_small, 1.0)
+    tpi_s_norm = np.abs(tpi_small) / relief_safe
+    bench = (
+        np.clip(1.0 - (np.abs(s_arr - 6.0) / 8.0), 0.0, 1.0)
+        * np.clip(1.0 - tpi_s_norm, 0.0, 1.0)
+    )
+    saddle = (
+        np.clip(relief_small / 8.0, 0.0, 1.0)
+        * np.clip(1.0 - tpi_s_norm, 0.0, 1.0)
+        * np.clip(np.abs(curvature) / 0.08, 0.0, 1.0)
+    )
+
+    # Corridor, shelter, roughness, curvature
+    corridor = (
+        np.clip(1.0 - (np.abs(tpi_large) / relief_safe), 0.0, 1.0)
+        * np.clip(relief_small / 10.0, 0.0, 1.0)
+    )
+    shelter = (
+        np.clip(1.0 - (s_arr / 20.0), 0.0, 1.0)
+        * np.clip((relief_small - np.abs(tpi_small)) / relief_safe, 0.0, 1.0)
+    )
+    roughness_score = np.clip(roughness / 6.0, 0.0, 1.0)
+    curvature_score = np.clip(np.abs(curvature) / 0.1, 0.0, 1.0)
+
+    # Aspect: prefer SE/south (170°), wider tolerance
+    _a_diff = np.abs(aspect_deg - 170.0) % 360.0
+    aspect_score = np.clip(1.0 - (np.minimum(_a_diff, 360.0 - _a_diff) / 100.0), 0.0, 1.0)
+
+    # Weighted composite score (array dot-product)
+    w = weights
+    score = (
+        slope_pref        * w["slope_pref"]
+        + elev_pref       * w["elev_pref"]
+        + bench           * w["bench"]
+        + saddle          * w["saddle"]
+        + corridor        * w["corridor"]
+        + roughness_score * w["roughness"]
+        + curvature_score * w["curvature"]
+        + shelter         * w["shelter"]
+        + aspect_score    * w["aspect"]
+        + ridgeline       * w.get("ridgeline", 0.04)
+        + drainage        * w.get("drainage", 0.04)
+    )
+
+    return {
+        "score": score,
+        "slope_pref": slope_pref,
+        "elev_pref": elev_pref,
+        "bench": bench,
+        "saddle": saddle,
+        "corridor": corridor,
+        "shelter": shelter,
+        "roughness": roughness_score,
+        "curvature": curvature_score,
+        "aspect": aspect_score,
+    }
@@ -0,0 +1,180 @@
+"""Process-isolated execution of max-accuracy pipeline runs.
+
+Terrain scoring and corridor routing are CPU-bound Python; run on threads
+inside the API process they hold the GIL and slow every other request.
+``ProcessJobRunner`` runs each pipeline in a spawned worker process
+instead. The calling thread (one of the router's orchestration threads)
+blocks on a manager queue, relaying progress into the caller's callback —
+i.e. the API process's status store — until the run finishes. Workers are
+replaced after ``max_jobs_per_worker`` runs (on Python 3.10, the whole
+pool is replaced after that many submissions) so memory held by rasterio,
+GDAL caches and large numpy temporaries is returned to the OS.
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import queue as queue_mod
+import sys
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .cancellation import CancellationToken
+from .config import MaxAccuracyConfig
+
+logger = logging.getLogger(__name__)
+
+# Sentinel put on the progress queue when the worker is done.
+_DONE = "__done__"
+
+# ProcessPoolExecutor(max_tasks_per_child=...) is new in Python 3.11; on
+# older interpreters the runner retires the whole pool instead.
+_NATIVE_WORKER_RECYCLING = sys.version_info >= (3, 11)
+
+
+def run_pipeline_job(
+    config: MaxAccuracyConfig,
+    corners: List[Tuple[float, float]],
+    *,
+    date_time: str,
+    season: str,
+    hunting_pressure: str,
+    progress_queue: Any,
+    cancel_event: Any,
+    deadline_s: Optional[float],
+) -> Dict[str, Any]:
+    """Worker-process entry point: run one pipeline, streaming progress."""
+    from .pipeline import MaxAccuracyPipeline
+
+    def _progress(stage: str, payload: Dict[str, Any]) -> None:
+        progress_queue.put((stage, payload))
+
+    token = CancellationToken(deadline_s=deadline_s, event=cancel_event)
+    try:
+        return MaxAccuracyPipeline(config).run(
+            corners,
+            date_time=date_time,
+            season=season,
+            hunting_pressure=hunting_pressure,
+            progress_callback=_progress,
+            cancel_token=token,
+        )
+    finally:
+        progress_queue.put((_DONE, {}))
+
+
+class ProcessJobRunner:
+    def __init__(self, max_workers: int, max_jobs_per_worker: int = 4) -> None:
+        self.max_workers = max(1, int(max_workers))
+        self.max_jobs_per_worker = max(1, int(max_jobs_per_worker))
+        # spawn, not fork: the API process is multi-threaded, and forking
+        # a process that holds locks in other threads can deadlock.
+        self._ctx = multiprocessing.get_context("spawn")
+        self._lock = threading.Lock()
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_submissions = 0
+        self._manager: Any = None
+
+    def _ensure_started(self) -> Tuple[ProcessPoolExecutor, Any]:
+        with self._lock:
+            if self._manager is None:
+                self._manager = self._ctx.Manager()
+            return self._started_pool(), self._manager
+
+    def _started_pool(self) -> ProcessPoolExecutor:
+        # Caller holds self._lock.
+        if self._pool is None:
+            kwargs: Dict[str, Any] = {}
+            if _NATIVE_WORKER_RECYCLING:
+                kwargs["max_tasks_per_child"] = self.max_jobs_per_worker
+            self._pool = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=self._ctx, **kwargs)
+            self._pool_submissions = 0
+        return self._pool
+
+    def _submit(self, fn: Callable[..., Dict[str, Any]], *args: Any, **kwargs: Any) -> "Future[Dict[str, Any]]":
+        """Submit to the pool, retiring it after max_jobs_per_worker runs where workers can't be recycled."""
+        retired: Optional[ProcessPoolExecutor] = None
+        with self._lock:
+            future = self._started_pool().submit(fn, *args, **kwargs)
+            if not _NATIVE_WORKER_RECYCLING:
+                self._pool_submissions += 1
+                if self._pool_submissions >= self.max_jobs_per_worker:
+                    retired, self._pool = self._pool, None
+        if retired is not None:
+            # Runs already submitted finish; the workers exit afterwards.
+            retired.shutdown(wait=False)
+        return future
+
+    def new_token(self, deadline_s: Optional[float] = None) -> CancellationToken:
+        """Token whose cancellation is visible inside worker processes."""
+        _, manager = self._ensure_started()
+        return CancellationToken(deadline_s=deadline_s, event=manager.Event())
+
+    def run(
+        self,
+        config: MaxAccuracyConfig,
+        corners: List[Tuple[float, float]],
+        *,
+        date_time: str,
+        season: str,
+        hunting_pressure: str,
+        progress_callback: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+        cancel_token: Optional[CancellationToken] = None,
+    ) -> Dict[str, Any]:
+        """Run the pipeline in a worker process and block until it returns."""
+        _, manager = self._ensure_started()
+        token = cancel_token if cancel_token is not None else self.new_token()
+        progress_queue = manager.Queue()
+        try:
+            future = self._submit(
+                run_pipeline_job,
+                config,
+                list(corners),
+                date_time=date_time,
+                season=season,
+                hunting_pressure=hunting_pressure,
+                progress_queue=progress_queue,
+                cancel_event=token.event,
+                deadline_s=token.remaining_s(),
+            )
+        except BrokenProcessPool:
+            self._reset_pool()
+            raise RuntimeError("Max-accuracy worker pool was broken; it has been restarted")
+
+        while True:
+            try:
+                stage, payload = progress_queue.get(timeout=0.5)
+            except queue_mod.Empty:
+                if future.done():
+                    break
+                continue
+            if stage == _DONE:
+                break
+            if progress_callback is not None:
+                progress_callback(stage, payload)
+
+        try:
+            return future.result()
+        except BrokenProcessPool:
+            # A worker died mid-run (OOM kill, segfault in GDAL). Replace the
+            # pool so later jobs still run.
+            self._reset_pool()
+            raise RuntimeError("Max-accuracy worker process crashed")
+
+    def _reset_pool(self) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+            manager, self._manager = self._manager, None
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+        if manager is not None:
+            manager.shutdown()
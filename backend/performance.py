@@ -1,19 +1,33 @@
 """
 Performance monitoring and optimization utilities.
 Provides decorators and utilities for monitoring application performance.
+
+``cache_result`` memoises into a ``BoundedCache`` per decorated function:
+LRU with separate entry and byte limits, per-entry TTL, canonical argument
+hashing and single-flight computation. Every cache registers with the
+global ``PerformanceMonitor`` so hit/miss/eviction counts can be read from
+one place.
 """
 import time
 import logging
 import functools
 import asyncio
-from typing import Dict, Any, Callable, Optional, List
-from datetime import datetime, timedelta
-from dataclasses import dataclass, field
-from collections import defaultdict, deque
+import math
+import sys
+from typing import Dict, Any, Callable, Optional, List, Tuple
+from datetime import date, datetime, timedelta
+from dataclasses import dataclass, field, fields, is_dataclass
+from collections import OrderedDict, defaultdict, deque
+from enum import Enum
 import threading
 import hashlib
 import json
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy ships with the backend
+    np = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -54,6 +68,29 @@ class PerformanceMonitor:
             lambda: PerformanceStats("")
         )
         self._lock = threading.RLock()
+        self.caches: Dict[str, "BoundedCache"] = {}
+    
+    def register_cache(self, name: str, cache: "BoundedCache") -> None:
+        """
+        Make a cache's statistics available through get_cache_stats.
+        
+        Args:
+            name: Unique cache name (the decorated function's qualified name)
+            cache: Cache to report on
+        """
+        with self._lock:
+            self.caches[name] = cache
+    
+    def get_cache_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get hit/miss/eviction statistics of every registered cache.
+        
+        Returns:
+            Dict[str, Dict[str, Any]]: Statistics keyed by cache name
+        """
+        with self._lock:
+            caches = dict(self.caches)
+        return {name: cache.stats() for name, cache in caches.items()}
     
     def record_metric(self, metric: PerformanceMetric) -> None:
         """
@@ -195,59 +232,299 @@ def performance_monitor(
     
     return decorator
 
-def cache_result(ttl_hours: int = 24) -> Callable:
-    """Decorator to cache function results"""
+_DEFAULT_CACHE_MAX_ENTRIES = 1024
+_DEFAULT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+def _canonical(value: Any, float_digits: int) -> Any:
+    """JSON-ready form of *value* that is equal for equal arguments"""
+    if value is None or isinstance(value, (bool, int, str)):
+        return value
+    if isinstance(value, float):
+        if math.isnan(value) or math.isinf(value):
+            return ["float", repr(value)]
+        return round(value, float_digits)
+    if isinstance(value, Enum):
+        return ["enum", type(value).__qualname__, _canonical(value.value, float_digits)]
+    if isinstance(value, (datetime, date)):
+        return ["datetime", value.isoformat()]
+    if isinstance(value, bytes):
+        return ["bytes", hashlib.blake2b(value, digest_size=16).hexdigest()]
+    if np is not None:
+        if isinstance(value, np.ndarray):
+            data = np.ascontiguousarray(value)
+            if data.dtype.kind == "f":
+                data = np.round(data, float_digits)
+            digest = hashlib.blake2b(data.tobytes(), digest_size=16).hexdigest()
+            return ["ndarray", data.dtype.str, list(data.shape), digest]
+        if isinstance(value, np.generic):
+            return _canonical(value.item(), float_digits)
+    if isinstance(value, dict):
+        items = [[_canonical(k, float_digits), _canonical(v, float_digits)] for k, v in value.items()]
+        return ["dict", sorted(items, key=lambda kv: json.dumps(kv[0], sort_keys=True))]
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v, float_digits) for v in value]
+    if isinstance(value, (set, frozenset)):
+        return ["set", sorted((_canonical(v, float_digits) for v in value), key=json.dumps)]
+    if is_dataclass(value) and not isinstance(value, type):
+        return [
+            "dataclass",
+            type(value).__qualname__,
+            {f.name: _canonical(getattr(value, f.name), float_digits) for f in fields(value)},
+        ]
+    # Anything else (service instances passed as ``self``, ...) is keyed by
+    # its type and repr, as the previous str(args) key did.
+    return ["object", f"{type(value).__module__}.{type(value).__qualname__}", repr(value)]
+
+
+def canonical_cache_key(func_name: str, args: tuple, kwargs: dict, float_digits: int = 9) -> str:
+    """
+    Stable cache key for a call.
+    
+    Dict keys are sorted, floats are rounded to *float_digits* and NumPy
+    arrays are reduced to dtype, shape and a digest of their contents, so
+    equal arguments give the same key across calls and processes.
+    """
+    payload = json.dumps(
+        [func_name, _canonical(args, float_digits), _canonical(kwargs, float_digits)],
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=20).hexdigest()
+
+
+def _estimate_size(value: Any, _depth: int = 0) -> int:
+    """Approximate memory held by a cached value, in bytes"""
+    if np is not None and isinstance(value, np.ndarray):
+        # getsizeof counts the buffer only when the array owns it.
+        return sys.getsizeof(value) + (0 if value.flags.owndata else int(value.nbytes))
+    size = sys.getsizeof(value)
+    if _depth >= 4:
+        return size
+    if isinstance(value, dict):
+        size += sum(_estimate_size(k, _depth + 1) + _estimate_size(v, _depth + 1) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(_estimate_size(v, _depth + 1) for v in value)
+    elif hasattr(value, "__dict__") and not isinstance(value, type):
+        size += _estimate_size(vars(value), _depth + 1)
+    return size
+
+
+class _Flight:
+    """One in-progress computation that concurrent callers wait on"""
+    
+    __slots__ = ("done", "value", "error")
+    
+    def __init__(self):
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class BoundedCache:
+    """
+    Thread-safe LRU cache bounded by entry count and estimated bytes.
+    
+    Entries expire after their TTL; expired entries are dropped when read
+    and are the first to go when the cache is over a limit.
+    """
+    
+    def __init__(
+        self,
+        max_entries: int = _DEFAULT_CACHE_MAX_ENTRIES,
+        max_bytes: int = _DEFAULT_CACHE_MAX_BYTES,
+        default_ttl_s: Optional[float] = None,
+    ):
+        self.max_entries = max(1, int(max_entries))
+        self.max_bytes = max(1, int(max_bytes))
+        self.default_ttl_s = default_ttl_s
+        # key -> (value, expires_at or None, size)
+        self._entries: "OrderedDict[str, Tuple[Any, Optional[float], int]]" = OrderedDict()
+        self._bytes = 0
+        self._inflight: Dict[str, _Flight] = {}
+        self._lock = threading.Lock()
+        self._counters = defaultdict(int)
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+    
+    def _lookup(self, key: str, now: float) -> Tuple[bool, Any]:
+        """Caller holds the lock"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        value, expires_at, size = entry
+        if expires_at is not None and expires_at <= now:
+            del self._entries[key]
+            self._bytes -= size
+            self._counters["expirations"] += 1
+            return False, None
+        self._entries.move_to_end(key)
+        return True, value
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            hit, value = self._lookup(key, time.monotonic())
+            self._counters["hits" if hit else "misses"] += 1
+            return value if hit else default
+    
+    def set(self, key: str, value: Any, ttl_s: Optional[float] = None) -> bool:
+        """Store *value*; False when it alone is larger than max_bytes"""
+        size = _estimate_size(value)
+        ttl = self.default_ttl_s if ttl_s is None else ttl_s
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[2]
+            if size > self.max_bytes:
+                self._counters["rejected"] += 1
+                return False
+            expires_at = time.monotonic() + ttl if ttl is not None else None
+            self._entries[key] = (value, expires_at, size)
+            self._bytes += size
+            self._evict(time.monotonic())
+            return True
+    
+    def _evict(self, now: float) -> None:
+        """Caller holds the lock"""
+        if len(self._entries) <= self.max_entries and self._bytes <= self.max_bytes:
+            return
+        for key in [k for k, (_, exp, _) in self._entries.items() if exp is not None and exp <= now]:
+            self._bytes -= self._entries.pop(key)[2]
+            self._counters["expirations"] += 1
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            _, (_, _, size) = self._entries.popitem(last=False)
+            self._bytes -= size
+            self._counters["evictions"] += 1
+    
+    def get_or_compute(self, key: str, compute: Callable[[], Any], ttl_s: Optional[float] = None) -> Any:
+        """
+        Cached value for *key*, computing it at most once at a time.
+        
+        Concurrent callers for a key that is being computed wait for that
+        computation instead of starting their own. Exceptions are passed to
+        every waiter and are not cached.
+        """
+        with self._lock:
+            hit, value = self._lookup(key, time.monotonic())
+            if hit:
+                self._counters["hits"] += 1
+                return value
+            self._counters["misses"] += 1
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = _Flight()
+            else:
+                self._counters["coalesced"] += 1
+        
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+        
+        try:
+            flight.value = compute()
+            self.set(key, flight.value, ttl_s)
+            return flight.value
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            flight.done.set()
+    
+    def discard(self, key: str) -> bool:
+        """Remove *key*; False if it was not cached"""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return False
+            self._bytes -= entry[2]
+            return True
+    
+    def discard_where(self, predicate: Callable[[str], bool]) -> int:
+        """Remove every key for which *predicate* is true"""
+        with self._lock:
+            keys = [k for k in self._entries if predicate(k)]
+            for key in keys:
+                self._bytes -= self._entries.pop(key)[2]
+            return len(keys)
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+    
+    def stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        with self._lock:
+            expired = sum(1 for _, exp, _ in self._entries.values() if exp is not None and exp <= now)
+            stats = {
+                "entries": len(self._entries),
+                "expired_entries": expired,
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "inflight": len(self._inflight),
+            }
+            for name in ("hits", "misses", "evictions", "expirations", "coalesced", "rejected"):
+                stats[name] = self._counters[name]
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        return stats
+
+
+def cache_result(
+    ttl_hours: float = 24,
+    *,
+    max_entries: int = _DEFAULT_CACHE_MAX_ENTRIES,
+    max_bytes: int = _DEFAULT_CACHE_MAX_BYTES,
+    float_digits: int = 9,
+) -> Callable:
+    """
+    Decorator to cache function results.
+    
+    Args:
+        ttl_hours: Lifetime of a cached result
+        max_entries: Most results kept for the function
+        max_bytes: Most estimated bytes kept for the function
+        float_digits: Decimal places float arguments are rounded to in the key
+    """
     def decorator(func: Callable) -> Callable:
+        name = f"{func.__module__}.{func.__qualname__}"
+        cache = BoundedCache(max_entries=max_entries, max_bytes=max_bytes, default_ttl_s=ttl_hours * 3600)
+        _performance_monitor.register_cache(name, cache)
+        
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            # Create cache key from function name and arguments
-            cache_key = _create_cache_key(func.__name__, args, kwargs)
-            
-            # Check if result is in cache and not expired
-            if cache_key in _cache:
-                cache_entry = _cache[cache_key]
-                if time.time() - cache_entry['timestamp'] < ttl_hours * 3600:
-                    logger.debug(f"Cache hit for {func.__name__}")
-                    return cache_entry['result']
-            
-            # Execute function and cache result
-            result = func(*args, **kwargs)
-            _cache[cache_key] = {
-                'result': result,
-                'timestamp': time.time()
-            }
-            logger.debug(f"Cache miss for {func.__name__}, result cached")
-            return result
+            cache_key = canonical_cache_key(func.__qualname__, args, kwargs, float_digits)
+            return cache.get_or_compute(cache_key, lambda: func(*args, **kwargs))
+        
+        wrapper.cache = cache
+        wrapper.cache_clear = cache.clear
         return wrapper
     return decorator
 
-def _create_cache_key(func_name: str, args: tuple, kwargs: dict) -> str:
-    """Create a unique cache key from function name and arguments"""
-    # Convert arguments to string representation
-    args_str = str(args)
-    kwargs_str = json.dumps(kwargs, sort_keys=True, default=str)
-    cache_input = f"{func_name}:{args_str}:{kwargs_str}"
-    
-    # Create hash to ensure consistent key length
-    return hashlib.md5(cache_input.encode()).hexdigest()
-
 def clear_cache():
     """Clear all cached results"""
-    global _cache
-    _cache.clear()
+    for cache in list(_performance_monitor.caches.values()):
+        cache.clear()
     logger.info("Cache cleared")
 
 def get_cache_stats() -> Dict[str, Any]:
     """Get cache statistics"""
-    total_entries = len(_cache)
-    current_time = time.time()
-    expired_entries = sum(
-        1 for entry in _cache.values() 
-        if current_time - entry['timestamp'] > 24 * 3600
-    )
+    per_cache = _performance_monitor.get_cache_stats()
+    total_entries = sum(s["entries"] for s in per_cache.values())
+    expired_entries = sum(s["expired_entries"] for s in per_cache.values())
     
     return {
         'total_entries': total_entries,
         'expired_entries': expired_entries,
-        'active_entries': total_entries - expired_entries
+        'active_entries': total_entries - expired_entries,
+        'total_bytes': sum(s["bytes"] for s in per_cache.values()),
+        'caches': per_cache,
     }
@@ -1,105 +1,296 @@
 """
 Prediction caching system to dramatically speed up repeated predictions.
+
+Entries live in one SQLite database (WAL journal) inside the cache
+directory. Payloads are zlib-compressed JSON, expiry is an indexed column,
+and the total payload size is kept under a byte budget by evicting the
+least recently used entries. Several worker processes can share the cache:
+every write is a single ``BEGIN IMMEDIATE`` transaction. JSON files left by
+the old one-file-per-key layout are imported (and removed) the first time
+a cache opens the directory.
 """
-import hashlib
 import json
+import logging
 import os
+import sqlite3
+import threading
 import time
-from datetime import datetime, timedelta
+import zlib
+from datetime import datetime
 from typing import Dict, Any, Optional
-import logging
 
 logger = logging.getLogger(__name__)
 
+DB_FILENAME = "prediction_cache.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    cache_key   TEXT PRIMARY KEY,
+    payload     BLOB NOT NULL,
+    size        INTEGER NOT NULL,
+    created_at  REAL NOT NULL,
+    expires_at  REAL NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_entries_expires_at ON entries(expires_at);
+CREATE INDEX IF NOT EXISTS idx_entries_last_access ON entries(last_access);
+CREATE TABLE IF NOT EXISTS cache_meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+-- Running payload total, kept exact by triggers so budget checks do not
+-- scan the table.
+CREATE TABLE IF NOT EXISTS cache_size (
+    id    INTEGER PRIMARY KEY CHECK (id = 0),
+    bytes INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO cache_size (id, bytes) VALUES (0, 0);
+CREATE TRIGGER IF NOT EXISTS entries_size_insert AFTER INSERT ON entries BEGIN
+    UPDATE cache_size SET bytes = bytes + new.size WHERE id = 0;
+END;
+CREATE TRIGGER IF NOT EXISTS entries_size_delete AFTER DELETE ON entries BEGIN
+    UPDATE cache_size SET bytes = bytes - old.size WHERE id = 0;
+END;
+CREATE TRIGGER IF NOT EXISTS entries_size_update AFTER UPDATE OF size ON entries BEGIN
+    UPDATE cache_size SET bytes = bytes - old.size + new.size WHERE id = 0;
+END;
+"""
+
+# Reads refresh an entry's LRU position at most this often, so hot keys do
+# not turn every read into a write.
+_ACCESS_REFRESH_SECONDS = 60.0
+# Eviction goes below the budget by this fraction so it does not run on
+# every subsequent write.
+_EVICT_LOW_WATER = 0.9
+
+
+def _parse_max_bytes() -> int:
+    raw = os.getenv("PREDICTION_CACHE_MAX_BYTES", str(256 * 1024 * 1024))
+    try:
+        return max(1, int(raw))
+    except ValueError:
+        logger.warning("Invalid PREDICTION_CACHE_MAX_BYTES=%r — defaulting to 256 MiB", raw)
+        return 256 * 1024 * 1024
+
+
 class PredictionCache:
     """Cache for expensive prediction calculations with TTL"""
-    
-    def __init__(self, cache_dir: str = "prediction_cache", ttl_hours: int = 6):
+
+    def __init__(self, cache_dir: str = "prediction_cache", ttl_hours: int = 6,
+                 max_bytes: Optional[int] = None):
         self.cache_dir = cache_dir
         self.ttl_seconds = ttl_hours * 3600
+        self.max_bytes = max_bytes if max_bytes is not None else _parse_max_bytes()
         os.makedirs(cache_dir, exist_ok=True)
-        
+        self.db_path = os.path.join(cache_dir, DB_FILENAME)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, timeout=30.0, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._migrate_json_files()
+
     def _get_cache_key(self, lat: float, lon: float, season: str, hour: int) -> str:
         """Generate cache key for prediction parameters"""
         # Round coordinates to reduce cache misses for nearby locations
         lat_rounded = round(lat, 4)  # ~11 meter precision
         lon_rounded = round(lon, 4)
         return f"{lat_rounded}_{lon_rounded}_{season}_{hour}"
-    
-    def _get_cache_path(self, cache_key: str) -> str:
-        """Get file path for cache key"""
-        return os.path.join(self.cache_dir, f"{cache_key}.json")
-    
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
     def get(self, lat: float, lon: float, season: str, hour: int) -> Optional[Dict[str, Any]]:
         """Retrieve cached prediction if available and fresh"""
         try:
             cache_key = self._get_cache_key(lat, lon, season, hour)
-            cache_path = self._get_cache_path(cache_key)
-            
-            if not os.path.exists(cache_path):
-                return None
-                
-            # Check if cache is still fresh
-            file_age = time.time() - os.path.getmtime(cache_path)
-            if file_age > self.ttl_seconds:
-                os.remove(cache_path)
-                logger.info(f"Removed expired cache for {cache_key}")
-                return None
-                
-            with open(cache_path, 'r') as f:
-                cached_data = json.load(f)
-                
+            now = time.time()
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT payload, expires_at, last_access FROM entries WHERE cache_key = ?", (cache_key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                payload, expires_at, last_access = row
+                if expires_at <= now:
+                    self._conn.execute(
+                        "DELETE FROM entries WHERE cache_key = ? AND expires_at <= ?", (cache_key, now)
+                    )
+                    logger.info(f"Removed expired cache for {cache_key}")
+                    return None
+                if now - last_access > _ACCESS_REFRESH_SECONDS:
+                    self._conn.execute(
+                        "UPDATE entries SET last_access = ? WHERE cache_key = ?", (now, cache_key)
+                    )
+
+            cached_data = json.loads(zlib.decompress(payload))
             logger.info(f"Using cached prediction for {cache_key}")
             return cached_data
-            
+
         except Exception as e:
             logger.warning(f"Failed to read cache: {e}")
             return None
-    
+
     def set(self, lat: float, lon: float, season: str, hour: int, prediction_data: Dict[str, Any]):
         """Store prediction in cache"""
         try:
             cache_key = self._get_cache_key(lat, lon, season, hour)
-            cache_path = self._get_cache_path(cache_key)
-            
+
             # Add timestamp to cached data
             cached_data = {
                 **prediction_data,
                 'cached_at': datetime.now().isoformat(),
                 'cache_key': cache_key
             }
-            
-            with open(cache_path, 'w') as f:
-                json.dump(cached_data, f, indent=2, default=str)
-                
+            payload = zlib.compress(json.dumps(cached_data, default=str).encode("utf-8"))
+            now = time.time()
+
+            with self._lock:
+                self._conn.execute("BEGIN IMMEDIATE")
+                try:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO entries "
+                        "(cache_key, payload, size, created_at, expires_at, last_access) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        (cache_key, payload, len(payload), now, now + self.ttl_seconds, now),
+                    )
+                    self._evict_over_budget(now)
+                    self._conn.execute("COMMIT")
+                except Exception:
+                    self._conn.execute("ROLLBACK")
+                    raise
+
             logger.info(f"Cached prediction for {cache_key}")
-            
+
         except Exception as e:
             logger.warning(f"Failed to write cache: {e}")
-    
-    def clear_expired(self):
-        """Remove all expired cache files"""
+
+    def _total_bytes(self) -> int:
+        return self._conn.execute("SELECT bytes FROM cache_size WHERE id = 0").fetchone()[0]
+
+    def _evict_over_budget(self, now: float) -> int:
+        """Drop expired, then least recently used, entries; caller holds a write transaction"""
+        if self._total_bytes() <= self.max_bytes:
+            return 0
+        removed = self._conn.execute("DELETE FROM entries WHERE expires_at <= ?", (now,)).rowcount
+        excess = self._total_bytes() - int(self.max_bytes * _EVICT_LOW_WATER)
+        if excess > 0:
+            # Oldest entries whose running size total reaches the excess.
+            removed += self._conn.execute(
+                "DELETE FROM entries WHERE cache_key IN ("
+                " SELECT cache_key FROM ("
+                "  SELECT cache_key, size,"
+                "   SUM(size) OVER (ORDER BY last_access, cache_key ROWS UNBOUNDED PRECEDING) AS running"
+                "  FROM entries)"
+                " WHERE running - size < ?)",
+                (excess,),
+            ).rowcount
+        if removed:
+            logger.info(f"Evicted {removed} prediction cache entries to stay under {self.max_bytes} bytes")
+        return removed
+
+    def clear_expired(self) -> int:
+        """Remove all expired cache entries"""
         try:
-            current_time = time.time()
-            removed_count = 0
-            
-            for filename in os.listdir(self.cache_dir):
-                if filename.endswith('.json'):
-                    filepath = os.path.join(self.cache_dir, filename)
-                    file_age = current_time - os.path.getmtime(filepath)
-                    if file_age > self.ttl_seconds:
-                        os.remove(filepath)
-                        removed_count += 1
-                        
+            with self._lock:
+                removed_count = self._conn.execute(
+                    "DELETE FROM entries WHERE expires_at <= ?", (time.time(),)
+                ).rowcount
+
             if removed_count > 0:
-                logger.info(f"Removed {removed_count} expired cache files")
-                
+                logger.info(f"Removed {removed_count} expired cache entries")
+            return removed_count
+
         except Exception as e:
             logger.warning(f"Failed to clear expired cache: {e}")
+            return 0
+
+    def clear(self) -> None:
+        """Remove every cache entry"""
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+
+    def stats(self) -> Dict[str, Any]:
+        """Entry count and payload bytes against the budget"""
+        with self._lock:
+            entries, expired = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(expires_at <= ?), 0) FROM entries", (time.time(),)
+            ).fetchone()
+            total_bytes = self._total_bytes()
+        return {
+            "entries": entries,
+            "expired_entries": expired,
+            "bytes": total_bytes,
+            "max_bytes": self.max_bytes,
+        }
+
+    def _migrate_json_files(self) -> int:
+        """Import ``<key>.json`` files from the old directory layout once"""
+        marker = "migrated_json_files"
+        with self._lock:
+            if self._conn.execute("SELECT 1 FROM cache_meta WHERE key = ?", (marker,)).fetchone():
+                return 0
+        rows = []
+        migrated_paths = []
+        now = time.time()
+        for filename in os.listdir(self.cache_dir):
+            if not filename.endswith('.json'):
+                continue
+            filepath = os.path.join(self.cache_dir, filename)
+            try:
+                mtime = os.path.getmtime(filepath)
+                if now - mtime > self.ttl_seconds:
+                    migrated_paths.append(filepath)  # expired, nothing to import
+                    continue
+                with open(filepath, 'rb') as f:
+                    raw = f.read()
+                json.loads(raw)
+                payload = zlib.compress(raw)
+                rows.append((filename[:-len('.json')], payload, len(payload), mtime, mtime + self.ttl_seconds, mtime))
+                migrated_paths.append(filepath)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Skipping unreadable cache file {filename}: {e}")
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                # Another worker may have finished the import meanwhile.
+                if self._conn.execute("SELECT 1 FROM cache_meta WHERE key = ?", (marker,)).fetchone():
+                    self._conn.execute("ROLLBACK")
+                    return 0
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO entries "
+                    "(cache_key, payload, size, created_at, expires_at, last_access) VALUES (?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+                self._evict_over_budget(now)
+                self._conn.execute(
+                    "INSERT INTO cache_meta (key, value) VALUES (?, ?)", (marker, str(now))
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        for filepath in migrated_paths:
+            try:
+                os.remove(filepath)
+            except OSError:
+                pass
+        if migrated_paths:
+            logger.info(f"Migrated {len(rows)} cached predictions from {len(migrated_paths)} JSON files")
+        return len(rows)
 
-# Global cache instance
-_prediction_cache = PredictionCache()
+# Global cache instance, created on first use and again in a forked worker
+# so processes never share a SQLite connection.
+_prediction_cache: Optional[PredictionCache] = None
+_prediction_cache_pid: Optional[int] = None
+_prediction_cache_lock = threading.Lock()
 
 def get_prediction_cache() -> PredictionCache:
     """Get the global prediction cache instance"""
-    return _prediction_cache
+    global _prediction_cache, _prediction_cache_pid
+    with _prediction_cache_lock:
+        if _prediction_cache is None or _prediction_cache_pid != os.getpid():
+            _prediction_cache = PredictionCache()
+            _prediction_cache_pid = os.getpid()
+        return _prediction_cache
@@ -0,0 +1,186 @@
+"""Job listing and progress event stream shared by max-accuracy and hotspot jobs.
+
+``GET /jobs`` lists recently updated jobs of both kinds straight from the
+job registry, newest first, optionally filtered by kind and state.
+
+``GET /jobs/{job_id}/events`` is a server-sent events stream: one
+``status`` event per progress update, pushed as soon as the job's status
+board records it, and a keep-alive comment while the job is quiet. The
+stream ends after the first terminal status, so clients fetch the report
+exactly once instead of polling for it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+
+from backend.routers.max_accuracy_router import (
+    STALE_JOB_MINUTES,
+    _JOB_ID_PATTERN,
+    _is_job_stale,
+    get_status_store,
+)
+from backend.services.hotspot import HotspotJob, get_hotspot_job_service
+from backend.services.hotspot.job_service import HOTSPOT_TERMINAL_STATES
+from backend.services.job_registry import get_job_registry
+from backend.services.job_status_store import JobUpdateNotifier
+
+logger = logging.getLogger(__name__)
+
+
+def _parse_keepalive_seconds() -> float:
+    raw = os.getenv("JOB_EVENTS_KEEPALIVE_SECONDS", "15")
+    try:
+        value = float(raw)
+        if value <= 0:
+            raise ValueError("must be positive")
+        return value
+    except ValueError:
+        logger.warning(
+            "Invalid JOB_EVENTS_KEEPALIVE_SECONDS=%r — defaulting to 15 seconds", raw
+        )
+        return 15.0
+
+
+KEEPALIVE_SECONDS = _parse_keepalive_seconds()
+# Upper bound between status re-reads when no in-process notification
+# arrives — covers jobs whose worker lives in another process and only
+# publishes through the on-disk status file.
+RECHECK_SECONDS = 2.0
+
+
+jobs_router = APIRouter(tags=["jobs"])
+
+
+def _hotspot_status(job: HotspotJob) -> Dict[str, Any]:
+    """Project a HotspotJob onto the max-accuracy status shape."""
+    return {
+        "job_id": job.job_id,
+        "kind": "hotspot",
+        "state": job.status,
+        "stage": job.message,
+        "payload": {
+            "completed": job.completed,
+            "total": job.total,
+            "error": job.error,
+            "report_path": job.report_path,
+            "map_path": job.map_path,
+            "provisional": job.provisional,
+        },
+        "updated_at": job.updated_at,
+    }
+
+
+def _max_accuracy_status(job_id: str) -> Optional[Dict[str, Any]]:
+    status = get_status_store().get(job_id)
+    if status is None:
+        return None
+    status = dict(status)
+    status["kind"] = "max_accuracy"
+    if _is_job_stale(status):
+        # Informational only, like GET /report: the worker is not told.
+        status["state"] = "stale"
+        status["payload"] = {
+            **(status.get("payload") or {}),
+            "error": (
+                f"Job exceeded stale threshold of {STALE_JOB_MINUTES} "
+                "minutes without completion"
+            ),
+        }
+    return status
+
+
+def _resolve_job(
+    job_id: str,
+) -> Tuple[Callable[[], Optional[Dict[str, Any]]], JobUpdateNotifier, frozenset]:
+    """Return (status reader, notifier, terminal states) for *job_id*."""
+    if _JOB_ID_PATTERN.fullmatch(job_id):
+        store = get_status_store()
+        if store.get(job_id) is None:
+            raise HTTPException(status_code=404, detail="Job not found")
+        terminal = store.terminal_states | {"stale"}
+        return (lambda: _max_accuracy_status(job_id)), store.updates, terminal
+
+    service = get_hotspot_job_service()
+    if service.get_job(job_id) is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    def _read() -> Optional[Dict[str, Any]]:
+        job = service.get_job(job_id)
+        return _hotspot_status(job) if job else None
+
+    return _read, service.updates, HOTSPOT_TERMINAL_STATES
+
+
+def _format_event(event: str, data: Dict[str, Any], event_id: int) -> str:
+    return f"id: {event_id}\nevent: {event}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n"
+
+
+async def _status_events(
+    request: Request,
+    job_id: str,
+    read_status: Callable[[], Optional[Dict[str, Any]]],
+    updates: JobUpdateNotifier,
+    terminal_states: frozenset,
+) -> AsyncIterator[str]:
+    changed = updates.subscribe(job_id)
+    loop = asyncio.get_running_loop()
+    event_id = 0
+    last_sent: Optional[str] = None
+    last_write = loop.time()
+    try:
+        while True:
+            changed.clear()
+            status = read_status()
+            if status is None:
+                yield _format_event("status", {"job_id": job_id, "state": "error",
+                                               "payload": {"error": "Job not found"}}, event_id + 1)
+                return
+            encoded = json.dumps(status, sort_keys=True, default=str)
+            if encoded != last_sent:
+                event_id += 1
+                last_sent = encoded
+                last_write = loop.time()
+                yield _format_event("status", status, event_id)
+            if status.get("state") in terminal_states:
+                return
+            if await request.is_disconnected():
+                return
+            try:
+                await asyncio.wait_for(changed.wait(), timeout=RECHECK_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+            if loop.time() - last_write >= KEEPALIVE_SECONDS:
+                last_write = loop.time()
+                yield ": keep-alive\n\n"
+    finally:
+        updates.unsubscribe(job_id, changed)
+
+
+@jobs_router.get("/jobs")
+async def list_jobs(
+    kind: Optional[str] = Query(None, pattern="^(hotspot|max_accuracy)$"),
+    state: Optional[List[str]] = Query(None),
+    limit: int = Query(50, ge=1, le=500),
+) -> Dict[str, Any]:
+    """Recently updated jobs (id, kind, state, timestamps) from the registry."""
+    jobs = get_job_registry().list_recent(kind=kind, states=state, limit=limit)
+    return {"jobs": jobs, "count": len(jobs)}
+
+
+@jobs_router.get("/jobs/{job_id}/events")
+async def stream_job_events(job_id: str, request: Request) -> StreamingResponse:
+    """Server-sent events stream of a max-accuracy or hotspot job's progress."""
+    read_status, updates, terminal_states = _resolve_job(job_id)
+    return StreamingResponse(
+        _status_events(request, job_id, read_status, updates, terminal_states),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import copy
+import hashlib
 import json
 import logging
 import os
@@ -8,16 +8,24 @@ import re
 import socket
 import shutil
 import threading
+import time
 import uuid
+from collections import OrderedDict
 from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel, Field, model_validator
 
 from backend.max_accuracy import MaxAccuracyConfig, MaxAccuracyPipeline
+from backend.max_accuracy.cancellation import CancellationToken
+from backend.max_accuracy.candidate_store import CANDIDATES_DIRNAME, query_candidates, write_candidates
+from backend.max_accuracy.worker import ProcessJobRunner
+from backend.services.hotspot import get_hotspot_job_service
+from backend.services.job_registry import get_job_registry
+from backend.services.job_status_store import JobStatusStore
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +49,26 @@ def _parse_stale_minutes() -> int:
 STALE_JOB_MINUTES = _parse_stale_minutes()
 
 
+def _parse_deadline_minutes() -> float:
+    raw = os.getenv("MAX_ACCURACY_JOB_DEADLINE_MINUTES", str(STALE_JOB_MINUTES))
+    try:
+        value = float(raw)
+        if value < 0:
+            raise ValueError("must be non-negative")
+        return value
+    except ValueError:
+        logger.warning(
+            "Invalid MAX_ACCURACY_JOB_DEADLINE_MINUTES=%r — defaulting to %s minutes",
+            raw, STALE_JOB_MINUTES,
+        )
+        return float(STALE_JOB_MINUTES)
+
+
+# Runs are cancelled cooperatively once they exceed this many minutes
+# from submission (0 disables the deadline).
+JOB_DEADLINE_MINUTES = _parse_deadline_minutes()
+
+
 def _parse_max_workers() -> int:
     raw = os.getenv("MAX_ACCURACY_MAX_WORKERS", "2")
     try:
@@ -86,10 +114,71 @@ _MAX_ACCURACY_EXECUTOR = ThreadPoolExecutor(
 # scope (without this, the only reference is the add_done_callback
 # closure — fragile if the closure is dropped).
 _INFLIGHT_FUTURES: Dict[str, "Future[None]"] = {}
+_CANCEL_TOKENS: Dict[str, CancellationToken] = {}
 _INFLIGHT_LOCK = threading.Lock()
 _MAX_INFLIGHT = _parse_max_inflight()
 
 
+def _parse_execution_mode() -> str:
+    raw = os.getenv("MAX_ACCURACY_EXECUTION_MODE", "thread").strip().lower()
+    if raw not in {"thread", "process"}:
+        logger.warning(
+            "Invalid MAX_ACCURACY_EXECUTION_MODE=%r — defaulting to 'thread'", raw
+        )
+        return "thread"
+    return raw
+
+
+def _parse_worker_max_jobs() -> int:
+    raw = os.getenv("MAX_ACCURACY_WORKER_MAX_JOBS", "4")
+    try:
+        value = int(raw)
+        if value <= 0:
+            raise ValueError("must be positive")
+        return value
+    except ValueError:
+        logger.warning(
+            "Invalid MAX_ACCURACY_WORKER_MAX_JOBS=%r — defaulting to 4", raw
+        )
+        return 4
+
+
+# In 'process' mode the executor threads above only orchestrate: each
+# pipeline runs in a spawned worker process (recycled after
+# MAX_ACCURACY_WORKER_MAX_JOBS runs) so CPU-bound scoring never holds the
+# API process's GIL. Progress is relayed back into the status store.
+EXECUTION_MODE = _parse_execution_mode()
+_PROCESS_RUNNER: Optional[ProcessJobRunner] = (
+    ProcessJobRunner(_parse_max_workers(), _parse_worker_max_jobs())
+    if EXECUTION_MODE == "process"
+    else None
+)
+
+
+def _parse_reuse_minutes() -> float:
+    raw = os.getenv("MAX_ACCURACY_REUSE_MINUTES", "60")
+    try:
+        value = float(raw)
+        if value < 0:
+            raise ValueError("must be non-negative")
+        return value
+    except ValueError:
+        logger.warning(
+            "Invalid MAX_ACCURACY_REUSE_MINUTES=%r — defaulting to 60 minutes", raw
+        )
+        return 60.0
+
+
+# Identical submissions (same fingerprint) attach to the job already in
+# flight, and reuse a completed job's report for REUSE_WINDOW_MINUTES
+# (0 disables reuse of completed results). Both maps are guarded by
+# _INFLIGHT_LOCK.
+REUSE_WINDOW_MINUTES = _parse_reuse_minutes()
+_RECENT_RESULTS_MAX = 256
+_INFLIGHT_BY_FINGERPRINT: Dict[str, str] = {}
+_RECENT_RESULTS: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+
+
 max_accuracy_router = APIRouter(tags=["property-hotspots", "max-accuracy"])
 
 
@@ -110,6 +199,8 @@ class MaxAccuracyConfigOverrides(BaseModel):
     min_per_quadrant: Optional[int] = Field(None, ge=0, le=20)
     enable_tiling: Optional[bool] = None
     tile_size_px: Optional[int] = Field(None, ge=256, le=8192)
+    streaming_top_k: Optional[bool] = None
+    terrain_source: Optional[str] = Field(None, pattern="^(dem|pyramid)$")
     # Bedding identification thresholds
     bedding_min_shelter: Optional[float] = Field(None, ge=0.0, le=1.0)
     bedding_min_bench: Optional[float] = Field(None, ge=0.0, le=1.0)
@@ -149,11 +240,25 @@ class MaxAccuracyRequest(BaseModel):
     config: Optional[MaxAccuracyConfigOverrides] = None
 
 
+class MaxAccuracyCandidatesResponse(BaseModel):
+    success: bool
+    job_id: Optional[str] = None
+    total: int = 0
+    offset: int = 0
+    limit: int = 0
+    candidates: List[Dict[str, Any]] = Field(default_factory=list)
+    error: Optional[str] = None
+
+
 class MaxAccuracyResponse(BaseModel):
     success: bool
     report: Optional[Dict[str, Any]] = None
     job_id: Optional[str] = None
     error: Optional[str] = None
+    reused: Optional[str] = Field(
+        None,
+        description="'in_flight' or 'cached' when an identical earlier request was reused",
+    )
 
 
 def _resolve_jobs_dir() -> Path:
@@ -164,45 +269,41 @@ def _resolve_jobs_dir() -> Path:
     return jobs_dir
 
 
-def _cleanup_old_jobs(max_age_days: int = JOB_RETENTION_DAYS) -> None:
-    """Delete job directories older than *max_age_days* from both
-    max_accuracy_jobs and the legacy hotspot_jobs folder."""
-    cutoff = datetime.now(timezone.utc) - timedelta(days=max_age_days)
-    dirs_to_scan: list[Path] = [_resolve_jobs_dir()]
-
-    # Also clean the legacy hotspot_jobs directory
+def _resolve_hotspot_jobs_dir() -> Path:
     base_dir = Path(__file__).resolve().parents[2]
-    hotspot_dir = base_dir / Path(os.getenv("HOTSPOT_JOBS_DIR", "data/hotspot_jobs"))
-    if hotspot_dir.exists():
-        dirs_to_scan.append(hotspot_dir)
-
-    removed = 0
-    removed_ids: list[str] = []
-    for parent in dirs_to_scan:
-        if not parent.is_dir():
-            continue
-        for child in parent.iterdir():
-            if not child.is_dir():
-                continue
-            try:
-                mtime = datetime.fromtimestamp(child.stat().st_mtime, tz=timezone.utc)
-                if mtime < cutoff:
-                    shutil.rmtree(child, ignore_errors=True)
-                    removed += 1
-                    removed_ids.append(child.name)
-            except OSError:
-                logger.debug("Job cleanup: failed to inspect/remove %s", child, exc_info=True)
-    if removed_ids:
-        with _STATUS_LOCKS_GUARD:
-            for jid in removed_ids:
-                _STATUS_LOCKS.pop(jid, None)
-    if removed:
-        logger.info("Job cleanup: removed %d job directories older than %d days", removed, max_age_days)
+    return base_dir / Path(os.getenv("HOTSPOT_JOBS_DIR", "data/hotspot_jobs"))
+
+
+def _cleanup_old_jobs(max_age_days: int = JOB_RETENTION_DAYS) -> None:
+    """Delete jobs not updated for *max_age_days* from the job registry and
+    remove their directories from max_accuracy_jobs / hotspot_jobs."""
+    expired = get_job_registry().delete_older_than(max_age_days * 86400.0)
+    if not expired:
+        return
+    jobs_dirs = {"max_accuracy": _resolve_jobs_dir(), "hotspot": _resolve_hotspot_jobs_dir()}
+    for jid, kind in expired:
+        parent = jobs_dirs.get(kind)
+        if parent is not None:
+            shutil.rmtree(parent / jid, ignore_errors=True)
+        if kind == "hotspot":
+            get_hotspot_job_service().forget_job(jid)
+        else:
+            _STATUS_STORE.forget(jid)
+    logger.info("Job cleanup: removed %d jobs older than %d days", len(expired), max_age_days)
+
+
+def shutdown_workers() -> None:
+    """Stop max-accuracy worker processes (process execution mode)."""
+    if _PROCESS_RUNNER is not None:
+        _PROCESS_RUNNER.shutdown()
 
 
 def run_startup_cleanup_jobs() -> None:
-    """Cleanup retained jobs at service startup."""
+    """Register pre-registry job directories once, then cleanup retained jobs."""
     try:
+        registry = get_job_registry()
+        registry.import_legacy_jobs("max_accuracy", _resolve_jobs_dir(), "status.json")
+        registry.import_legacy_jobs("hotspot", _resolve_hotspot_jobs_dir(), "job_state.json")
         _cleanup_old_jobs()
     except Exception:
         logger.debug("Max-accuracy startup cleanup failed", exc_info=True)
@@ -221,10 +322,83 @@ def _build_pipeline(request: MaxAccuracyRequest) -> tuple[MaxAccuracyPipeline, l
     return MaxAccuracyPipeline(config), corners
 
 
-def _read_status(job_id: str) -> Optional[Dict[str, Any]]:
-    status_path = _resolve_jobs_dir() / job_id / "status.json"
-    if not status_path.exists():
+def _normalize_corners(corners: List[Corner]) -> List[Tuple[float, float]]:
+    """Round to ~0.1 m, drop a closing vertex, and pick a canonical start
+    vertex and winding so the same polygon always normalizes the same way."""
+    ring = [(round(c.lat, 6), round(c.lon, 6)) for c in corners]
+    if len(ring) > 1 and ring[0] == ring[-1]:
+        ring = ring[:-1]
+    if not ring:
+        return ring
+
+    def _rotated(seq: List[Tuple[float, float]]) -> List[Tuple[float, float]]:
+        start = seq.index(min(seq))
+        return seq[start:] + seq[:start]
+
+    return min(_rotated(ring), _rotated(ring[::-1]))
+
+
+def _normalize_date_time(value: str) -> str:
+    try:
+        dt = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+    except ValueError:
+        return value.strip()
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt.isoformat()
+
+
+def _request_fingerprint(request: MaxAccuracyRequest) -> str:
+    """Stable hash of everything that influences a max-accuracy report."""
+    overrides = request.config.model_dump(exclude_none=True) if request.config else {}
+    key = {
+        "corners": _normalize_corners(request.corners),
+        "date_time": _normalize_date_time(request.date_time),
+        "season": request.season.strip().lower(),
+        "hunting_pressure": request.hunting_pressure.strip().lower(),
+        "config": overrides,
+    }
+    encoded = json.dumps(key, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _report_path(job_id: str) -> Path:
+    return _resolve_jobs_dir() / job_id / "max_accuracy_report.json"
+
+
+def _remember_result(fingerprint: str, job_id: str) -> None:
+    if REUSE_WINDOW_MINUTES <= 0:
+        return
+    with _INFLIGHT_LOCK:
+        _RECENT_RESULTS[fingerprint] = (job_id, time.time())
+        _RECENT_RESULTS.move_to_end(fingerprint)
+        while len(_RECENT_RESULTS) > _RECENT_RESULTS_MAX:
+            _RECENT_RESULTS.popitem(last=False)
+
+
+def _lookup_recent_result(fingerprint: str) -> Optional[str]:
+    """Return the job_id of a fresh completed run with this fingerprint."""
+    if REUSE_WINDOW_MINUTES <= 0:
+        return None
+    with _INFLIGHT_LOCK:
+        entry = _RECENT_RESULTS.get(fingerprint)
+        if entry is None:
+            return None
+        job_id, completed_at = entry
+        if time.time() - completed_at > REUSE_WINDOW_MINUTES * 60:
+            _RECENT_RESULTS.pop(fingerprint, None)
+            return None
+    if not _report_path(job_id).exists():
+        # Report was cleaned up or never written; forget the entry.
+        with _INFLIGHT_LOCK:
+            if _RECENT_RESULTS.get(fingerprint, (None,))[0] == job_id:
+                _RECENT_RESULTS.pop(fingerprint, None)
         return None
+    return job_id
+
+
+def _load_report(job_id: str) -> Dict[str, Any]:
+    return json.loads(_report_path(job_id).read_text(encoding="utf-8"))
 
 
 _JOB_ID_PATTERN = re.compile(r"^[a-f0-9]{32}$")
@@ -233,11 +407,10 @@ _JOB_ID_PATTERN = re.compile(r"^[a-f0-9]{32}$")
 def _validate_job_id(job_id: str) -> None:
     if not _JOB_ID_PATTERN.fullmatch(job_id):
         raise HTTPException(status_code=400, detail="Invalid job_id format")
-    try:
-        return json.loads(status_path.read_text(encoding="utf-8"))
-    except Exception:
-        logger.debug("Failed to read status for job %s", job_id, exc_info=True)
-        return None
+
+
+def _read_status(job_id: str) -> Optional[Dict[str, Any]]:
+    return _STATUS_STORE.get(job_id)
 
 
 def _is_job_stale(status: Dict[str, Any], stale_minutes: int = STALE_JOB_MINUTES) -> bool:
@@ -254,57 +427,68 @@ def _is_job_stale(status: Dict[str, Any], stale_minutes: int = STALE_JOB_MINUTES
     return updated < cutoff
 
 
-# One lock per job_id so concurrent writers (worker progress thread +
-# any reaper) don't truncate each other's writes mid-flight.
-_STATUS_LOCKS: Dict[str, threading.Lock] = {}
-_STATUS_LOCKS_GUARD = threading.Lock()
+def _parse_status_flush_seconds() -> float:
+    raw = os.getenv("MAX_ACCURACY_STATUS_FLUSH_SECONDS", "2")
+    try:
+        value = float(raw)
+        if value < 0:
+            raise ValueError("must be non-negative")
+        return value
+    except ValueError:
+        logger.warning(
+            "Invalid MAX_ACCURACY_STATUS_FLUSH_SECONDS=%r — defaulting to 2 seconds", raw
+        )
+        return 2.0
+
+
+# Latest status per job lives in memory; the job registry is updated at
+# most every MAX_ACCURACY_STATUS_FLUSH_SECONDS (and immediately for the
+# first and terminal states) so progress callbacks stay off the disk.
+# Other processes and restarts recover jobs from the registry, and from
+# status.json for jobs that predate it.
+_STATUS_STORE = JobStatusStore(
+    lambda job_id: _resolve_jobs_dir() / job_id / "status.json",
+    registry_for=get_job_registry,
+    kind="max_accuracy",
+    flush_interval_s=_parse_status_flush_seconds(),
+)
 
 
-def _status_lock(job_id: str) -> threading.Lock:
-    with _STATUS_LOCKS_GUARD:
-        lock = _STATUS_LOCKS.get(job_id)
-        if lock is None:
-            lock = threading.Lock()
-            _STATUS_LOCKS[job_id] = lock
-        return lock
+def _write_status(job_id: str, status: Dict[str, Any]) -> None:
+    _STATUS_STORE.put(job_id, status)
 
 
-def _write_status(job_id: str, status: Dict[str, Any]) -> None:
-    jobs_dir = _resolve_jobs_dir()
-    job_dir = jobs_dir / job_id
-    job_dir.mkdir(parents=True, exist_ok=True)
-    status_path = job_dir / "status.json"
-    tmp_path = status_path.with_suffix(".json.tmp")
-    payload = json.dumps(status, indent=2)
-    with _status_lock(job_id):
-        # Write-then-rename for atomic publish: a concurrent reader
-        # never sees a partially written status.json.
-        tmp_path.write_text(payload, encoding="utf-8")
-        os.replace(tmp_path, status_path)
+def get_status_store() -> JobStatusStore:
+    """Status board for max-accuracy jobs (also consumed by /jobs/{job_id}/events)."""
+    return _STATUS_STORE
 
 
 def _persist_report(report: Dict[str, Any], job_id: str | None = None) -> Dict[str, Any]:
+    """Write the report manifest and its columnar terrain candidates.
+
+    The manifest (inputs, stats, stands, bedding, corridors) stays JSON;
+    every terrain candidate goes to ``terrain_candidates/`` as memory-mappable
+    columns served by ``/report/{job_id}/candidates``. Only the top-level
+    dict is copied — the caller's report is never mutated.
+    """
     job_id = job_id or uuid.uuid4().hex
     jobs_dir = _resolve_jobs_dir()
     job_dir = jobs_dir / job_id
     job_dir.mkdir(parents=True, exist_ok=True)
     report_path = job_dir / "max_accuracy_report.json"
-    # Deep-copy so we never mutate the caller's dict (callers may keep a
-    # reference to the in-memory report and we trim terrain_candidates
-    # below for on-disk persistence).
-    report_payload = copy.deepcopy(report)
-
-    # Persist only the top-N terrain candidates to prevent oversized report payloads.
-    top_n = int(os.getenv("MAX_ACCURACY_REPORT_TERRAIN_TOP_N", "1000"))
-    terrain_candidates = report_payload.get("terrain_candidates")
-    if isinstance(terrain_candidates, list) and top_n > 0 and len(terrain_candidates) > top_n:
-        report_payload["terrain_candidates_total"] = len(terrain_candidates)
-        report_payload["terrain_candidates_trimmed"] = True
-        report_payload["terrain_candidates"] = terrain_candidates[:top_n]
+
+    report_payload = {k: v for k, v in report.items() if k != "terrain_candidates"}
+    terrain_candidates = report.get("terrain_candidates")
+    if isinstance(terrain_candidates, list):
+        candidates_dir = job_dir / CANDIDATES_DIRNAME
+        report_payload["terrain_candidates_total"] = write_candidates(candidates_dir, terrain_candidates)
+        report_payload["terrain_candidates_url"] = f"/property-hotspots/max-accuracy/report/{job_id}/candidates"
 
     report_payload["job_id"] = job_id
     report_payload["report_path"] = str(report_path)
-    report_path.write_text(json.dumps(report_payload, indent=2), encoding="utf-8")
+    tmp_path = report_path.with_suffix(".json.tmp")
+    tmp_path.write_text(json.dumps(report_payload, indent=2), encoding="utf-8")
+    os.replace(tmp_path, report_path)
     return report_payload
 
 
@@ -312,17 +496,26 @@ def _persist_report(report: Dict[str, Any], job_id: str | None = None) -> Dict[s
 async def analyze_max_accuracy(request: MaxAccuracyRequest) -> MaxAccuracyResponse:
     try:
         pipeline, corners = _build_pipeline(request)
+        fingerprint = _request_fingerprint(request)
+        cached_job_id = _lookup_recent_result(fingerprint)
+        if cached_job_id:
+            return MaxAccuracyResponse(
+                success=True, report=_load_report(cached_job_id), job_id=cached_job_id, reused="cached"
+            )
+
         report = pipeline.run(
             corners,
             date_time=request.date_time,
             season=request.season,
             hunting_pressure=request.hunting_pressure,
+            cancel_token=CancellationToken(deadline_s=JOB_DEADLINE_MINUTES * 60),
         )
 
         if isinstance(report, dict) and report.get("error"):
             return MaxAccuracyResponse(success=False, error=str(report.get("error")))
 
         report_payload = _persist_report(report)
+        _remember_result(fingerprint, report_payload["job_id"])
 
         return MaxAccuracyResponse(success=True, report=report_payload, job_id=report_payload.get("job_id"))
     except HTTPException:
@@ -336,8 +529,31 @@ async def analyze_max_accuracy(request: MaxAccuracyRequest) -> MaxAccuracyRespon
 async def run_max_accuracy(request: MaxAccuracyRequest) -> MaxAccuracyResponse:
     try:
         pipeline, corners = _build_pipeline(request)
+        fingerprint = _request_fingerprint(request)
+
+        cached_job_id = _lookup_recent_result(fingerprint)
+        if cached_job_id:
+            return MaxAccuracyResponse(
+                success=True, report=_load_report(cached_job_id), job_id=cached_job_id, reused="cached"
+            )
 
+        job_id = uuid.uuid4().hex
+        deadline_s = JOB_DEADLINE_MINUTES * 60
+        cancel_token = (
+            _PROCESS_RUNNER.new_token(deadline_s)
+            if _PROCESS_RUNNER is not None
+            else CancellationToken(deadline_s=deadline_s)
+        )
+        with _INFLIGHT_LOCK:
+            existing = _INFLIGHT_BY_FINGERPRINT.get(fingerprint)
+        # The status read can hit the registry or status.json, so it happens
+        # outside the lock; the fingerprint is re-checked below.
+        existing_stale = existing is not None and _is_job_stale(_read_status(existing) or {})
         with _INFLIGHT_LOCK:
+            current = _INFLIGHT_BY_FINGERPRINT.get(fingerprint)
+            # A hung worker should not capture every identical resubmission.
+            if current is not None and not (current == existing and existing_stale):
+                return MaxAccuracyResponse(success=True, job_id=current, reused="in_flight")
             if len(_INFLIGHT_FUTURES) >= _MAX_INFLIGHT:
                 raise HTTPException(
                     status_code=503,
@@ -346,8 +562,9 @@ async def run_max_accuracy(request: MaxAccuracyRequest) -> MaxAccuracyResponse:
                         "Try again shortly."
                     ),
                 )
+            _INFLIGHT_BY_FINGERPRINT[fingerprint] = job_id
+            _CANCEL_TOKENS[job_id] = cancel_token
 
-        job_id = uuid.uuid4().hex
         now = datetime.now(timezone.utc).isoformat()
         _write_status(
             job_id,
@@ -363,10 +580,20 @@ async def run_max_accuracy(request: MaxAccuracyRequest) -> MaxAccuracyResponse:
         )
 
         def _progress(stage: str, payload: Dict[str, Any]) -> None:
+            if cancel_token.cancelled and stage not in {"cancelled", "error", "complete"}:
+                # DELETE already published 'cancelled'; don't let progress
+                # emitted before the next checkpoint overwrite it. Terminal
+                # states always land: once the report is persisted the job
+                # is complete even if a DELETE raced with it.
+                return
             previous = _read_status(job_id) or {}
+            if stage in {"error", "cancelled"}:
+                state = stage
+            else:
+                state = "completed" if stage == "complete" else "running"
             status = {
                 "job_id": job_id,
-                "state": "error" if stage == "error" else ("completed" if stage == "complete" else "running"),
+                "state": state,
                 "stage": stage,
                 "payload": payload,
                 "started_at": previous.get("started_at", now),
@@ -376,19 +603,48 @@ async def run_max_accuracy(request: MaxAccuracyRequest) -> MaxAccuracyResponse:
             }
             _write_status(job_id, status)
 
+        def _pipeline_progress(stage: str, payload: Dict[str, Any]) -> None:
+            # The pipeline reports 'complete' before the report is on disk;
+            # event-stream clients fetch the report on the terminal status,
+            # so the job only completes once _persist_report has run.
+            if stage == "complete":
+                stage = "persisting_report"
+            _progress(stage, payload)
+
         def _runner() -> None:
             try:
-                report = pipeline.run(
-                    corners,
-                    date_time=request.date_time,
-                    season=request.season,
-                    hunting_pressure=request.hunting_pressure,
-                    progress_callback=_progress,
-                )
+                if _PROCESS_RUNNER is not None:
+                    report = _PROCESS_RUNNER.run(
+                        pipeline.config,
+                        corners,
+                        date_time=request.date_time,
+                        season=request.season,
+                        hunting_pressure=request.hunting_pressure,
+                        progress_callback=_pipeline_progress,
+                        cancel_token=cancel_token,
+                    )
+                else:
+                    report = pipeline.run(
+                        corners,
+                        date_time=request.date_time,
+                        season=request.season,
+                        hunting_pressure=request.hunting_pressure,
+                        progress_callback=_pipeline_progress,
+                        cancel_token=cancel_token,
+                    )
+                if isinstance(report, dict) and report.get("cancelled"):
+                    return
                 if isinstance(report, dict) and report.get("error"):
                     _progress("error", {"error": str(report.get("error"))})
                     return
+                if cancel_token.cancelled:
+                    # The deadline or a DELETE landed after the pipeline
+                    # returned; on the deadline path nothing else publishes
+                    # the terminal status, so do it here and skip the report.
+                    _progress("cancelled", {"reason": cancel_token.reason})
+                    return
                 report_payload = _persist_report(report, job_id=job_id)
+                _remember_result(fingerprint, job_id)
                 _progress("complete", {"report_path": report_payload.get("report_path")})
                 # Housekeeping: purge old jobs after each successful run
                 try:
@@ -398,13 +654,24 @@ async def run_max_accuracy(request: MaxAccuracyRequest) -> MaxAccuracyResponse:
             except Exception as exc:
                 _progress("error", {"error": str(exc)})
 
-        future = _MAX_ACCURACY_EXECUTOR.submit(_runner)
+        try:
+            future = _MAX_ACCURACY_EXECUTOR.submit(_runner)
+        except Exception:
+            with _INFLIGHT_LOCK:
+                _INFLIGHT_BY_FINGERPRINT.pop(fingerprint, None)
+                _CANCEL_TOKENS.pop(job_id, None)
+            raise
         with _INFLIGHT_LOCK:
             _INFLIGHT_FUTURES[job_id] = future
 
         def _on_done(f: "Future[None]") -> None:
             with _INFLIGHT_LOCK:
                 _INFLIGHT_FUTURES.pop(job_id, None)
+                _CANCEL_TOKENS.pop(job_id, None)
+                if _INFLIGHT_BY_FINGERPRINT.get(fingerprint) == job_id:
+                    _INFLIGHT_BY_FINGERPRINT.pop(fingerprint, None)
+            if f.cancelled():
+                return
             exc = f.exception()
             if exc is not None:
                 logger.error(
@@ -466,3 +733,93 @@ async def get_max_accuracy_report(job_id: str) -> MaxAccuracyResponse:
     except Exception as exc:
         logger.exception("MaxAccuracy /report unhandled error for job %s", job_id)
         return MaxAccuracyResponse(success=False, error=str(exc), job_id=job_id)
+
+
+def _parse_bbox(raw: Optional[str]) -> Optional[Tuple[float, float, float, float]]:
+    if raw is None or not raw.strip():
+        return None
+    try:
+        parts = [float(p) for p in raw.split(",")]
+    except ValueError:
+        parts = []
+    if len(parts) != 4 or parts[0] > parts[2] or parts[1] > parts[3]:
+        raise HTTPException(
+            status_code=400,
+            detail="bbox must be 'min_lat,min_lon,max_lat,max_lon'",
+        )
+    return parts[0], parts[1], parts[2], parts[3]
+
+
+@max_accuracy_router.get(
+    "/property-hotspots/max-accuracy/report/{job_id}/candidates",
+    response_model=MaxAccuracyCandidatesResponse,
+)
+async def get_max_accuracy_candidates(
+    job_id: str,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(500, ge=1, le=5000),
+    bbox: Optional[str] = Query(None, description="min_lat,min_lon,max_lat,max_lon"),
+    min_score: Optional[float] = Query(None, description="Minimum combined_score"),
+) -> MaxAccuracyCandidatesResponse:
+    """Page through a report's terrain candidates (best combined score first)."""
+    _validate_job_id(job_id)
+    box = _parse_bbox(bbox)
+    candidates_dir = _resolve_jobs_dir() / job_id / CANDIDATES_DIRNAME
+    if not candidates_dir.is_dir():
+        raise HTTPException(status_code=404, detail="Candidates not found")
+    try:
+        total, rows = query_candidates(
+            candidates_dir, offset=offset, limit=limit, bbox=box, min_score=min_score
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    except Exception as exc:
+        logger.exception("MaxAccuracy /candidates unhandled error for job %s", job_id)
+        return MaxAccuracyCandidatesResponse(success=False, job_id=job_id, error=str(exc))
+    return MaxAccuracyCandidatesResponse(
+        success=True, job_id=job_id, total=total, offset=offset, limit=limit, candidates=rows
+    )
+
+
+@max_accuracy_router.delete("/property-hotspots/max-accuracy/{job_id}", response_model=MaxAccuracyResponse)
+async def cancel_max_accuracy(job_id: str) -> MaxAccuracyResponse:
+    """Cancel a queued or running job and release its capacity slot now.
+
+    A queued job never starts; a running one stops at its next pipeline
+    checkpoint. The status is published as 'cancelled' immediately.
+    """
+    _validate_job_id(job_id)
+    with _INFLIGHT_LOCK:
+        token = _CANCEL_TOKENS.pop(job_id, None)
+        future = _INFLIGHT_FUTURES.pop(job_id, None)
+        for fingerprint, inflight_id in list(_INFLIGHT_BY_FINGERPRINT.items()):
+            if inflight_id == job_id:
+                _INFLIGHT_BY_FINGERPRINT.pop(fingerprint, None)
+
+    if token is None:
+        status = _read_status(job_id)
+        if not status:
+            raise HTTPException(status_code=404, detail="Job not found")
+        return MaxAccuracyResponse(
+            success=False,
+            job_id=job_id,
+            error=f"Job is not running (state: {status.get('state', 'unknown')})",
+        )
+
+    token.cancel("cancelled_by_user")
+    if future is not None:
+        future.cancel()
+    previous = _read_status(job_id) or {}
+    _write_status(
+        job_id,
+        {
+            **previous,
+            "job_id": job_id,
+            "state": "cancelled",
+            "stage": "cancelled",
+            "payload": {"reason": "cancelled_by_user"},
+            "updated_at": datetime.now(timezone.utc).isoformat(),
+        },
+    )
+    logger.info("MaxAccuracy: job %s cancelled by user", job_id)
+    return MaxAccuracyResponse(success=True, job_id=job_id)
@@ -75,26 +75,17 @@ async def import_scouting_data(
 ) -> Dict[str, Any]:
     """Import scouting observations from a GPX upload."""
 
-    try:
-        if file.size is not None and file.size > MAX_SCOUTING_IMPORT_BYTES:
-            raise HTTPException(
-                status_code=413,
-                detail=f"Uploaded file exceeds {MAX_SCOUTING_IMPORT_BYTES} byte limit",
-            )
-        file_bytes = await file.read()
-    except HTTPException:
-        raise
-    except Exception as exc:  # pragma: no cover - defensive I/O guard
-        raise HTTPException(status_code=400, detail=f"Failed to read uploaded file: {exc}")
-
-    if len(file_bytes) > MAX_SCOUTING_IMPORT_BYTES:
+    if file.size is not None and file.size > MAX_SCOUTING_IMPORT_BYTES:
         raise HTTPException(
             status_code=413,
             detail=f"Uploaded file exceeds {MAX_SCOUTING_IMPORT_BYTES} byte limit",
         )
 
+    # The spooled upload is parsed as it is read; the limit is enforced on
+    # the bytes actually read as well, since the declared size is optional.
     return await scouting_service.import_scouting_data(
-        file_bytes,
+        file.file,
         filename=file.filename,
         dry_run=dry_run,
+        max_bytes=MAX_SCOUTING_IMPORT_BYTES,
     )
@@ -3,18 +3,21 @@
 Scouting Data Manager
 
 Handles storage, retrieval, and management of scouting observation data.
-Uses JSON file storage initially with support for future database migration.
+Observations live in a SQLite database (WAL journal) with an R*Tree index on
+position and indexed type, date and confidence columns, so radius queries
+prefilter by bounding box in SQL instead of scanning every record. An
+existing JSON observations file is migrated into the database once.
 
 Author: Vermont Deer Prediction System
 Version: 1.0.0
 """
 
 import json
-import os
+import sqlite3
 import uuid
 import logging
 from datetime import datetime, timedelta, timezone
-from typing import List, Dict, Optional, Any, Tuple
+from typing import List, Dict, Optional, Any, Iterable, Tuple
 from pathlib import Path
 import math
 from threading import Lock
@@ -36,128 +39,186 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+EARTH_RADIUS_MILES = 3959
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS observations (
+    id               TEXT PRIMARY KEY,
+    lat              REAL NOT NULL,
+    lon              REAL NOT NULL,
+    observation_type TEXT NOT NULL,
+    observed_at      REAL NOT NULL,
+    confidence       INTEGER NOT NULL,
+    payload          TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_observations_type_time ON observations(observation_type, observed_at);
+CREATE INDEX IF NOT EXISTS idx_observations_time ON observations(observed_at);
+CREATE TABLE IF NOT EXISTS store_meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# R*Tree over observation positions, kept in sync by triggers on the
+# observations rowid.
+_RTREE_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS observations_rtree USING rtree(id, min_lat, max_lat, min_lon, max_lon);
+CREATE TRIGGER IF NOT EXISTS observations_rtree_insert AFTER INSERT ON observations BEGIN
+    INSERT INTO observations_rtree VALUES (new.rowid, new.lat, new.lat, new.lon, new.lon);
+END;
+CREATE TRIGGER IF NOT EXISTS observations_rtree_update AFTER UPDATE OF lat, lon ON observations BEGIN
+    UPDATE observations_rtree SET min_lat = new.lat, max_lat = new.lat, min_lon = new.lon, max_lon = new.lon
+    WHERE id = new.rowid;
+END;
+CREATE TRIGGER IF NOT EXISTS observations_rtree_delete AFTER DELETE ON observations BEGIN
+    DELETE FROM observations_rtree WHERE id = old.rowid;
+END;
+"""
+
+# Used when the SQLite build lacks the R*Tree module.
+_FALLBACK_SPATIAL_SCHEMA = """
+CREATE INDEX IF NOT EXISTS idx_observations_lat_lon ON observations(lat, lon);
+"""
+
 
 class ScoutingDataManager:
     """Manages scouting observation data storage and retrieval"""
     
-    def __init__(self, data_file: str = "data/scouting_observations.json"):
+    def __init__(self, data_file: str = "data/scouting_observations.json", db_file: Optional[str] = None):
+        """
+        Args:
+            data_file: Legacy JSON observations file, migrated on first use.
+            db_file: SQLite database; defaults to *data_file* with a
+                ``.sqlite3`` suffix.
+        """
         self.data_file = Path(data_file)
-        self.data_lock = Lock()  # Thread safety for concurrent access
+        self.db_file = Path(db_file) if db_file else self.data_file.with_suffix(".sqlite3")
+        self.data_lock = Lock()  # Serialises use of the shared connection
         self._ensure_data_directory()
-        self._initialize_data_file()
+        self._connect()
+        self._migrate_json_file()
     
     def _ensure_data_directory(self) -> None:
         """Ensure the data directory exists"""
         try:
-            self.data_file.parent.mkdir(parents=True, exist_ok=True)
-            logger.info(f"Data directory ensured: {self.data_file.parent}")
+            self.db_file.parent.mkdir(parents=True, exist_ok=True)
+            logger.info(f"Data directory ensured: {self.db_file.parent}")
         except Exception as e:
             logger.error(f"Failed to create data directory: {e}")
             raise
     
-    def _initialize_data_file(self) -> None:
-        """Initialize data file if it doesn't exist"""
-        if not self.data_file.exists():
-            try:
-                initial_data = {
-                    "version": "1.0.0",
-                    "created": datetime.now().isoformat(),
-                    "observations": [],
-                    "metadata": {
-                        "total_observations": 0,
-                        "last_updated": None
-                    }
-                }
-                with open(self.data_file, 'w') as f:
-                    json.dump(initial_data, f, indent=2)
-                logger.info(f"Initialized scouting data file: {self.data_file}")
-            except Exception as e:
-                logger.error(f"Failed to initialize data file: {e}")
-                raise
-    
-    def _load_data(self) -> Dict[str, Any]:
-        """Load data from file with error handling"""
+    def _connect(self) -> None:
+        """Open the database and create the schema"""
         try:
-            with open(self.data_file, 'r') as f:
-                data = json.load(f)
-            return data
-        except FileNotFoundError:
-            logger.warning(f"Data file not found: {self.data_file}")
-            self._initialize_data_file()
-            return self._load_data()
-        except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON in data file: {e}")
-            # Backup corrupted file and reinitialize
-            backup_file = f"{self.data_file}.backup.{int(datetime.now().timestamp())}"
-            os.rename(self.data_file, backup_file)
-            logger.info(f"Backed up corrupted file to: {backup_file}")
-            self._initialize_data_file()
-            return self._load_data()
+            self._conn = sqlite3.connect(
+                str(self.db_file), timeout=30.0, check_same_thread=False, isolation_level=None
+            )
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+            try:
+                self._conn.executescript(_RTREE_SCHEMA)
+                self.has_rtree = True
+            except sqlite3.OperationalError:
+                logger.warning("SQLite R*Tree module unavailable; using a lat/lon index for scouting queries")
+                self._conn.executescript(_FALLBACK_SPATIAL_SCHEMA)
+                self.has_rtree = False
         except Exception as e:
-            logger.error(f"Unexpected error loading data: {e}")
+            logger.error(f"Failed to open scouting database {self.db_file}: {e}")
             raise
     
-    def _save_data(self, data: Dict[str, Any]) -> None:
-        """Save data to file with atomic write"""
+    def _migrate_json_file(self) -> None:
+        """Import observations from the legacy JSON file once"""
+        marker = f"json_migrated:{self.data_file.resolve()}"
+        with self.data_lock:
+            if self._conn.execute("SELECT 1 FROM store_meta WHERE key = ?", (marker,)).fetchone():
+                return
+        if self.data_file.exists():
+            try:
+                with open(self.data_file, 'r') as f:
+                    data = json.load(f)
+            except json.JSONDecodeError as e:
+                # Left in place (and not marked migrated) so it can be repaired.
+                logger.error(f"Invalid JSON in legacy data file {self.data_file}; not migrated: {e}")
+                return
+            observations = []
+            for obs_dict in data.get("observations", []):
+                try:
+                    observations.append(ScoutingObservation.from_dict(dict(obs_dict)))
+                except Exception as e:
+                    logger.warning(f"Skipping invalid observation during migration: {e}")
+            self.add_observations(observations)
+            logger.info(f"Migrated {len(observations)} observations from {self.data_file} to {self.db_file}")
+        with self.data_lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO store_meta (key, value) VALUES (?, ?)",
+                (marker, datetime.now(timezone.utc).isoformat()),
+            )
+    
+    def _row_params(self, observation: ScoutingObservation) -> Tuple[Any, ...]:
+        payload = json.dumps(self._json_safe(observation.to_dict()))
+        return (
+            observation.id,
+            float(observation.lat),
+            float(observation.lon),
+            observation.observation_type.value,
+            observation.timestamp.timestamp(),
+            int(observation.confidence),
+            payload,
+        )
+    
+    def add_observation(self, observation: ScoutingObservation) -> str:
+        """Add a new scouting observation"""
         try:
-            # Update metadata
-            data["metadata"]["last_updated"] = datetime.now().isoformat()
-            data["metadata"]["total_observations"] = len(data.get("observations", []))
-            
-            # Atomic write using temporary file
-            temp_file = f"{self.data_file}.tmp"
-            with open(temp_file, 'w') as f:
-                json.dump(self._json_safe(data), f, indent=2)
-            
-            # Replace original file atomically
-            os.replace(temp_file, self.data_file)
-            logger.debug(f"Saved {len(data.get('observations', []))} observations to file")
-            
+            self.add_observations([observation])
+            logger.info(f"Added scouting observation: {observation.observation_type} at "
+                       f"{observation.lat:.5f}, {observation.lon:.5f}")
+            return observation.id
         except Exception as e:
-            logger.error(f"Failed to save data: {e}")
-            # Clean up temp file if it exists
-            if os.path.exists(f"{self.data_file}.tmp"):
-                os.remove(f"{self.data_file}.tmp")
+            logger.error(f"Failed to add observation: {e}")
             raise
     
-    def add_observation(self, observation: ScoutingObservation) -> str:
-        """Add a new scouting observation"""
+    def add_observations(self, observations: Iterable[ScoutingObservation]) -> List[str]:
+        """Add several observations in one transaction; returns their IDs"""
+        rows = []
+        for observation in observations:
+            # Generate unique ID if not provided
+            if not observation.id:
+                observation.id = self._generate_observation_id()
+            rows.append(self._row_params(observation))
+        if not rows:
+            return []
         with self.data_lock:
+            self._conn.execute("BEGIN IMMEDIATE")
             try:
-                # Generate unique ID if not provided
-                if not observation.id:
-                    observation.id = self._generate_observation_id()
-                
-                # Load existing data
-                data = self._load_data()
-                
-                # Convert observation to dict and add
-                obs_dict = self._json_safe(observation.to_dict())
-                data["observations"].append(obs_dict)
-                
-                # Save updated data
-                self._save_data(data)
-                
-                logger.info(f"Added scouting observation: {observation.observation_type} at "
-                           f"{observation.lat:.5f}, {observation.lon:.5f}")
-                
-                return observation.id
-                
-            except Exception as e:
-                logger.error(f"Failed to add observation: {e}")
+                self._conn.executemany(
+                    "INSERT INTO observations (id, lat, lon, observation_type, observed_at, confidence, payload) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT(id) DO UPDATE SET lat=excluded.lat, lon=excluded.lon, "
+                    "observation_type=excluded.observation_type, observed_at=excluded.observed_at, "
+                    "confidence=excluded.confidence, payload=excluded.payload",
+                    rows,
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
                 raise
+        logger.debug(f"Stored {len(rows)} observations")
+        return [row[0] for row in rows]
     
     def get_observations(self, query: ScoutingQuery) -> List[ScoutingObservation]:
         """Get observations matching query parameters"""
         try:
-            data = self._load_data()
+            sql, params = self._candidate_sql(query)
+            with self.data_lock:
+                rows = self._conn.execute(sql, params).fetchall()
             observations = []
             
-            for obs_dict in data.get("observations", []):
+            for (payload,) in rows:
                 try:
-                    obs = ScoutingObservation.from_dict(obs_dict)
+                    obs = ScoutingObservation.from_dict(json.loads(payload))
                     
-                    # Apply filters
+                    # Exact filters on the SQL-prefiltered candidates
                     if not self._matches_query(obs, query):
                         continue
                     
@@ -167,15 +228,106 @@ class ScoutingDataManager:
                     logger.warning(f"Skipping invalid observation: {e}")
                     continue
             
-            # Sort by timestamp (most recent first)
-            observations.sort(key=lambda x: x.timestamp, reverse=True)
-            
             logger.info(f"Retrieved {len(observations)} observations for query")
             return observations
         except Exception as e:
             logger.error(f"Failed to get observations: {e}")
             return []
 
+    def get_observations_in_bbox(
+        self,
+        min_lat: float,
+        max_lat: float,
+        min_lon: Optional[float] = None,
+        max_lon: Optional[float] = None,
+        *,
+        observation_types: Optional[List[ObservationType]] = None,
+        since: Optional[datetime] = None,
+    ) -> List[ScoutingObservation]:
+        """Get every observation inside a lat/lon box (no radius check).
+
+        Longitude bounds of None leave longitude unfiltered.
+        """
+        sql, params = self._select_sql(
+            (min_lat, max_lat, min_lon, max_lon),
+            observation_types=observation_types,
+            since_ts=since.timestamp() if since else None,
+        )
+        with self.data_lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        observations = []
+        for (payload,) in rows:
+            try:
+                observations.append(ScoutingObservation.from_dict(json.loads(payload)))
+            except Exception as e:
+                logger.warning(f"Skipping invalid observation: {e}")
+        return observations
+
+    def _candidate_sql(self, query: ScoutingQuery) -> Tuple[str, List[Any]]:
+        """SQL selecting observations in the query's bounding box, most recent first"""
+        since_ts = None
+        if query.days_back:
+            since_ts = (datetime.now(timezone.utc) - timedelta(days=query.days_back)).timestamp()
+        return self._select_sql(
+            self._bounding_box(query.lat, query.lon, query.radius_miles),
+            observation_types=query.observation_types,
+            min_confidence=query.min_confidence,
+            since_ts=since_ts,
+        )
+
+    def _select_sql(
+        self,
+        bbox: Tuple[float, float, Optional[float], Optional[float]],
+        *,
+        observation_types: Optional[List[ObservationType]] = None,
+        min_confidence: Optional[int] = None,
+        since_ts: Optional[float] = None,
+    ) -> Tuple[str, List[Any]]:
+        where: List[str] = []
+        params: List[Any] = []
+        min_lat, max_lat, min_lon, max_lon = bbox
+        if self.has_rtree:
+            source = "observations o JOIN observations_rtree r ON r.id = o.rowid"
+            # Overlap tests: R*Tree boxes are rounded outwards to float32,
+            # so containment tests could drop points on the box edge.
+            where.append("r.max_lat >= ? AND r.min_lat <= ?")
+            params += [min_lat, max_lat]
+            if min_lon is not None:
+                where.append("r.max_lon >= ? AND r.min_lon <= ?")
+                params += [min_lon, max_lon]
+        else:
+            source = "observations o"
+            where.append("o.lat BETWEEN ? AND ?")
+            params += [min_lat, max_lat]
+            if min_lon is not None:
+                where.append("o.lon BETWEEN ? AND ?")
+                params += [min_lon, max_lon]
+        if observation_types:
+            where.append(f"o.observation_type IN ({','.join('?' * len(observation_types))})")
+            params += [t.value for t in observation_types]
+        if min_confidence:
+            where.append("o.confidence >= ?")
+            params.append(min_confidence)
+        if since_ts is not None:
+            where.append("o.observed_at >= ?")
+            params.append(since_ts)
+        sql = f"SELECT o.payload FROM {source} WHERE {' AND '.join(where)} ORDER BY o.observed_at DESC, o.rowid"
+        return sql, params
+
+    @staticmethod
+    def _bounding_box(lat: float, lon: float, radius_miles: float) -> Tuple[float, float, Optional[float], Optional[float]]:
+        """Lat/lon box containing the radius; longitude bounds are None when the
+        box wraps the antimeridian or reaches a pole."""
+        dlat = math.degrees(radius_miles / EARTH_RADIUS_MILES) * 1.01
+        min_lat, max_lat = lat - dlat, lat + dlat
+        if min_lat <= -90 or max_lat >= 90:
+            return max(min_lat, -90.0), min(max_lat, 90.0), None, None
+        dlon = dlat / max(min(math.cos(math.radians(min_lat)), math.cos(math.radians(max_lat))), 1e-12)
+        min_lon, max_lon = lon - dlon, lon + dlon
+        if min_lon < -180 or max_lon > 180:
+            return min_lat, max_lat, None, None
+        return min_lat, max_lat, min_lon, max_lon
+
     @staticmethod
     def _json_safe(obj: Any) -> Any:
         if isinstance(obj, datetime):
@@ -189,13 +341,13 @@ class ScoutingDataManager:
     def get_observation_by_id(self, observation_id: str) -> Optional[ScoutingObservation]:
         """Get a specific observation by ID"""
         try:
-            data = self._load_data()
-            
-            for obs_dict in data.get("observations", []):
-                if obs_dict.get("id") == observation_id:
-                    return ScoutingObservation.from_dict(obs_dict)
-            
-            return None
+            with self.data_lock:
+                row = self._conn.execute(
+                    "SELECT payload FROM observations WHERE id = ?", (observation_id,)
+                ).fetchone()
+            if row is None:
+                return None
+            return ScoutingObservation.from_dict(json.loads(row[0]))
             
         except Exception as e:
             logger.error(f"Failed to get observation {observation_id}: {e}")
@@ -203,49 +355,40 @@ class ScoutingDataManager:
     
     def update_observation(self, observation: ScoutingObservation) -> bool:
         """Update an existing observation"""
-        with self.data_lock:
-            try:
-                data = self._load_data()
-                
-                # Find and update observation
-                for i, obs_dict in enumerate(data.get("observations", [])):
-                    if obs_dict.get("id") == observation.id:
-                        data["observations"][i] = observation.to_dict()
-                        self._save_data(data)
-                        logger.info(f"Updated observation: {observation.id}")
-                        return True
-                
-                logger.warning(f"Observation not found for update: {observation.id}")
-                return False
-                
-            except Exception as e:
-                logger.error(f"Failed to update observation: {e}")
-                return False
+        try:
+            params = self._row_params(observation)
+            with self.data_lock:
+                cursor = self._conn.execute(
+                    "UPDATE observations SET lat = ?, lon = ?, observation_type = ?, observed_at = ?, "
+                    "confidence = ?, payload = ? WHERE id = ?",
+                    params[1:] + params[:1],
+                )
+            if cursor.rowcount:
+                logger.info(f"Updated observation: {observation.id}")
+                return True
+            
+            logger.warning(f"Observation not found for update: {observation.id}")
+            return False
+            
+        except Exception as e:
+            logger.error(f"Failed to update observation: {e}")
+            return False
     
     def delete_observation(self, observation_id: str) -> bool:
         """Delete an observation by ID"""
-        with self.data_lock:
-            try:
-                data = self._load_data()
-                original_count = len(data.get("observations", []))
-                
-                # Filter out the observation to delete
-                data["observations"] = [
-                    obs for obs in data.get("observations", [])
-                    if obs.get("id") != observation_id
-                ]
-                
-                if len(data["observations"]) < original_count:
-                    self._save_data(data)
-                    logger.info(f"Deleted observation: {observation_id}")
-                    return True
-                else:
-                    logger.warning(f"Observation not found for deletion: {observation_id}")
-                    return False
-                
-            except Exception as e:
-                logger.error(f"Failed to delete observation: {e}")
+        try:
+            with self.data_lock:
+                cursor = self._conn.execute("DELETE FROM observations WHERE id = ?", (observation_id,))
+            if cursor.rowcount:
+                logger.info(f"Deleted observation: {observation_id}")
+                return True
+            else:
+                logger.warning(f"Observation not found for deletion: {observation_id}")
                 return False
+            
+        except Exception as e:
+            logger.error(f"Failed to delete observation: {e}")
+            return False
     
     def get_analytics(self, lat: float, lon: float, radius_miles: float = 10.0) -> ScoutingAnalytics:
         """Get analytics for observations in an area"""
@@ -349,7 +492,7 @@ class ScoutingDataManager:
     def _calculate_distance(self, lat1: float, lon1: float, lat2: float, lon2: float) -> float:
         """Calculate distance between two points in miles"""
         # Haversine formula
-        R = 3959  # Earth's radius in miles
+        R = EARTH_RADIUS_MILES
         
         lat1_rad = math.radians(lat1)
         lon1_rad = math.radians(lon1)
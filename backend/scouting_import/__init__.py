@@ -3,16 +3,19 @@
 from .contracts import (
     WaypointRecord,
     canonical_observation_payload,
+    iter_gpx_waypoints,
     load_gpx_waypoints,
     load_gpx_waypoints_from_bytes,
 )
-from .importer import ImportSummary, ScoutingImporter
+from .importer import ImportSummary, ImportTooLargeError, ScoutingImporter
 
 __all__ = [
     "WaypointRecord",
     "canonical_observation_payload",
+    "iter_gpx_waypoints",
     "load_gpx_waypoints",
     "load_gpx_waypoints_from_bytes",
     "ImportSummary",
+    "ImportTooLargeError",
     "ScoutingImporter",
 ]
@@ -5,6 +5,11 @@ functions that convert GPX waypoints into the existing
 `ScoutingObservation` schema. The actual persistence layer is handled by
 `ScoutingDataManager`; these helpers are intentionally side-effect free
 so they can be validated in isolation.
+
+GPX and KML files are read with ``ElementTree.iterparse``: records are
+yielded as their closing tag is parsed and consumed elements are detached
+from the tree, so memory stays flat however many track points or
+placemarks an export holds.
 """
 
 from __future__ import annotations
@@ -16,7 +21,7 @@ from datetime import datetime, timezone
 from enum import Enum
 from io import BytesIO
 from pathlib import Path
-from typing import Iterable, List, Optional, Tuple
+from typing import BinaryIO, Iterator, List, Optional, Tuple, Union
 from xml.etree import ElementTree as ET
 
 from backend.scouting_models import ObservationType
@@ -268,6 +273,10 @@ def _compute_track_distance(pts: Tuple[TrackPoint, ...]) -> float:
     return round(d, 1)
 
 
+# A file path, or a binary file object positioned at the start of the document.
+XmlSource = Union[Path, str, BinaryIO]
+
+
 def load_gpx_waypoints(path: Path | str) -> List[WaypointRecord]:
     """Load waypoints from a GPX file path."""
 
@@ -275,8 +284,7 @@ def load_gpx_waypoints(path: Path | str) -> List[WaypointRecord]:
     if not gpx_path.exists():
         raise FileNotFoundError(gpx_path)
 
-    tree = ET.parse(gpx_path)
-    return _waypoints_from_tree(tree)
+    return list(iter_gpx_waypoints(gpx_path))
 
 
 def load_gpx_waypoints_from_bytes(data: bytes) -> List[WaypointRecord]:
@@ -284,8 +292,7 @@ def load_gpx_waypoints_from_bytes(data: bytes) -> List[WaypointRecord]:
 
     if not data:
         return []
-    tree = ET.parse(BytesIO(data))
-    return _waypoints_from_tree(tree)
+    return list(iter_gpx_waypoints(BytesIO(data)))
 
 
 def load_gpx_tracks(path: Path | str) -> List[TrackRecord]:
@@ -293,16 +300,14 @@ def load_gpx_tracks(path: Path | str) -> List[TrackRecord]:
     gpx_path = Path(path)
     if not gpx_path.exists():
         raise FileNotFoundError(gpx_path)
-    tree = ET.parse(gpx_path)
-    return _tracks_from_tree(tree)
+    return list(iter_gpx_tracks(gpx_path))
 
 
 def load_gpx_tracks_from_bytes(data: bytes) -> List[TrackRecord]:
     """Load tracks from raw GPX bytes."""
     if not data:
         return []
-    tree = ET.parse(BytesIO(data))
-    return _tracks_from_tree(tree)
+    return list(iter_gpx_tracks(BytesIO(data)))
 
 
 def load_kml_waypoints(path: Path | str) -> List[WaypointRecord]:
@@ -312,8 +317,7 @@ def load_kml_waypoints(path: Path | str) -> List[WaypointRecord]:
     if not kml_path.exists():
         raise FileNotFoundError(kml_path)
 
-    tree = ET.parse(kml_path)
-    return _placemarks_from_tree(tree)
+    return list(iter_kml_waypoints(kml_path))
 
 
 def load_kml_waypoints_from_bytes(data: bytes) -> List[WaypointRecord]:
@@ -321,8 +325,43 @@ def load_kml_waypoints_from_bytes(data: bytes) -> List[WaypointRecord]:
 
     if not data:
         return []
-    tree = ET.parse(BytesIO(data))
-    return _placemarks_from_tree(tree)
+    return list(iter_kml_waypoints(BytesIO(data)))
+
+
+def iter_gpx_waypoints(source: XmlSource) -> Iterator[WaypointRecord]:
+    """Stream the top-level ``<wpt>`` waypoints of a GPX document."""
+    for record in _iter_gpx(source, waypoints=True, tracks=False):
+        yield record  # type: ignore[misc]
+
+
+def iter_gpx_tracks(source: XmlSource) -> Iterator[TrackRecord]:
+    """Stream the ``<trk>`` tracks of a GPX document, one record per track."""
+    for record in _iter_gpx(source, waypoints=False, tracks=True):
+        yield record  # type: ignore[misc]
+
+
+def iter_gpx_records(source: XmlSource) -> Iterator[Union[WaypointRecord, TrackRecord]]:
+    """Stream waypoints and tracks of a GPX document in document order."""
+    return _iter_gpx(source, waypoints=True, tracks=True)
+
+
+def iter_kml_waypoints(source: XmlSource) -> Iterator[WaypointRecord]:
+    """Stream point placemarks of a KML document."""
+    namespace = ""
+    for event, elem, parents in _iter_events(source):
+        if event == "start":
+            if not parents:
+                namespace = _detect_namespace(elem)
+            continue
+        if not parents:
+            continue
+        if elem.tag == f"{namespace}Placemark":
+            record = _placemark_record(elem, namespace)
+            if record is not None:
+                yield record
+        elif any(p.tag == f"{namespace}Placemark" for p in parents):
+            continue  # part of a placemark, read when it closes
+        parents[-1].remove(elem)
 
 
 def canonical_observation_payload(record: WaypointRecord) -> dict:
@@ -421,124 +460,146 @@ def canonical_observation_payload(record: WaypointRecord) -> dict:
     return payload
 
 
-def _waypoints_from_tree(tree: ET.ElementTree) -> List[WaypointRecord]:
-    root = tree.getroot()
-    namespace = _detect_namespace(root)
-    waypoints: List[WaypointRecord] = []
-    for element in root.findall(f"{namespace}wpt"):
-        waypoints.append(WaypointRecord.from_element(element))
-    return waypoints
-
-
-def _tracks_from_tree(tree: ET.ElementTree) -> List[TrackRecord]:
-    """Parse all ``<trk>`` elements from a GPX tree."""
-    root = tree.getroot()
-    ns = _detect_namespace(root)
-    tracks: List[TrackRecord] = []
-
-    for trk in root.findall(f"{ns}trk"):
-        name = ""
-        description = None
-        for child in trk:
-            tag = child.tag.split("}")[-1]
-            text = (child.text or "").strip()
-            if tag == "name" and text:
-                name = text
-            elif tag == "desc" and text:
-                description = text
+def _iter_events(source: XmlSource) -> Iterator[Tuple[str, ET.Element, List[ET.Element]]]:
+    """``iterparse`` start/end events with the list of open ancestors.
 
-        points: List[TrackPoint] = []
-        for seg in trk.findall(f"{ns}trkseg"):
-            for trkpt in seg.findall(f"{ns}trkpt"):
-                lat = float(trkpt.attrib["lat"])
-                lon = float(trkpt.attrib["lon"])
-                ele: Optional[float] = None
-                ts: Optional[datetime] = None
-                for child in trkpt:
-                    tag = child.tag.split("}")[-1]
-                    text = (child.text or "").strip()
-                    if not text:
-                        continue
-                    if tag == "ele":
-                        try:
-                            ele = float(text)
-                        except ValueError:
-                            pass
-                    elif tag == "time":
-                        ts = _parse_iso8601(text)
-                points.append(TrackPoint(lat=lat, lon=lon, elevation_m=ele, time_utc=ts))
-
-        pts_tuple = tuple(points)
-        track_type = _infer_track_type(name, description)
-        tracks.append(TrackRecord(
-            name=name,
-            track_type=track_type,
-            points=pts_tuple,
-            total_distance_m=_compute_track_distance(pts_tuple),
-            description=description,
-        ))
-
-    return tracks
-
-
-def _placemarks_from_tree(tree: ET.ElementTree) -> List[WaypointRecord]:
-    root = tree.getroot()
-    namespace = _detect_namespace(root)
-    placemarks: List[WaypointRecord] = []
-
-    for placemark in root.findall(f".//{namespace}Placemark"):
-        name = ""
-        description = None
-        timestamp = None
-        coords_text = None
-
-        for child in placemark:
-            tag = child.tag.split("}")[-1]
-            text = (child.text or "").strip()
-            if tag == "name" and text:
-                name = text
-            elif tag == "description" and text:
-                description = text
-            elif tag == "TimeStamp":
-                when = child.find(f"{namespace}when")
-                if when is not None and when.text:
-                    timestamp = _parse_iso8601(when.text.strip())
-
-        point = placemark.find(f".//{namespace}Point/{namespace}coordinates")
-        if point is not None and point.text:
-            coords_text = point.text.strip()
-
-        if not coords_text:
+    Consumers detach finished elements from ``parents[-1]`` so the partial
+    tree never grows beyond the elements still needed.
+    """
+    if isinstance(source, Path):
+        source = str(source)
+    parents: List[ET.Element] = []
+    for event, elem in ET.iterparse(source, events=("start", "end")):
+        if event == "start":
+            yield event, elem, parents
+            parents.append(elem)
+        else:
+            parents.pop()
+            yield event, elem, parents
+
+
+def _iter_gpx(
+    source: XmlSource, *, waypoints: bool, tracks: bool
+) -> Iterator[Union[WaypointRecord, TrackRecord]]:
+    ns = ""
+    points: List[TrackPoint] = []
+    for event, elem, parents in _iter_events(source):
+        depth = len(parents)
+        if event == "start":
+            if depth == 0:
+                ns = _detect_namespace(elem)
             continue
-
-        parts = [p for p in coords_text.replace("\n", " ").split() if p]
-        # Use first coordinate if multiple are present.
-        lon_lat_alt = parts[0].split(",")
-        if len(lon_lat_alt) < 2:
+        if depth == 0:
             continue
 
-        lon = float(lon_lat_alt[0])
-        lat = float(lon_lat_alt[1])
-        elevation = None
-        if len(lon_lat_alt) >= 3:
+        in_trk = parents[1].tag == f"{ns}trk" if depth >= 2 else elem.tag == f"{ns}trk"
+        if depth == 1:
+            if elem.tag == f"{ns}wpt" and waypoints:
+                yield WaypointRecord.from_element(elem)
+            elif in_trk and tracks:
+                yield _track_record(elem, tuple(points))
+                points = []
+        elif in_trk and tracks:
+            if depth == 3 and elem.tag == f"{ns}trkpt" and parents[2].tag == f"{ns}trkseg":
+                points.append(_track_point(elem))
+            elif depth == 2 and elem.tag != f"{ns}trkseg":
+                continue  # <name>/<desc> are read when the track closes
+            elif depth > 3:
+                continue  # children of a <trkpt>, read when it closes
+        elif depth > 1 and parents[1].tag == f"{ns}wpt" and waypoints:
+            continue  # children of a <wpt>, read when it closes
+        parents[-1].remove(elem)
+
+
+def _track_point(trkpt: ET.Element) -> TrackPoint:
+    lat = float(trkpt.attrib["lat"])
+    lon = float(trkpt.attrib["lon"])
+    ele: Optional[float] = None
+    ts: Optional[datetime] = None
+    for child in trkpt:
+        tag = child.tag.split("}")[-1]
+        text = (child.text or "").strip()
+        if not text:
+            continue
+        if tag == "ele":
             try:
-                elevation = float(lon_lat_alt[2])
+                ele = float(text)
             except ValueError:
-                elevation = None
-
-        placemarks.append(
-            WaypointRecord(
-                lat=lat,
-                lon=lon,
-                elevation_m=elevation,
-                time_utc=timestamp,
-                name=name,
-                description=description,
-                symbol=None,
-            )
-        )
+                pass
+        elif tag == "time":
+            ts = _parse_iso8601(text)
+    return TrackPoint(lat=lat, lon=lon, elevation_m=ele, time_utc=ts)
+
+
+def _track_record(trk: ET.Element, points: Tuple[TrackPoint, ...]) -> TrackRecord:
+    name = ""
+    description = None
+    for child in trk:
+        tag = child.tag.split("}")[-1]
+        text = (child.text or "").strip()
+        if tag == "name" and text:
+            name = text
+        elif tag == "desc" and text:
+            description = text
+
+    return TrackRecord(
+        name=name,
+        track_type=_infer_track_type(name, description),
+        points=points,
+        total_distance_m=_compute_track_distance(points),
+        description=description,
+    )
+
+
+def _placemark_record(placemark: ET.Element, namespace: str) -> Optional[WaypointRecord]:
+    name = ""
+    description = None
+    timestamp = None
+    coords_text = None
+
+    for child in placemark:
+        tag = child.tag.split("}")[-1]
+        text = (child.text or "").strip()
+        if tag == "name" and text:
+            name = text
+        elif tag == "description" and text:
+            description = text
+        elif tag == "TimeStamp":
+            when = child.find(f"{namespace}when")
+            if when is not None and when.text:
+                timestamp = _parse_iso8601(when.text.strip())
+
+    point = placemark.find(f".//{namespace}Point/{namespace}coordinates")
+    if point is not None and point.text:
+        coords_text = point.text.strip()
+
+    if not coords_text:
+        return None
+
+    parts = [p for p in coords_text.replace("\n", " ").split() if p]
+    # Use first coordinate if multiple are present.
+    lon_lat_alt = parts[0].split(",")
+    if len(lon_lat_alt) < 2:
+        return None
+
+    lon = float(lon_lat_alt[0])
+    lat = float(lon_lat_alt[1])
+    elevation = None
+    if len(lon_lat_alt) >= 3:
+        try:
+            elevation = float(lon_lat_alt[2])
+        except ValueError:
+            elevation = None
 
-    return placemarks
+    return WaypointRecord(
+        lat=lat,
+        lon=lon,
+        elevation_m=elevation,
+        time_utc=timestamp,
+        name=name,
+        description=description,
+        symbol=None,
+    )
 
 
 def _parse_iso8601(value: str) -> datetime:
@@ -596,6 +657,11 @@ __all__ = [
     "load_gpx_tracks",
     "load_gpx_tracks_from_bytes",
     "load_kml_waypoints",
+    "load_kml_waypoints_from_bytes",
+    "iter_gpx_waypoints",
+    "iter_gpx_tracks",
+    "iter_gpx_records",
+    "iter_kml_waypoints",
     "canonical_observation_payload",
     "parse_date_from_text",
 ]
@@ -2,20 +2,23 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import math
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import BinaryIO, Callable, Dict, Iterable, List, Optional, Tuple
 
 from backend.scouting_data_manager import (
+    EARTH_RADIUS_MILES,
     ScoutingDataManager,
     get_scouting_data_manager,
 )
-from backend.scouting_models import ObservationType, ScoutingObservation, ScoutingQuery
+from backend.scouting_models import ObservationType, ScoutingObservation
 
 from .contracts import (
     WaypointRecord,
     canonical_observation_payload,
+    iter_gpx_waypoints,
     load_gpx_waypoints,
     load_gpx_waypoints_from_bytes,
     load_kml_waypoints,
@@ -33,18 +36,50 @@ class ImportSummary:
     errors: List[str]
     dry_run: bool
     source: Optional[str] = None
+    duplicates_by_reason: Dict[str, int] = field(default_factory=dict)
+    bytes_read: Optional[int] = None
 
     def to_dict(self) -> dict:
         return {
             "total_waypoints": self.total_waypoints,
             "imported": self.imported,
             "duplicates": self.duplicates,
+            "duplicates_by_reason": dict(self.duplicates_by_reason),
             "errors": self.errors,
             "dry_run": self.dry_run,
             "source": self.source,
+            "bytes_read": self.bytes_read,
         }
 
 
+class ImportTooLargeError(ValueError):
+    """Raised when a streamed upload grows past its byte limit."""
+
+
+class _ProgressReader:
+    """File wrapper that counts bytes handed to the XML parser."""
+
+    def __init__(
+        self,
+        fileobj: BinaryIO,
+        progress_callback: Optional[Callable[[int], None]],
+        max_bytes: Optional[int],
+    ) -> None:
+        self._fileobj = fileobj
+        self._progress_callback = progress_callback
+        self._max_bytes = max_bytes
+        self.bytes_read = 0
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._fileobj.read(size)
+        self.bytes_read += len(chunk)
+        if self._max_bytes is not None and self.bytes_read > self._max_bytes:
+            raise ImportTooLargeError(f"Uploaded file exceeds {self._max_bytes} byte limit")
+        if chunk and self._progress_callback is not None:
+            self._progress_callback(self.bytes_read)
+        return chunk
+
+
 class ScoutingImporter:
     """Import scouting observations from historical data sources."""
 
@@ -77,6 +112,27 @@ class ScoutingImporter:
         records = load_gpx_waypoints_from_bytes(data)
         return self.import_records(records, dry_run=dry_run, source=filename)
 
+    def import_gpx_stream(
+        self,
+        fileobj: BinaryIO,
+        *,
+        filename: Optional[str] = None,
+        dry_run: bool = False,
+        progress_callback: Optional[Callable[[int], None]] = None,
+        max_bytes: Optional[int] = None,
+    ) -> ImportSummary:
+        """Import waypoints while the GPX file is still being read.
+
+        Waypoints are parsed as their elements close, so memory does not grow
+        with the size of the file's tracks. *progress_callback* receives the
+        number of bytes read so far; reading past *max_bytes* raises
+        :class:`ImportTooLargeError` before anything is stored.
+        """
+        reader = _ProgressReader(fileobj, progress_callback, max_bytes)
+        summary = self.import_records(iter_gpx_waypoints(reader), dry_run=dry_run, source=filename)
+        summary.bytes_read = reader.bytes_read
+        return summary
+
     def import_kml_file(self, path: str | Path, *, dry_run: bool = False) -> ImportSummary:
         records = load_kml_waypoints(path)
         return self.import_records(records, dry_run=dry_run, source=str(path))
@@ -107,50 +163,72 @@ class ScoutingImporter:
             source=source,
         )
 
+        observations: List[ScoutingObservation] = []
         for record in records:
             summary.total_waypoints += 1
             try:
                 payload = canonical_observation_payload(record)
-                observation = ScoutingObservation(**payload)
-
-                if self._is_duplicate(observation):
-                    summary.duplicates += 1
-                    continue
-
-                if not dry_run:
-                    self._data_manager.add_observation(observation)
-
-                summary.imported += 1
+                observations.append(ScoutingObservation(**payload))
             except Exception as exc:  # pragma: no cover - defensive
                 summary.errors.append(f"{record.name or 'waypoint'}: {exc}")
+        if not observations:
+            return summary
+
+        # Existing observations are loaded once for the whole import; every
+        # record is then checked against them and against the records
+        # accepted before it in this import.
+        index = self._build_duplicate_index(observations)
+        accepted: List[ScoutingObservation] = []
+        for observation in observations:
+            reason = index.duplicate_reason(observation)
+            if reason is not None:
+                summary.duplicates += 1
+                summary.duplicates_by_reason[reason] = summary.duplicates_by_reason.get(reason, 0) + 1
+                continue
+            index.add(observation, DUPLICATE_IN_IMPORT)
+            accepted.append(observation)
 
+        if accepted and not dry_run:
+            try:
+                self._data_manager.add_observations(accepted)
+            except Exception as exc:
+                summary.errors.append(f"Failed to store {len(accepted)} observations: {exc}")
+                return summary
+
+        summary.imported = len(accepted)
         return summary
 
     # Internal helpers -----------------------------------------------------------
 
-    def _is_duplicate(self, observation: ScoutingObservation) -> bool:
-        query = ScoutingQuery(
-            lat=observation.lat,
-            lon=observation.lon,
-            radius_miles=self.dedupe_radius_miles,
-            observation_types=[observation.observation_type],
-            days_back=self.dedupe_time_days,
+    def _build_duplicate_index(self, observations: List[ScoutingObservation]) -> "_DuplicateIndex":
+        lats = [o.lat for o in observations]
+        lons = [o.lon for o in observations]
+        pad_lat = math.degrees(self.dedupe_radius_miles / EARTH_RADIUS_MILES) * 1.01
+        min_lat, max_lat = max(min(lats) - pad_lat, -90.0), min(max(lats) + pad_lat, 90.0)
+        max_abs_lat = max(abs(min_lat), abs(max_lat))
+        pad_lon = pad_lat / max(math.cos(math.radians(max_abs_lat)), 1e-6)
+        min_lon, max_lon = min(lons) - pad_lon, max(lons) + pad_lon
+        if min_lon < -180 or max_lon > 180:
+            min_lon = max_lon = None
+
+        index = _DuplicateIndex(
+            self.dedupe_radius_miles,
+            timedelta(hours=self.dedupe_time_window_hours),
+            max_abs_lat,
+            # Same distance as the manager's get_observations radius check.
+            distance_miles=self._data_manager._calculate_distance,
         )
-
-        existing = self._data_manager.get_observations(query)
-        time_window = timedelta(hours=self.dedupe_time_window_hours)
-
-        for existing_obs in existing:
-            if existing_obs.observation_type != observation.observation_type:
-                continue
-
-            if self._time_difference(existing_obs.timestamp, observation.timestamp) > time_window:
-                continue
-
-            if self._notes_match(existing_obs, observation):
-                return True
-
-        return False
+        existing = self._data_manager.get_observations_in_bbox(
+            min_lat,
+            max_lat,
+            min_lon,
+            max_lon,
+            observation_types=sorted({o.observation_type for o in observations}, key=lambda t: t.value),
+            since=datetime.now(timezone.utc) - timedelta(days=self.dedupe_time_days),
+        )
+        for observation in existing:
+            index.add(observation, DUPLICATE_OF_EXISTING)
+        return index
 
     @staticmethod
     def _time_difference(first: datetime, second: datetime) -> timedelta:
@@ -171,4 +249,59 @@ class ScoutingImporter:
         return existing_notes == new_notes or not new_notes
 
 
-__all__ = ["ImportSummary", "ScoutingImporter"]
+DUPLICATE_OF_EXISTING = "matches_existing_observation"
+DUPLICATE_IN_IMPORT = "repeated_in_import"
+
+
+class _DuplicateIndex:
+    """Grid hash of observations keyed by (type, time bucket, lat cell, lon cell).
+
+    Cells are at least the dedupe radius wide and buckets the time window
+    long, so every possible duplicate is in the 3x3 neighbouring cells of
+    the same or an adjacent bucket.
+    """
+
+    def __init__(
+        self,
+        radius_miles: float,
+        time_window: timedelta,
+        max_abs_lat: float,
+        distance_miles: Callable[[float, float, float, float], float],
+    ) -> None:
+        self.radius_miles = radius_miles
+        self.time_window = time_window
+        self._distance_miles = distance_miles
+        self._cell_lat = max(math.degrees(radius_miles / EARTH_RADIUS_MILES), 1e-9)
+        self._cell_lon = self._cell_lat / max(math.cos(math.radians(min(max_abs_lat, 90.0))), 1e-6)
+        self._bucket_s = max(time_window.total_seconds(), 1.0)
+        self._cells: Dict[Tuple[str, int, int, int], List[Tuple[ScoutingObservation, str]]] = {}
+
+    def _key(self, observation: ScoutingObservation) -> Tuple[str, int, int, int]:
+        return (
+            observation.observation_type.value,
+            math.floor(ScoutingImporter._as_utc(observation.timestamp).timestamp() / self._bucket_s),
+            math.floor(observation.lat / self._cell_lat),
+            math.floor(observation.lon / self._cell_lon),
+        )
+
+    def add(self, observation: ScoutingObservation, origin: str) -> None:
+        self._cells.setdefault(self._key(observation), []).append((observation, origin))
+
+    def duplicate_reason(self, observation: ScoutingObservation) -> Optional[str]:
+        """Origin of the first indexed observation *observation* duplicates."""
+        obs_type, bucket, cy, cx = self._key(observation)
+        for db in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for dx in (-1, 0, 1):
+                    for other, origin in self._cells.get((obs_type, bucket + db, cy + dy, cx + dx), ()):
+                        if ScoutingImporter._time_difference(other.timestamp, observation.timestamp) > self.time_window:
+                            continue
+                        distance = self._distance_miles(other.lat, other.lon, observation.lat, observation.lon)
+                        if distance > self.radius_miles:
+                            continue
+                        if ScoutingImporter._notes_match(other, observation):
+                            return origin
+        return None
+
+
+__all__ = ["DUPLICATE_IN_IMPORT", "DUPLICATE_OF_EXISTING", "ImportSummary", "ImportTooLargeError", "ScoutingImporter"]
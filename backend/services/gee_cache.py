@@ -0,0 +1,367 @@
+"""Persistent cache of Google Earth Engine point samples.
+
+GEE answers (NDVI composites, Hansen tree cover, NLCD land cover) change on
+the scale of months or years, but each query costs seconds. Results are kept
+in one SQLite database (WAL journal) keyed by product, composite period and
+a snapped grid cell, so nearby requests on the same parcel share an entry
+and the cache survives restarts. Every product has its own TTL.
+
+``GEEResultCache.prefetch_bbox`` fills every cell of a bounding box ahead
+of time, which lets a property be analysed later without Earth Engine.
+``FixtureGEEProvider`` serves payloads from a local JSON file instead of
+Earth Engine (``GEE_FIXTURE_PATH``) for offline runs and tests; its answers
+are never written to the cache.
+
+The database path comes from ``GEE_CACHE_DB`` (default
+``data/gee_cache.sqlite3`` under the repository root) and the cell size from
+``GEE_CACHE_CELL_DEG`` (default 0.001 degrees, roughly 110 x 80 m in
+Vermont).
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import ee
+    GEE_AVAILABLE = True
+except ImportError:
+    GEE_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+_DAY = 86400.0
+
+
+@dataclass(frozen=True)
+class GEEProduct:
+    name: str
+    period: str
+    ttl_seconds: float
+
+
+# The composite period is part of the key, so moving a product to a new
+# composite simply stops matching the old rows instead of serving them.
+PRODUCTS: Dict[str, GEEProduct] = {
+    "ndvi": GEEProduct("ndvi", "2024-06-01/2024-09-30", 30 * _DAY),
+    "canopy": GEEProduct("canopy", "hansen_2023_v1_11", 365 * _DAY),
+    "landcover": GEEProduct("landcover", "nlcd_2021", 365 * _DAY),
+    # Not a GEE product, but fetched alongside it and part of the same payload.
+    "osm_disturbance": GEEProduct("osm_disturbance", "current", 30 * _DAY),
+}
+
+DEFAULT_CELL_DEG = 0.001
+# Prefetch refuses boxes larger than this many cells per product.
+MAX_PREFETCH_CELLS = 20_000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS gee_results (
+    product    TEXT NOT NULL,
+    period     TEXT NOT NULL,
+    cell_udeg  INTEGER NOT NULL,
+    cell_y     INTEGER NOT NULL,
+    cell_x     INTEGER NOT NULL,
+    payload    TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    PRIMARY KEY (product, period, cell_udeg, cell_y, cell_x)
+);
+CREATE INDEX IF NOT EXISTS idx_gee_results_expires_at ON gee_results(expires_at);
+"""
+
+
+def _parse_cell_deg() -> float:
+    raw = os.getenv("GEE_CACHE_CELL_DEG", str(DEFAULT_CELL_DEG))
+    try:
+        value = float(raw)
+        if not 0 < value <= 1:
+            raise ValueError(raw)
+        return value
+    except ValueError:
+        logger.warning("Invalid GEE_CACHE_CELL_DEG=%r — defaulting to %s", raw, DEFAULT_CELL_DEG)
+        return DEFAULT_CELL_DEG
+
+
+def _product(name: str) -> GEEProduct:
+    try:
+        return PRODUCTS[name]
+    except KeyError:
+        raise ValueError(f"Unknown GEE product {name!r}") from None
+
+
+class GEEResultCache:
+    def __init__(self, path: Path, cell_deg: Optional[float] = None) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.cell_deg = cell_deg if cell_deg is not None else _parse_cell_deg()
+        self._cell_udeg = int(round(self.cell_deg * 1_000_000))
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=30.0, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # ------------------------------------------------------------------
+    # Grid
+    # ------------------------------------------------------------------
+    def snap(self, lat: float, lon: float) -> Tuple[int, int]:
+        """Grid cell (row, column) containing the point."""
+        # The epsilon keeps 44.26 in cell 44260 despite 44.26 / 0.001 == 44259.999...
+        return (math.floor(lat / self.cell_deg + 1e-9), math.floor(lon / self.cell_deg + 1e-9))
+
+    def cell_center(self, lat: float, lon: float) -> Tuple[float, float]:
+        """Centre of the cell containing the point; cached values are sampled here."""
+        cell_y, cell_x = self.snap(lat, lon)
+        return self._center_of(cell_y, cell_x)
+
+    def _center_of(self, cell_y: int, cell_x: int) -> Tuple[float, float]:
+        return (round((cell_y + 0.5) * self.cell_deg, 7), round((cell_x + 0.5) * self.cell_deg, 7))
+
+    # ------------------------------------------------------------------
+    # Reads and writes
+    # ------------------------------------------------------------------
+    def get(self, product: str, lat: float, lon: float) -> Optional[Dict[str, Any]]:
+        spec = _product(product)
+        cell_y, cell_x = self.snap(lat, lon)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload FROM gee_results WHERE product = ? AND period = ? AND cell_udeg = ? "
+                "AND cell_y = ? AND cell_x = ? AND expires_at > ?",
+                (spec.name, spec.period, self._cell_udeg, cell_y, cell_x, time.time()),
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def set(self, product: str, lat: float, lon: float, payload: Dict[str, Any],
+            ttl_s: Optional[float] = None) -> None:
+        self.set_many(product, [(lat, lon, payload)], ttl_s=ttl_s)
+
+    def set_many(self, product: str, rows: Iterable[Tuple[float, float, Dict[str, Any]]],
+                 ttl_s: Optional[float] = None) -> int:
+        """Store ``(lat, lon, payload)`` rows of one product in a single transaction."""
+        spec = _product(product)
+        now = time.time()
+        expires_at = now + (spec.ttl_seconds if ttl_s is None else ttl_s)
+        params = []
+        for lat, lon, payload in rows:
+            cell_y, cell_x = self.snap(lat, lon)
+            params.append((spec.name, spec.period, self._cell_udeg, cell_y, cell_x,
+                           json.dumps(payload, separators=(",", ":"), default=str), now, expires_at))
+        if not params:
+            return 0
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO gee_results "
+                    "(product, period, cell_udeg, cell_y, cell_x, payload, fetched_at, expires_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    params,
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return len(params)
+
+    def clear_expired(self) -> int:
+        with self._lock:
+            return self._conn.execute("DELETE FROM gee_results WHERE expires_at <= ?", (time.time(),)).rowcount
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT product, COUNT(*), COALESCE(SUM(expires_at <= ?), 0) FROM gee_results GROUP BY product",
+                (time.time(),),
+            ).fetchall()
+        return {
+            "path": str(self.path),
+            "cell_deg": self.cell_deg,
+            "products": {name: {"entries": count, "expired": expired} for name, count, expired in rows},
+        }
+
+    # ------------------------------------------------------------------
+    # Prefetch
+    # ------------------------------------------------------------------
+    def prefetch_bbox(
+        self,
+        min_lat: float,
+        min_lon: float,
+        max_lat: float,
+        max_lon: float,
+        provider: Any,
+        products: Sequence[str] = ("ndvi", "canopy"),
+        *,
+        batch_size: int = 100,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> Dict[str, Dict[str, int]]:
+        """Fetch every missing or expired cell of the box from ``provider``.
+
+        Cells already fresh in the cache are skipped, so an interrupted run
+        can simply be repeated. Failed cells are counted and left empty.
+        ``progress_callback(done, total)`` is called after each batch.
+        """
+        if min_lat > max_lat or min_lon > max_lon:
+            raise ValueError("Bounding box minimum exceeds maximum")
+        min_y, min_x = self.snap(min_lat, min_lon)
+        max_y, max_x = self.snap(max_lat, max_lon)
+        cells = [(y, x) for y in range(min_y, max_y + 1) for x in range(min_x, max_x + 1)]
+        if len(cells) > MAX_PREFETCH_CELLS:
+            raise ValueError(f"Bounding box covers {len(cells)} cells (limit {MAX_PREFETCH_CELLS})")
+
+        summary: Dict[str, Dict[str, int]] = {}
+        total = len(cells) * len(products)
+        done = 0
+        for product in products:
+            spec = _product(product)
+            with self._lock:
+                fresh = set(self._conn.execute(
+                    "SELECT cell_y, cell_x FROM gee_results WHERE product = ? AND period = ? AND cell_udeg = ? "
+                    "AND cell_y BETWEEN ? AND ? AND cell_x BETWEEN ? AND ? AND expires_at > ?",
+                    (spec.name, spec.period, self._cell_udeg, min_y, max_y, min_x, max_x, time.time()),
+                ).fetchall())
+            counts = {"cells": len(cells), "cached": len(fresh), "fetched": 0, "failed": 0}
+            pending: List[Tuple[float, float, Dict[str, Any]]] = []
+            for index, (cell_y, cell_x) in enumerate(cells, 1):
+                if (cell_y, cell_x) not in fresh:
+                    lat, lon = self._center_of(cell_y, cell_x)
+                    try:
+                        pending.append((lat, lon, provider.fetch(product, lat, lon)))
+                    except Exception as e:
+                        counts["failed"] += 1
+                        logger.warning("GEE prefetch of %s at (%.5f, %.5f) failed: %s", product, lat, lon, e)
+                if len(pending) >= batch_size:
+                    counts["fetched"] += self.set_many(product, pending)
+                    pending = []
+                if progress_callback and index % batch_size == 0:
+                    progress_callback(done + index, total)
+            counts["fetched"] += self.set_many(product, pending)
+            done += len(cells)
+            summary[product] = counts
+            logger.info("GEE prefetch %s: %s", product, counts)
+        if progress_callback:
+            progress_callback(done, total)
+        return summary
+
+
+class EarthEngineProvider:
+    """Samples products from Earth Engine; requires an initialised ``ee`` session."""
+
+    products = ("ndvi", "canopy", "landcover")
+    data_source = "dynamic_gee_enhanced"
+    cacheable = True
+
+    def fetch(self, product: str, lat: float, lon: float) -> Dict[str, Any]:
+        if not GEE_AVAILABLE:
+            raise RuntimeError("Google Earth Engine not available")
+        point = ee.Geometry.Point([lon, lat])
+        if product == "ndvi":
+            start, end = PRODUCTS["ndvi"].period.split("/")
+            landsat = ee.ImageCollection('LANDSAT/LC08/C02/T1_L2') \
+                .filterBounds(point) \
+                .filterDate(start, end) \
+                .filter(ee.Filter.lt('CLOUD_COVER', 20)) \
+                .first()
+            ndvi = landsat.normalizedDifference(['SR_B5', 'SR_B4'])
+            value = ndvi.sample(point, 30).first().get('nd').getInfo()
+            return {"ndvi_value": float(value) if value is not None else None}
+        if product == "canopy":
+            canopy = ee.Image('UMD/hansen/global_forest_change_2023_v1_11').select('treecover2000')
+            value = canopy.sample(point, 30).first().get('treecover2000').getInfo()
+            return {"treecover2000": float(value) if value is not None else None}
+        if product == "landcover":
+            nlcd = ee.Image('USGS/NLCD_RELEASES/2021_REL/NLCD/2021').select('landcover')
+            value = nlcd.sample(point, 30).first().get('landcover').getInfo()
+            return {"nlcd_class": int(value) if value is not None else None}
+        raise ValueError(f"Earth Engine cannot serve product {product!r}")
+
+
+class FixtureGEEProvider:
+    """Serves product payloads from a local JSON file instead of Earth Engine.
+
+    The file holds per-product ``defaults`` and optional ``points``; a
+    request gets the nearest point within ``radius_deg`` that has the
+    product, otherwise the default::
+
+        {"defaults": {"ndvi": {"ndvi_value": 0.72}, "canopy": {"treecover2000": 85}},
+         "points": [{"lat": 43.31, "lon": -73.215, "canopy": {"treecover2000": 5}}]}
+    """
+
+    data_source = "gee_fixture"
+    cacheable = False
+
+    def __init__(self, fixture: Dict[str, Any], radius_deg: float = 0.01) -> None:
+        self.defaults: Dict[str, Dict[str, Any]] = dict(fixture.get("defaults") or {})
+        self.points: List[Dict[str, Any]] = list(fixture.get("points") or [])
+        self.radius_deg = radius_deg
+        names = set(self.defaults)
+        for point in self.points:
+            names.update(k for k in point if k in PRODUCTS)
+        self.products = tuple(sorted(names))
+
+    @classmethod
+    def from_file(cls, path: Path, radius_deg: float = 0.01) -> "FixtureGEEProvider":
+        with Path(path).open("r", encoding="utf-8") as fh:
+            return cls(json.load(fh), radius_deg=radius_deg)
+
+    @classmethod
+    def from_env(cls) -> Optional["FixtureGEEProvider"]:
+        """Provider for ``GEE_FIXTURE_PATH``, or None when it is unset or unreadable."""
+        raw = os.getenv("GEE_FIXTURE_PATH")
+        if not raw:
+            return None
+        try:
+            return cls.from_file(Path(raw))
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring GEE_FIXTURE_PATH=%r: %s", raw, e)
+            return None
+
+    def fetch(self, product: str, lat: float, lon: float) -> Dict[str, Any]:
+        best: Optional[Dict[str, Any]] = None
+        best_distance = self.radius_deg
+        for point in self.points:
+            if product not in point:
+                continue
+            distance = math.hypot(point["lat"] - lat, point["lon"] - lon)
+            if distance <= best_distance:
+                best, best_distance = point[product], distance
+        if best is None:
+            best = self.defaults.get(product)
+        if best is None:
+            raise KeyError(f"GEE fixture has no {product!r} payload near ({lat}, {lon})")
+        return dict(best)
+
+
+def _resolve_cache_path() -> Path:
+    base_dir = Path(__file__).resolve().parents[2]
+    path = Path(os.getenv("GEE_CACHE_DB", "data/gee_cache.sqlite3"))
+    if not path.is_absolute():
+        path = base_dir / path
+    return path
+
+
+_CACHES: Dict[Tuple[Path, int], GEEResultCache] = {}
+_CACHES_LOCK = threading.Lock()
+
+
+def get_gee_cache() -> GEEResultCache:
+    """Cache for the current ``GEE_CACHE_DB`` (one connection per path and process)."""
+    key = (_resolve_cache_path(), os.getpid())
+    with _CACHES_LOCK:
+        cache = _CACHES.get(key)
+        if cache is None:
+            cache = GEEResultCache(key[0])
+            _CACHES[key] = cache
+        return cache
@@ -2,19 +2,20 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
-
-from backend.utils.geo import haversine
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 
 def _meters_to_radians(meters: float) -> float:
     return meters / 6371000.0
 
 
-def extract_stand_points(prediction: Dict[str, Any]) -> List[Dict[str, Any]]:
-    """Pull stand-site points from a full prediction payload."""
-    stands: List[Dict[str, Any]] = []
+_CONTEXT_FIELDS = ("wind_thermal", "wind_overall", "context_summary")
+
 
+def _prediction_context(prediction: Dict[str, Any]) -> Dict[str, Optional[Dict[str, Any]]]:
+    """Prediction-level context shared by every stand of one prediction."""
     wind_thermal = prediction.get("wind_thermal_analysis") if isinstance(prediction, dict) else None
     if not isinstance(wind_thermal, dict):
         wind_thermal = None
@@ -30,7 +31,15 @@ def extract_stand_points(prediction: Dict[str, Any]) -> List[Dict[str, Any]]:
     if not isinstance(context_summary, dict):
         context_summary = None
 
-    optimized = prediction.get("optimized_points") if isinstance(prediction, dict) else None
+    return {"wind_thermal": wind_thermal, "wind_overall": wind_overall, "context_summary": context_summary}
+
+
+def _iter_stand_entries(prediction: Dict[str, Any]) -> Iterator[Tuple[Dict[str, Any], Dict[str, Any]]]:
+    """Yield (normalised stand fields, raw stand dict) for every located stand."""
+    if not isinstance(prediction, dict):
+        return
+
+    optimized = prediction.get("optimized_points")
     if isinstance(optimized, dict):
         stand_sites = optimized.get("stand_sites")
         if isinstance(stand_sites, list):
@@ -41,7 +50,7 @@ def extract_stand_points(prediction: Dict[str, Any]) -> List[Dict[str, Any]]:
                 lon = s.get("lon")
                 if lat is None or lon is None:
                     continue
-                stands.append(
+                yield (
                     {
                         "lat": float(lat),
                         "lon": float(lon),
@@ -50,14 +59,11 @@ def extract_stand_points(prediction: Dict[str, Any]) -> List[Dict[str, Any]]:
                         "source": "optimized_points.stand_sites",
                         "description": s.get("description"),
                         "confidence": s.get("confidence"),
-                        "wind_thermal": wind_thermal,
-                        "wind_overall": wind_overall,
-                        "context_summary": context_summary,
-                        "raw": s,
-                    }
+                    },
+                    s,
                 )
 
-    mba = prediction.get("mature_buck_analysis") if isinstance(prediction, dict) else None
+    mba = prediction.get("mature_buck_analysis")
     if isinstance(mba, dict):
         stand_recs = mba.get("stand_recommendations")
         if isinstance(stand_recs, list):
@@ -68,7 +74,7 @@ def extract_stand_points(prediction: Dict[str, Any]) -> List[Dict[str, Any]]:
                 lon = s.get("lon")
                 if lat is None or lon is None:
                     continue
-                stands.append(
+                yield (
                     {
                         "lat": float(lat),
                         "lon": float(lon),
@@ -77,19 +83,101 @@ def extract_stand_points(prediction: Dict[str, Any]) -> List[Dict[str, Any]]:
                         "source": "mature_buck_analysis.stand_recommendations",
                         "description": s.get("description") or s.get("reason"),
                         "confidence": s.get("confidence"),
-                        "wind_thermal": wind_thermal,
-                        "wind_overall": wind_overall,
-                        "context_summary": context_summary,
-                        "raw": s,
-                    }
+                    },
+                    s,
                 )
 
-    return stands
+
+def extract_stand_points(prediction: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Pull stand-site points from a full prediction payload."""
+    context = _prediction_context(prediction)
+    return [{**fields, **context, "raw": raw} for fields, raw in _iter_stand_entries(prediction)]
+
+
+@dataclass(slots=True)
+class StandRecord:
+    """Compact stand point; prediction context is referenced by ``context_id``.
+
+    Supports ``record["lat"]`` / ``record.get("score")`` so clustering and
+    map code can treat records and plain stand dicts alike.
+    """
+
+    lat: float
+    lon: float
+    score: float
+    strategy: Optional[str]
+    source: str
+    description: Optional[str] = None
+    confidence: Any = None
+    context_id: Optional[int] = None
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default)
+
+
+class StandContextStore:
+    """Interns prediction context blobs so each distinct blob is kept once.
+
+    Predictions of one hotspot job often return identical wind and context
+    summaries; identical blobs share one id.
+    """
+
+    def __init__(self) -> None:
+        self._blobs: List[Dict[str, Any]] = []
+        self._ids: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._blobs)
+
+    def add(self, context: Dict[str, Optional[Dict[str, Any]]]) -> Optional[int]:
+        """Store *context* (or find its twin) and return its id; None if empty."""
+        if all(context.get(k) is None for k in _CONTEXT_FIELDS):
+            return None
+        blob = {k: context.get(k) for k in _CONTEXT_FIELDS}
+        key = json.dumps(blob, sort_keys=True, default=str)
+        context_id = self._ids.get(key)
+        if context_id is None:
+            context_id = len(self._blobs)
+            self._blobs.append(blob)
+            self._ids[key] = context_id
+        return context_id
+
+    def get(self, context_id: Optional[int]) -> Dict[str, Optional[Dict[str, Any]]]:
+        if context_id is None or not 0 <= context_id < len(self._blobs):
+            return {k: None for k in _CONTEXT_FIELDS}
+        return self._blobs[context_id]
+
+    def to_report(self) -> Dict[str, Dict[str, Any]]:
+        """JSON-safe ``{id: blob}`` mapping for ``hotspot_report.json``."""
+        return {str(i): blob for i, blob in enumerate(self._blobs)}
 
 
-def stand_summary_for_report(stand: Dict[str, Any]) -> Dict[str, Any]:
-    """Create a slimmed-down stand dict for JSON reports."""
-    return {
+def extract_stand_records(prediction: Dict[str, Any], contexts: StandContextStore) -> List[StandRecord]:
+    """Like ``extract_stand_points`` but returns compact records.
+
+    The prediction's wind/context blobs go into *contexts* once and every
+    record of the prediction references them by id; the raw stand dicts and
+    the rest of the payload are not retained.
+    """
+    entries = list(_iter_stand_entries(prediction))
+    if not entries:
+        return []
+    context_id = contexts.add(_prediction_context(prediction))
+    return [StandRecord(**fields, context_id=context_id) for fields, _ in entries]
+
+
+def stand_summary_for_report(stand: Any) -> Dict[str, Any]:
+    """Create a slimmed-down stand dict for JSON reports.
+
+    Records carry their ``context_id`` instead of inlined context blobs.
+    """
+    summary = {
         "lat": float(stand.get("lat")) if stand.get("lat") is not None else None,
         "lon": float(stand.get("lon")) if stand.get("lon") is not None else None,
         "score": float(stand.get("score", 0.0) or 0.0),
@@ -97,10 +185,13 @@ def stand_summary_for_report(stand: Dict[str, Any]) -> Dict[str, Any]:
         "source": stand.get("source"),
         "description": stand.get("description"),
         "confidence": stand.get("confidence"),
-        "wind_thermal": stand.get("wind_thermal"),
-        "wind_overall": stand.get("wind_overall"),
-        "context_summary": stand.get("context_summary"),
     }
+    if isinstance(stand, StandRecord):
+        summary["context_id"] = stand.context_id
+    else:
+        for key in _CONTEXT_FIELDS:
+            summary[key] = stand.get(key)
+    return summary
 
 
 def best_site_score_0_200(*, support: int, avg_stand_score_0_10: float) -> float:
@@ -109,12 +200,41 @@ def best_site_score_0_200(*, support: int, avg_stand_score_0_10: float) -> float
     return float(max(0.0, min(200.0, s)))
 
 
+# Upper bound on pairwise-distance matrix elements held at once while finding
+# a medoid; large clusters are processed in row chunks of this many cells.
+_MEDOID_CHUNK_CELLS = 4_000_000
+
+
+def _medoid_index(lat_rad, lon_rad) -> int:
+    """Index of the point with the smallest summed haversine distance to the rest.
+
+    Distance sums are built from row chunks of the pairwise matrix so memory
+    stays bounded for dense clusters. Ties keep the first point, as before.
+    """
+    import numpy as np  # type: ignore
+
+    n = lat_rad.size
+    cos_lat = np.cos(lat_rad)
+    chunk = max(1, _MEDOID_CHUNK_CELLS // max(1, n))
+    sums = np.empty(n, dtype=float)
+    for start in range(0, n, chunk):
+        stop = min(n, start + chunk)
+        dphi = lat_rad[None, :] - lat_rad[start:stop, None]
+        dlam = lon_rad[None, :] - lon_rad[start:stop, None]
+        a = np.sin(dphi / 2.0) ** 2 + cos_lat[start:stop, None] * cos_lat[None, :] * np.sin(dlam / 2.0) ** 2
+        sums[start:stop] = (2.0 * 6_371_000.0 * np.arctan2(np.sqrt(a), np.sqrt(1.0 - a))).sum(axis=1)
+    return int(np.argmin(sums))
+
+
 def cluster_stands(
     points: List[Dict[str, Any]],
     epsilon_m: float,
     min_samples: int,
 ) -> List[Dict[str, Any]]:
-    """Cluster stand points with DBSCAN (haversine metric) and return ranked clusters."""
+    """Cluster stand points with DBSCAN (haversine metric) and return ranked clusters.
+
+    Points without coordinates (failed predictions) are ignored.
+    """
     if not points:
         return []
 
@@ -122,59 +242,84 @@ def cluster_stands(
         import numpy as np  # type: ignore
         from sklearn.cluster import DBSCAN  # type: ignore
 
+        points = [p for p in points if p.get("lat") is not None and p.get("lon") is not None]
+        if not points:
+            return []
+
         coords = np.radians(np.array([[p["lat"], p["lon"]] for p in points], dtype=float))
         clustering = DBSCAN(eps=_meters_to_radians(epsilon_m), min_samples=min_samples, metric="haversine")
-        labels = clustering.fit_predict(coords)
-
-        clusters: Dict[int, List[int]] = {}
-        for idx, label in enumerate(labels):
-            if int(label) == -1:
-                continue
-            clusters.setdefault(int(label), []).append(idx)
-
-        out: List[Dict[str, Any]] = []
-        for label, idxs in clusters.items():
-            cluster_points = [points[i] for i in idxs]
-            centroid_lat = sum(p["lat"] for p in cluster_points) / len(cluster_points)
-            centroid_lon = sum(p["lon"] for p in cluster_points) / len(cluster_points)
-
-            best_i = 0
-            best_sum = float("inf")
-            for i, p in enumerate(cluster_points):
-                s = sum(haversine(p["lat"], p["lon"], q["lat"], q["lon"]) for q in cluster_points)
-                if s < best_sum:
-                    best_sum = s
-                    best_i = i
-
-            medoid = cluster_points[best_i]
-            best_point = max(cluster_points, key=lambda s: float(s.get("score", 0.0)))
-            avg_score = sum(p.get("score", 0.0) for p in cluster_points) / len(cluster_points)
-            out.append(
-                {
-                    "cluster_id": label,
-                    "size": len(cluster_points),
-                    "centroid": {"lat": centroid_lat, "lon": centroid_lon},
-                    "medoid": {"lat": medoid["lat"], "lon": medoid["lon"]},
-                    "avg_score": avg_score,
-                    "best_score": float(best_point.get("score", 0.0) or 0.0),
-                    "medoid_point": stand_summary_for_report(medoid),
-                    "best_point": stand_summary_for_report(best_point),
-                    "strategies": sorted({str(p.get("strategy") or "") for p in cluster_points if p.get("strategy")}),
-                    "points": [
-                        {
-                            "lat": p["lat"],
-                            "lon": p["lon"],
-                            "score": p.get("score", 0.0),
-                            "strategy": p.get("strategy"),
-                            "source": p.get("source"),
-                        }
-                        for p in cluster_points
-                    ],
-                }
-            )
-
-        out.sort(key=lambda c: (c["size"], c["avg_score"]), reverse=True)
-        return out
+        return clusters_from_labels(points, clustering.fit_predict(coords))
 
     except Exception:
         return []
+
+
+def clusters_from_labels(points: List[Dict[str, Any]], labels: Any) -> List[Dict[str, Any]]:
+    """Summarise labelled stand points (label -1 = noise) into ranked clusters.
+
+    Sizes, centroids and score aggregates come from ``np.bincount`` over the
+    labels; medoids use a chunked NumPy distance matrix. Shared by the batch
+    DBSCAN path and the incremental clusterer so both produce the same payload.
+    """
+    import numpy as np  # type: ignore
+
+    labels = np.asarray(labels, dtype=np.int64)
+    if not points or labels.size != len(points):
+        return []
+    lat_lon = np.array([[p["lat"], p["lon"]] for p in points], dtype=float)
+    scores = np.array([float(p.get("score", 0.0) or 0.0) for p in points], dtype=float)
+    coords = np.radians(lat_lon)
+
+    member = np.flatnonzero(labels >= 0)
+    if member.size == 0:
+        return []
+    member_labels = labels[member]
+    n_labels = int(member_labels.max()) + 1
+    sizes = np.bincount(member_labels, minlength=n_labels)
+    centroid_lat = np.bincount(member_labels, weights=lat_lon[member, 0], minlength=n_labels)
+    centroid_lon = np.bincount(member_labels, weights=lat_lon[member, 1], minlength=n_labels)
+    score_sum = np.bincount(member_labels, weights=scores[member], minlength=n_labels)
+
+    # Group member indices by label, each group in original point order.
+    order = member[np.argsort(member_labels, kind="stable")]
+    bounds = np.concatenate(([0], np.cumsum(sizes)))
+
+    out: List[Dict[str, Any]] = []
+    for label in range(n_labels):
+        size = int(sizes[label])
+        if size == 0:
+            continue
+        idxs = order[bounds[label]:bounds[label + 1]]
+        medoid = points[int(idxs[_medoid_index(coords[idxs, 0], coords[idxs, 1])])]
+        best_point = points[int(idxs[int(np.argmax(scores[idxs]))])]
+        medoid_summary = stand_summary_for_report(medoid)
+        cluster_points = [points[i] for i in idxs.tolist()]
+        out.append(
+            {
+                "cluster_id": label,
+                "size": size,
+                "centroid": {
+                    "lat": float(centroid_lat[label] / size),
+                    "lon": float(centroid_lon[label] / size),
+                },
+                "medoid": {"lat": medoid["lat"], "lon": medoid["lon"]},
+                "avg_score": float(score_sum[label] / size),
+                "best_score": float(best_point.get("score", 0.0) or 0.0),
+                "medoid_point": medoid_summary,
+                "best_point": medoid_summary if best_point is medoid else stand_summary_for_report(best_point),
+                "strategies": sorted({str(p.get("strategy") or "") for p in cluster_points if p.get("strategy")}),
+                "points": [
+                    {
+                        "lat": p["lat"],
+                        "lon": p["lon"],
+                        "score": p.get("score", 0.0),
+                        "strategy": p.get("strategy"),
+                        "source": p.get("source"),
+                    }
+                    for p in cluster_points
+                ],
+            }
+        )
+
+    out.sort(key=lambda c: (c["size"], c["avg_score"]), reverse=True)
+    return out
@@ -0,0 +1,196 @@
+"""Incremental DBSCAN-style clustering of stand points for hotspot runs.
+
+``cluster_stands`` needs every prediction before it can say anything. The
+``IncrementalStandClusterer`` here accepts stand points as each prediction
+finishes and keeps DBSCAN's core/border/noise labelling up to date with a
+grid-hash neighbourhood index (cells of about ``epsilon_m``, 3x3 lookups),
+so the job can publish a provisional best stand site after every prediction.
+Cluster payloads (medoid, aggregates, point lists) are cached by membership,
+so each update only summarises the clusters the new points changed.
+
+Core-point connectivity is order-independent, so once all points are in the
+clusters match a batch DBSCAN run; only border points reachable from two
+clusters may be assigned differently, exactly as DBSCAN itself allows. The
+final report still uses the batch ``cluster_stands`` result.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any, Dict, List, Optional, Tuple
+
+from backend.services.hotspot.clustering import clusters_from_labels
+from backend.utils.geo import haversine
+
+_M_PER_DEG_LAT = 111_320.0
+# Cells are a little wider than epsilon so the equirectangular projection
+# (longitude scale fixed at the first point) never hides a true neighbour
+# outside the 3x3 lookup.
+_CELL_SLACK = 1.05
+
+
+class IncrementalStandClusterer:
+    """Insert-only DBSCAN over (lat, lon) stand points.
+
+    Args:
+        epsilon_m: Neighbourhood radius in metres (same as ``cluster_stands``).
+        min_samples: Points (including itself) a core point needs within
+            ``epsilon_m``, with scikit-learn's DBSCAN semantics.
+    """
+
+    def __init__(self, epsilon_m: float, min_samples: int) -> None:
+        self.epsilon_m = float(epsilon_m)
+        self.min_samples = max(1, int(min_samples))
+        self.points: List[Dict[str, Any]] = []
+        self._cells: Dict[Tuple[int, int], List[int]] = {}
+        self._neighbours: List[List[int]] = []
+        self._core: List[bool] = []
+        self._parent: List[int] = []
+        self._lon_scale: Optional[float] = None
+        self._cached: Optional[List[Dict[str, Any]]] = None
+        # Member indices -> cluster payload from the previous clusters() call.
+        self._payloads: Dict[Tuple[int, ...], Dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    def _cell(self, lat: float, lon: float) -> Tuple[int, int]:
+        if self._lon_scale is None:
+            self._lon_scale = _M_PER_DEG_LAT * max(1e-6, math.cos(math.radians(lat)))
+        size = self.epsilon_m * _CELL_SLACK
+        return (
+            int(math.floor(lat * _M_PER_DEG_LAT / size)),
+            int(math.floor(lon * self._lon_scale / size)),
+        )
+
+    def _find(self, i: int) -> int:
+        parent = self._parent
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def _union(self, a: int, b: int) -> None:
+        ra, rb = self._find(a), self._find(b)
+        if ra != rb:
+            # Lower index becomes the root so labels follow insertion order.
+            if rb < ra:
+                ra, rb = rb, ra
+            self._parent[rb] = ra
+
+    def _promote(self, i: int) -> None:
+        self._core[i] = True
+        for j in self._neighbours[i]:
+            if self._core[j]:
+                self._union(i, j)
+
+    def add(self, stand: Dict[str, Any]) -> bool:
+        """Insert one stand point; returns False if it has no coordinates."""
+        lat, lon = stand.get("lat"), stand.get("lon")
+        if lat is None or lon is None:
+            return False
+        lat, lon = float(lat), float(lon)
+        idx = len(self.points)
+        cy, cx = self._cell(lat, lon)
+
+        neighbours: List[int] = []
+        for dy in (-1, 0, 1):
+            for dx in (-1, 0, 1):
+                for j in self._cells.get((cy + dy, cx + dx), ()):
+                    q = self.points[j]
+                    if haversine(lat, lon, q["lat"], q["lon"]) <= self.epsilon_m:
+                        neighbours.append(j)
+
+        self.points.append(stand)
+        self._cells.setdefault((cy, cx), []).append(idx)
+        self._neighbours.append(neighbours)
+        self._core.append(False)
+        self._parent.append(idx)
+        self._cached = None
+
+        for j in neighbours:
+            self._neighbours[j].append(idx)
+            if not self._core[j] and len(self._neighbours[j]) + 1 >= self.min_samples:
+                self._promote(j)
+        if len(neighbours) + 1 >= self.min_samples:
+            self._promote(idx)
+        return True
+
+    def extend(self, stands: List[Dict[str, Any]]) -> int:
+        """Insert several stand points; returns how many had coordinates."""
+        return sum(1 for s in stands if self.add(s))
+
+    def labels(self) -> List[int]:
+        """DBSCAN labels for the points inserted so far (-1 = noise)."""
+        label_of_root: Dict[int, int] = {}
+        labels: List[int] = []
+        for i in range(len(self.points)):
+            if self._core[i]:
+                anchor = i
+            else:
+                core_neighbours = [j for j in self._neighbours[i] if self._core[j]]
+                if not core_neighbours:
+                    labels.append(-1)
+                    continue
+                anchor = min(core_neighbours)
+            root = self._find(anchor)
+            labels.append(label_of_root.setdefault(root, len(label_of_root)))
+        return labels
+
+    def clusters(self) -> List[Dict[str, Any]]:
+        """Ranked clusters in the ``cluster_stands`` payload format.
+
+        Matches ``clusters_from_labels(points, labels())``, but only clusters
+        whose members changed since the previous call are summarised again.
+        """
+        if self._cached is None:
+            self._cached = self._build_clusters()
+        return self._cached
+
+    def _build_clusters(self) -> List[Dict[str, Any]]:
+        groups: Dict[int, List[int]] = {}
+        for i, label in enumerate(self.labels()):
+            if label >= 0:
+                groups.setdefault(label, []).append(i)
+
+        payloads: Dict[Tuple[int, ...], Dict[str, Any]] = {}
+        out: List[Dict[str, Any]] = []
+        for label, members in groups.items():
+            key = tuple(members)
+            payload = self._payloads.get(key)
+            if payload is None:
+                [payload] = clusters_from_labels([self.points[i] for i in members], [0] * len(members))
+            payloads[key] = payload
+            out.append({**payload, "cluster_id": label})
+        self._payloads = payloads
+        out.sort(key=lambda c: (c["size"], c["avg_score"]), reverse=True)
+        return out
+
+
+class TopClusterTracker:
+    """Counts consecutive updates on which the leading cluster kept its medoid.
+
+    The medoid is matched by position within ``tolerance_m`` so a cluster
+    that grows around the same stand counts as stable.
+    """
+
+    def __init__(self, tolerance_m: float) -> None:
+        self.tolerance_m = float(tolerance_m)
+        self.stable_updates = 0
+        self._medoid: Optional[Tuple[float, float]] = None
+
+    def update(self, clusters: List[Dict[str, Any]]) -> int:
+        medoid = None
+        if clusters:
+            m = clusters[0]["medoid"]
+            medoid = (float(m["lat"]), float(m["lon"]))
+        if (
+            medoid is not None
+            and self._medoid is not None
+            and haversine(medoid[0], medoid[1], self._medoid[0], self._medoid[1]) <= self.tolerance_m
+        ):
+            self.stable_updates += 1
+        else:
+            self.stable_updates = 0
+        self._medoid = medoid
+        return self.stable_updates
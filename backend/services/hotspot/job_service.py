@@ -13,7 +13,7 @@ import logging
 import os
 import threading
 import uuid
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
@@ -39,8 +39,11 @@ def _utc_now_iso() -> str:
 from backend.services.hotspot.clustering import (
     best_site_score_0_200,
     cluster_stands,
-    extract_stand_points,
+    StandContextStore,
+    StandRecord,
+    extract_stand_records,
 )
+from backend.services.hotspot.incremental_clustering import IncrementalStandClusterer, TopClusterTracker
 from backend.services.hotspot.lidar_scoring import lidar_shortlist_points
 from backend.services.hotspot.map_builder import build_map_html
 from backend.services.hotspot.polygon import (
@@ -48,6 +51,25 @@ from backend.services.hotspot.polygon import (
     sample_points_in_polygon,
     stable_seed_from_corners,
 )
+from backend.services.hotspot.property_context import PropertyContext, build_property_context
+from backend.services.job_registry import get_job_registry
+from backend.services.job_status_store import JobStatusStore
+
+# Clusters (without their point lists) kept in the provisional job snapshot.
+PROVISIONAL_TOP_CLUSTERS = 5
+
+# Hotspot jobs have no 'error' state of their own; 'stale' is set by the
+# status endpoint and 'interrupted' by recovery after a restart.
+HOTSPOT_TERMINAL_STATES = frozenset({"completed", "error", "stale", "interrupted", "unknown"})
+
+
+def _parse_status_flush_seconds() -> float:
+    raw = os.getenv("HOTSPOT_STATUS_FLUSH_SECONDS", "2")
+    try:
+        return max(0.0, float(raw))
+    except ValueError:
+        logger.warning("Invalid HOTSPOT_STATUS_FLUSH_SECONDS=%r — defaulting to 2 seconds", raw)
+        return 2.0
 
 
 def _parse_dt_to_eastern(date_time: str) -> datetime:
@@ -68,47 +90,137 @@ class HotspotJob:
     error: Optional[str] = None
     report_path: Optional[str] = None
     map_path: Optional[str] = None
+    provisional: Optional[Dict[str, Any]] = None
+
+
+def _best_stand_site(
+    clusters: List[Dict[str, Any]],
+    stands: List[StandRecord],
+    contexts: StandContextStore,
+) -> Optional[Dict[str, Any]]:
+    """Top cluster medoid, or the highest scoring stand when nothing clustered.
+
+    The chosen stand's prediction context is resolved from *contexts* so the
+    best site carries its wind and situation details inline.
+    """
+    if clusters:
+        top = clusters[0]
+        medoid_point = top.get("medoid_point") if isinstance(top, dict) else None
+        if not isinstance(medoid_point, dict):
+            medoid_point = {"lat": float(top["medoid"]["lat"]), "lon": float(top["medoid"]["lon"])}
+        support = int(top.get("size", 0) or 0)
+        avg_score = float(top.get("avg_score", 0.0) or 0.0)
+        return {
+            "lat": float(medoid_point.get("lat")),
+            "lon": float(medoid_point.get("lon")),
+            "supporting_predictions": support,
+            "cluster_avg_score_0_10": avg_score,
+            "stand_score_0_10": float(medoid_point.get("score", 0.0) or 0.0),
+            "best_site_score_0_200": best_site_score_0_200(support=support, avg_stand_score_0_10=avg_score),
+            "strategy": medoid_point.get("strategy"),
+            "description": medoid_point.get("description"),
+            "confidence": medoid_point.get("confidence"),
+            **contexts.get(medoid_point.get("context_id")),
+            "sources": ["cluster_medoid"],
+            "reason": "Densest consensus cluster medoid (most repeatable across sample points)",
+        }
+
+    if not stands:
+        return None
+    best = max(stands, key=lambda s: float(s.score))
+    support = 1
+    avg_score = float(best.get("score", 0.0) or 0.0)
+    return {
+        "lat": float(best["lat"]),
+        "lon": float(best["lon"]),
+        "supporting_predictions": support,
+        "cluster_avg_score_0_10": avg_score,
+        "stand_score_0_10": float(best.get("score", 0.0) or 0.0),
+        "best_site_score_0_200": best_site_score_0_200(support=support, avg_stand_score_0_10=avg_score),
+        "strategy": best.get("strategy"),
+        "description": best.get("description"),
+        "confidence": best.get("confidence"),
+        **contexts.get(best.context_id),
+        "sources": [str(best.get("source"))],
+        "reason": "Fallback to highest scoring stand point (no clusters formed)",
+    }
+
+
+def _provisional_snapshot(
+    clusterer: IncrementalStandClusterer,
+    contexts: StandContextStore,
+    *,
+    completed: int,
+    total: int,
+    stable_updates: int,
+) -> Dict[str, Any]:
+    """Small JSON-safe view of the clusters so far, stored on the job state."""
+    clusters = clusterer.clusters()
+    return {
+        "completed": completed,
+        "total": total,
+        "stand_points_count": len(clusterer),
+        "clusters_count": len(clusters),
+        "top_clusters": [
+            {k: v for k, v in c.items() if k not in ("points", "best_point")}
+            for c in clusters[:PROVISIONAL_TOP_CLUSTERS]
+        ],
+        "best_stand_site": _best_stand_site(clusters, clusterer.points, contexts),
+        "top_cluster_stable_updates": stable_updates,
+        "updated_at": _utc_now_iso(),
+    }
+
+
+def _refresh_provisional(
+    clusterer: IncrementalStandClusterer,
+    tracker: TopClusterTracker,
+    contexts: StandContextStore,
+    *,
+    completed: int,
+    total: int,
+) -> Tuple[int, Dict[str, Any]]:
+    """Advance the top-cluster tracker and build the provisional snapshot.
+
+    Runs in a worker thread: summarising a large consensus cluster (medoid
+    distance sums) is too slow to do on the event loop after every prediction.
+    """
+    stable = tracker.update(clusterer.clusters())
+    snapshot = _provisional_snapshot(
+        clusterer, contexts, completed=completed, total=total, stable_updates=stable
+    )
+    return stable, snapshot
 
 
 class HotspotJobService:
     def __init__(self) -> None:
         self._jobs: Dict[str, HotspotJob] = {}
         self._lock = threading.Lock()
+        # Job state is persisted to the shared job registry, throttled like
+        # max-accuracy statuses: progress and provisional snapshots are
+        # flushed at most every HOTSPOT_STATUS_FLUSH_SECONDS, the first and
+        # terminal states immediately. job_state.json is only read, for
+        # jobs written before the registry existed.
+        self._store = JobStatusStore(
+            self._job_state_path,
+            registry_for=get_job_registry,
+            kind="hotspot",
+            state_key="status",
+            flush_interval_s=_parse_status_flush_seconds(),
+            terminal_states=HOTSPOT_TERMINAL_STATES,
+        )
+        self.updates = self._store.updates
 
     def _job_state_path(self, job_id: str) -> Path:
         jobs_dir = Path(os.getenv("HOTSPOT_JOBS_DIR", "/app/data/hotspot_jobs"))
         return jobs_dir / job_id / "job_state.json"
 
     def _persist_job_state(self, job: HotspotJob) -> None:
-        try:
-            state_path = self._job_state_path(job.job_id)
-            state_path.parent.mkdir(parents=True, exist_ok=True)
-            payload = {
-                "job_id": job.job_id,
-                "status": job.status,
-                "created_at": job.created_at,
-                "updated_at": job.updated_at,
-                "total": job.total,
-                "completed": job.completed,
-                "message": job.message,
-                "error": job.error,
-                "report_path": job.report_path,
-                "map_path": job.map_path,
-            }
-            state_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
-        except Exception:
-            return
-
-    def _recover_job_from_disk(self, job_id: str) -> Optional[HotspotJob]:
-        jobs_dir = Path(os.getenv("HOTSPOT_JOBS_DIR", "/app/data/hotspot_jobs"))
-        job_dir = jobs_dir / job_id
-        if not job_dir.exists():
-            return None
+        self._store.put(job.job_id, asdict(job))
 
-        state_path = job_dir / "job_state.json"
-        if state_path.exists():
+    def _recover_job(self, job_id: str) -> Optional[HotspotJob]:
+        state = self._store.get(job_id)
+        if state is not None:
             try:
-                state = json.loads(state_path.read_text(encoding="utf-8"))
                 status = state.get("status") or "unknown"
                 report_path = state.get("report_path")
                 map_path = state.get("map_path")
@@ -125,10 +237,12 @@ class HotspotJobService:
                     error=state.get("error"),
                     report_path=report_path,
                     map_path=map_path,
+                    provisional=state.get("provisional"),
                 )
             except Exception:
-                logger.debug("Failed to recover hotspot job state from %s", state_path, exc_info=True)
+                logger.debug("Failed to recover hotspot job state for %s", job_id, exc_info=True)
 
+        job_dir = Path(os.getenv("HOTSPOT_JOBS_DIR", "/app/data/hotspot_jobs")) / job_id
         report_path_f = job_dir / "hotspot_report.json"
         map_path_f = job_dir / "hotspot_map.html"
         if not report_path_f.exists() and not map_path_f.exists():
@@ -172,7 +286,7 @@ class HotspotJobService:
         if job:
             return job
 
-        recovered = self._recover_job_from_disk(job_id)
+        recovered = self._recover_job(job_id)
         if recovered:
             with self._lock:
                 self._jobs[job_id] = recovered
@@ -190,6 +304,12 @@ class HotspotJobService:
             job.updated_at = _utc_now_iso()
         self._persist_job_state(job)
 
+    def forget_job(self, job_id: str) -> None:
+        """Drop in-memory state for *job_id* (e.g. after retention cleanup)."""
+        with self._lock:
+            self._jobs.pop(job_id, None)
+        self._store.forget(job_id)
+
     async def run_job(
         self,
         job_id: str,
@@ -250,7 +370,11 @@ class HotspotJobService:
             total = len(sample_points)
             self.update_job(job_id, total=total, completed=0, message="Running predictions")
 
-        all_stands: List[Dict[str, Any]] = []
+        # Stands are compact records; each prediction's wind/context blobs are
+        # interned once in stand_contexts and referenced by id.
+        all_stands: List[StandRecord] = []
+        stand_contexts = StandContextStore()
+        prediction_errors: List[Dict[str, Any]] = []
         per_point_best: List[Dict[str, Any]] = []
 
         if mode == "lidar_first" and lidar_shortlist:
@@ -260,6 +384,22 @@ class HotspotJobService:
             query_points = sample_points_in_polygon(corners, num_sample_points, seed=seed)
 
         total = len(query_points)
+
+        # Weather, roads, vegetation and the DEM window are property-wide, so
+        # fetch them once here instead of once per prediction.
+        self.update_job(job_id, message="Loading shared property context (weather, roads, vegetation, DEM)")
+        context: Optional[PropertyContext] = None
+        try:
+            context = await asyncio.to_thread(
+                build_property_context,
+                corners,
+                season=season,
+                target_datetime=target_dt,
+                predictor=service.predictor,
+            )
+        except Exception as e:
+            logger.warning("Hotspot job %s: property context unavailable, predicting without it: %s", job_id, e)
+
         max_concurrency = int(os.getenv("HOTSPOT_PREDICTION_CONCURRENCY", "3"))
         max_concurrency = max(1, min(10, max_concurrency))
         self.update_job(job_id, message=f"Running predictions ({total} points, concurrency={max_concurrency})", completed=0, total=total)
@@ -281,6 +421,7 @@ class HotspotJobService:
                             season=season,
                             hunting_pressure=hunting_pressure,
                             target_datetime=target_dt,
+                            context=context,
                         ),
                         timeout=180,
                     ),
@@ -288,87 +429,70 @@ class HotspotJobService:
 
         tasks = [asyncio.create_task(_predict_one(i, lat, lon)) for i, (lat, lon) in enumerate(query_points, 1)]
 
+        # Provisional clusters are refreshed after every prediction (off the
+        # event loop, re-summarising only the clusters that changed) so the
+        # status/events endpoints can show a best stand before the run ends.
+        # With HOTSPOT_EARLY_STOP_STABLE_UPDATES > 0 the remaining predictions
+        # are cancelled once the top cluster's medoid has held for that many
+        # consecutive predictions (and at least the minimum fraction is done).
+        clusterer = IncrementalStandClusterer(effective_epsilon, min_samples)
+        tracker = TopClusterTracker(tolerance_m=effective_epsilon / 2.0)
+        early_stop_updates = max(0, int(os.getenv("HOTSPOT_EARLY_STOP_STABLE_UPDATES", "0")))
+        early_stop_min_fraction = min(1.0, max(0.0, float(os.getenv("HOTSPOT_EARLY_STOP_MIN_FRACTION", "0.5"))))
+        early_stop: Optional[Dict[str, Any]] = None
+
         done_count = 0
         for fut in asyncio.as_completed(tasks):
             try:
                 idx, lat, lon, prediction = await fut
-                stands = extract_stand_points(prediction)
+                stands = extract_stand_records(prediction, stand_contexts)
                 all_stands.extend(stands)
+                clusterer.extend(stands)
 
                 if stands:
-                    best = max(stands, key=lambda s: float(s.get("score", 0.0)))
+                    best = max(stands, key=lambda s: s.score)
                     per_point_best.append(
                         {
                             "query_lat": lat,
                             "query_lon": lon,
-                            "best_lat": best["lat"],
-                            "best_lon": best["lon"],
-                            "best_score": best.get("score", 0.0),
-                            "best_strategy": best.get("strategy"),
+                            "best_lat": best.lat,
+                            "best_lon": best.lon,
+                            "best_score": best.score,
+                            "best_strategy": best.strategy,
                         }
                     )
             except Exception as e:
-                all_stands.append(
-                    {
-                        "lat": None,
-                        "lon": None,
-                        "score": 0.0,
-                        "strategy": "prediction_error",
-                        "source": "error",
-                        "error": str(e),
-                    }
-                )
+                prediction_errors.append({"error": str(e)})
             finally:
                 done_count += 1
-                self.update_job(job_id, completed=done_count, message=f"Predictions: {done_count}/{total}")
+                stable, provisional = await asyncio.to_thread(
+                    _refresh_provisional, clusterer, tracker, stand_contexts, completed=done_count, total=total
+                )
+                self.update_job(
+                    job_id,
+                    completed=done_count,
+                    message=f"Predictions: {done_count}/{total}",
+                    provisional=provisional,
+                )
+
+            if (
+                early_stop_updates
+                and done_count < total
+                and stable >= early_stop_updates
+                and done_count >= early_stop_min_fraction * total
+            ):
+                early_stop = {"completed": done_count, "total": total, "stable_updates": stable}
+                logger.info("Hotspot job %s: top cluster stable, stopping early at %d/%d", job_id, done_count, total)
+                break
+
+        if early_stop is not None:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
         self.update_job(job_id, message="Clustering stand points")
         clusters = cluster_stands(all_stands, effective_epsilon, min_samples)
-
-        best_stand_site: Optional[Dict[str, Any]] = None
-        if clusters:
-            top = clusters[0]
-            medoid_point = top.get("medoid_point") if isinstance(top, dict) else None
-            if not isinstance(medoid_point, dict):
-                medoid_point = {"lat": float(top["medoid"]["lat"]), "lon": float(top["medoid"]["lon"])}
-            support = int(top.get("size", 0) or 0)
-            avg_score = float(top.get("avg_score", 0.0) or 0.0)
-            best_stand_site = {
-                "lat": float(medoid_point.get("lat")),
-                "lon": float(medoid_point.get("lon")),
-                "supporting_predictions": support,
-                "cluster_avg_score_0_10": avg_score,
-                "stand_score_0_10": float(medoid_point.get("score", 0.0) or 0.0),
-                "best_site_score_0_200": best_site_score_0_200(support=support, avg_stand_score_0_10=avg_score),
-                "strategy": medoid_point.get("strategy"),
-                "description": medoid_point.get("description"),
-                "confidence": medoid_point.get("confidence"),
-                "wind_thermal": medoid_point.get("wind_thermal"),
-                "wind_overall": medoid_point.get("wind_overall"),
-                "context_summary": medoid_point.get("context_summary"),
-                "sources": ["cluster_medoid"],
-                "reason": "Densest consensus cluster medoid (most repeatable across sample points)",
-            }
-        elif all_stands:
-            best = max(all_stands, key=lambda s: float(s.get("score", 0.0)))
-            support = 1
-            avg_score = float(best.get("score", 0.0) or 0.0)
-            best_stand_site = {
-                "lat": float(best["lat"]),
-                "lon": float(best["lon"]),
-                "supporting_predictions": support,
-                "cluster_avg_score_0_10": avg_score,
-                "stand_score_0_10": float(best.get("score", 0.0) or 0.0),
-                "best_site_score_0_200": best_site_score_0_200(support=support, avg_stand_score_0_10=avg_score),
-                "strategy": best.get("strategy"),
-                "description": best.get("description"),
-                "confidence": best.get("confidence"),
-                "wind_thermal": best.get("wind_thermal"),
-                "wind_overall": best.get("wind_overall"),
-                "context_summary": best.get("context_summary"),
-                "sources": [str(best.get("source"))],
-                "reason": "Fallback to highest scoring stand point (no clusters formed)",
-            }
+        best_stand_site = _best_stand_site(clusters, all_stands, stand_contexts)
 
         baseline = best_stand_site
 
@@ -390,11 +514,15 @@ class HotspotJobService:
             },
             "lidar_shortlist": lidar_shortlist,
             "lidar_meta": lidar_meta,
+            "property_context": context.summary() if context is not None else None,
             "best_stand_site": best_stand_site,
             "baseline_stand": baseline,
             "clusters": clusters,
             "per_sample_point_best": per_point_best,
             "stand_points_count": len(all_stands),
+            "stand_contexts": stand_contexts.to_report(),
+            "prediction_errors": prediction_errors,
+            "early_stop": early_stop,
         }
 
         report_path = job_dir / "hotspot_report.json"
@@ -1,12 +1,18 @@
-"""LiDAR/DEM terrain scoring for hotspot property analysis."""
+"""LiDAR/DEM terrain scoring for hotspot property analysis.
+
+Every grid point is scored from whole-window feature maps (slope, curvature
+and NaN-aware box statistics) gathered in one vectorised pass, so the
+detailed terrain score is computed for all points rather than a pre-filtered
+candidate pool.
+"""
 
 from __future__ import annotations
 
-import math
 import os
-from typing import Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
-from backend.utils.terrain_scoring import ridge_proximity_preference, slope_preference
+if TYPE_CHECKING:
+    import numpy as np
 
 
 def pick_best_dem_file(lidar_files: Dict[str, str]) -> Optional[str]:
@@ -19,6 +25,52 @@ def pick_best_dem_file(lidar_files: Dict[str, str]) -> Optional[str]:
     return next(iter(lidar_files.values()), None)
 
 
+def nan_box_stats(
+    data: "np.ndarray",
+    radius: int,
+    rows: "np.ndarray",
+    cols: "np.ndarray",
+    *,
+    std: bool = False,
+    extrema: bool = False,
+) -> Dict[str, "np.ndarray"]:
+    """NaN-aware statistics of the (2*radius+1)² box around each (row, col).
+
+    Equivalent to ``np.nanmean``/``nanstd``/``nanmin``/``nanmax`` over
+    ``data[r - radius:r + radius + 1, c - radius:c + radius + 1]`` for every
+    point, but computed as whole-raster filters and then gathered once.
+    Boxes are clipped at the raster edge: sums pad with zeros and extrema pad
+    with ±inf, so padding never contributes. ``count`` is the number of
+    finite cells per box; the other statistics are NaN where it is zero.
+    """
+    import numpy as np  # type: ignore
+    from scipy.ndimage import maximum_filter, minimum_filter, uniform_filter  # type: ignore
+
+    size = 2 * int(radius) + 1
+    finite = np.isfinite(data)
+    values = np.where(finite, data, 0.0).astype(np.float64)
+
+    # uniform_filter returns box means over `size`² cells including padding;
+    # the ratio of value-mean to finite-mean is the mean over finite cells.
+    finite_frac = uniform_filter(finite.astype(np.float64), size=size, mode="constant", cval=0.0)[rows, cols]
+    count = np.rint(finite_frac * size * size)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        safe_frac = np.where(count > 0, finite_frac, np.nan)
+        mean = uniform_filter(values, size=size, mode="constant", cval=0.0)[rows, cols] / safe_frac
+        out: Dict[str, np.ndarray] = {"count": count, "mean": mean}
+        if std:
+            mean_sq = uniform_filter(values * values, size=size, mode="constant", cval=0.0)[rows, cols] / safe_frac
+            out["std"] = np.sqrt(np.maximum(mean_sq - mean * mean, 0.0))
+    del values
+
+    if extrema:
+        low = minimum_filter(np.where(finite, data, np.inf), size=size, mode="constant", cval=np.inf)[rows, cols]
+        high = maximum_filter(np.where(finite, data, -np.inf), size=size, mode="constant", cval=-np.inf)[rows, cols]
+        out["min"] = np.where(count > 0, low, np.nan).astype(np.float64)
+        out["max"] = np.where(count > 0, high, np.nan).astype(np.float64)
+    return out
+
+
 def lidar_shortlist_points(
     corners: List[Tuple[float, float]],
     points: List[Tuple[float, float]],
@@ -46,6 +98,7 @@ def lidar_shortlist_points(
     try:
         import numpy as np  # type: ignore
         import rasterio  # type: ignore
+        from backend.utils.terrain_scoring import ridge_proximity_preference_array, slope_preference_array
         from rasterio.windows import from_bounds  # type: ignore
         from rasterio.warp import transform  # type: ignore
 
@@ -89,166 +142,132 @@ def lidar_shortlist_points(
 
             elev_min = float(np.nanmin(elev))
             elev_max = float(np.nanmax(elev))
-            elev_range = max(1e-6, elev_max - elev_min)
 
             w_transform = src.window_transform(window)
 
-            def _sample_at(lat: float, lon: float) -> Optional[Tuple[int, int, float, float]]:
-                xs2, ys2 = transform("EPSG:4326", src.crs, [lon], [lat])
-                x, y = xs2[0], ys2[0]
-                row, col = rasterio.transform.rowcol(w_transform, x, y)
-                if row < 0 or col < 0 or row >= elev.shape[0] or col >= elev.shape[1]:
-                    return None
-                e = float(elev[row, col])
-                s = float(slope_deg[row, col])
-                if not (math.isfinite(e) and math.isfinite(s)):
-                    return None
-                return row, col, e, s
-
-            def _clamp01(value: float) -> float:
-                return max(0.0, min(1.0, value))
+            # ---- Gather: project every grid point in one call ----
+            lats_in = np.asarray([p[0] for p in points], dtype=np.float64)
+            lons_in = np.asarray([p[1] for p in points], dtype=np.float64)
+            if lats_in.size == 0:
+                return [], {"lidar_available": True, "dem_path": dem_path, "scored_points": 0}
+            xs2, ys2 = transform("EPSG:4326", src.crs, lons_in.tolist(), lats_in.tolist())
+            rows_all, cols_all = rasterio.transform.rowcol(w_transform, xs2, ys2)
+            rows_all = np.asarray(rows_all, dtype=np.int64)
+            cols_all = np.asarray(cols_all, dtype=np.int64)
+            inside = (rows_all >= 0) & (cols_all >= 0) & (rows_all < elev.shape[0]) & (cols_all < elev.shape[1])
+            rows = np.where(inside, rows_all, 0)
+            cols = np.where(inside, cols_all, 0)
+            e = elev[rows, cols].astype(np.float64)
+            s = slope_deg[rows, cols].astype(np.float64)
+            keep = inside & np.isfinite(e) & np.isfinite(s)
+            rows, cols, e, s = rows[keep], cols[keep], e[keep], s[keep]
+            lats_out, lons_out = lats_in[keep], lons_in[keep]
 
             cell_m = max(1e-6, max(xres, yres))
             local_radius_px = max(1, min(6, int((float(sample_radius_m) / cell_m) * 0.15)))
             large_radius_px = max(local_radius_px + 2, min(18, int((float(sample_radius_m) / cell_m) * 0.6)))
 
-            # ---- Phase 1: fast base scoring ----
-            base_scored: List[Dict[str, Any]] = []
-            for (lat, lon) in points:
-                sampled = _sample_at(lat, lon)
-                if not sampled:
-                    continue
-                row, col, e, s = sampled
-
-                slope_pref = slope_preference(s)
-                elev_pref = ridge_proximity_preference(e, elev_min, elev_min + elev_range)
-                base_score = slope_pref * 60.0 + elev_pref * 40.0
-
-                base_scored.append(
-                    {
-                        "lat": float(lat),
-                        "lon": float(lon),
-                        "row": int(row),
-                        "col": int(col),
-                        "elevation_m": float(e),
-                        "slope_deg": float(s),
-                        "slope_pref": float(slope_pref),
-                        "elev_pref": float(elev_pref),
-                        "base_score": float(base_score),
-                    }
-                )
-
-            base_scored.sort(
-                key=lambda r: (
-                    -float(r.get("base_score", 0.0)),
-                    float(r.get("lat", 0.0)),
-                    float(r.get("lon", 0.0)),
-                )
+            # ---- Whole-window box statistics, gathered at every kept point ----
+            # Elevations are offset by elev_min so the squared sums behind
+            # the standard deviation stay well inside float64 precision.
+            elev_rel = elev - np.float32(elev_min)
+            local_elev = nan_box_stats(elev_rel, local_radius_px, rows, cols, std=True, extrema=True)
+            local_slope = nan_box_stats(slope_deg, local_radius_px, rows, cols, std=True)
+            local_curv = nan_box_stats(np.abs(curvature), local_radius_px, rows, cols)
+            large_elev = nan_box_stats(elev_rel, large_radius_px, rows, cols, extrema=True)
+
+            e_rel = e - elev_min
+            has_local = local_elev["count"] > 0
+            local_mean = np.where(has_local, local_elev["mean"], e_rel)
+            local_min = np.where(has_local, local_elev["min"], e_rel)
+            local_max = np.where(has_local, local_elev["max"], e_rel)
+            local_relief = np.maximum(1e-6, local_max - local_min)
+            local_roughness = np.where(has_local, local_elev["std"], 0.0)
+
+            has_slope = local_slope["count"] > 0
+            local_slope_mean = np.where(has_slope, local_slope["mean"], s)
+            local_slope_std = np.where(has_slope, local_slope["std"], 0.0)
+            local_curv_mean = np.where(local_curv["count"] > 0, local_curv["mean"], 0.0)
+
+            tpi = e_rel - local_mean
+            tpi_norm = tpi / local_relief
+
+            has_large = large_elev["count"] > 0
+            large_mean = np.where(has_large, large_elev["mean"], local_mean)
+            large_min = np.where(has_large, large_elev["min"], local_min)
+            large_max = np.where(has_large, large_elev["max"], local_max)
+            large_relief = np.maximum(1e-6, large_max - large_min)
+            tpi_large = e_rel - large_mean
+            tpi_large_norm = tpi_large / large_relief
+
+            slope_pref = slope_preference_array(s)
+            elev_pref = ridge_proximity_preference_array(e, elev_min, elev_max)
+
+            bench_score = (
+                np.clip(1.0 - (local_slope_mean / 12.0), 0.0, 1.0)
+                * np.clip(1.0 - (np.abs(tpi_norm) * 2.0), 0.0, 1.0)
             )
-
-            candidate_pool = max(200, max(1, top_k) * 20)
-            candidates = base_scored[: min(candidate_pool, len(base_scored))]
-
-            # ---- Phase 2: detailed terrain scoring ----
-            scored: List[Dict[str, Any]] = []
-            for c in candidates:
-                row = int(c["row"])
-                col = int(c["col"])
-                e = float(c["elevation_m"])
-                s = float(c["slope_deg"])
-                slope_pref = float(c["slope_pref"])
-                elev_pref = float(c["elev_pref"])
-
-                r0 = max(0, row - local_radius_px)
-                r1 = min(elev.shape[0], row + local_radius_px + 1)
-                c0 = max(0, col - local_radius_px)
-                c1 = min(elev.shape[1], col + local_radius_px + 1)
-
-                local_elev = elev[r0:r1, c0:c1]
-                local_slope = slope_deg[r0:r1, c0:c1]
-                local_curv = curvature[r0:r1, c0:c1]
-
-                local_mean = float(np.nanmean(local_elev)) if np.isfinite(local_elev).any() else e
-                local_min = float(np.nanmin(local_elev)) if np.isfinite(local_elev).any() else e
-                local_max = float(np.nanmax(local_elev)) if np.isfinite(local_elev).any() else e
-                local_relief = max(1e-6, local_max - local_min)
-
-                local_slope_mean = float(np.nanmean(local_slope)) if np.isfinite(local_slope).any() else s
-                local_slope_std = float(np.nanstd(local_slope)) if np.isfinite(local_slope).any() else 0.0
-                local_roughness = float(np.nanstd(local_elev)) if np.isfinite(local_elev).any() else 0.0
-                local_curv_mean = float(np.nanmean(np.abs(local_curv))) if np.isfinite(local_curv).any() else 0.0
-
-                tpi = float(e - local_mean)
-                tpi_norm = float(tpi / local_relief)
-
-                lr0 = max(0, row - large_radius_px)
-                lr1 = min(elev.shape[0], row + large_radius_px + 1)
-                lc0 = max(0, col - large_radius_px)
-                lc1 = min(elev.shape[1], col + large_radius_px + 1)
-                large_elev = elev[lr0:lr1, lc0:lc1]
-                large_mean = float(np.nanmean(large_elev)) if np.isfinite(large_elev).any() else local_mean
-                large_min = float(np.nanmin(large_elev)) if np.isfinite(large_elev).any() else local_min
-                large_max = float(np.nanmax(large_elev)) if np.isfinite(large_elev).any() else local_max
-                large_relief = max(1e-6, large_max - large_min)
-                tpi_large = float(e - large_mean)
-                tpi_large_norm = float(tpi_large / large_relief)
-
-                bench_score = _clamp01(1.0 - (local_slope_mean / 12.0)) * _clamp01(1.0 - (abs(tpi_norm) * 2.0))
-                saddle_score = _clamp01(local_relief / 12.0) * _clamp01(1.0 - (abs(tpi_norm) * 2.0)) * _clamp01(local_slope_std / 5.0)
-                corridor_score = _clamp01(1.0 - (abs(local_slope_mean - 8.0) / 8.0)) * _clamp01(local_relief / 10.0)
-                roughness_score = _clamp01(local_roughness / 6.0)
-                curvature_score = _clamp01(local_curv_mean / 0.08)
-                shelter_score = _clamp01((-tpi_norm) * 1.5) * _clamp01(local_relief / 15.0) * _clamp01(1.0 - (abs(local_slope_mean - 10.0) / 12.0))
-                tpi_large_score = _clamp01(1.0 - (abs(tpi_large_norm) * 2.0))
-
-                score = (
-                    slope_pref * 30.0
-                    + elev_pref * 20.0
-                    + bench_score * 12.0
-                    + saddle_score * 8.0
-                    + corridor_score * 8.0
-                    + roughness_score * 8.0
-                    + curvature_score * 4.0
-                    + shelter_score * 6.0
-                    + tpi_large_score * 4.0
-                )
-                scored.append(
-                    {
-                        "lat": float(c["lat"]),
-                        "lon": float(c["lon"]),
-                        "lidar_score": float(score),
-                        "elevation_m": float(e),
-                        "slope_deg": float(s),
-                        "tpi": float(tpi),
-                        "tpi_large": float(tpi_large),
-                        "local_relief_m": float(local_relief),
-                        "large_relief_m": float(large_relief),
-                        "local_slope_mean": float(local_slope_mean),
-                        "local_roughness": float(local_roughness),
-                        "local_curvature": float(local_curv_mean),
-                        "bench_score": float(bench_score),
-                        "saddle_score": float(saddle_score),
-                        "corridor_score": float(corridor_score),
-                        "roughness_score": float(roughness_score),
-                        "curvature_score": float(curvature_score),
-                        "shelter_score": float(shelter_score),
-                        "tpi_large_score": float(tpi_large_score),
-                    }
-                )
-
-            scored.sort(
-                key=lambda r: (
-                    -float(r.get("lidar_score", 0.0)),
-                    float(r.get("lat", 0.0)),
-                    float(r.get("lon", 0.0)),
-                )
+            saddle_score = (
+                np.clip(local_relief / 12.0, 0.0, 1.0)
+                * np.clip(1.0 - (np.abs(tpi_norm) * 2.0), 0.0, 1.0)
+                * np.clip(local_slope_std / 5.0, 0.0, 1.0)
+            )
+            corridor_score = (
+                np.clip(1.0 - (np.abs(local_slope_mean - 8.0) / 8.0), 0.0, 1.0)
+                * np.clip(local_relief / 10.0, 0.0, 1.0)
+            )
+            roughness_score = np.clip(local_roughness / 6.0, 0.0, 1.0)
+            curvature_score = np.clip(local_curv_mean / 0.08, 0.0, 1.0)
+            shelter_score = (
+                np.clip((-tpi_norm) * 1.5, 0.0, 1.0)
+                * np.clip(local_relief / 15.0, 0.0, 1.0)
+                * np.clip(1.0 - (np.abs(local_slope_mean - 10.0) / 12.0), 0.0, 1.0)
             )
-            top = scored[: max(1, top_k)]
+            tpi_large_score = np.clip(1.0 - (np.abs(tpi_large_norm) * 2.0), 0.0, 1.0)
+
+            score = (
+                slope_pref * 30.0
+                + elev_pref * 20.0
+                + bench_score * 12.0
+                + saddle_score * 8.0
+                + corridor_score * 8.0
+                + roughness_score * 8.0
+                + curvature_score * 4.0
+                + shelter_score * 6.0
+                + tpi_large_score * 4.0
+            )
+
+            # Best score first; ties broken by lat, then lon.
+            order = np.lexsort((lons_out, lats_out, -score))[: max(1, top_k)]
+            top = [
+                {
+                    "lat": float(lats_out[i]),
+                    "lon": float(lons_out[i]),
+                    "lidar_score": float(score[i]),
+                    "elevation_m": float(e[i]),
+                    "slope_deg": float(s[i]),
+                    "tpi": float(tpi[i]),
+                    "tpi_large": float(tpi_large[i]),
+                    "local_relief_m": float(local_relief[i]),
+                    "large_relief_m": float(large_relief[i]),
+                    "local_slope_mean": float(local_slope_mean[i]),
+                    "local_roughness": float(local_roughness[i]),
+                    "local_curvature": float(local_curv_mean[i]),
+                    "bench_score": float(bench_score[i]),
+                    "saddle_score": float(saddle_score[i]),
+                    "corridor_score": float(corridor_score[i]),
+                    "roughness_score": float(roughness_score[i]),
+                    "curvature_score": float(curvature_score[i]),
+                    "shelter_score": float(shelter_score[i]),
+                    "tpi_large_score": float(tpi_large_score[i]),
+                }
+                for i in order
+            ]
 
             meta = {
                 "lidar_available": True,
                 "dem_path": dem_path,
-                "scored_points": len(scored),
+                "scored_points": int(score.size),
                 "window_shape": [int(elev.shape[0]), int(elev.shape[1])],
                 "window_resolution_m": [xres, yres],
             }
@@ -6,6 +6,10 @@ import math
 import random
 from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
+
+from backend.utils.geo import points_in_polygon_mask
+
 
 def _wrap_lon(lon: float) -> float:
     return ((lon + 180.0) % 360.0) - 180.0
@@ -58,21 +62,24 @@ def sample_points_in_polygon(
     min_lat, max_lat = min(lats), max(lats)
     min_lon, max_lon = min(lons), max(lons)
 
-    polygon = try_make_polygon(corners)
-
     points: List[Tuple[float, float]] = []
     center = points_center(corners)
     points.append(center)
 
+    # Candidates are drawn in the same rng order as a one-at-a-time loop and
+    # tested in batches, so a given seed yields the same points.
     max_tries = max(2000, n * 200)
     tries = 0
     while len(points) < n and tries < max_tries:
-        tries += 1
-        lat = rng.uniform(min_lat, max_lat)
-        lon = rng.uniform(min_lon, max_lon)
-        lon = _wrap_lon(lon)
-        if point_in_polygon(lat, lon, polygon):
-            points.append((lat, lon))
+        batch = min(max_tries - tries, max(64, (n - len(points)) * 4))
+        tries += batch
+        cand = [(rng.uniform(min_lat, max_lat), _wrap_lon(rng.uniform(min_lon, max_lon))) for _ in range(batch)]
+        lat_arr = np.fromiter((c[0] for c in cand), dtype=float, count=batch)
+        lon_arr = np.fromiter((c[1] for c in cand), dtype=float, count=batch)
+        for k in np.flatnonzero(points_in_polygon_mask(lat_arr, lon_arr, corners)):
+            points.append(cand[k])
+            if len(points) >= n:
+                break
 
     return points[:n]
 
@@ -104,38 +111,21 @@ def generate_grid_points_in_polygon(
     lons = [c[1] for c in corners]
     min_lat, max_lat = min(lats), max(lats)
     min_lon, max_lon = min(lons), max(lons)
-    polygon = try_make_polygon(corners)
 
     oversample = 2.0
     grid_size = max(8, int(math.sqrt(max(1, target_n) * oversample)))
 
-    try:
-        import numpy as np  # type: ignore
-
-        lat_vals = np.linspace(min_lat, max_lat, grid_size, dtype=float)
-        lon_vals = np.linspace(min_lon, max_lon, grid_size, dtype=float)
-        inside: List[Tuple[float, float]] = []
-        for lat in lat_vals:
-            for lon in lon_vals:
-                lon_w = _wrap_lon(float(lon))
-                lat_f = float(lat)
-                if point_in_polygon(lat_f, lon_w, polygon):
-                    inside.append((lat_f, lon_w))
-    except Exception:
-        inside = []
-        for i in range(grid_size):
-            lat = min_lat + (max_lat - min_lat) * (i / max(1, grid_size - 1))
-            for j in range(grid_size):
-                lon = min_lon + (max_lon - min_lon) * (j / max(1, grid_size - 1))
-                lon = _wrap_lon(lon)
-                if point_in_polygon(lat, lon, polygon):
-                    inside.append((lat, lon))
+    lat_vals = np.linspace(min_lat, max_lat, grid_size, dtype=float)
+    lon_vals = (np.linspace(min_lon, max_lon, grid_size, dtype=float) + 180.0) % 360.0 - 180.0
+    lat_grid, lon_grid = np.meshgrid(lat_vals, lon_vals, indexing="ij")
+    mask = points_in_polygon_mask(lat_grid, lon_grid, corners)
+    inside: List[Tuple[float, float]] = list(zip(lat_grid[mask].tolist(), lon_grid[mask].tolist()))
 
     if not inside:
         return []
 
     center = points_center(corners)
-    if center not in inside and point_in_polygon(center[0], center[1], polygon):
+    if center not in inside and points_in_polygon_mask([center[0]], [center[1]], corners)[0]:
         inside.insert(0, center)
 
     if len(inside) <= target_n:
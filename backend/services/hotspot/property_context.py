@@ -0,0 +1,207 @@
+"""Shared per-job environmental context for hotspot property runs.
+
+A hotspot job runs a full prediction for every shortlisted point of one
+property. The weather forecast, road network, vegetation analysis and DEM
+tiles are the same for all of those points, so ``build_property_context``
+fetches them once for the property bounding box and every prediction of the
+job reads them from the resulting ``PropertyContext`` instead of hitting
+Open-Meteo, Overpass, Earth Engine and the LiDAR files again.
+
+Each source is optional: if one fails to load, predictions fall back to
+fetching that source per point exactly as they do without a context.
+"""
+
+from __future__ import annotations
+
+import copy
+import logging
+import math
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from backend.services.hotspot.polygon import points_center
+from backend.utils.geo import haversine
+
+logger = logging.getLogger(__name__)
+
+# Radii used by the per-point prediction path; the context is built so that
+# every point in the property still sees this much surrounding area.
+OSM_RADIUS_KM = 1.0
+VEGETATION_RADIUS_KM = 0.914
+DEM_SAMPLE_RADIUS_M = 30
+
+
+@dataclass
+class PropertyContext:
+    bbox: Tuple[float, float, float, float]  # (min_lat, min_lon, max_lat, max_lon)
+    center: Tuple[float, float]
+    season: str
+    target_datetime: Optional[datetime] = None
+    weather: Optional[Dict[str, Any]] = None
+    osm_roads: Optional[List[Dict[str, Any]]] = None
+    vegetation: Optional[Dict[str, Any]] = None
+    dem_window: Any = None  # backend.services.lidar_processor.DEMWindow
+    load_seconds: Dict[str, float] = field(default_factory=dict)
+
+    def weather_data(self) -> Optional[Dict[str, Any]]:
+        """Return a private copy of the property forecast (callers mutate it)."""
+        if self.weather is None:
+            return None
+        return copy.deepcopy(self.weather)
+
+    def osm_data(self, predictor: Any, lat: float, lon: float) -> Optional[Dict[str, Any]]:
+        """Road proximity for one point computed from the property extract."""
+        if self.osm_roads is None:
+            return None
+        return predictor.road_proximity_from_elements(lat, lon, self.osm_roads, radius_km=OSM_RADIUS_KM)
+
+    def vegetation_data(self, lat: float, lon: float) -> Optional[Dict[str, Any]]:
+        """Property vegetation analysis with canopy coverage localised to *lat/lon*.
+
+        The canopy grid covers the whole property; the scalar coverage is the
+        mean of grid cells within the per-point vegetation radius, so points
+        in open fields and in timber keep distinct canopy values.
+        """
+        if self.vegetation is None:
+            return None
+        data = dict(self.vegetation)
+        canopy = data.get("canopy_coverage_analysis")
+        if isinstance(canopy, dict):
+            canopy = dict(canopy)
+            local = _local_canopy_mean(canopy, lat, lon, VEGETATION_RADIUS_KM * 1000.0)
+            if local is not None:
+                canopy["canopy_coverage"] = local
+            data["canopy_coverage_analysis"] = canopy
+        return data
+
+    def lidar_terrain(self, lat: float, lon: float) -> Optional[Dict[str, Any]]:
+        """Point terrain from the in-memory DEM window, or None if not covered."""
+        if self.dem_window is None:
+            return None
+        try:
+            return self.dem_window.terrain_at(lat, lon, sample_radius_m=DEM_SAMPLE_RADIUS_M)
+        except Exception:
+            logger.debug("PropertyContext: DEM window lookup failed at %.5f, %.5f", lat, lon, exc_info=True)
+            return None
+
+    def summary(self) -> Dict[str, Any]:
+        """JSON-safe description of what was shared, for the job report."""
+        return {
+            "bbox": list(self.bbox),
+            "center": {"lat": self.center[0], "lon": self.center[1]},
+            "weather": self.weather is not None,
+            "osm_roads": len(self.osm_roads) if self.osm_roads is not None else None,
+            "vegetation": self.vegetation is not None,
+            "dem_window_shape": list(self.dem_window.shape) if self.dem_window is not None else None,
+            "load_seconds": {k: round(v, 3) for k, v in self.load_seconds.items()},
+        }
+
+
+def _local_canopy_mean(canopy: Dict[str, Any], lat: float, lon: float, radius_m: float) -> Optional[float]:
+    grid = canopy.get("canopy_grid") or []
+    coords = canopy.get("grid_coordinates") or {}
+    lats = coords.get("lat") or []
+    lons = coords.get("lon") or []
+    values = [v for row in grid for v in row] if grid and isinstance(grid[0], list) else list(grid)
+    if not values or len(values) != len(lats) or len(lats) != len(lons):
+        return None
+    near = [
+        float(v) for v, glat, glon in zip(values, lats, lons)
+        if haversine(lat, lon, float(glat), float(glon)) <= radius_m
+    ]
+    if not near:
+        return None
+    return sum(near) / len(near)
+
+
+def _expand_bbox(
+    bbox: Tuple[float, float, float, float], margin_m: float
+) -> Tuple[float, float, float, float]:
+    min_lat, min_lon, max_lat, max_lon = bbox
+    dlat = margin_m / 111_320.0
+    mid_lat = math.radians((min_lat + max_lat) / 2.0)
+    dlon = margin_m / max(1e-6, 111_320.0 * math.cos(mid_lat))
+    return (min_lat - dlat, min_lon - dlon, max_lat + dlat, max_lon + dlon)
+
+
+def _timed(label: str, timings: Dict[str, float], fn, *args, **kwargs):
+    start = time.perf_counter()
+    try:
+        return fn(*args, **kwargs)
+    except Exception as e:
+        logger.warning("PropertyContext: %s failed, predictions will fetch it per point: %s", label, e)
+        return None
+    finally:
+        timings[label] = time.perf_counter() - start
+
+
+def _load_vegetation(lat: float, lon: float, radius_km: float, season: str) -> Optional[Dict[str, Any]]:
+    from backend.vegetation_analyzer import VegetationAnalyzer
+
+    analyzer = VegetationAnalyzer()
+    if not analyzer.initialize():
+        return None
+    return analyzer.analyze_hunting_area(lat, lon, radius_km=radius_km, season=season)
+
+
+def _load_dem_window(bbox: Tuple[float, float, float, float]):
+    from backend.services.lidar_processor import get_lidar_processor
+
+    dem_manager, _, _ = get_lidar_processor()
+    max_cells = int(os.getenv("HOTSPOT_LIDAR_MAX_WINDOW_CELLS", "50000000"))
+    return dem_manager.read_window(*bbox, sample_radius_m=DEM_SAMPLE_RADIUS_M, max_cells=max_cells)
+
+
+def build_property_context(
+    corners: List[Tuple[float, float]],
+    *,
+    season: str,
+    target_datetime: Optional[datetime],
+    predictor: Any,
+) -> PropertyContext:
+    """Fetch the shared environmental data for a property, sources in parallel.
+
+    Args:
+        corners: Property polygon as (lat, lon) tuples.
+        predictor: The ``EnhancedBeddingZonePredictor`` used for the job; its
+            weather and OSM clients are reused so results match per-point calls.
+    """
+    lats = [c[0] for c in corners]
+    lons = [c[1] for c in corners]
+    bbox = (min(lats), min(lons), max(lats), max(lons))
+    center = points_center(corners)
+    half_diagonal_km = haversine(bbox[0], bbox[1], bbox[2], bbox[3]) / 2000.0
+
+    timings: Dict[str, float] = {}
+    with ThreadPoolExecutor(max_workers=4, thread_name_prefix="property-context") as pool:
+        weather_f = pool.submit(
+            _timed, "weather", timings,
+            predictor.get_enhanced_weather_with_trends, center[0], center[1], target_datetime,
+        )
+        osm_f = pool.submit(
+            _timed, "osm", timings,
+            predictor.get_osm_roads_in_bbox, *_expand_bbox(bbox, OSM_RADIUS_KM * 1000.0),
+        )
+        vegetation_f = pool.submit(
+            _timed, "vegetation", timings,
+            _load_vegetation, center[0], center[1], half_diagonal_km + VEGETATION_RADIUS_KM, season,
+        )
+        dem_f = pool.submit(_timed, "dem_window", timings, _load_dem_window, bbox)
+
+    context = PropertyContext(
+        bbox=bbox,
+        center=center,
+        season=season,
+        target_datetime=target_datetime,
+        weather=weather_f.result(),
+        osm_roads=osm_f.result(),
+        vegetation=vegetation_f.result(),
+        dem_window=dem_f.result(),
+        load_seconds=timings,
+    )
+    logger.info("PropertyContext ready: %s", context.summary())
+    return context
@@ -0,0 +1,249 @@
+"""SQLite job registry shared by hotspot and max-accuracy jobs.
+
+One ``jobs`` table (WAL journal) holds the latest status of every job of
+both kinds, indexed by id, by kind/state and by age. Status boards write to
+it in batched transactions, the events stream and status endpoints read
+from it when a job is not in memory (another worker process, or after a
+restart), listing recent jobs is a single indexed query, and retention
+cleanup is one ``DELETE``. Job artifacts (reports, maps, candidate columns)
+stay in the per-job directories.
+
+The database path comes from ``JOB_REGISTRY_DB`` (default
+``data/job_registry.sqlite3`` under the repository root) and is resolved on
+every ``get_job_registry()`` call, so an override takes effect without a
+restart.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id     TEXT PRIMARY KEY,
+    kind       TEXT NOT NULL,
+    state      TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    status     TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_kind_state ON jobs(kind, state);
+CREATE INDEX IF NOT EXISTS idx_jobs_updated_at ON jobs(updated_at);
+CREATE TABLE IF NOT EXISTS registry_meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# (job_id, status) or (job_id, status, updated_at epoch seconds)
+StatusRow = Tuple[Any, ...]
+
+
+def _state_of(status: Dict[str, Any]) -> str:
+    # Max-accuracy statuses use "state", hotspot jobs use "status".
+    return str(status.get("state") or status.get("status") or "unknown")
+
+
+class JobRegistry:
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        # One connection per registry, serialised by _lock; WAL lets other
+        # processes read while this one writes.
+        self._conn = sqlite3.connect(str(self.path), timeout=30.0, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+    def upsert_many(self, kind: str, rows: Iterable[StatusRow]) -> int:
+        """Insert or replace the status of several jobs in one transaction.
+
+        ``created_at`` is kept from the first write of a job; ``updated_at``
+        is the row's explicit timestamp or now.
+        """
+        now = time.time()
+        params = []
+        for row in rows:
+            job_id, status = row[0], row[1]
+            updated_at = float(row[2]) if len(row) > 2 and row[2] is not None else now
+            params.append(
+                (str(job_id), kind, _state_of(status), updated_at, updated_at,
+                 json.dumps(status, separators=(",", ":"), default=str))
+            )
+        if not params:
+            return 0
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(
+                    "INSERT INTO jobs (job_id, kind, state, created_at, updated_at, status) "
+                    "VALUES (?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT(job_id) DO UPDATE SET kind=excluded.kind, state=excluded.state, "
+                    "updated_at=excluded.updated_at, status=excluded.status",
+                    params,
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return len(params)
+
+    def upsert(self, kind: str, job_id: str, status: Dict[str, Any]) -> None:
+        self.upsert_many(kind, [(job_id, status)])
+
+    def delete(self, job_ids: Sequence[str]) -> int:
+        if not job_ids:
+            return 0
+        with self._lock:
+            cur = self._conn.execute(
+                f"DELETE FROM jobs WHERE job_id IN ({','.join('?' * len(job_ids))})", list(job_ids)
+            )
+            return cur.rowcount
+
+    def delete_older_than(self, max_age_s: float, *, kind: Optional[str] = None) -> List[Tuple[str, str]]:
+        """Delete jobs not updated for *max_age_s* seconds; returns (job_id, kind)."""
+        cutoff = time.time() - float(max_age_s)
+        sql = "DELETE FROM jobs WHERE updated_at < ?"
+        args: List[Any] = [cutoff]
+        if kind is not None:
+            sql += " AND kind = ?"
+            args.append(kind)
+        with self._lock:
+            return [(r[0], r[1]) for r in self._conn.execute(sql + " RETURNING job_id, kind", args).fetchall()]
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+    def get(self, job_id: str, *, kind: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Latest stored status of *job_id* (optionally only of one kind)."""
+        sql = "SELECT status FROM jobs WHERE job_id = ?"
+        args: List[Any] = [job_id]
+        if kind is not None:
+            sql += " AND kind = ?"
+            args.append(kind)
+        with self._lock:
+            row = self._conn.execute(sql, args).fetchone()
+        if row is None:
+            return None
+        try:
+            return json.loads(row[0])
+        except ValueError:
+            logger.debug("JobRegistry: corrupt status row for %s", job_id, exc_info=True)
+            return None
+
+    def list_recent(
+        self,
+        *,
+        kind: Optional[str] = None,
+        states: Optional[Iterable[str]] = None,
+        limit: int = 50,
+    ) -> List[Dict[str, Any]]:
+        """Most recently updated jobs, newest first."""
+        clauses: List[str] = []
+        args: List[Any] = []
+        if kind is not None:
+            clauses.append("kind = ?")
+            args.append(kind)
+        state_list = list(states or ())
+        if state_list:
+            clauses.append(f"state IN ({','.join('?' * len(state_list))})")
+            args.extend(state_list)
+        where = f"WHERE {' AND '.join(clauses)} " if clauses else ""
+        args.append(max(1, int(limit)))
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT job_id, kind, state, created_at, updated_at FROM jobs "
+                f"{where}ORDER BY updated_at DESC LIMIT ?",
+                args,
+            ).fetchall()
+        return [
+            {"job_id": r[0], "kind": r[1], "state": r[2], "created_at": r[3], "updated_at": r[4]}
+            for r in rows
+        ]
+
+    # ------------------------------------------------------------------
+    # One-off import of jobs that predate the registry
+    # ------------------------------------------------------------------
+    def import_legacy_jobs(self, kind: str, jobs_dir: Path, status_filename: str) -> int:
+        """Register job directories written before the registry existed.
+
+        Runs once per (kind, directory); the status file's contents (or
+        ``{"state": "unknown"}``) are stored with the directory mtime as
+        ``updated_at`` so retention keeps working for old jobs.
+        """
+        marker = f"legacy_import:{kind}:{Path(jobs_dir).resolve()}"
+        with self._lock:
+            if self._conn.execute("SELECT 1 FROM registry_meta WHERE key = ?", (marker,)).fetchone():
+                return 0
+        rows: List[StatusRow] = []
+        if Path(jobs_dir).is_dir():
+            for child in Path(jobs_dir).iterdir():
+                if not child.is_dir():
+                    continue
+                try:
+                    status: Dict[str, Any] = {"job_id": child.name, "state": "unknown"}
+                    status_path = child / status_filename
+                    if status_path.exists():
+                        status = json.loads(status_path.read_text(encoding="utf-8"))
+                    rows.append((child.name, status, child.stat().st_mtime))
+                except (OSError, ValueError):
+                    logger.debug("JobRegistry: skipping unreadable legacy job %s", child, exc_info=True)
+        with self._lock:
+            known = {r[0] for r in self._conn.execute("SELECT job_id FROM jobs").fetchall()}
+        imported = self.upsert_many(kind, [r for r in rows if r[0] not in known])
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO registry_meta (key, value) VALUES (?, ?)", (marker, str(time.time()))
+            )
+        if imported:
+            logger.info("JobRegistry: imported %d legacy %s jobs from %s", imported, kind, jobs_dir)
+        return imported
+
+
+def _resolve_registry_path() -> Path:
+    base_dir = Path(__file__).resolve().parents[2]
+    path = Path(os.getenv("JOB_REGISTRY_DB", "data/job_registry.sqlite3"))
+    if not path.is_absolute():
+        path = base_dir / path
+    return path
+
+
+_REGISTRIES: Dict[Path, JobRegistry] = {}
+_REGISTRIES_LOCK = threading.Lock()
+
+
+def get_job_registry() -> JobRegistry:
+    """Registry for the current ``JOB_REGISTRY_DB`` (one connection per path)."""
+    path = _resolve_registry_path()
+    with _REGISTRIES_LOCK:
+        registry = _REGISTRIES.get(path)
+        if registry is None:
+            registry = JobRegistry(path)
+            _REGISTRIES[path] = registry
+        return registry
+
+
+def reset_job_registries() -> None:
+    """Close every cached registry connection and forget them (tests, shutdown)."""
+    with _REGISTRIES_LOCK:
+        registries = list(_REGISTRIES.values())
+        _REGISTRIES.clear()
+    for registry in registries:
+        registry.close()
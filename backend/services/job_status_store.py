@@ -0,0 +1,280 @@
+"""In-process job status board with throttled persistence.
+
+Long-running jobs report progress many times per second (grid rows, DEM
+tiles, GEE batches). Writing every update to ``status.json`` puts hundreds
+of JSON read-modify-write cycles on the request path. ``JobStatusStore``
+keeps the latest status per job in memory, serves reads from there, and
+flushes at most every ``flush_interval_s`` seconds — immediately for the
+first write and for terminal states so other processes (and a restarted
+backend) can still recover the job.
+
+Persistence goes either to one status file per job (``path_for``) or to
+the shared SQLite ``JobRegistry`` (``registry_for``). In registry mode a
+flush writes every dirty job in a single transaction, and reads fall back
+to the legacy status file for jobs that predate the registry.
+
+``JobUpdateNotifier`` lets event-stream subscribers await the next update
+of a job instead of polling for it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from backend.services.job_registry import JobRegistry
+
+logger = logging.getLogger(__name__)
+
+TERMINAL_STATES = frozenset({"completed", "error", "cancelled"})
+
+
+class JobUpdateNotifier:
+    """Wakes asyncio subscribers when a job's status changes.
+
+    ``notify`` may be called from any thread (pipeline workers, executor
+    threads); each subscriber's event is set on its own event loop via
+    ``call_soon_threadsafe`` so no thread is ever parked waiting.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._subscribers: Dict[str, List[Tuple[asyncio.AbstractEventLoop, asyncio.Event]]] = {}
+
+    def subscribe(self, job_id: str) -> asyncio.Event:
+        """Return an event (bound to the running loop) set on every update."""
+        event = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            self._subscribers.setdefault(job_id, []).append((loop, event))
+        return event
+
+    def unsubscribe(self, job_id: str, event: asyncio.Event) -> None:
+        with self._lock:
+            subs = self._subscribers.get(job_id)
+            if not subs:
+                return
+            subs[:] = [(loop, ev) for loop, ev in subs if ev is not event]
+            if not subs:
+                self._subscribers.pop(job_id, None)
+
+    def notify(self, job_id: str) -> None:
+        with self._lock:
+            subs = list(self._subscribers.get(job_id, ()))
+        for loop, event in subs:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                # Subscriber's loop already closed; it will unsubscribe itself.
+                continue
+
+
+class JobStatusStore:
+    def __init__(
+        self,
+        path_for: Optional[Callable[[str], Path]] = None,
+        *,
+        registry_for: Optional[Callable[[], "JobRegistry"]] = None,
+        kind: str = "job",
+        state_key: str = "state",
+        flush_interval_s: float = 2.0,
+        max_entries: int = 1000,
+        terminal_states: Iterable[str] = TERMINAL_STATES,
+    ) -> None:
+        """
+        Args:
+            path_for: Maps a job_id to its status file. Resolved on every
+                flush so a jobs-dir override takes effect without a restart.
+                With *registry_for* it is only read, for jobs written
+                before the registry existed.
+            registry_for: Returns the job registry to persist to; resolved
+                on every flush for the same reason as *path_for*.
+            kind: Job kind recorded in the registry.
+            state_key: Status field holding the job state.
+            flush_interval_s: Minimum seconds between writes for
+                non-terminal updates of one job.
+            max_entries: Terminal jobs beyond this count are dropped from
+                memory (oldest first); they remain readable from storage.
+        """
+        if path_for is None and registry_for is None:
+            raise ValueError("JobStatusStore needs path_for or registry_for")
+        self._path_for = path_for
+        self._registry_for = registry_for
+        self.kind = kind
+        self.state_key = state_key
+        self.flush_interval_s = max(0.0, float(flush_interval_s))
+        self.max_entries = max(1, int(max_entries))
+        self.terminal_states = frozenset(terminal_states)
+
+        self._lock = threading.Lock()
+        self._status: Dict[str, Dict[str, Any]] = {}
+        self._dirty: set[str] = set()
+        self._last_flush: Dict[str, float] = {}
+        self._timers: Dict[str, threading.Timer] = {}
+        self._file_locks: Dict[str, threading.Lock] = {}
+        self._registry_flush_lock = threading.Lock()
+        self.updates = JobUpdateNotifier()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    def put(self, job_id: str, status: Dict[str, Any], *, force: bool = False) -> None:
+        """Record the latest *status* for *job_id*.
+
+        The write is persisted now when it is the job's first status, a
+        terminal state, *force* is set, or the flush interval has elapsed;
+        otherwise a deferred flush is scheduled.
+        """
+        now = time.monotonic()
+        with self._lock:
+            first = job_id not in self._last_flush
+            self._status[job_id] = dict(status)
+            self._dirty.add(job_id)
+            terminal = status.get(self.state_key) in self.terminal_states
+            due = now - self._last_flush.get(job_id, 0.0) >= self.flush_interval_s
+            flush_now = force or first or terminal or due
+            if not flush_now and job_id not in self._timers:
+                delay = self.flush_interval_s - (now - self._last_flush[job_id])
+                timer = threading.Timer(max(0.0, delay), self.flush, args=(job_id,))
+                timer.daemon = True
+                self._timers[job_id] = timer
+                timer.start()
+            if terminal:
+                self._prune_locked()
+        if flush_now:
+            self.flush(job_id)
+        self.updates.notify(job_id)
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Return the latest status, from memory or (for other processes'
+        jobs and after a restart) from the registry or status file."""
+        with self._lock:
+            status = self._status.get(job_id)
+            if status is not None:
+                return dict(status)
+        status = self._read_persisted(job_id)
+        if status is not None and status.get(self.state_key) in self.terminal_states:
+            # Terminal statuses never change again, so they are safe to
+            # cache. Live statuses owned by another process are not.
+            with self._lock:
+                self._status.setdefault(job_id, dict(status))
+                self._last_flush.setdefault(job_id, time.monotonic())
+        return status
+
+    def flush(self, job_id: Optional[str] = None) -> None:
+        """Persist pending status for *job_id* (or every dirty job).
+
+        In registry mode every dirty job is written, in one transaction.
+        """
+        if self._registry_for is not None:
+            self._flush_registry()
+            return
+        with self._lock:
+            ids = [job_id] if job_id is not None else list(self._dirty)
+        for jid in ids:
+            with self._lock:
+                file_lock = self._file_locks.setdefault(jid, threading.Lock())
+            # Snapshot under the file lock so a slower flush can never
+            # overwrite a newer status written by a concurrent flush.
+            with file_lock:
+                with self._lock:
+                    timer = self._timers.pop(jid, None)
+                    if jid not in self._dirty:
+                        continue
+                    status = dict(self._status[jid])
+                    self._dirty.discard(jid)
+                    self._last_flush[jid] = time.monotonic()
+                if timer is not None and timer is not threading.current_thread():
+                    timer.cancel()
+                try:
+                    self._write_disk(jid, status)
+                except Exception:
+                    logger.warning("JobStatusStore: failed to persist status for %s", jid, exc_info=True)
+                    with self._lock:
+                        self._dirty.add(jid)
+
+    def forget(self, job_id: str) -> None:
+        """Drop all in-memory state for *job_id* (e.g. after cleanup)."""
+        with self._lock:
+            timer = self._timers.pop(job_id, None)
+            self._status.pop(job_id, None)
+            self._dirty.discard(job_id)
+            self._last_flush.pop(job_id, None)
+            self._file_locks.pop(job_id, None)
+        if timer is not None:
+            timer.cancel()
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+    def _prune_locked(self) -> None:
+        excess = len(self._status) - self.max_entries
+        if excess <= 0:
+            return
+        terminal = [
+            jid for jid, st in self._status.items()
+            if st.get(self.state_key) in self.terminal_states and jid not in self._dirty
+        ]
+        for jid in terminal[:excess]:
+            self._status.pop(jid, None)
+            self._last_flush.pop(jid, None)
+            self._file_locks.pop(jid, None)
+
+    def _flush_registry(self) -> None:
+        # Serialised so an older batch can never land after a newer one.
+        with self._registry_flush_lock:
+            with self._lock:
+                rows = [(jid, dict(self._status[jid])) for jid in self._dirty]
+                timers = [self._timers.pop(jid) for jid, _ in rows if jid in self._timers]
+                now = time.monotonic()
+                for jid, _ in rows:
+                    self._last_flush[jid] = now
+                self._dirty.clear()
+            for timer in timers:
+                if timer is not threading.current_thread():
+                    timer.cancel()
+            if not rows:
+                return
+            try:
+                self._registry_for().upsert_many(self.kind, rows)
+            except Exception:
+                logger.warning("JobStatusStore: failed to persist %d %s statuses", len(rows), self.kind, exc_info=True)
+                with self._lock:
+                    self._dirty.update(jid for jid, _ in rows if jid in self._status)
+
+    def _read_persisted(self, job_id: str) -> Optional[Dict[str, Any]]:
+        if self._registry_for is not None:
+            try:
+                status = self._registry_for().get(job_id, kind=self.kind)
+            except Exception:
+                logger.debug("JobStatusStore: failed to read registry status for %s", job_id, exc_info=True)
+                status = None
+            if status is not None or self._path_for is None:
+                return status
+        return self._read_disk(job_id)
+
+    def _read_disk(self, job_id: str) -> Optional[Dict[str, Any]]:
+        path = self._path_for(job_id)
+        if not path.exists():
+            return None
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except Exception:
+            logger.debug("JobStatusStore: failed to read status for %s", job_id, exc_info=True)
+            return None
+
+    def _write_disk(self, job_id: str, status: Dict[str, Any]) -> None:
+        path = self._path_for(job_id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        # Write-then-rename for atomic publish: a concurrent reader never
+        # sees a partially written status file.
+        tmp_path.write_text(json.dumps(status, indent=2), encoding="utf-8")
+        os.replace(tmp_path, path)
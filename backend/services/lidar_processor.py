@@ -8,6 +8,7 @@ Key Features:
 - DEMFileManager: Manages DEM file discovery and caching (0.35m resolution offline capability)
 - TerrainExtractor: Extracts terrain metrics from LIDAR data (slope, aspect, elevation)
 - BatchLIDARProcessor: Process multiple locations efficiently (52-196 pts in one pass)
+- DEMSampler: Vectorised elevation/slope/aspect over DEM windows kept in a bounded LRU
 
 Provides 86× better resolution than GEE SRTM (0.35m vs 30m).
 
@@ -18,16 +19,18 @@ Date: October 19, 2025
 import os
 import logging
 import numpy as np
-from typing import Dict, Optional, Tuple, List
+from typing import Dict, Iterator, Optional, Sequence, Tuple, List
 from pathlib import Path
 
+from backend.performance import BoundedCache, get_performance_monitor
+
 logger = logging.getLogger(__name__)
 
 # Try to import rasterio (for TIF reading)
 try:
     import rasterio
     from rasterio.windows import Window
-    from rasterio.transform import from_bounds
+    from rasterio.transform import from_bounds, rowcol
     from rasterio.warp import transform
     RASTERIO_AVAILABLE = True
 except ImportError:
@@ -181,6 +184,204 @@ class DEMFileManager:
         """Get discovered LIDAR files (name -> path mapping)"""
         return self.lidar_files
 
+    def read_window(self, min_lat: float, min_lon: float,
+                    max_lat: float, max_lon: float,
+                    sample_radius_m: int = 30,
+                    max_cells: int = 50_000_000) -> Optional["DEMWindow"]:
+        """
+        Read the DEM pixels covering a lat/lon bounding box into memory.
+
+        The window is padded by one point-sample radius so every point inside
+        the box can be served by ``DEMWindow.terrain_at`` without touching
+        the file again. Uses the first file (DEM preferred) that intersects
+        the box, matching ``TerrainExtractor.extract_point_terrain``'s order.
+
+        Returns:
+            DEMWindow, or None if no file intersects the box or the window
+            would exceed ``max_cells`` pixels.
+        """
+        if not RASTERIO_AVAILABLE or not self.lidar_files:
+            return None
+
+        for file_name, lidar_file in self.lidar_files.items():
+            try:
+                with rasterio.open(lidar_file) as src:
+                    xs, ys = transform(
+                        'EPSG:4326', src.crs,
+                        [min_lon, max_lon, min_lon, max_lon],
+                        [min_lat, min_lat, max_lat, max_lat],
+                    )
+                    bounds = src.bounds
+                    if (max(xs) < bounds.left or min(xs) > bounds.right or
+                            max(ys) < bounds.bottom or min(ys) > bounds.top):
+                        continue
+
+                    resolution_m = float(src.res[0])
+                    pixel_radius = max(3, int(sample_radius_m / resolution_m))
+                    pad = (pixel_radius + 1) * resolution_m
+                    row_a, col_a = rowcol(src.transform, min(xs) - pad, max(ys) + pad)
+                    row_b, col_b = rowcol(src.transform, max(xs) + pad, min(ys) - pad)
+                    row_off = max(0, min(row_a, row_b))
+                    col_off = max(0, min(col_a, col_b))
+                    height = min(src.height, max(row_a, row_b) + 1) - row_off
+                    width = min(src.width, max(col_a, col_b) + 1) - col_off
+                    if height <= 0 or width <= 0:
+                        continue
+                    if height * width > max_cells:
+                        logger.warning(
+                            f"DEM window {height}x{width} exceeds {max_cells} cells - "
+                            f"falling back to per-point reads"
+                        )
+                        return None
+
+                    elevation = src.read(1, window=Window(col_off, row_off, width, height))
+                    logger.info(f"📐 Loaded DEM window {height}x{width} from {file_name}")
+                    return DEMWindow(
+                        elevation=elevation,
+                        dataset_transform=src.transform,
+                        crs=src.crs,
+                        resolution_m=resolution_m,
+                        dataset_shape=(int(src.height), int(src.width)),
+                        row_off=int(row_off),
+                        col_off=int(col_off),
+                        lidar_file=lidar_file,
+                    )
+            except (rasterio.RasterioIOError, OSError, ValueError) as e:
+                logger.debug(f"Could not read window from {file_name}: {e}")
+                continue
+
+        return None
+
+
+class DEMWindow:
+    """
+    In-memory block of one DEM file covering a property.
+
+    Serves point terrain for any point inside the block with the same pixel
+    window (and therefore the same values) ``extract_point_terrain`` would
+    read from disk, without reopening the file per point.
+    """
+
+    def __init__(self, elevation: np.ndarray, dataset_transform, crs,
+                 resolution_m: float, dataset_shape: Tuple[int, int],
+                 row_off: int, col_off: int, lidar_file: str):
+        self.elevation = elevation
+        self.dataset_transform = dataset_transform
+        self.crs = crs
+        self.resolution_m = resolution_m
+        self.dataset_shape = dataset_shape
+        self.row_off = row_off
+        self.col_off = col_off
+        self.lidar_file = lidar_file
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return tuple(self.elevation.shape)
+
+    def terrain_at(self, lat: float, lon: float,
+                   sample_radius_m: int = 30) -> Optional[Dict]:
+        """
+        Point terrain from the in-memory block.
+
+        Returns None when the point's sample window is not fully inside the
+        block, so callers can fall back to ``extract_point_terrain``.
+        """
+        xs, ys = transform('EPSG:4326', self.crs, [lon], [lat])
+        row, col = rowcol(self.dataset_transform, xs[0], ys[0])
+        dataset_height, dataset_width = self.dataset_shape
+        if not (0 <= row < dataset_height and 0 <= col < dataset_width):
+            return None
+
+        # Same window arithmetic as extract_point_terrain, clipped to the file.
+        pixel_radius = max(3, int(sample_radius_m / self.resolution_m))
+        row0 = max(0, row - pixel_radius)
+        col0 = max(0, col - pixel_radius)
+        row1 = min(dataset_height, row0 + min(pixel_radius * 2, dataset_height - row + pixel_radius))
+        col1 = min(dataset_width, col0 + min(pixel_radius * 2, dataset_width - col + pixel_radius))
+
+        local_row0 = row0 - self.row_off
+        local_col0 = col0 - self.col_off
+        local_row1 = row1 - self.row_off
+        local_col1 = col1 - self.col_off
+        block_height, block_width = self.elevation.shape
+        if local_row0 < 0 or local_col0 < 0 or local_row1 > block_height or local_col1 > block_width:
+            return None
+
+        elevation_grid = self.elevation[local_row0:local_row1, local_col0:local_col1]
+        return TerrainExtractor.terrain_from_grid(
+            elevation_grid, self.resolution_m, pixel_radius, self.lidar_file, lat, lon
+        )
+
+    def pixel_indices(self, lats: Sequence[float], lons: Sequence[float]) -> Tuple[np.ndarray, np.ndarray]:
+        """Dataset (row, col) of every point, with one CRS transform for the batch."""
+        xs, ys = transform('EPSG:4326', self.crs, np.asarray(lons, dtype=float).tolist(),
+                           np.asarray(lats, dtype=float).tolist())
+        rows, cols = rowcol(self.dataset_transform, xs, ys)
+        return np.asarray(rows, dtype=np.int64), np.asarray(cols, dtype=np.int64)
+
+    def sample_elevations(self, lats: Sequence[float], lons: Sequence[float]) -> np.ndarray:
+        """Elevation of the pixel under each point; NaN outside the block."""
+        rows, cols = self.pixel_indices(lats, lons)
+        rows -= self.row_off
+        cols -= self.col_off
+        block_height, block_width = self.elevation.shape
+        inside = (rows >= 0) & (rows < block_height) & (cols >= 0) & (cols < block_width)
+        elevations = np.full(rows.shape, np.nan)
+        elevations[inside] = self.elevation[rows[inside], cols[inside]]
+        return elevations
+
+    def sample_terrain(self, lats: Sequence[float], lons: Sequence[float],
+                       sample_radius_m: int = 30) -> Dict[str, np.ndarray]:
+        """
+        Elevation, slope and aspect for many points in one vectorised pass.
+
+        Uses Horn's method on each point's 3×3 neighbourhood, the same
+        arithmetic as ``terrain_from_grid``. ``valid`` marks points whose
+        whole (unclipped) sample window lies inside the block; the other
+        entries are NaN and should be served by ``terrain_at`` or a file read.
+        Also returns the block-local ``rows``/``cols`` of every point.
+        """
+        rows, cols = self.pixel_indices(lats, lons)
+        pixel_radius = max(3, int(sample_radius_m / self.resolution_m))
+        dataset_height, dataset_width = self.dataset_shape
+        block_height, block_width = self.elevation.shape
+        local_rows = rows - self.row_off
+        local_cols = cols - self.col_off
+        valid = ((rows >= pixel_radius) & (cols >= pixel_radius) &
+                 (rows + pixel_radius <= dataset_height) & (cols + pixel_radius <= dataset_width) &
+                 (local_rows >= pixel_radius) & (local_cols >= pixel_radius) &
+                 (local_rows + pixel_radius <= block_height) & (local_cols + pixel_radius <= block_width))
+
+        r, c = local_rows[valid], local_cols[valid]
+
+        def neighbour(dr: int, dc: int) -> np.ndarray:
+            return self.elevation[r + dr, c + dc].astype(np.float64)
+
+        a, b, c3 = neighbour(-1, -1), neighbour(-1, 0), neighbour(-1, 1)
+        d, f = neighbour(0, -1), neighbour(0, 1)
+        g, h, i = neighbour(1, -1), neighbour(1, 0), neighbour(1, 1)
+        gradient_x = (c3 + 2*f + i) - (a + 2*d + g)
+        gradient_y = (g + 2*h + i) - (a + 2*b + c3)
+
+        dz_dx = gradient_x / (8.0 * self.resolution_m)
+        dz_dy = gradient_y / (8.0 * self.resolution_m)
+        slope = np.clip(np.degrees(np.arctan(np.sqrt(dz_dx**2 + dz_dy**2))), 0.0, 90.0)
+
+        dz_dx = gradient_x / 8.0
+        dz_dy = gradient_y / 8.0
+        aspect = 90.0 - np.degrees(np.arctan2(-dz_dy, dz_dx))
+        aspect = np.where(aspect < 0, aspect + 360.0, aspect)
+        aspect = np.where((np.abs(dz_dx) < 0.001) & (np.abs(dz_dy) < 0.001), 0.0, aspect)
+
+        result = {name: np.full(rows.shape, np.nan) for name in ('elevation', 'slope', 'aspect')}
+        result['elevation'][valid] = neighbour(0, 0)
+        result['slope'][valid] = slope
+        result['aspect'][valid] = aspect
+        result['valid'] = valid
+        result['rows'] = local_rows
+        result['cols'] = local_cols
+        return result
+
 
 class TerrainExtractor:
     """
@@ -258,60 +459,14 @@ class TerrainExtractor:
                     
                     # Read elevation data
                     elevation_grid = src.read(1, window=window)
-                    
-                    # Handle edge cases
-                    if elevation_grid.size < 9:  # Need at least 3×3 for calculations
-                        logger.warning(f"Insufficient data at ({lat}, {lon}) - edge of coverage")
-                        continue
-                    
-                    # Calculate center point elevation
-                    center_row = min(pixel_radius, elevation_grid.shape[0] // 2)
-                    center_col = min(pixel_radius, elevation_grid.shape[1] // 2)
-                    
-                    if center_row < 1 or center_col < 1:
-                        logger.warning(f"Edge case at ({lat}, {lon}) - cannot calculate terrain")
-                        continue
-                    
-                    center_elevation = float(elevation_grid[center_row, center_col])
-                    
-                    # Calculate slope and aspect using Horn's method
-                    slope = TerrainExtractor._calculate_point_slope(
-                        elevation_grid, resolution_m, center_row, center_col
-                    )
-                    aspect = TerrainExtractor._calculate_point_aspect(
-                        elevation_grid, center_row, center_col
-                    )
 
-                    # Corridor feature heuristics (bench/ridge/saddle strength)
-                    corridor_features = TerrainExtractor._calculate_corridor_features(
-                        elevation_grid, resolution_m, center_row, center_col
-                    )
-                    
-                    logger.debug(
-                        f"✅ LIDAR point terrain: {lat:.5f}, {lon:.5f} -> "
-                        f"Slope={slope:.1f}°, Aspect={aspect:.0f}°, Elev={center_elevation:.0f}m"
+                    terrain = TerrainExtractor.terrain_from_grid(
+                        elevation_grid, resolution_m, pixel_radius, lidar_file, lat, lon
                     )
-                    
-                    # Mark data source (DEM = accurate, hillshade = visualization)
-                    if 'DEM' in file_name.upper():
-                        source_type = 'LIDAR_DEM'
-                        accurate_slopes = True
-                    else:
-                        source_type = 'LIDAR_HILLSHADE'
-                        accurate_slopes = False
-                    
-                    return {
-                        'slope': float(slope),
-                        'aspect': float(aspect),
-                        'elevation': float(center_elevation),
-                        'resolution_m': float(resolution_m),
-                        'source': source_type,
-                        'accurate_slopes': accurate_slopes,
-                        'coverage': True,
-                        'file': os.path.basename(lidar_file),
-                        **corridor_features
-                    }
-                    
+                    if terrain is None:
+                        continue
+                    return terrain
+
             except Exception as e:
                 logger.debug(f"Error extracting point terrain from {file_name}: {e}")
                 continue
@@ -320,6 +475,84 @@ class TerrainExtractor:
         logger.debug(f"No LIDAR coverage for point terrain at ({lat:.5f}, {lon:.5f})")
         return None
     
+    @staticmethod
+    def terrain_from_grid(elevation_grid: np.ndarray,
+                          resolution_m: float,
+                          pixel_radius: int,
+                          lidar_file: str,
+                          lat: float,
+                          lon: float) -> Optional[Dict]:
+        """
+        Compute point terrain from an elevation window centred on the point.
+
+        Shared by ``extract_point_terrain`` (window read from disk) and
+        ``DEMWindow.terrain_at`` (window sliced from an in-memory raster) so
+        both paths return identical values for the same pixels.
+
+        Returns None when the window is too small or the point sits on its edge.
+        """
+        # Handle edge cases
+        if elevation_grid.size < 9:  # Need at least 3×3 for calculations
+            logger.warning(f"Insufficient data at ({lat}, {lon}) - edge of coverage")
+            return None
+
+        # Calculate center point elevation
+        center_row = min(pixel_radius, elevation_grid.shape[0] // 2)
+        center_col = min(pixel_radius, elevation_grid.shape[1] // 2)
+
+        if center_row < 1 or center_col < 1:
+            logger.warning(f"Edge case at ({lat}, {lon}) - cannot calculate terrain")
+            return None
+
+        center_elevation = float(elevation_grid[center_row, center_col])
+
+        # Calculate slope and aspect using Horn's method
+        slope = TerrainExtractor._calculate_point_slope(
+            elevation_grid, resolution_m, center_row, center_col
+        )
+        aspect = TerrainExtractor._calculate_point_aspect(
+            elevation_grid, center_row, center_col
+        )
+
+        # Corridor feature heuristics (bench/ridge/saddle strength)
+        corridor_features = TerrainExtractor._calculate_corridor_features(
+            elevation_grid, resolution_m, center_row, center_col
+        )
+
+        logger.debug(
+            f"✅ LIDAR point terrain: {lat:.5f}, {lon:.5f} -> "
+            f"Slope={slope:.1f}°, Aspect={aspect:.0f}°, Elev={center_elevation:.0f}m"
+        )
+
+        return TerrainExtractor.terrain_record(
+            slope, aspect, center_elevation, resolution_m, lidar_file, corridor_features
+        )
+
+    @staticmethod
+    def terrain_record(slope: float, aspect: float, elevation: float, resolution_m: float,
+                       lidar_file: str, corridor_features: Dict[str, float]) -> Dict:
+        """Point terrain dict in the shape every LIDAR caller expects."""
+        # Mark data source (DEM = accurate, hillshade = visualization)
+        file_name = os.path.basename(lidar_file)
+        if 'DEM' in file_name.upper():
+            source_type = 'LIDAR_DEM'
+            accurate_slopes = True
+        else:
+            source_type = 'LIDAR_HILLSHADE'
+            accurate_slopes = False
+
+        return {
+            'slope': float(slope),
+            'aspect': float(aspect),
+            'elevation': float(elevation),
+            'resolution_m': float(resolution_m),
+            'source': source_type,
+            'accurate_slopes': accurate_slopes,
+            'coverage': True,
+            'file': file_name,
+            **corridor_features
+        }
+    
     @staticmethod
     def _is_in_bounds(src, lat: float, lon: float) -> bool:
         """Check if lat/lon is within raster bounds"""
@@ -476,32 +709,10 @@ class TerrainExtractor:
                                      center_col: int) -> Dict[str, float]:
         """Estimate bench/ridge/saddle strength from a local elevation window."""
         try:
-            dy, dx = np.gradient(elevation_grid)
-            slope = np.degrees(np.arctan(np.sqrt(dx**2 + dy**2) / max(resolution_m, 0.1)))
-
-            low_slope_pct = float(np.mean(slope < 6.0))
-            moderate_slope_pct = float(np.mean((slope >= 6.0) & (slope <= 18.0)))
-
-            elev_center = float(elevation_grid[center_row, center_col])
-            elev_mean = float(np.mean(elevation_grid))
-            elev_std = float(np.std(elevation_grid)) or 1.0
-            elev_z = (elev_center - elev_mean) / elev_std
-
-            bench_score = min(1.0, low_slope_pct * 1.5)
-            ridge_score = min(1.0, max(0.0, elev_z / 2.0))
-            saddle_score = min(1.0, max(0.0, (0.5 - abs(elev_z)) * 2.0))
-
-            corridor_strength = max(
-                0.0,
-                min(1.0, bench_score * 0.5 + saddle_score * 0.3 + ridge_score * 0.2 + moderate_slope_pct * 0.1)
+            features = TerrainExtractor.corridor_feature_arrays(
+                elevation_grid[np.newaxis], resolution_m, center_row, center_col
             )
-
-            return {
-                "bench_score": round(bench_score, 3),
-                "ridge_score": round(ridge_score, 3),
-                "saddle_score": round(saddle_score, 3),
-                "corridor_strength": round(corridor_strength, 3)
-            }
+            return {name: round(float(values[0]), 3) for name, values in features.items()}
         except Exception:
             return {
                 "bench_score": 0.0,
@@ -510,6 +721,157 @@ class TerrainExtractor:
                 "corridor_strength": 0.0
             }
 
+    @staticmethod
+    def corridor_feature_arrays(elevation_grids: np.ndarray,
+                                resolution_m: float,
+                                center_row: int,
+                                center_col: int) -> Dict[str, np.ndarray]:
+        """
+        Unrounded corridor features for a stack of equally sized windows.
+
+        ``elevation_grids`` has shape (points, rows, cols) with every point at
+        (center_row, center_col) of its window. Each window is reduced on its
+        own, exactly as a single 2-D window would be.
+        """
+        count = elevation_grids.shape[0]
+        dy, dx = np.gradient(elevation_grids, axis=(1, 2))
+        slope = np.degrees(np.arctan(np.sqrt(dx**2 + dy**2) / max(resolution_m, 0.1))).reshape(count, -1)
+
+        low_slope_pct = np.mean(slope < 6.0, axis=1)
+        moderate_slope_pct = np.mean((slope >= 6.0) & (slope <= 18.0), axis=1)
+
+        flat = np.ascontiguousarray(elevation_grids).reshape(count, -1)
+        elev_center = elevation_grids[:, center_row, center_col].astype(np.float64)
+        elev_mean = np.mean(flat, axis=1)
+        elev_std = np.std(flat, axis=1)
+        elev_std = np.where(elev_std == 0, 1.0, elev_std)
+        elev_z = (elev_center - elev_mean) / elev_std
+
+        bench_score = np.minimum(1.0, low_slope_pct * 1.5)
+        ridge_score = np.minimum(1.0, np.maximum(0.0, elev_z / 2.0))
+        saddle_score = np.minimum(1.0, np.maximum(0.0, (0.5 - np.abs(elev_z)) * 2.0))
+        corridor_strength = np.maximum(
+            0.0,
+            np.minimum(1.0, bench_score * 0.5 + saddle_score * 0.3 + ridge_score * 0.2 + moderate_slope_pct * 0.1)
+        )
+
+        return {
+            "bench_score": bench_score,
+            "ridge_score": ridge_score,
+            "saddle_score": saddle_score,
+            "corridor_strength": corridor_strength
+        }
+
+
+# Upper bound on the window stack DEMSampler.terrain_records reduces at once.
+_CORRIDOR_STACK_BYTES = 32 * 1024 * 1024
+
+
+def _parse_sampler_max_bytes() -> int:
+    raw = os.getenv("DEM_SAMPLER_MAX_BYTES", str(256 * 1024 * 1024))
+    try:
+        return max(1, int(raw))
+    except ValueError:
+        logger.warning("Invalid DEM_SAMPLER_MAX_BYTES=%r — defaulting to 256 MiB", raw)
+        return 256 * 1024 * 1024
+
+
+class DEMSampler:
+    """
+    Vectorised terrain lookups over DEM windows cached per map tile.
+
+    Points are grouped into ``tile_deg`` tiles; each tile's window (padded
+    by the sample radius) is read from disk once and kept in a byte-bounded
+    LRU, so repeated lookups around a property do no raster I/O. Points
+    without coverage come back as NaN (or None / invalid).
+    """
+
+    def __init__(self, dem_manager: DEMFileManager, max_bytes: Optional[int] = None,
+                 tile_deg: float = 0.005, sample_radius_m: int = 30):
+        self.dem_manager = dem_manager
+        self.tile_deg = tile_deg
+        self.sample_radius_m = sample_radius_m
+        self.windows = BoundedCache(max_entries=256, max_bytes=max_bytes or _parse_sampler_max_bytes())
+
+    def _window(self, tile_y: int, tile_x: int) -> Optional[DEMWindow]:
+        def read() -> Optional[DEMWindow]:
+            deg = self.tile_deg
+            return self.dem_manager.read_window(tile_y * deg, tile_x * deg, (tile_y + 1) * deg, (tile_x + 1) * deg,
+                                                sample_radius_m=self.sample_radius_m)
+        # A tile without coverage is cached as None as well.
+        return self.windows.get_or_compute(f"{tile_y},{tile_x}", read)
+
+    def _by_window(self, lats: np.ndarray, lons: np.ndarray) -> Iterator[Tuple[DEMWindow, np.ndarray]]:
+        """(window, point indices) for every tile of the batch that has DEM coverage."""
+        if not RASTERIO_AVAILABLE or not self.dem_manager.get_files() or lats.size == 0:
+            return
+        tiles = np.stack([np.floor(lats / self.tile_deg), np.floor(lons / self.tile_deg)], axis=1).astype(np.int64)
+        unique_tiles, inverse = np.unique(tiles, axis=0, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        for k, (tile_y, tile_x) in enumerate(unique_tiles):
+            window = self._window(int(tile_y), int(tile_x))
+            if window is not None:
+                yield window, np.flatnonzero(inverse == k)
+
+    def sample_elevations(self, lats: Sequence[float], lons: Sequence[float]) -> np.ndarray:
+        """Elevation at every point (metres); NaN where no DEM covers it."""
+        lats, lons = np.atleast_1d(np.asarray(lats, dtype=float)), np.atleast_1d(np.asarray(lons, dtype=float))
+        elevations = np.full(lats.shape, np.nan)
+        for window, idx in self._by_window(lats, lons):
+            elevations[idx] = window.sample_elevations(lats[idx], lons[idx])
+        return elevations
+
+    def sample_terrain(self, lats: Sequence[float], lons: Sequence[float]) -> Dict[str, np.ndarray]:
+        """
+        Elevation, slope and aspect arrays for a batch of points in one call.
+
+        ``valid`` is False (and the values NaN) where no cached window can
+        serve the point's full sample window.
+        """
+        lats, lons = np.atleast_1d(np.asarray(lats, dtype=float)), np.atleast_1d(np.asarray(lons, dtype=float))
+        result = {name: np.full(lats.shape, np.nan) for name in ('elevation', 'slope', 'aspect', 'resolution_m')}
+        result['valid'] = np.zeros(lats.shape, dtype=bool)
+        for window, idx in self._by_window(lats, lons):
+            terrain = window.sample_terrain(lats[idx], lons[idx], self.sample_radius_m)
+            valid = terrain['valid']
+            for name in ('elevation', 'slope', 'aspect'):
+                result[name][idx[valid]] = terrain[name][valid]
+            result['resolution_m'][idx[valid]] = window.resolution_m
+            result['valid'][idx[valid]] = True
+        return result
+
+    def terrain_records(self, lats: Sequence[float], lons: Sequence[float]) -> List[Optional[Dict]]:
+        """
+        Full point terrain dicts (as ``extract_point_terrain`` returns) from memory.
+
+        Slope/aspect/elevation and the corridor features are computed for
+        the whole batch at once; points the windows cannot serve are None.
+        """
+        lats, lons = np.atleast_1d(np.asarray(lats, dtype=float)), np.atleast_1d(np.asarray(lons, dtype=float))
+        records: List[Optional[Dict]] = [None] * lats.size
+        for window, idx in self._by_window(lats, lons):
+            terrain = window.sample_terrain(lats[idx], lons[idx], self.sample_radius_m)
+            pixel_radius = max(3, int(self.sample_radius_m / window.resolution_m))
+            valid = np.flatnonzero(terrain['valid'])
+            # Gather every point's window into one (points, rows, cols) stack,
+            # a few MiB at a time, and reduce the stack in one call.
+            offsets = np.arange(-pixel_radius, pixel_radius)
+            chunk = max(1, _CORRIDOR_STACK_BYTES // (offsets.size ** 2 * window.elevation.itemsize))
+            for start in range(0, valid.size, chunk):
+                batch = valid[start:start + chunk]
+                rows = terrain['rows'][batch][:, None, None] + offsets[None, :, None]
+                cols = terrain['cols'][batch][:, None, None] + offsets[None, None, :]
+                features = TerrainExtractor.corridor_feature_arrays(
+                    window.elevation[rows, cols], window.resolution_m, pixel_radius, pixel_radius
+                )
+                for k, j in enumerate(batch):
+                    corridor_features = {name: round(float(values[k]), 3) for name, values in features.items()}
+                    records[idx[j]] = TerrainExtractor.terrain_record(
+                        terrain['slope'][j], terrain['aspect'][j], terrain['elevation'][j],
+                        window.resolution_m, window.lidar_file, corridor_features
+                    )
+        return records
+
 
 class BatchLIDARProcessor:
     """
@@ -522,16 +884,19 @@ class BatchLIDARProcessor:
     - Key optimization for alternative search (vs 52 sequential GEE API calls)
     """
     
-    def __init__(self, dem_manager: DEMFileManager, terrain_extractor: TerrainExtractor):
+    def __init__(self, dem_manager: DEMFileManager, terrain_extractor: TerrainExtractor,
+                 sampler: Optional[DEMSampler] = None):
         """
         Initialize batch processor.
         
         Args:
             dem_manager: DEMFileManager instance for file access
             terrain_extractor: TerrainExtractor instance for terrain calculations
+            sampler: Optional DEMSampler serving points from cached windows
         """
         self.dem_manager = dem_manager
         self.terrain_extractor = terrain_extractor
+        self.sampler = sampler
     
     def batch_extract(self, 
                      coordinates: List[Tuple[float, float]],
@@ -567,11 +932,18 @@ class BatchLIDARProcessor:
         logger.info(f"🗺️ LIDAR BATCH EXTRACTION: Processing {len(coordinates)} locations")
         start_time = time.time()
         
-        for lat, lon in coordinates:
+        # Points the cached windows can serve need no file reads at all.
+        records: List[Optional[Dict]] = [None] * len(coordinates)
+        if self.sampler is not None and sample_radius_m == self.sampler.sample_radius_m and coordinates:
+            lats, lons = zip(*coordinates)
+            records = self.sampler.terrain_records(lats, lons)
+
+        for (lat, lon), terrain in zip(coordinates, records):
             key = f"{lat:.6f},{lon:.6f}"
-            terrain = self.terrain_extractor.extract_point_terrain(
-                lat, lon, lidar_files, sample_radius_m
-            )
+            if terrain is None:
+                terrain = self.terrain_extractor.extract_point_terrain(
+                    lat, lon, lidar_files, sample_radius_m
+                )
             
             if terrain and terrain.get('coverage'):
                 terrain_cache[key] = terrain
@@ -607,6 +979,8 @@ def get_lidar_processor() -> Tuple[DEMFileManager, TerrainExtractor, BatchLIDARP
     if _lidar_processor_instance is None:
         dem_manager = DEMFileManager()
         terrain_extractor = TerrainExtractor()
-        batch_processor = BatchLIDARProcessor(dem_manager, terrain_extractor)
+        sampler = DEMSampler(dem_manager)
+        get_performance_monitor().register_cache("lidar_processor.DEMSampler.windows", sampler.windows)
+        batch_processor = BatchLIDARProcessor(dem_manager, terrain_extractor, sampler=sampler)
         _lidar_processor_instance = (dem_manager, terrain_extractor, batch_processor)
     return _lidar_processor_instance
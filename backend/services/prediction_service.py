@@ -106,6 +106,7 @@ class PredictionService:
         season: str,
         hunting_pressure: str,
         target_datetime: Optional[datetime] = None,
+        context: Optional[Any] = None,
     ) -> Dict:
         """
         Generate comprehensive deer movement prediction using EnhancedBeddingZonePredictor exclusively.
@@ -117,6 +118,7 @@ class PredictionService:
             season: Season ('spring', 'summer', 'fall', 'winter')
             hunting_pressure: Pressure level ('low', 'medium', 'high')
             target_datetime: Optional future datetime to align forecast data with
+            context: Optional PropertyContext shared across a multi-point job
             
         Returns:
             Dict: Enhanced prediction results with comprehensive data integration, wind analysis, and thermal analysis
@@ -129,6 +131,7 @@ class PredictionService:
             hunting_pressure,
             analyzer=None,
             target_datetime=target_datetime,
+            context=context,
         )
     
     async def predict_with_analysis(
@@ -140,6 +143,7 @@ class PredictionService:
         hunting_pressure: str,
         analyzer: Optional[PredictionAnalyzer] = None,
         target_datetime: Optional[datetime] = None,
+        context: Optional[Any] = None,
     ) -> Dict:
         """
         Generate comprehensive prediction with optional detailed analysis collection.
@@ -152,6 +156,8 @@ class PredictionService:
             hunting_pressure: Pressure level ('low', 'medium', 'high')
             analyzer: Optional PredictionAnalyzer for detailed analysis collection
             target_datetime: Optional future datetime to align forecast data and context
+            context: Optional PropertyContext (backend.services.hotspot.property_context)
+                whose weather, roads, vegetation and DEM window replace per-point fetches
             
         Returns:
             Dict: Enhanced prediction results with comprehensive data integration
@@ -176,6 +182,7 @@ class PredictionService:
                 season,
                 hunting_pressure,
                 target_datetime=target_datetime,
+                context=context,
             )
             
             # Extract environmental data for analysis
@@ -331,7 +338,10 @@ class PredictionService:
                 score_maps = {
                     "travel": self._extract_travel_scores(result, lat, lon),
                     "bedding": self._extract_bedding_scores(result, lat, lon), 
-                    "feeding": self._extract_feeding_scores(result, lat, lon, season)
+                    "feeding": self._extract_feeding_scores(
+                        result, lat, lon, season,
+                        vegetation_data=context.vegetation_data(lat, lon) if context is not None else None,
+                    )
                 }
                 
                 # Store score_maps in result for optimized points generation
@@ -670,7 +680,9 @@ class PredictionService:
         except (KeyError, TypeError, AttributeError):
             return np.ones((10, 10)) * 5.0
 
-    def _extract_feeding_scores(self, result: Dict, lat: Optional[float] = None, lon: Optional[float] = None, season: str = 'early_season') -> np.ndarray:
+    def _extract_feeding_scores(self, result: Dict, lat: Optional[float] = None, lon: Optional[float] = None,
+                                season: str = 'early_season',
+                                vegetation_data: Optional[Dict] = None) -> np.ndarray:
         """
         Extract feeding scores from prediction results with Vermont food classification.
         
@@ -678,20 +690,24 @@ class PredictionService:
         across the prediction area based on real Vermont food sources.
         
         If lat/lon/season provided, uses Vermont food classifier for real food source analysis.
-        Otherwise falls back to generic feeding area scoring.
+        Otherwise falls back to generic feeding area scoring. A precomputed
+        ``vegetation_data`` (e.g. from a PropertyContext) skips the analyzer call.
         """
         try:
             grid_size = 10
 
             # Primary path: use vegetation analyzer Vermont food classification when available.
-            if lat is not None and lon is not None and self.vegetation_analyzer is not None:
+            has_vegetation = vegetation_data is not None or self.vegetation_analyzer is not None
+            if lat is not None and lon is not None and has_vegetation:
                 try:
-                    veg_result = self.vegetation_analyzer.analyze_hunting_area(
-                        lat=lat,
-                        lon=lon,
-                        radius_km=2.0,
-                        season=season,
-                    )
+                    veg_result = vegetation_data
+                    if veg_result is None:
+                        veg_result = self.vegetation_analyzer.analyze_hunting_area(
+                            lat=lat,
+                            lon=lon,
+                            radius_km=2.0,
+                            season=season,
+                        )
                     food_sources = veg_result.get('food_sources', {}) if isinstance(veg_result, dict) else {}
                     overall_food_score = float(food_sources.get('overall_food_score', 0.0))
 
@@ -5,14 +5,30 @@ Redis Cache Service
 Provides async Redis caching functionality with connection pooling,
 serialization, and cache management.
 
+Reads go through a small in-process LRU (L1) with short TTLs before Redis.
+Writes and deletes publish the affected keys on a pub/sub channel so other
+processes drop their L1 copies; the L1 TTL bounds staleness if a message is
+missed. ``get_or_compute`` coalesces concurrent misses (one computation per
+process, and a Redis lock key with a poll fallback across processes) and
+refreshes hot entries probabilistically before they expire. Without Redis,
+or while it is unreachable, the service keeps working on L1 alone.
+
 Author: System Refactoring - Phase 2
 Version: 2.0.0
 """
 
+from __future__ import annotations
+
 import logging
 import asyncio
 import json
-from typing import Any, Optional, Union, Dict, List
+import math
+import os
+import random
+import time
+import uuid
+from fnmatch import fnmatchcase
+from typing import Any, Awaitable, Callable, Optional, Tuple, Union, Dict, List
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 
@@ -26,10 +42,39 @@ except ImportError:
     except ImportError:
         REDIS_AVAILABLE = False
 
+from backend.performance import BoundedCache
 from backend.services.base_service import BaseService, Result, AppError, ErrorCode
 
 logger = logging.getLogger(__name__)
 
+_MISSING = object()
+
+# Envelope prefixes; entries written before compact separators were used
+# have a space after each colon.
+_JSON_PREFIXES = (b'{"__type__":"json",', b'{"__type__": "json",')
+_PICKLE_PREFIXES = (b'{"__type__":"pickle",', b'{"__type__": "pickle",')
+
+# After a Redis error the service stays on L1 for this long before retrying.
+_REDIS_RETRY_SECONDS = 5.0
+
+
+def _parse_l1_max_entries() -> int:
+    raw = os.getenv("REDIS_CACHE_L1_MAX_ENTRIES", "2048")
+    try:
+        return max(1, int(raw))
+    except ValueError:
+        logger.warning("Invalid REDIS_CACHE_L1_MAX_ENTRIES=%r — defaulting to 2048", raw)
+        return 2048
+
+
+def _parse_l1_ttl_seconds() -> float:
+    raw = os.getenv("REDIS_CACHE_L1_TTL_SECONDS", "30")
+    try:
+        return max(0.0, float(raw))
+    except ValueError:
+        logger.warning("Invalid REDIS_CACHE_L1_TTL_SECONDS=%r — defaulting to 30 seconds", raw)
+        return 30.0
+
 
 @dataclass
 class CacheEntry:
@@ -48,8 +93,10 @@ class RedisCacheService(BaseService):
     
     Features:
     - Connection pooling for performance
-    - JSON and pickle serialization
+    - In-process L1 LRU in front of Redis, invalidated over pub/sub
+    - JSON serialization
     - TTL management
+    - Request coalescing and probabilistic early refresh
     - Cache statistics
     - Bulk operations
     - Health monitoring
@@ -58,105 +105,258 @@ class RedisCacheService(BaseService):
     def __init__(self, 
                  redis_url: str = "redis://localhost:6379/0",
                  max_connections: int = 50,
-                 default_ttl_seconds: int = 3600):
+                 default_ttl_seconds: int = 3600,
+                 *,
+                 l1_max_entries: Optional[int] = None,
+                 l1_max_bytes: int = 32 * 1024 * 1024,
+                 l1_ttl_seconds: Optional[float] = None,
+                 invalidation_channel: str = "cache:invalidate",
+                 client: Optional[Any] = None):
         super().__init__()
         self.redis_url = redis_url
         self.max_connections = max_connections
         self.default_ttl_seconds = default_ttl_seconds
+        self.l1_ttl_seconds = _parse_l1_ttl_seconds() if l1_ttl_seconds is None else l1_ttl_seconds
+        self.invalidation_channel = invalidation_channel
         self._pool: Optional[redis.ConnectionPool] = None
-        self._client: Optional[redis.Redis] = None
+        # An injected client (tests, shared pools) stands in for the pooled one.
+        self._client: Optional[redis.Redis] = client
+        self._redis_enabled = REDIS_AVAILABLE or client is not None
+        self._redis_retry_at = 0.0
+        # L1 holds the serialized bytes, so callers never share mutable values.
+        self._l1 = BoundedCache(
+            max_entries=l1_max_entries or _parse_l1_max_entries(),
+            max_bytes=l1_max_bytes,
+        )
+        self._instance_id = uuid.uuid4().hex
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._listener_task: Optional[asyncio.Task] = None
         self._stats = {
             "hits": 0,
             "misses": 0,
+            "l1_hits": 0,
             "sets": 0,
             "deletes": 0,
-            "errors": 0
+            "errors": 0,
+            "coalesced": 0,
+            "lock_waits": 0,
+            "early_refreshes": 0,
+            "invalidations_received": 0,
+            "redis_fallbacks": 0,
         }
         
-        if not REDIS_AVAILABLE:
-            self.logger.warning("Redis not available - caching functionality limited")
+        if not self._redis_enabled:
+            self.logger.warning("Redis not available - caching in-process only")
     
     async def _get_client(self) -> redis.Redis:
         """Get or create Redis client with connection pooling"""
+        if self._client is not None:
+            return self._client
+        
         if not REDIS_AVAILABLE:
             raise RuntimeError("Redis not installed - cannot create cache client")
         
-        if self._client is None:
-            # Create connection pool
-            self._pool = redis.ConnectionPool.from_url(
-                self.redis_url,
-                max_connections=self.max_connections,
-                retry_on_timeout=True,
-                socket_keepalive=True,
-                socket_keepalive_options={},
-                health_check_interval=30
-            )
-            
-            # Create Redis client
-            self._client = redis.Redis(connection_pool=self._pool)
-            
-            self.logger.debug("Created Redis client with connection pooling")
+        # Create connection pool
+        self._pool = redis.ConnectionPool.from_url(
+            self.redis_url,
+            max_connections=self.max_connections,
+            retry_on_timeout=True,
+            socket_keepalive=True,
+            socket_keepalive_options={},
+            health_check_interval=30
+        )
+        
+        # Create Redis client
+        self._client = redis.Redis(connection_pool=self._pool)
+        
+        self.logger.debug("Created Redis client with connection pooling")
         
         return self._client
     
-    async def get(self, key: str, default: Any = None) -> Result[Any]:
-        """
-        Get value from cache with deserialization
+    # ------------------------------------------------------------------
+    # Redis availability and L1 invalidation
+    # ------------------------------------------------------------------
+    def _redis_usable(self) -> bool:
+        return self._redis_enabled and time.monotonic() >= self._redis_retry_at
+    
+    def _redis_failed(self, operation: str, exc: Exception) -> None:
+        self._stats["errors"] += 1
+        self._stats["redis_fallbacks"] += 1
+        self._redis_retry_at = time.monotonic() + _REDIS_RETRY_SECONDS
+        self.logger.warning(f"Redis {operation} failed, using in-process cache only for "
+                            f"{_REDIS_RETRY_SECONDS:.0f}s: {exc}")
+    
+    async def _ensure_invalidation_listener(self, client: Any) -> None:
+        if self._listener_task is not None:
+            return
+        try:
+            pubsub = client.pubsub()
+            await pubsub.subscribe(self.invalidation_channel)
+        except Exception as e:
+            # Without the listener, L1 entries still expire after l1_ttl_seconds.
+            self.logger.debug(f"Cache invalidation listener unavailable: {e}")
+            self._listener_task = asyncio.get_running_loop().create_future()
+            self._listener_task.set_result(None)
+            return
+        self._listener_task = asyncio.create_task(self._listen_for_invalidations(pubsub))
+    
+    async def _listen_for_invalidations(self, pubsub: Any) -> None:
+        try:
+            async for message in pubsub.listen():
+                if message.get("type") == "message":
+                    self._apply_invalidation(message.get("data"))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.logger.warning(f"Cache invalidation listener stopped: {e}")
+        finally:
+            self._listener_task = None
+            try:
+                await pubsub.close()
+            except Exception:
+                pass
+    
+    def _apply_invalidation(self, data: Union[bytes, str, None]) -> None:
+        try:
+            message = json.loads(data)
+        except (TypeError, ValueError):
+            return
+        if message.get("origin") == self._instance_id:
+            return
+        self._stats["invalidations_received"] += 1
+        for key in message.get("keys", ()):
+            self._l1.discard(key)
+        pattern = message.get("pattern")
+        if pattern:
+            self._l1.discard_where(lambda k: fnmatchcase(k, pattern))
+    
+    async def _publish_invalidation(self, client: Any, *, keys: Optional[List[str]] = None,
+                                    pattern: Optional[str] = None) -> None:
+        message = {"origin": self._instance_id}
+        if keys:
+            message["keys"] = keys
+        if pattern:
+            message["pattern"] = pattern
+        try:
+            await client.publish(self.invalidation_channel, json.dumps(message))
+        except Exception as e:
+            self.logger.debug(f"Failed to publish cache invalidation: {e}")
+    
+    # ------------------------------------------------------------------
+    # Lookup and storage shared by the public operations
+    # ------------------------------------------------------------------
+    def _decode(self, raw: bytes) -> Tuple[str, Any, Optional[Dict[str, Any]]]:
+        """Decode a stored value into (status, value, meta).
         
-        Args:
-            key: Cache key
-            default: Default value if key not found
-            
-        Returns:
-            Result containing cached value or default
+        Deserialize value. We deliberately accept JSON only — never
+        pickle. Anyone who can write to Redis (and Redis has no auth in
+        the default docker-compose setup) could otherwise stash a forged
+        pickle blob and achieve RCE inside the backend container the next
+        time we read it.
         """
         try:
-            self.log_operation_start("cache_get", key=key)
-            
-            if not REDIS_AVAILABLE:
-                return Result.success(default)
-            
+            if raw.startswith(_JSON_PREFIXES):
+                json_data = json.loads(raw.decode('utf-8'))
+                return "ok", json_data.get("data"), json_data.get("__meta__")
+            if raw.startswith(_PICKLE_PREFIXES):
+                return "pickle", None, None
+            return "ok", raw.decode('utf-8'), None
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            self.logger.warning(f"Failed to deserialize cached value: {e}")
+            return "corrupt", None, None
+    
+    def _l1_ttl(self, meta: Optional[Dict[str, Any]]) -> float:
+        ttl = self.l1_ttl_seconds
+        if meta and meta.get("expiry"):
+            ttl = min(ttl, max(0.0, meta["expiry"] - time.time()))
+        return ttl
+    
+    async def _lookup(self, key: str) -> Tuple[bool, Any, Optional[Dict[str, Any]]]:
+        """L1, then Redis; returns (found, value, meta)"""
+        raw = self._l1.get(key, _MISSING)
+        if raw is not _MISSING:
+            status, value, meta = self._decode(raw)
+            if status == "ok":
+                self._stats["hits"] += 1
+                self._stats["l1_hits"] += 1
+                return True, value, meta
+            self._l1.discard(key)
+        
+        if not self._redis_usable():
+            self._stats["misses"] += 1
+            return False, None, None
+        
+        try:
             client = await self._get_client()
-            
-            # Get raw value from Redis
-            raw_value = await client.get(key)
-            
-            if raw_value is None:
+            await self._ensure_invalidation_listener(client)
+            raw = await client.get(key)
+            if raw is None:
                 self._stats["misses"] += 1
                 self.logger.debug(f"Cache miss for key: {key}")
-                return Result.success(default)
-            
-            # Deserialize value. We deliberately accept JSON only —
-            # never pickle. Anyone who can write to Redis (and Redis
-            # has no auth in the default docker-compose setup) could
-            # otherwise stash a forged pickle blob and achieve RCE
-            # inside the backend container the next time we read it.
-            try:
-                if raw_value.startswith(b'{"__type__":"json",'):
-                    json_data = json.loads(raw_value.decode('utf-8'))
-                    value = json_data.get("data")
-                elif raw_value.startswith(b'{"__type__":"pickle",'):
+                return False, None, None
+            if isinstance(raw, str):
+                raw = raw.encode('utf-8')
+            status, value, meta = self._decode(raw)
+            if status != "ok":
+                if status == "pickle":
                     # Legacy pickle entries are silently dropped.
                     self.logger.warning(
                         "Refusing to deserialize legacy pickle cache entry "
                         "for key %s — deleting", key,
                     )
-                    await client.delete(key)
-                    self._stats["misses"] += 1
-                    return Result.success(default)
-                else:
-                    value = raw_value.decode('utf-8')
-
-                self._stats["hits"] += 1
-                self.log_operation_success("cache_get", key=key, hit=True)
-                return Result.success(value)
-
-            except (json.JSONDecodeError, UnicodeDecodeError) as e:
-                self.logger.warning(f"Failed to deserialize cached value for key {key}: {e}")
                 # Delete corrupted entry
                 await client.delete(key)
                 self._stats["misses"] += 1
+                return False, None, None
+        except Exception as e:
+            self._redis_failed("get", e)
+            self._stats["misses"] += 1
+            return False, None, None
+        
+        self._stats["hits"] += 1
+        l1_ttl = self._l1_ttl(meta)
+        if l1_ttl > 0:
+            self._l1.set(key, raw, ttl_s=l1_ttl)
+        return True, value, meta
+    
+    async def _store(self, key: str, serialized_value: bytes, ttl: int) -> bool:
+        """Write L1 and (when reachable) Redis; False if Redis refused the write"""
+        if self.l1_ttl_seconds > 0:
+            self._l1.set(key, serialized_value, ttl_s=min(self.l1_ttl_seconds, ttl))
+        if not self._redis_usable():
+            return True
+        try:
+            client = await self._get_client()
+            await self._ensure_invalidation_listener(client)
+            success = await client.setex(key, ttl, serialized_value)
+            if success:
+                await self._publish_invalidation(client, keys=[key])
+            return bool(success)
+        except Exception as e:
+            self._redis_failed("set", e)
+            return True
+    
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    async def get(self, key: str, default: Any = None) -> Result[Any]:
+        """
+        Get value from cache with deserialization
+        
+        Args:
+            key: Cache key
+            default: Default value if key not found
+            
+        Returns:
+            Result containing cached value or default
+        """
+        try:
+            self.log_operation_start("cache_get", key=key)
+            found, value, _ = await self._lookup(key)
+            if not found:
                 return Result.success(default)
+            self.log_operation_success("cache_get", key=key, hit=True)
+            return Result.success(value)
             
         except Exception as e:
             self._stats["errors"] += 1
@@ -179,11 +379,6 @@ class RedisCacheService(BaseService):
         try:
             self.log_operation_start("cache_set", key=key, ttl_seconds=ttl_seconds)
             
-            if not REDIS_AVAILABLE:
-                return Result.success(True)  # Silently succeed when Redis unavailable
-            
-            client = await self._get_client()
-            
             # Serialize value (raises TypeError if value isn't JSON-safe)
             try:
                 serialized_value = self._serialize_value(value)
@@ -198,10 +393,7 @@ class RedisCacheService(BaseService):
             # Set TTL
             ttl = ttl_seconds or self.default_ttl_seconds
             
-            # Store in Redis
-            success = await client.setex(key, ttl, serialized_value)
-            
-            if success:
+            if await self._store(key, serialized_value, ttl):
                 self._stats["sets"] += 1
                 self.log_operation_success("cache_set", key=key, ttl_seconds=ttl)
                 return Result.success(True)
@@ -217,6 +409,147 @@ class RedisCacheService(BaseService):
             error = self.handle_unexpected_error("cache_set", e, key=key)
             return Result.failure(error)
     
+    async def get_or_compute(self,
+                             key: str,
+                             compute: Callable[[], Awaitable[Any]],
+                             ttl_seconds: Optional[int] = None,
+                             *,
+                             beta: float = 1.0,
+                             lock_timeout_seconds: float = 30.0,
+                             wait_timeout_seconds: float = 10.0,
+                             poll_interval_seconds: float = 0.05) -> Result[Any]:
+        """
+        Cached value for *key*, computing it once when it is missing
+        
+        Concurrent calls in this process share one computation. Across
+        processes a ``lock:<key>`` entry elects one computer; the others poll
+        Redis for its result and compute themselves only after
+        *wait_timeout_seconds*. A cached value is recomputed early with a
+        probability that rises as its expiry approaches, scaled by how long
+        it took to compute and *beta* (0 disables early refresh).
+        
+        Args:
+            key: Cache key
+            compute: Coroutine function producing the value
+            ttl_seconds: Time to live in seconds (None for default)
+            
+        Returns:
+            Result containing the cached or computed value
+        """
+        flight = self._inflight.get(key)
+        if flight is not None:
+            self._stats["coalesced"] += 1
+            try:
+                return Result.success(await asyncio.shield(flight))
+            except asyncio.CancelledError:
+                if not flight.cancelled():
+                    raise  # this caller was cancelled, not the leader
+                # The leading call was cancelled; take over the computation.
+                return await self.get_or_compute(
+                    key, compute, ttl_seconds,
+                    beta=beta,
+                    lock_timeout_seconds=lock_timeout_seconds,
+                    wait_timeout_seconds=wait_timeout_seconds,
+                    poll_interval_seconds=poll_interval_seconds,
+                )
+            except Exception as e:
+                return Result.failure(self.handle_unexpected_error("cache_get_or_compute", e, key=key))
+        
+        flight = asyncio.get_running_loop().create_future()
+        self._inflight[key] = flight
+        try:
+            value = await self._get_or_compute_once(
+                key, compute, ttl_seconds or self.default_ttl_seconds,
+                beta, lock_timeout_seconds, wait_timeout_seconds, poll_interval_seconds,
+            )
+            flight.set_result(value)
+            return Result.success(value)
+        except Exception as e:
+            flight.set_exception(e)
+            flight.exception()  # retrieved here; waiters re-raise it
+            return Result.failure(self.handle_unexpected_error("cache_get_or_compute", e, key=key))
+        finally:
+            # CancelledError skips the handlers above; wake the waiters so
+            # they don't block on a future nobody will resolve.
+            if not flight.done():
+                flight.cancel()
+            self._inflight.pop(key, None)
+    
+    def _should_refresh_early(self, meta: Optional[Dict[str, Any]], beta: float) -> bool:
+        if beta <= 0 or not meta or "expiry" not in meta:
+            return False
+        delta = float(meta.get("delta") or 0.0)
+        # 1 - random() is in (0, 1], so the log is finite and <= 0.
+        return time.time() - delta * beta * math.log(1.0 - random.random()) >= float(meta["expiry"])
+    
+    async def _get_or_compute_once(self, key: str, compute: Callable[[], Awaitable[Any]], ttl: int,
+                                   beta: float, lock_timeout: float, wait_timeout: float,
+                                   poll_interval: float) -> Any:
+        found, value, meta = await self._lookup(key)
+        if found and not self._should_refresh_early(meta, beta):
+            return value
+        if found:
+            self._stats["early_refreshes"] += 1
+        
+        token = await self._acquire_lock(key, lock_timeout)
+        if token is None:
+            if found:
+                return value  # another process is already refreshing it
+            self._stats["lock_waits"] += 1
+            deadline = time.monotonic() + wait_timeout
+            while time.monotonic() < deadline:
+                await asyncio.sleep(poll_interval)
+                found, value, _ = await self._lookup(key)
+                if found:
+                    return value
+            self.logger.warning(f"Timed out waiting for cache key {key}; computing locally")
+        
+        try:
+            started = time.monotonic()
+            value = await compute()
+            delta = time.monotonic() - started
+            try:
+                serialized_value = self._serialize_value(
+                    value, meta={"delta": round(delta, 6), "expiry": time.time() + ttl}
+                )
+            except TypeError as exc:
+                self.logger.warning(f"Not caching {key}: {exc}")
+                return value
+            if await self._store(key, serialized_value, ttl):
+                self._stats["sets"] += 1
+            return value
+        finally:
+            if token:
+                await self._release_lock(key, token)
+    
+    async def _acquire_lock(self, key: str, timeout: float) -> Optional[str]:
+        """Token if this process may compute *key*, None if another holds the lock"""
+        token = uuid.uuid4().hex
+        if not self._redis_usable():
+            return token  # the in-process single flight is all there is
+        try:
+            client = await self._get_client()
+            acquired = await client.set(f"lock:{key}", token, nx=True, px=max(1, int(timeout * 1000)))
+            return token if acquired else None
+        except Exception as e:
+            self._redis_failed("lock", e)
+            return token
+    
+    async def _release_lock(self, key: str, token: str) -> None:
+        if not self._redis_usable():
+            return
+        try:
+            client = await self._get_client()
+            current = await client.get(f"lock:{key}")
+            if isinstance(current, bytes):
+                current = current.decode('utf-8')
+            # Only release our own lock; an expired lock may now belong to
+            # another process.
+            if current == token:
+                await client.delete(f"lock:{key}")
+        except Exception as e:
+            self.logger.debug(f"Failed to release cache lock for {key}: {e}")
+    
     async def delete(self, key: str) -> Result[bool]:
         """
         Delete key from cache
@@ -230,17 +563,20 @@ class RedisCacheService(BaseService):
         try:
             self.log_operation_start("cache_delete", key=key)
             
-            if not REDIS_AVAILABLE:
-                return Result.success(True)
-            
-            client = await self._get_client()
-            
-            # Delete from Redis
-            deleted_count = await client.delete(key)
+            deleted = self._l1.discard(key)
+            if self._redis_usable():
+                try:
+                    client = await self._get_client()
+                    
+                    # Delete from Redis
+                    deleted = (await client.delete(key)) > 0 or deleted
+                    await self._publish_invalidation(client, keys=[key])
+                except Exception as e:
+                    self._redis_failed("delete", e)
             
             self._stats["deletes"] += 1
-            self.log_operation_success("cache_delete", key=key, deleted=deleted_count > 0)
-            return Result.success(deleted_count > 0)
+            self.log_operation_success("cache_delete", key=key, deleted=deleted)
+            return Result.success(deleted)
             
         except Exception as e:
             self._stats["errors"] += 1
@@ -250,7 +586,9 @@ class RedisCacheService(BaseService):
     async def exists(self, key: str) -> Result[bool]:
         """Check if key exists in cache"""
         try:
-            if not REDIS_AVAILABLE:
+            if self._l1.get(key, _MISSING) is not _MISSING:
+                return Result.success(True)
+            if not self._redis_usable():
                 return Result.success(False)
             
             client = await self._get_client()
@@ -264,7 +602,7 @@ class RedisCacheService(BaseService):
     async def get_ttl(self, key: str) -> Result[Optional[int]]:
         """Get time to live for a key in seconds"""
         try:
-            if not REDIS_AVAILABLE:
+            if not self._redis_usable():
                 return Result.success(None)
             
             client = await self._get_client()
@@ -286,27 +624,30 @@ class RedisCacheService(BaseService):
         try:
             self.log_operation_start("cache_bulk_get", key_count=len(keys))
             
-            if not REDIS_AVAILABLE:
-                return Result.success({})
-            
-            client = await self._get_client()
-            
-            # Use mget for efficiency
-            raw_values = await client.mget(keys)
-            
             result = {}
-            for key, raw_value in zip(keys, raw_values):
-                if raw_value is not None:
-                    try:
-                        # Deserialize value (simplified version)
-                        if raw_value.startswith(b'{"__type__":"json",'):
-                            json_data = json.loads(raw_value.decode('utf-8'))
-                            result[key] = json_data.get("data")
-                        else:
-                            result[key] = raw_value.decode('utf-8')
-                    except Exception as e:
-                        self.logger.warning(f"Failed to deserialize bulk value for key {key}: {e}")
+            remote_keys = []
+            for key in keys:
+                raw = self._l1.get(key, _MISSING)
+                status, value, _ = self._decode(raw) if raw is not _MISSING else ("missing", None, None)
+                if status == "ok":
+                    result[key] = value
+                else:
+                    remote_keys.append(key)
+            
+            if remote_keys and self._redis_usable():
+                client = await self._get_client()
+                
+                # Use mget for efficiency
+                raw_values = await client.mget(remote_keys)
+                
+                for key, raw_value in zip(remote_keys, raw_values):
+                    if raw_value is None:
                         continue
+                    if isinstance(raw_value, str):
+                        raw_value = raw_value.encode('utf-8')
+                    status, value, _ = self._decode(raw_value)
+                    if status == "ok":
+                        result[key] = value
             
             self.log_operation_success("cache_bulk_get", 
                                      key_count=len(keys), 
@@ -322,21 +663,20 @@ class RedisCacheService(BaseService):
         try:
             self.log_operation_start("cache_clear_pattern", pattern=pattern)
             
-            if not REDIS_AVAILABLE:
-                return Result.success(0)
-            
-            client = await self._get_client()
-            
-            # Find matching keys
-            keys = await client.keys(pattern)
-            
-            if keys:
-                # Delete in batches
-                deleted_count = await client.delete(*keys)
-                self._stats["deletes"] += deleted_count
-            else:
-                deleted_count = 0
+            deleted_count = self._l1.discard_where(lambda k: fnmatchcase(k, pattern))
             
+            if self._redis_usable():
+                client = await self._get_client()
+                
+                # Find matching keys
+                keys = await client.keys(pattern)
+                
+                if keys:
+                    # Delete in batches
+                    deleted_count = await client.delete(*keys)
+                await self._publish_invalidation(client, pattern=pattern)
+            
+            self._stats["deletes"] += deleted_count
             self.log_operation_success("cache_clear_pattern", 
                                      pattern=pattern, 
                                      deleted_count=deleted_count)
@@ -346,7 +686,7 @@ class RedisCacheService(BaseService):
             error = self.handle_unexpected_error("cache_clear_pattern", e, pattern=pattern)
             return Result.failure(error)
     
-    def _serialize_value(self, value: Any) -> bytes:
+    def _serialize_value(self, value: Any, meta: Optional[Dict[str, Any]] = None) -> bytes:
         """Serialize value for storage.
 
         JSON-only. If a value is not JSON-serializable, raise — callers
@@ -356,12 +696,18 @@ class RedisCacheService(BaseService):
         deserializing untrusted bytes from Redis on read, which is
         equivalent to remote code execution if Redis is reachable by
         an attacker.
+
+        *meta* (compute time and expiry, used for early refresh) is stored
+        after the data so the ``{"__type__":"json",`` prefix is unchanged.
         """
+        envelope: Dict[str, Any] = {
+            "__type__": "json",
+            "data": value,
+        }
+        if meta:
+            envelope["__meta__"] = meta
         try:
-            return json.dumps({
-                "__type__": "json",
-                "data": value,
-            }).encode("utf-8")
+            return json.dumps(envelope, separators=(",", ":")).encode("utf-8")
         except (TypeError, ValueError) as exc:
             raise TypeError(
                 f"RedisCacheService can only cache JSON-serializable values; "
@@ -371,17 +717,18 @@ class RedisCacheService(BaseService):
     async def get_stats(self) -> Result[Dict[str, Any]]:
         """Get cache statistics"""
         try:
-            total_operations = sum(self._stats.values())
+            total_operations = sum(self._stats[k] for k in ("hits", "misses", "sets", "deletes", "errors"))
             hit_ratio = (self._stats["hits"] / (self._stats["hits"] + self._stats["misses"])) if (self._stats["hits"] + self._stats["misses"]) > 0 else 0
             
             stats = {
                 **self._stats,
                 "total_operations": total_operations,
                 "hit_ratio": hit_ratio,
-                "redis_available": REDIS_AVAILABLE
+                "redis_available": self._redis_enabled,
+                "l1": self._l1.stats(),
             }
             
-            if REDIS_AVAILABLE and self._client:
+            if self._redis_usable() and self._client:
                 # Get Redis info
                 client = await self._get_client()
                 redis_info = await client.info()
@@ -404,11 +751,11 @@ class RedisCacheService(BaseService):
             health_data = {
                 "service": "RedisCacheService",
                 "status": "healthy",
-                "redis_available": REDIS_AVAILABLE,
+                "redis_available": self._redis_enabled,
                 "stats": self._stats
             }
             
-            if REDIS_AVAILABLE and self._client:
+            if self._redis_enabled and self._client:
                 try:
                     # Test Redis connection
                     client = await self._get_client()
@@ -427,6 +774,14 @@ class RedisCacheService(BaseService):
     async def shutdown(self) -> None:
         """Gracefully shutdown cache service"""
         try:
+            if self._listener_task is not None and not self._listener_task.done():
+                self._listener_task.cancel()
+                try:
+                    await self._listener_task
+                except asyncio.CancelledError:
+                    pass
+            self._listener_task = None
+            
             if self._client:
                 await self._client.close()
                 self.logger.debug("Redis client closed")
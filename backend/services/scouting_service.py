@@ -5,10 +5,13 @@ Handles scouting observation management and analytics.
 This service encapsulates scouting-related endpoints and business logic.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import BinaryIO, Dict, Any, List, Optional, Union
 from fastapi import HTTPException
 from datetime import datetime, timezone
+import asyncio
+import io
 import logging
+import xml.etree.ElementTree as ET
 
 # Import scouting models and components
 from backend.scouting_models import (
@@ -25,10 +28,13 @@ from backend.scouting_models import (
 from backend.config_manager import get_config
 from backend.scouting_data_manager import get_scouting_data_manager
 from backend.scouting_prediction_enhancer import get_scouting_enhancer
-from backend.scouting_import.importer import ScoutingImporter
+from backend.scouting_import.importer import ImportTooLargeError, ScoutingImporter
 
 logger = logging.getLogger(__name__)
 
+# Log import progress roughly once per this many bytes read.
+_IMPORT_PROGRESS_LOG_BYTES = 1024 * 1024
+
 
 class ScoutingService:
     """Service for managing scouting observations and analytics."""
@@ -277,15 +283,23 @@ class ScoutingService:
 
     async def import_scouting_data(
         self,
-        file_bytes: bytes,
+        upload: Union[bytes, BinaryIO],
         *,
         filename: Optional[str] = None,
         dry_run: bool = False,
+        max_bytes: Optional[int] = None,
     ) -> Dict[str, Any]:
-        """Import scouting observations from an uploaded GPX file."""
+        """Import scouting observations from an uploaded GPX file.
+
+        *upload* is the file content or a binary file object; file objects are
+        parsed as they are read, in a worker thread, without loading the whole
+        upload into memory.
+        """
 
-        if not file_bytes:
-            raise HTTPException(status_code=400, detail="Uploaded file is empty")
+        if isinstance(upload, (bytes, bytearray)):
+            if not upload:
+                raise HTTPException(status_code=400, detail="Uploaded file is empty")
+            upload = io.BytesIO(upload)
 
         import_config = self._config.get("scouting_import", {}) if self._config else {}
 
@@ -302,11 +316,28 @@ class ScoutingService:
             dedupe_time_window_hours=import_config.get("dedupe_time_window_hours", 48),
         )
 
-        summary = importer.import_gpx_bytes(
-            file_bytes,
-            filename=filename,
-            dry_run=dry_run,
-        )
+        next_log = [_IMPORT_PROGRESS_LOG_BYTES]
+
+        def _log_progress(bytes_read: int) -> None:
+            if bytes_read >= next_log[0]:
+                logger.info("Scouting import %s: %d bytes read", filename or "<upload>", bytes_read)
+                next_log[0] = bytes_read + _IMPORT_PROGRESS_LOG_BYTES
+
+        try:
+            summary = await asyncio.to_thread(
+                importer.import_gpx_stream,
+                upload,
+                filename=filename,
+                dry_run=dry_run,
+                progress_callback=_log_progress,
+                max_bytes=max_bytes,
+            )
+        except ImportTooLargeError as exc:
+            raise HTTPException(status_code=413, detail=str(exc))
+        except ET.ParseError as exc:
+            if exc.position == (1, 0):
+                raise HTTPException(status_code=400, detail="Uploaded file is empty")
+            raise HTTPException(status_code=400, detail=f"Invalid GPX file format: {exc}")
 
         result = summary.to_dict()
         result["configuration"] = {
@@ -126,3 +126,73 @@ class TestScoutingDataManager:
         assert delete_successful is True
         retrieved_obs = data_manager.get_observation_by_id(obs_id)
         assert retrieved_obs is None
+
+    def test_add_observations_batch(self, data_manager):
+        """Test adding several observations in one call."""
+        observations = [
+            ScoutingObservation(lat=44.0 + i * 0.001, lon=-72.0, timestamp=datetime.now(),
+                                observation_type=ObservationType.RUB_LINE, confidence=5)
+            for i in range(5)
+        ]
+        ids = data_manager.add_observations(observations)
+        assert len(set(ids)) == 5
+        assert all(data_manager.get_observation_by_id(obs_id) is not None for obs_id in ids)
+
+
+class TestScoutingSqliteStore:
+    def test_radius_query_matches_full_scan(self, data_manager):
+        """SQL bounding-box prefilter returns exactly the observations a full scan would."""
+        import random
+
+        rng = random.Random(3)
+        types = [ObservationType.FRESH_SCRAPE, ObservationType.RUB_LINE, ObservationType.BEDDING_AREA]
+        observations = [
+            ScoutingObservation(
+                lat=44.0 + rng.uniform(-0.3, 0.3),
+                lon=-72.5 + rng.uniform(-0.4, 0.4),
+                timestamp=datetime.now() - timedelta(days=rng.uniform(0, 60)),
+                observation_type=rng.choice(types),
+                confidence=rng.randint(1, 10),
+            )
+            for _ in range(400)
+        ]
+        data_manager.add_observations(observations)
+        stored = [data_manager.get_observation_by_id(o.id) for o in observations]
+
+        for query in [
+            ScoutingQuery(lat=44.0, lon=-72.5, radius_miles=5.0),
+            ScoutingQuery(lat=44.1, lon=-72.6, radius_miles=3.0, observation_types=[ObservationType.RUB_LINE]),
+            ScoutingQuery(lat=44.0, lon=-72.5, radius_miles=10.0, min_confidence=6, days_back=30),
+        ]:
+            expected = {o.id for o in stored if data_manager._matches_query(o, query)}
+            result = data_manager.get_observations(query)
+            assert {o.id for o in result} == expected
+            assert [o.timestamp for o in result] == sorted((o.timestamp for o in result), reverse=True)
+
+    def test_update_and_delete_keep_spatial_index_in_sync(self, data_manager, sample_observation):
+        data_manager.add_observation(sample_observation)
+        sample_observation.lat = 45.0
+        assert data_manager.update_observation(sample_observation) is True
+        assert data_manager.get_observations(ScoutingQuery(lat=44.2601, lon=-72.5754, radius_miles=1.0)) == []
+        assert len(data_manager.get_observations(ScoutingQuery(lat=45.0, lon=-72.5754, radius_miles=1.0))) == 1
+        assert data_manager.delete_observation(sample_observation.id) is True
+        assert data_manager.get_observations(ScoutingQuery(lat=45.0, lon=-72.5754, radius_miles=1.0)) == []
+
+    def test_json_file_migrated_once(self, tmp_path):
+        import json
+
+        data_file = tmp_path / "scouting_observations.json"
+        data_file.write_text(json.dumps({"observations": [
+            {"id": "legacy1", "lat": 44.0, "lon": -72.0, "observation_type": "Fresh Scrape",
+             "confidence": 7, "timestamp": "2024-10-01T06:00:00Z"},
+            {"id": "broken", "lat": 44.0},
+        ]}))
+
+        manager = ScoutingDataManager(data_file=str(data_file))
+        assert manager.db_file == tmp_path / "scouting_observations.sqlite3"
+        assert manager.get_observation_by_id("legacy1").confidence == 7
+        assert manager.get_observation_by_id("broken") is None
+
+        manager.delete_observation("legacy1")
+        reopened = ScoutingDataManager(data_file=str(data_file))
+        assert reopened.get_observation_by_id("legacy1") is None
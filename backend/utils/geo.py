@@ -8,7 +8,9 @@ the prediction pipeline and max-accuracy modules.
 from __future__ import annotations
 
 import math
-from typing import List, Tuple
+from typing import List, Sequence, Tuple
+
+import numpy as np
 
 
 def haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
@@ -67,3 +69,68 @@ def point_in_polygon(
             inside = not inside
         j = i
     return inside
+
+
+def _edge_side(
+    lat: np.ndarray, lon: np.ndarray, yi: float, xi: float, yj: float, xj: float
+) -> np.ndarray:
+    """Sign (-1, 0, 1) of the cross product of edge i->j with i->point.
+
+    Floating-point results too close to zero to trust are recomputed exactly
+    with ``fractions.Fraction``, so collinear points are detected the way an
+    exact (shapely/GEOS) predicate would.
+    """
+    a = (xj - xi) * (lat - yi)
+    b = (yj - yi) * (lon - xi)
+    side = np.sign(a - b)
+    unsure = np.flatnonzero(np.abs(a - b) <= 1e-14 * (np.abs(a) + np.abs(b)))
+    if unsure.size:
+        from fractions import Fraction
+
+        fy, fx = Fraction(yi), Fraction(xi)
+        dx, dy = Fraction(xj) - fx, Fraction(yj) - fy
+        flat_side = side.reshape(-1)
+        flat_lat, flat_lon = lat.reshape(-1), lon.reshape(-1)
+        for k in unsure.tolist():
+            exact = dx * (Fraction(float(flat_lat[k])) - fy) - dy * (Fraction(float(flat_lon[k])) - fx)
+            flat_side[k] = (exact > 0) - (exact < 0)
+    return side
+
+
+def points_in_polygon_mask(
+    lats: "np.ndarray | Sequence[float]",
+    lons: "np.ndarray | Sequence[float]",
+    polygon: List[Tuple[float, float]],
+) -> np.ndarray:
+    """Vectorised point-in-polygon test for arrays of (lat, lon) coords.
+
+    Returns a boolean mask shaped like *lats*. Points on an edge or vertex
+    count as inside, like shapely's ``contains or touches``. Polygons with
+    fewer than three corners cannot exclude anything, so every point is
+    reported inside.
+    """
+    lat = np.ascontiguousarray(lats, dtype=float)
+    lon = np.ascontiguousarray(lons, dtype=float)
+    if len(polygon) < 3:
+        return np.ones(lat.shape, dtype=bool)
+
+    inside = np.zeros(lat.shape, dtype=bool)
+    on_edge = np.zeros(lat.shape, dtype=bool)
+    j = len(polygon) - 1
+    for i in range(len(polygon)):
+        yi, xi = float(polygon[i][0]), float(polygon[i][1])
+        yj, xj = float(polygon[j][0]), float(polygon[j][1])
+        side = _edge_side(lat, lon, yi, xi, yj, xj)
+        # Ray cast towards +lon: the edge is crossed when the point lies on
+        # the side of the edge that faces the ray's origin.
+        crosses = (yi > lat) != (yj > lat)
+        inside ^= crosses & (side == (1 if yj > yi else -1))
+        on_edge |= (
+            (side == 0)
+            & (lat >= min(yi, yj))
+            & (lat <= max(yi, yj))
+            & (lon >= min(xi, xj))
+            & (lon <= max(xi, xj))
+        )
+        j = i
+    return inside | on_edge
@@ -46,6 +46,16 @@ def slope_preference(slope_deg: float) -> float:
     return 0.0
 
 
+def slope_preference_array(slope_deg: np.ndarray) -> np.ndarray:
+    """Vectorised :func:`slope_preference` for point arrays or rasters (NaN scores 0)."""
+    s = np.asarray(slope_deg)
+    return np.select(
+        [s < 0.0, s < 5.0, s <= 22.0, s <= 35.0],
+        [0.0, 0.2 + 0.8 * (s / 5.0), 1.0, np.maximum(0.0, 1.0 - (s - 22.0) / 13.0)],
+        default=0.0,
+    )
+
+
 # ---------------------------------------------------------------------------
 # Elevation / ridge proximity preference
 # ---------------------------------------------------------------------------
@@ -87,6 +97,25 @@ def ridge_proximity_preference(
     return max(0.7, 1.0 - (elev_norm - 0.92) / 0.08 * 0.3)
 
 
+def ridge_proximity_preference_array(
+    elevation: np.ndarray,
+    elev_min: float,
+    elev_max: float,
+) -> np.ndarray:
+    """Vectorised :func:`ridge_proximity_preference` for point arrays or rasters."""
+    denom = max(1e-6, elev_max - elev_min)
+    elev_norm = (np.asarray(elevation) - elev_min) / denom
+    return np.select(
+        [elev_norm < 0.3, elev_norm < 0.6, elev_norm <= 0.92],
+        [
+            np.maximum(0.1, elev_norm / 0.3 * 0.4),
+            0.4 + (elev_norm - 0.3) / 0.3 * 0.5,
+            np.maximum(0.9, 1.0 - np.abs(elev_norm - 0.80) / 0.20),
+        ],
+        default=np.maximum(0.7, 1.0 - (elev_norm - 0.92) / 0.08 * 0.3),
+    )
+
+
 # ---------------------------------------------------------------------------
 # Ridgeline detection from DEM grids
 # ---------------------------------------------------------------------------
@@ -23,6 +23,8 @@ from dataclasses import asdict
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 from optimized_biological_integration import OptimizedBiologicalIntegration
 from backend.utils.geo import angular_diff, bearing_between, haversine
+from backend.performance import BoundedCache
+from backend.services.bedding_candidates import decluster_indices, dense_candidates
 
 
 _LEGACY_MODULE_LINE_BUDGET = 5106
@@ -176,7 +178,7 @@ class EnhancedBeddingZonePredictor(OptimizedBiologicalIntegration):
         METERS_PER_DEGREE (int): Conversion factor for latitude/longitude to meters
         MIN_DESCENT_METERS (float): Minimum elevation drop to consider downhill placement
         elevation_api_url (str): API endpoint for elevation data fallback
-        _elevation_cache (dict): Cache for elevation lookups to reduce API calls
+        _elevation_cache (BoundedCache): LRU of per-point elevation API lookups
     
     Example:
         >>> predictor = EnhancedBeddingZonePredictor()
@@ -206,7 +208,7 @@ class EnhancedBeddingZonePredictor(OptimizedBiologicalIntegration):
         """
         super().__init__()
         self.elevation_api_url = "https://api.open-elevation.com/api/v1/lookup"
-        self._elevation_cache = {}
+        self._elevation_cache = BoundedCache(max_entries=4096)
         self.config = None
         self.last_scan_trace = {}
         try:
@@ -396,20 +398,30 @@ class EnhancedBeddingZonePredictor(OptimizedBiologicalIntegration):
         delta_lon = (distance_m * math.sin(bearing_rad)) / meters_per_degree_lon
         return delta_lat, delta_lon
 
+    @property
+    def dem_sampler(self):
+        """Shared DEM sampler (LRU of DEM windows) when LIDAR is enabled, else None."""
+        return getattr(getattr(self, 'lidar_batch_processor', None), 'sampler', None)
+
+    def sample_elevations(self, lats, lons) -> np.ndarray:
+        """Elevations for many points: local DEM windows in one pass, then cached per-point lookups."""
+        lats, lons = np.atleast_1d(np.asarray(lats, dtype=float)), np.atleast_1d(np.asarray(lons, dtype=float))
+        elevations = self.dem_sampler.sample_elevations(lats, lons) if self.dem_sampler else np.full(lats.shape, np.nan)
+        for i in np.flatnonzero(np.isnan(elevations)):
+            lat, lon = float(lats[i]), float(lons[i])
+            try:
+                elevation_value = self._elevation_cache.get_or_compute(
+                    f"{lat:.5f},{lon:.5f}", lambda: self.get_elevation_data(lat, lon).get("elevation"))
+            except Exception as exc:  # pragma: no cover - defensive logging
+                logger.debug("Elevation lookup failed at %.5f, %.5f: %s", lat, lon, exc)
+                elevation_value = None
+            elevations[i] = np.nan if elevation_value is None else elevation_value
+        return elevations
+
     def _lookup_elevation(self, lat: float, lon: float, fallback: Optional[float] = None) -> Optional[float]:
-        """Lookup elevation with simple caching and graceful fallback."""
-        cache_key = (round(lat, 5), round(lon, 5))
-        if cache_key in self._elevation_cache:
-            return self._elevation_cache[cache_key]
-        try:
-            elevation_data = self.get_elevation_data(lat, lon)
-            elevation_value = elevation_data.get("elevation")
-            if elevation_value is not None:
-                self._elevation_cache[cache_key] = elevation_value
-                return elevation_value
-        except Exception as exc:  # pragma: no cover - defensive logging
-            logger.debug("Elevation lookup failed at %.5f, %.5f: %s", lat, lon, exc)
-        return fallback
+        """Lookup elevation with caching and graceful fallback."""
+        elevation = self.sample_elevations([lat], [lon])[0]
+        return fallback if np.isnan(elevation) else float(elevation)
 
     def _compute_elevation_profile(self, base_lat: float, base_lon: float,
                                     lat_offset: float, lon_offset: float,
@@ -436,16 +448,10 @@ class EnhancedBeddingZonePredictor(OptimizedBiologicalIntegration):
             }
 
         samples.append(float(base_elevation))
-        for step_idx in range(1, steps + 1):
-            ratio = step_idx / steps
-            sample_lat = base_lat + lat_offset * ratio
-            sample_lon = base_lon + lon_offset * ratio
-            elevation = self._lookup_elevation(sample_lat, sample_lon, fallback=samples[-1])
-            if elevation is None:
-                # Maintain continuity if lookup fails
-                samples.append(samples[-1])
-            else:
-                samples.append(float(elevation))
+        ratios = np.arange(1, steps + 1) / steps
+        for elevation in self.sample_elevations(base_lat + lat_offset * ratios, base_lon + lon_offset * ratios):
+            # Maintain continuity if lookup fails
+            samples.append(samples[-1] if np.isnan(elevation) else float(elevation))
 
         segment_deltas = [samples[i + 1] - samples[i] for i in range(len(samples) - 1)]
         total_change = samples[-1] - samples[0]
@@ -524,6 +530,11 @@ class EnhancedBeddingZonePredictor(OptimizedBiologicalIntegration):
 
     def get_slope_aspect_rasterio(self, lat: float, lon: float) -> Dict:
         """Get accurate slope and aspect using rasterio DEM analysis with robust fallbacks"""
+        local = self.dem_sampler.sample_terrain([lat], [lon]) if self.dem_sampler else None
+        if local is not None and local['valid'][0]:
+            return {"elevation": float(local['elevation'][0]), "slope": float(local['slope'][0]),
+                    "aspect": float(local['aspect'][0]), "api_source": "lidar-dem-window",
+                    "query_success": True, "resolution_m": float(local['resolution_m'][0])}
         try:
             if not RASTERIO_AVAILABLE:
                 return self.get_elevation_data_fallback(lat, lon)
@@ -725,14 +736,16 @@ class EnhancedBeddingZonePredictor(OptimizedBiologicalIntegration):
     def get_elevation_data(self, lat: float, lon: float) -> Dict:
         """Get elevation, slope, and aspect data with GEE > rasterio > fallback priority"""
         # Priority order: GEE SRTM > Rasterio analysis > Open-Elevation fallback
-        if GEE_AVAILABLE:
+        if GEE_AVAILABLE and getattr(self, 'gee_authenticated', False):
             return self.get_slope_aspect_gee(lat, lon)
         elif RASTERIO_AVAILABLE:
             return self.get_slope_aspect_rasterio(lat, lon)
         else:
             return self.get_elevation_data_fallback(lat, lon)
 
-    def get_dynamic_gee_data_enhanced(self, lat: float, lon: float, vegetation_data: Optional[Dict] = None, max_retries: int = 5, prefer_lidar: bool = True) -> Dict:
+    def get_dynamic_gee_data_enhanced(self, lat: float, lon: float, vegetation_data: Optional[Dict] = None,
+                                      max_retries: int = 5, prefer_lidar: bool = True,
+                                      lidar_terrain: Optional[Dict] = None) -> Dict:
         """Enhanced GEE data with REAL canopy coverage from vegetation analyzer
         
         [OSM] LIDAR-FIRST ARCHITECTURE (Phase 2):
@@ -746,6 +759,7 @@ class EnhancedBeddingZonePredictor(OptimizedBiologicalIntegration):
             vegetation_data: Optional vegetation analysis data
             max_retries: Max GEE API retries
             prefer_lidar: Whether to try LIDAR before GEE (default: True)
+            lidar_terrain: Point terrain the caller already extracted (skips the LIDAR read)
         """
         gee_data = self.get_dynamic_gee_data(lat, lon, max_retries)
         
@@ -756,12 +770,10 @@ class EnhancedBeddingZonePredictor(OptimizedBiologicalIntegration):
         # [OSM] TIER 1: Try LIDAR first (0.35m resolution, instant)
         if self.use_lidar_first and prefer_lidar and self.lidar_terrain_extractor:
             try:
-                import time
                 start_time = time.time()
                 
-                lidar_files = self.lidar_dem_manager.get_files()
-                lidar_terrain = self.lidar_terrain_extractor.extract_point_terrain(
-                    lat, lon, lidar_files, sample_radius_m=30
+                lidar_terrain = lidar_terrain or self.lidar_terrain_extractor.extract_point_terrain(
+                    lat, lon, self.lidar_dem_manager.get_files(), sample_radius_m=30
                 )
                 
                 elapsed_ms = (time.time() - start_time) * 1000
@@ -800,7 +812,6 @@ class EnhancedBeddingZonePredictor(OptimizedBiologicalIntegration):
                         self.lidar_stats['gee_fallback_calls'] += 1
                     
                     # Fall through to TIER 2: GEE
-                    import time
                     start_time = time.time()
                     elevation_data = self.get_elevation_data(lat, lon)
                     if hasattr(self, 'lidar_stats'):
@@ -813,7 +824,6 @@ class EnhancedBeddingZonePredictor(OptimizedBiologicalIntegration):
                     self.lidar_stats['gee_fallback_calls'] += 1
                 
                 # TIER 2: GEE fallback on error
-                import time
                 start_time = time.time()
                 elevation_data = self.get_elevation_data(lat, lon)
                 if hasattr(self, 'lidar_stats'):
@@ -824,7 +834,6 @@ class EnhancedBeddingZonePredictor(OptimizedBiologicalIntegration):
             if hasattr(self, 'lidar_stats'):
                 self.lidar_stats['gee_fallback_calls'] += 1
             
-            import time
             start_time = time.time()
             elevation_data = self.get_elevation_data(lat, lon)
             if hasattr(self, 'lidar_stats'):
@@ -1994,7 +2003,8 @@ class EnhancedBeddingZonePredictor(OptimizedBiologicalIntegration):
 
     def run_enhanced_biological_analysis(self, lat: float, lon: float, time_of_day: int,
                                         season: str, hunting_pressure: str,
-                                        target_datetime: Optional[datetime] = None) -> Dict:
+                                        target_datetime: Optional[datetime] = None,
+                                        context: Optional[Any] = None) -> Dict:
         """
         Run comprehensive biological analysis for mature buck hunting strategy.
         
@@ -2016,6 +2026,7 @@ class EnhancedBeddingZonePredictor(OptimizedBiologicalIntegration):
             season: Hunting season ('early', 'rut', 'late', 'spring', 'summer', 'fall', 'winter')
             hunting_pressure: Level of hunting activity ('low', 'medium', 'high')
             target_datetime: Optional specific datetime for weather forecast (default: now)
+            context: Optional PropertyContext whose shared weather/roads/vegetation/DEM replace per-point fetches
         
         Returns:
             dict: Comprehensive prediction containing:
@@ -2056,7 +2067,7 @@ class EnhancedBeddingZonePredictor(OptimizedBiologicalIntegration):
         start_time = time.time()
         
         # 🆕 GET VEGETATION ANALYSIS FIRST (includes real canopy coverage!)
-        vegetation_data = None
+        vegetation_data = context.vegetation_data(lat, lon) if context is not None else None
         try:
             try:
                 from backend.vegetation_analyzer import VegetationAnalyzer
@@ -2064,7 +2075,7 @@ class EnhancedBeddingZonePredictor(OptimizedBiologicalIntegration):
                 from vegetation_analyzer import VegetationAnalyzer
             
             analyzer = VegetationAnalyzer()
-            if analyzer.initialize():
+            if vegetation_data is None and analyzer.initialize():
                 logger.info(f"🌿 Analyzing vegetation with 1000-yard radius (914m)...")
                 vegetation_data = analyzer.analyze_hunting_area(
                     lat, lon, 
@@ -2072,27 +2083,26 @@ class EnhancedBeddingZonePredictor(OptimizedBiologicalIntegration):
                     season=season
                 )
                 logger.info("[INIT] Vegetation analysis complete (includes real canopy coverage)")
-            else:
+            elif vegetation_data is None:
                 logger.warning("[WARN] VegetationAnalyzer initialization failed, will use estimated canopy")
         except Exception as e:
             logger.error(f"Vegetation analysis failed: {e}, will use estimated canopy")
         
         # 🆕 GET LIDAR TERRAIN DATA (35cm resolution for microhabitat features!)
         lidar_data = None
+        point_terrain = context.lidar_terrain(lat, lon) if context is not None else None  # shared DEM window
         try:
             try:
                 from backend.services.lidar_processor import get_lidar_processor
             except ImportError:
                 logger.warning("LIDAR processor service not available")
-                lidar_data = None
             else:
                 dem_manager, terrain_extractor, batch_processor = get_lidar_processor()
-                if dem_manager.has_coverage(lat, lon):
+                if point_terrain is not None or dem_manager.has_coverage(lat, lon):
                     logger.info(f"[OSM] Extracting LiDAR terrain (35cm resolution)...")
-                    # Note: get_terrain_data with radius is not implemented in new service
-                    # Using point terrain extraction as fallback
                     lidar_files = dem_manager.get_files()
-                    point_terrain = terrain_extractor.extract_point_terrain(lat, lon, lidar_files, sample_radius_m=30)
+                    point_terrain = point_terrain or terrain_extractor.extract_point_terrain(
+                        lat, lon, lidar_files, sample_radius_m=30)
                     if point_terrain and point_terrain.get('coverage'):
                         # Convert to old format for compatibility
                         lidar_data = {
@@ -2114,7 +2124,8 @@ class EnhancedBeddingZonePredictor(OptimizedBiologicalIntegration):
             logger.error(f"LiDAR analysis failed: {e}, will use SRTM 30m fallback")
         
         # Get enhanced environmental data (now includes REAL canopy from vegetation analysis)
-        gee_data = self.get_dynamic_gee_data_enhanced(lat, lon, vegetation_data=vegetation_data)
+        gee_data = self.get_dynamic_gee_data_enhanced(lat, lon, vegetation_data=vegetation_data,
+                                                      lidar_terrain=point_terrain)
         
         # 🆕 Enhance GEE data with LiDAR terrain features
         if lidar_data:
@@ -2145,8 +2156,9 @@ class EnhancedBeddingZonePredictor(OptimizedBiologicalIntegration):
                     'file': 'none'
                 }
         
-        osm_data = self.get_osm_road_proximity(lat, lon)
-        weather_data = self.get_enhanced_weather_with_trends(lat, lon, target_datetime)
+        osm_data = (context and context.osm_data(self, lat, lon)) or self.get_osm_road_proximity(lat, lon)
+        weather_data = ((context and context.weather_data())
+                        or self.get_enhanced_weather_with_trends(lat, lon, target_datetime))
         if isinstance(weather_data, dict):
             weather_data.setdefault("season", season)
         
@@ -4145,73 +4157,17 @@ class EnhancedBeddingZonePredictor(OptimizedBiologicalIntegration):
         Uses a spacing derived from target_points to approximate the requested density.
         Returns candidates with offsets to preserve distance calculations downstream.
         """
-        if target_points <= 0 or radius_m <= 0:
-            return []
-
-        area_m2 = math.pi * (radius_m ** 2)
-        spacing_m = max(3.0, math.sqrt(area_m2 / max(target_points, 1)))
-
-        lat_to_meters = 111000
-        lon_to_meters = 111000 * math.cos(math.radians(center_lat))
-
-        max_steps = int(radius_m / spacing_m)
-        candidates: List[Dict[str, Any]] = []
-
-        for y_step in range(-max_steps, max_steps + 1):
-            dy_m = y_step * spacing_m
-            for x_step in range(-max_steps, max_steps + 1):
-                dx_m = x_step * spacing_m
-                if (dx_m * dx_m + dy_m * dy_m) > (radius_m * radius_m):
-                    continue
-
-                lat_offset = dy_m / lat_to_meters
-                lon_offset = dx_m / lon_to_meters
-                candidates.append({
-                    "lat": center_lat + lat_offset,
-                    "lon": center_lon + lon_offset,
-                    "tier": {"name": "dense_lidar"},
-                    "lat_offset": lat_offset,
-                    "lon_offset": lon_offset,
-                    "distance_m": int((dx_m * dx_m + dy_m * dy_m) ** 0.5)
-                })
-
-        if len(candidates) > target_points:
-            stride = max(1, math.ceil(len(candidates) / target_points))
-            candidates = candidates[::stride]
-
-        return candidates
+        return dense_candidates(center_lat, center_lon, radius_m, target_points)
 
     def _decluster_candidates(self,
                               candidates: List[Dict[str, Any]],
                               min_separation_m: int,
                               max_keep: int) -> List[Dict[str, Any]]:
         """Reduce overlapping candidates by keeping top-scored points far enough apart."""
-        if not candidates:
-            return []
-
-        if min_separation_m <= 0:
-            return candidates[:max_keep] if max_keep else candidates
-
-        selected: List[Dict[str, Any]] = []
-        for candidate in candidates:
-            if max_keep and len(selected) >= max_keep:
-                break
-
-            keep = True
-            cand_lat = candidate["candidate"]["lat"]
-            cand_lon = candidate["candidate"]["lon"]
-            for chosen in selected:
-                chosen_lat = chosen["candidate"]["lat"]
-                chosen_lon = chosen["candidate"]["lon"]
-                distance_m = ((cand_lat - chosen_lat) ** 2 + (cand_lon - chosen_lon) ** 2) ** 0.5 * 111000
-                if distance_m < min_separation_m:
-                    keep = False
-                    break
-
-            if keep:
-                selected.append(candidate)
-
-        return selected
+        keep = decluster_indices([c["candidate"]["lat"] for c in candidates],
+                                 [c["candidate"]["lon"] for c in candidates],
+                                 min_separation_m, max_keep)
+        return [candidates[i] for i in keep]
 
     def _search_alternative_bedding_sites(self, center_lat: float, center_lon: float, 
                                          base_gee_data: Dict, base_osm_data: Dict, 
@@ -4264,7 +4220,6 @@ class EnhancedBeddingZonePredictor(OptimizedBiologicalIntegration):
                 # [POINTS] PHASE 4.8: Systematic multi-tier search pattern
                 # 6 distance tiers × 8 cardinal bearings = 48 strategic candidates
                 # Expanded from 300m -> 450m (~1000ft -> ~1500ft) per user request
-                import math
                 distance_tiers_m = [75, 150, 225, 300, 375, 450]  # meters
                 bearings = [0, 45, 90, 135, 180, 225, 270, 315]  # N, NE, E, SE, S, SW, W, NW
                 
@@ -4330,12 +4285,10 @@ class EnhancedBeddingZonePredictor(OptimizedBiologicalIntegration):
             lidar_coverage_hits = 0
             if self.use_lidar_first and self.lidar_batch_processor and all_candidates:
                 logger.info(f"[OSM] BATCH LIDAR: Pre-fetching terrain for {len(all_candidates)} alternative sites...")
-                import time
                 batch_start = time.time()
                 total_hits = 0
 
-                chunk_size = dense_scan_chunk_size if dense_scan_used else len(all_candidates)
-                chunk_size = max(1, chunk_size)
+                chunk_size = max(1, dense_scan_chunk_size if dense_scan_used else len(all_candidates))
 
                 try:
                     for start_idx in range(0, len(all_candidates), chunk_size):
@@ -4386,7 +4339,6 @@ class EnhancedBeddingZonePredictor(OptimizedBiologicalIntegration):
                     slope = terrain['slope']
                     if slope > 45:
                         elevation = terrain.get('elevation', 300)
-                        import numpy as np
                         if elevation > 800:
                             slope = np.random.uniform(15, 30)
                         elif elevation > 400:
@@ -4468,15 +4420,15 @@ class EnhancedBeddingZonePredictor(OptimizedBiologicalIntegration):
                 promising_candidates = [
                     c for c in terrain_scored_candidates
                     if c['terrain_score'] >= terrain_threshold
-                ][:max_gee_queries]
+                ]
                 decluster_m = int(lidar_config.get("min_separation_m", 75))
                 decluster_m = int(os.getenv("LIDAR_DENSE_SCAN_MIN_SEPARATION_M", str(decluster_m)))
-                if decluster_m > 0:
-                    promising_candidates = self._decluster_candidates(
-                        promising_candidates,
-                        min_separation_m=decluster_m,
-                        max_keep=max_gee_queries
-                    )
+                # Decluster the whole ranked pool so the shortlist fills up with separated sites
+                promising_candidates = self._decluster_candidates(
+                    promising_candidates,
+                    min_separation_m=decluster_m,
+                    max_keep=max_gee_queries
+                )
             else:
                 terrain_threshold = 50  # Only query GEE for candidates with terrain score > 50%
                 max_gee_queries = 15    # Safety cap to prevent excessive queries
@@ -4554,7 +4506,6 @@ class EnhancedBeddingZonePredictor(OptimizedBiologicalIntegration):
                         # Apply slope correction for hillshade data (same as get_dynamic_gee_data_enhanced)
                         if search_gee_data.get("slope", 0) > 45:
                             elevation = search_gee_data.get("elevation", 300)
-                            import numpy as np
                             if elevation > 800:
                                 search_gee_data["slope"] = np.random.uniform(15, 30)  # Mountainous
                             elif elevation > 400:
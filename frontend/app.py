@@ -417,6 +417,59 @@ def _noaa_sunset_utc(date_local, lat: float, lon: float) -> datetime | None:
 def _dt_to_iso_z(dt: datetime) -> str:
     return dt.astimezone(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
 
+
+# Rough position of each max-accuracy pipeline stage in a run, for the progress bar.
+MAX_ACCURACY_STAGE_PROGRESS = {
+    "queued": 0.0,
+    "started": 0.02,
+    "grid_progress": 0.05,
+    "grid_generated": 0.10,
+    "terrain_scoring_started": 0.12,
+    "dem_opened": 0.15,
+    "dem_window": 0.18,
+    "terrain_tile": 0.20,
+    "terrain_scored": 0.55,
+    "gee_enriched": 0.70,
+    "combined_scored": 0.75,
+    "bedding_identified": 0.80,
+    "corridors_computed": 0.90,
+    "stands_selected": 0.95,
+    "persisting_report": 0.98,
+    "complete": 1.0,
+}
+JOB_TERMINAL_STATES = {"completed", "error", "cancelled", "stale", "interrupted"}
+
+
+def _iter_job_events(job_id: str, max_wait_s: float = 600.0):
+    """Yield status dicts from the backend's /jobs/{job_id}/events SSE stream.
+
+    Stops after a terminal status or once *max_wait_s* has elapsed.
+    """
+    deadline = time.monotonic() + max_wait_s
+    with requests.get(
+        f"{BACKEND_URL}/jobs/{job_id}/events",
+        stream=True,
+        timeout=(10, 60),
+        headers={"Accept": "text/event-stream"},
+    ) as resp:
+        resp.raise_for_status()
+        data_lines: list[str] = []
+        for line in resp.iter_lines(decode_unicode=True):
+            if time.monotonic() > deadline:
+                return
+            if line is None:
+                continue
+            if line == "":
+                if data_lines:
+                    status = json.loads("\n".join(data_lines))
+                    data_lines = []
+                    yield status
+                    if status.get("state") in JOB_TERMINAL_STATES:
+                        return
+                continue
+            if line.startswith("data:"):
+                data_lines.append(line[5:].lstrip())
+
 # Initialize session state for map data
 if 'hunt_location' not in st.session_state:
     st.session_state.hunt_location = [44.26639, -72.58133]  # Vermont center
@@ -653,15 +706,34 @@ with tab_hotspots:
                         job_id = data["job_id"]
                         st.session_state["max_accuracy_job_id"] = job_id
                         st.session_state["max_accuracy_auto_loaded"] = False
-                        # Auto-poll until report is ready
+                        if data.get("reused") == "cached" and data.get("report"):
+                            # Identical parcel/time analyzed recently — reuse it
+                            st.session_state["max_accuracy_report"] = data["report"]
+                            st.session_state["max_accuracy_auto_loaded"] = True
+                            st.rerun()
+                        if data.get("reused") == "in_flight":
+                            st.info("An identical analysis is already running — following it.")
+                        # Follow the job's event stream, then fetch the report once
                         status_msg = st.empty()
                         progress_bar = st.progress(0)
-                        max_poll = 120  # up to 10 minutes (120 × 5s)
                         loaded = False
-                        for i in range(max_poll):
-                            status_msg.info(f"⏳ Waiting for report... ({(i + 1) * 5}s)")
-                            progress_bar.progress(min(0.95, (i + 1) / max_poll))
-                            time.sleep(5)
+                        final_state = None
+                        try:
+                            for ev in _iter_job_events(job_id):
+                                stage = ev.get("stage") or ev.get("state") or "running"
+                                payload = ev.get("payload") or {}
+                                fraction = MAX_ACCURACY_STAGE_PROGRESS.get(stage)
+                                if stage == "terrain_tile" and payload.get("tiles"):
+                                    fraction = 0.20 + 0.35 * payload.get("tile", 0) / payload["tiles"]
+                                if fraction is not None:
+                                    progress_bar.progress(min(1.0, max(0.0, fraction)))
+                                status_msg.info(f"⏳ {stage.replace('_', ' ')}")
+                                final_state = ev.get("state")
+                                if final_state in JOB_TERMINAL_STATES and final_state != "completed":
+                                    status_msg.error(f"Max Accuracy failed: {payload.get('error') or final_state}")
+                        except Exception as stream_exc:
+                            logger.debug("Max-accuracy event stream failed: %s", stream_exc)
+                        if final_state == "completed":
                             try:
                                 rpt = requests.get(f"{BACKEND_URL}/property-hotspots/max-accuracy/report/{job_id}", timeout=30)
                                 rpt_data = rpt.json() if rpt.headers.get("content-type", "").startswith("application/json") else {}
@@ -671,13 +743,10 @@ with tab_hotspots:
                                     progress_bar.progress(1.0)
                                     status_msg.success("✅ Max Accuracy report loaded!")
                                     loaded = True
-                                    time.sleep(1)
                                     st.rerun()
-                                    break
-                            except Exception as poll_exc:
-                                logger.debug("Max-accuracy poll attempt failed: %s", poll_exc)
-                        if not loaded:
-                            progress_bar.progress(1.0)
+                            except Exception as load_exc:
+                                logger.debug("Max-accuracy report load failed: %s", load_exc)
+                        if not loaded and final_state not in JOB_TERMINAL_STATES:
                             status_msg.warning("Report is still processing. Use the refresh button below.")
                     else:
                         st.error(f"Max Accuracy failed: {data.get('error') or resp.text}")
@@ -711,6 +780,17 @@ with tab_hotspots:
                         st.warning("Report not ready yet.")
                 except Exception as e:
                     st.error(f"Could not load report: {e}")
+            if st.button("⛔ Cancel running analysis"):
+                job_id = st.session_state.get("max_accuracy_job_id")
+                try:
+                    resp = requests.delete(f"{BACKEND_URL}/property-hotspots/max-accuracy/{job_id}", timeout=30)
+                    data = resp.json() if resp.headers.get("content-type", "").startswith("application/json") else {}
+                    if resp.status_code == 200 and data.get("success"):
+                        st.success("Analysis cancelled.")
+                    else:
+                        st.warning(data.get("error") or data.get("detail") or "Job is not running.")
+                except Exception as e:
+                    st.error(f"Could not cancel job: {e}")
     with st.expander("Load max-accuracy report by job id", expanded=False):
         if max_accuracy_job_id:
             st.caption(f"Last max-accuracy job id: {max_accuracy_job_id}")
@@ -19,6 +19,7 @@ import json
 import logging
 import math
 import requests
+import sqlite3
 import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional, Tuple
@@ -30,6 +31,8 @@ from selenium.webdriver.chrome.options import Options
 import websocket
 import threading
 
+from backend.services.gee_cache import FixtureGEEProvider, EarthEngineProvider, get_gee_cache
+
 # Try to import Google Earth Engine
 try:
     import ee
@@ -40,6 +43,12 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Once every attempt for a point has failed, Earth Engine is not queried
+# again for this long: points get fallback data straight away (nothing is
+# cached) instead of each paying the retry back-off during an outage.
+_GEE_RETRY_SECONDS = 60.0
+_gee_retry_at = 0.0
+
 class OptimizedBiologicalIntegration:
     """Optimized biological integration with all advanced recommendations"""
     
@@ -48,10 +57,11 @@ class OptimizedBiologicalIntegration:
         self.gee_authenticated = False
         self.pressure_history = []  # For trend analysis
         self.websocket_connected = False
-        self._gee_cache = {}
+        # A local fixture (GEE_FIXTURE_PATH) replaces Earth Engine entirely.
+        self.gee_provider = FixtureGEEProvider.from_env()
         
         # Initialize GEE if available
-        if GEE_AVAILABLE:
+        if GEE_AVAILABLE and self.gee_provider is None:
             self.initialize_gee()
         
         # Vermont test locations with varied terrain
@@ -95,74 +105,101 @@ class OptimizedBiologicalIntegration:
                 self.gee_authenticated = False
     
     def get_dynamic_gee_data(self, lat: float, lon: float, max_retries: int = 3) -> Dict:
-        """Get dynamic NDVI/canopy data from Google Earth Engine with error retries"""
-        if not self.gee_authenticated:
-            return self.get_fallback_gee_data(lat, lon)
+        """Get dynamic NDVI/canopy data from Google Earth Engine with error retries
 
-        cache_date = datetime.now().strftime('%Y-%m-%d')
-        cache_key = f"{round(lat, 3)},{round(lon, 3)},{cache_date}"
-        cached = self._gee_cache.get(cache_key)
-        if cached:
-            return cached.copy()
-        
-        for attempt in range(max_retries):
-            try:
-                # Create point geometry
-                point = ee.Geometry.Point([lon, lat])
-                
-                # Get recent Landsat data for NDVI
-                landsat = ee.ImageCollection('LANDSAT/LC08/C02/T1_L2') \
-                    .filterBounds(point) \
-                    .filterDate('2024-06-01', '2024-09-30') \
-                    .filter(ee.Filter.lt('CLOUD_COVER', 20)) \
-                    .first()
-                
-                if landsat:
-                    # Calculate NDVI
-                    ndvi = landsat.normalizedDifference(['SR_B5', 'SR_B4'])
-                    
-                    # Get canopy cover from Global Forest Cover
-                    canopy = ee.Image('UMD/hansen/global_forest_change_2023_v1_11') \
-                        .select('treecover2000')
-                    
-                    # ENHANCED: Get OSM disturbance data integrated with GEE
-                    osm_disturbance = self.get_osm_disturbance_for_gee(lat, lon)
-                    
-                    # Sample values at point
-                    ndvi_value = ndvi.sample(point, 30).first().get('nd').getInfo()
-                    canopy_value = canopy.sample(point, 30).first().get('treecover2000').getInfo()
-                    
-                    # Apply OSM disturbance factor to canopy
-                    effective_canopy = float(canopy_value) / 100 if canopy_value else 0.6
-                    if osm_disturbance["high_disturbance"]:
-                        effective_canopy *= 0.8  # Reduce effective canopy near roads/development
-                    
-                    gee_data = {
-                        "ndvi_value": float(ndvi_value) if ndvi_value else 0.5,
-                        "canopy_coverage": effective_canopy,
-                        "deciduous_forest_percentage": effective_canopy,
-                        "vegetation_health": "excellent" if ndvi_value and ndvi_value > 0.6 else "good",
-                        "data_source": "dynamic_gee_enhanced",
-                        "query_success": True,
-                        "attempt": attempt + 1,
-                        "osm_disturbance": osm_disturbance,
-                        "timestamp": datetime.now().isoformat()
-                    }
-                    
-                    self.logger.info(f"✅ Enhanced GEE data (attempt {attempt+1}): NDVI={ndvi_value:.3f}, Canopy={effective_canopy:.1%}")
-                    self._gee_cache[cache_key] = gee_data.copy()
-                    return gee_data
-                
-            except Exception as e:
-                self.logger.warning(f"⚠️ GEE query attempt {attempt+1} failed: {e}")
-                if attempt < max_retries - 1:
-                    time.sleep(2 ** attempt)  # Exponential backoff
-                else:
-                    self.logger.error(f"❌ All {max_retries} GEE attempts failed")
-        
-        fallback = self.get_fallback_gee_data(lat, lon)
-        self._gee_cache[cache_key] = fallback.copy()
-        return fallback
+        Samples come from the persistent GEE cache (snapped grid cell, product,
+        composite period) when fresh, so prefetched areas work without Earth
+        Engine; misses are fetched from the provider and cached. After a
+        point exhausts its retries, misses return fallback data for
+        ``_GEE_RETRY_SECONDS`` without querying the provider.
+        """
+        global _gee_retry_at
+        provider = self._get_gee_provider()
+        cache = self._get_gee_result_cache() if provider is None or provider.cacheable else None
+        query_lat, query_lon = cache.cell_center(lat, lon) if cache else (lat, lon)
+
+        payloads = {}
+        if cache:
+            for product in ("ndvi", "canopy", "osm_disturbance"):
+                cached = cache.get(product, lat, lon)
+                if cached is not None:
+                    payloads[product] = cached
+        missing = [p for p in ("ndvi", "canopy") if p not in payloads]
+        attempts = 0
+        if missing:
+            if provider is None or time.monotonic() < _gee_retry_at:
+                return self.get_fallback_gee_data(lat, lon)
+            for attempt in range(max_retries):
+                attempts = attempt + 1
+                try:
+                    fetched = {p: provider.fetch(p, query_lat, query_lon) for p in missing}
+                    break
+                except Exception as e:
+                    self.logger.warning(f"⚠️ GEE query attempt {attempt+1} failed: {e}")
+                    if attempt < max_retries - 1:
+                        time.sleep(2 ** attempt)  # Exponential backoff
+                    else:
+                        self.logger.error(f"❌ All {max_retries} GEE attempts failed; "
+                                          f"using fallback data for {_GEE_RETRY_SECONDS:.0f}s")
+            else:
+                _gee_retry_at = time.monotonic() + _GEE_RETRY_SECONDS
+                return self.get_fallback_gee_data(lat, lon)
+            payloads.update(fetched)
+            if cache:
+                for product, payload in fetched.items():
+                    cache.set(product, lat, lon, payload)
+
+        # ENHANCED: Get OSM disturbance data integrated with GEE
+        osm_disturbance = payloads.get("osm_disturbance")
+        if osm_disturbance is None:
+            if provider is not None and "osm_disturbance" in provider.products:
+                osm_disturbance = provider.fetch("osm_disturbance", query_lat, query_lon)
+            else:
+                osm_disturbance = self.get_osm_disturbance_for_gee(query_lat, query_lon)
+            if cache and osm_disturbance.get("osm_disturbance_success"):
+                cache.set("osm_disturbance", lat, lon, osm_disturbance)
+
+        ndvi_value = payloads["ndvi"].get("ndvi_value")
+        canopy_value = payloads["canopy"].get("treecover2000")
+
+        # Apply OSM disturbance factor to canopy
+        effective_canopy = float(canopy_value) / 100 if canopy_value else 0.6
+        if osm_disturbance.get("high_disturbance"):
+            effective_canopy *= 0.8  # Reduce effective canopy near roads/development
+
+        gee_data = {
+            "ndvi_value": float(ndvi_value) if ndvi_value else 0.5,
+            "canopy_coverage": effective_canopy,
+            "deciduous_forest_percentage": effective_canopy,
+            "vegetation_health": "excellent" if ndvi_value and ndvi_value > 0.6 else "good",
+            "data_source": provider.data_source if provider is not None else EarthEngineProvider.data_source,
+            "query_success": True,
+            "attempt": attempts,
+            "cached": not missing,
+            "osm_disturbance": osm_disturbance,
+            "timestamp": datetime.now().isoformat()
+        }
+
+        if missing:
+            self.logger.info(f"✅ Enhanced GEE data (attempt {attempts}): NDVI={gee_data['ndvi_value']:.3f}, Canopy={effective_canopy:.1%}")
+        return gee_data
+
+    def _get_gee_result_cache(self):
+        """Persistent GEE cache, or None when its database cannot be opened"""
+        try:
+            return get_gee_cache()
+        except (OSError, sqlite3.Error) as e:
+            self.logger.warning(f"⚠️ GEE cache unavailable, querying without it: {e}")
+            return None
+
+    def _get_gee_provider(self):
+        """Fixture provider when configured, Earth Engine when authenticated, else None"""
+        provider = getattr(self, "gee_provider", None)
+        if provider is not None:
+            return provider
+        if getattr(self, "gee_authenticated", False):
+            return EarthEngineProvider()
+        return None
     
     def get_osm_disturbance_for_gee(self, lat: float, lon: float) -> Dict:
         """Get OSM disturbance data for GEE hybrid analysis"""
@@ -239,30 +276,7 @@ class OptimizedBiologicalIntegration:
             if response.status_code == 200:
                 data = response.json()
                 roads = data.get('elements', [])
-                
-                min_distance = float('inf')
-                road_types = []
-                
-                for road in roads:
-                    if 'geometry' in road:
-                        road_types.append(road.get('tags', {}).get('highway', 'unknown'))
-                        # Simplified distance calculation to first point
-                        if road['geometry']:
-                            road_lat = road['geometry'][0]['lat']
-                            road_lon = road['geometry'][0]['lon']
-                            distance = self.haversine_distance(lat, lon, road_lat, road_lon)
-                            min_distance = min(min_distance, distance)
-                
-                proximity_data = {
-                    "nearest_road_distance_m": min_distance if min_distance != float('inf') else 1000,
-                    "road_types_nearby": list(set(road_types)),
-                    "bedding_security_score": min(1.0, max(0.0, (min_distance - 200) / 800)),  # >200m is good
-                    "osm_query_success": True,
-                    "roads_found": len(roads)
-                }
-                
-                self.logger.info(f"✅ OSM road data: {min_distance:.0f}m to nearest road")
-                return proximity_data
+                return self.road_proximity_from_elements(lat, lon, roads)
             
         except Exception as e:
             self.logger.warning(f"⚠️ OSM road query failed: {e}")
@@ -275,6 +289,74 @@ class OptimizedBiologicalIntegration:
             "osm_query_success": False,
             "roads_found": 0
         }
+
+    def get_osm_roads_in_bbox(self, min_lat: float, min_lon: float,
+                              max_lat: float, max_lon: float) -> Optional[List[Dict]]:
+        """Fetch road ways (with geometry) intersecting a bounding box in one Overpass query.
+
+        Returns the raw Overpass elements, or None if the query failed.
+        """
+        try:
+            overpass_url = "https://overpass-api.de/api/interpreter"
+            query = f"""
+            [out:json][timeout:60];
+            (
+              way["highway"~"^(primary|secondary|tertiary|trunk|motorway)$"]({min_lat},{min_lon},{max_lat},{max_lon});
+            );
+            out geom;
+            """
+
+            response = requests.post(overpass_url, data=query, timeout=90)
+            if response.status_code == 200:
+                roads = response.json().get('elements', [])
+                self.logger.info(f"✅ OSM bbox extract: {len(roads)} roads")
+                return roads
+            self.logger.warning(f"⚠️ OSM bbox query returned HTTP {response.status_code}")
+        except Exception as e:
+            self.logger.warning(f"⚠️ OSM bbox query failed: {e}")
+        return None
+
+    def road_proximity_from_elements(self, lat: float, lon: float, roads: List[Dict],
+                                     radius_km: Optional[float] = None) -> Dict:
+        """Summarise road proximity for a point from Overpass road elements.
+
+        When *radius_km* is given, only roads with a vertex inside the radius
+        are considered, which mirrors an ``around:`` query against a larger
+        (e.g. property-wide) extract.
+        """
+        if radius_km is not None:
+            radius_m = radius_km * 1000
+            roads = [
+                road for road in roads
+                if any(
+                    self.haversine_distance(lat, lon, node['lat'], node['lon']) <= radius_m
+                    for node in road.get('geometry') or ()
+                )
+            ]
+
+        min_distance = float('inf')
+        road_types = []
+        
+        for road in roads:
+            if 'geometry' in road:
+                road_types.append(road.get('tags', {}).get('highway', 'unknown'))
+                # Simplified distance calculation to first point
+                if road['geometry']:
+                    road_lat = road['geometry'][0]['lat']
+                    road_lon = road['geometry'][0]['lon']
+                    distance = self.haversine_distance(lat, lon, road_lat, road_lon)
+                    min_distance = min(min_distance, distance)
+        
+        proximity_data = {
+            "nearest_road_distance_m": min_distance if min_distance != float('inf') else 1000,
+            "road_types_nearby": list(set(road_types)),
+            "bedding_security_score": min(1.0, max(0.0, (min_distance - 200) / 800)),  # >200m is good
+            "osm_query_success": True,
+            "roads_found": len(roads)
+        }
+        
+        self.logger.info(f"✅ OSM road data: {min_distance:.0f}m to nearest road")
+        return proximity_data
     
     def haversine_distance(self, lat1: float, lon1: float, lat2: float, lon2: float) -> float:
         """Calculate distance between two points in meters"""
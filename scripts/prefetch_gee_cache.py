@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""Prefetch Earth Engine samples for a bounding box into the GEE cache.
+
+Run once while Earth Engine credentials are available; predictions inside
+the box are then served from ``GEE_CACHE_DB`` without Earth Engine.
+
+    python scripts/prefetch_gee_cache.py 43.30 -73.23 43.32 -73.20 --products ndvi canopy landcover
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from backend.services.gee_cache import PRODUCTS, get_gee_cache  # noqa: E402
+from optimized_biological_integration import OptimizedBiologicalIntegration  # noqa: E402
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("min_lat", type=float)
+    parser.add_argument("min_lon", type=float)
+    parser.add_argument("max_lat", type=float)
+    parser.add_argument("max_lon", type=float)
+    parser.add_argument(
+        "--products",
+        nargs="+",
+        default=["ndvi", "canopy"],
+        choices=sorted(p for p in PRODUCTS if p != "osm_disturbance"),
+        help="Products to fetch (default: ndvi canopy)",
+    )
+    args = parser.parse_args()
+
+    provider = OptimizedBiologicalIntegration()._get_gee_provider()
+    if provider is None or not provider.cacheable:
+        print("Earth Engine is not authenticated (or GEE_FIXTURE_PATH is set); nothing to prefetch.")
+        return 1
+
+    cache = get_gee_cache()
+
+    def progress(done: int, total: int) -> None:
+        print(f"  {done}/{total} cells", flush=True)
+
+    summary = cache.prefetch_bbox(
+        args.min_lat, args.min_lon, args.max_lat, args.max_lon, provider, args.products,
+        progress_callback=progress,
+    )
+    for product, counts in summary.items():
+        print(f"{product}: {counts}")
+    print(f"Cache: {cache.path}")
+    return 0 if all(c["failed"] == 0 for c in summary.values()) else 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
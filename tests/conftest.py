@@ -62,3 +62,13 @@ def verify_backend_running(backend_url):
             pytest.skip(f"Backend not healthy: {response.status_code}")
     except requests.exceptions.RequestException:
         pytest.skip("Backend not accessible - start backend with: python backend/main.py")
+
+
+@pytest.fixture(autouse=True)
+def isolated_job_registry(tmp_path, monkeypatch):
+    """Point the SQLite job registry at a per-test database."""
+    monkeypatch.setenv("JOB_REGISTRY_DB", str(tmp_path / "job_registry.sqlite3"))
+    yield
+    from backend.services.job_registry import reset_job_registries
+
+    reset_job_registries()
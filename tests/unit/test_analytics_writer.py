@@ -0,0 +1,112 @@
+"""Tests for the batched background writer in the analytics collector."""
+
+from __future__ import annotations
+
+import sqlite3
+import time
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from backend.analytics.data_collector import (
+    DROP_OLDEST,
+    AnalyticsCollector,
+    PerformanceMetric,
+    PredictionRecord,
+)
+
+
+def _prediction(i: int) -> PredictionRecord:
+    return PredictionRecord(
+        prediction_id=f"p{i}", timestamp=datetime.now(), latitude=44.0, longitude=-72.5,
+        season="rut", weather_conditions=["clear"], time_of_day="dawn",
+        stand_rating=7.5, confidence_score=60.0 + i % 30,
+    )
+
+
+def _count(db_path: Path, table: str) -> int:
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+@pytest.fixture()
+def db_path(tmp_path: Path) -> Path:
+    return tmp_path / "analytics.db"
+
+
+def test_rows_are_written_in_batches(db_path: Path):
+    collector = AnalyticsCollector(str(db_path), batch_size=500, flush_interval_s=60.0)
+    try:
+        for i in range(1200):
+            collector.record_prediction(_prediction(i))
+        collector.record_performance_metric(PerformanceMetric("m1", datetime.now(), "cpu_usage", 12.5))
+        collector.record_performance_metric(PerformanceMetric("m1", datetime.now(), "cpu_usage", 99.0))
+        assert collector.flush()
+
+        stats = collector.writer_stats()
+        assert stats["written"] == 1202
+        assert stats["batches"] == 3
+        assert stats["dropped"] == 0
+        assert _count(db_path, "predictions") == 1200
+        # A repeated metric id no longer fails the batch it lands in.
+        assert _count(db_path, "performance_metrics") == 1
+
+        analytics = collector.get_prediction_analytics(days=1)
+        assert analytics["summary"]["total_predictions"] == 1200
+    finally:
+        collector.close()
+
+
+def test_interval_flush_without_explicit_flush(db_path: Path):
+    collector = AnalyticsCollector(str(db_path), batch_size=1000, flush_interval_s=0.05)
+    try:
+        collector.record_prediction(_prediction(1))
+        deadline = time.monotonic() + 5
+        while collector.writer_stats()["written"] < 1 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert _count(db_path, "predictions") == 1
+    finally:
+        collector.close()
+
+
+@pytest.mark.parametrize("policy", ["drop_newest", DROP_OLDEST])
+def test_full_queue_drops_without_blocking(db_path: Path, policy: str):
+    collector = AnalyticsCollector(str(db_path), queue_size=10, batch_size=1, flush_interval_s=60.0,
+                                   drop_policy=policy)
+    try:
+        # Holding the connection lock stalls the writer as a slow disk would.
+        with collector._lock:
+            started = time.perf_counter()
+            for i in range(50):
+                collector.record_prediction(_prediction(i))
+            elapsed = time.perf_counter() - started
+            stats = collector.writer_stats()
+        assert elapsed < 1.0
+        assert stats["dropped"] >= 39
+        assert stats["max_queue_depth"] == 10
+
+        assert collector.flush()
+        with sqlite3.connect(db_path) as conn:
+            stored = {row[0] for row in conn.execute("SELECT prediction_id FROM predictions")}
+        assert len(stored) == 50 - collector.writer_stats()["dropped"]
+        assert ("p49" in stored) == (policy == DROP_OLDEST)
+    finally:
+        collector.close()
+
+
+def test_close_flushes_pending_rows(db_path: Path):
+    collector = AnalyticsCollector(str(db_path), batch_size=1000, flush_interval_s=60.0)
+    for i in range(5):
+        collector.record_prediction(_prediction(i))
+    collector.close()
+
+    assert _count(db_path, "predictions") == 5
+    assert not collector.writer_stats()["writer_alive"]
+    collector.record_prediction(_prediction(99))
+    assert collector.writer_stats()["dropped"] == 1
+
+
+def test_invalid_drop_policy_rejected(db_path: Path):
+    with pytest.raises(ValueError):
+        AnalyticsCollector(str(db_path), drop_policy="block")
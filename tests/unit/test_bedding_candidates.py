@@ -0,0 +1,95 @@
+"""Tests for the array-based bedding candidate lattice and grid-hash declustering."""
+
+from __future__ import annotations
+
+import math
+from typing import Any, Dict, List
+
+import numpy as np
+import pytest
+
+from backend.services.bedding_candidates import decluster_indices, dense_candidate_lattice, dense_candidates
+from enhanced_bedding_zone_predictor import EnhancedBeddingZonePredictor
+
+
+def _loop_candidates(center_lat: float, center_lon: float, radius_m: int, target_points: int) -> List[Dict[str, Any]]:
+    """The nested-loop lattice the bedding predictor used to build."""
+    area_m2 = math.pi * (radius_m ** 2)
+    spacing_m = max(3.0, math.sqrt(area_m2 / max(target_points, 1)))
+    lon_to_meters = 111000 * math.cos(math.radians(center_lat))
+    max_steps = int(radius_m / spacing_m)
+    candidates = []
+    for y_step in range(-max_steps, max_steps + 1):
+        dy_m = y_step * spacing_m
+        for x_step in range(-max_steps, max_steps + 1):
+            dx_m = x_step * spacing_m
+            if (dx_m * dx_m + dy_m * dy_m) > (radius_m * radius_m):
+                continue
+            lat_offset = dy_m / 111000
+            lon_offset = dx_m / lon_to_meters
+            candidates.append({
+                "lat": center_lat + lat_offset,
+                "lon": center_lon + lon_offset,
+                "tier": {"name": "dense_lidar"},
+                "lat_offset": lat_offset,
+                "lon_offset": lon_offset,
+                "distance_m": int((dx_m * dx_m + dy_m * dy_m) ** 0.5),
+            })
+    if len(candidates) > target_points:
+        candidates = candidates[::max(1, math.ceil(len(candidates) / target_points))]
+    return candidates
+
+
+def _pairwise_decluster(points: List[tuple], min_separation_m: float, max_keep: int) -> List[int]:
+    kept: List[int] = []
+    for i, (lat, lon) in enumerate(points):
+        if max_keep and len(kept) >= max_keep:
+            break
+        if all(((lat - points[j][0]) ** 2 + (lon - points[j][1]) ** 2) ** 0.5 * 111000 >= min_separation_m
+               for j in kept):
+            kept.append(i)
+    return kept
+
+
+@pytest.mark.parametrize("radius_m,target_points", [(800, 5000), (450, 300), (100, 10_000), (800, 1)])
+def test_lattice_matches_nested_loops(radius_m: int, target_points: int):
+    assert dense_candidates(44.004, -72.495, radius_m, target_points) == _loop_candidates(
+        44.004, -72.495, radius_m, target_points)
+
+
+def test_lattice_degenerate_inputs():
+    assert dense_candidates(44.0, -72.0, 0, 100) == []
+    assert dense_candidate_lattice(44.0, -72.0, 100, 0)["lat"].size == 0
+
+
+def test_decluster_matches_pairwise_greedy():
+    rng = np.random.default_rng(7)
+    lats = 44.0 + rng.uniform(-0.004, 0.004, 3000)
+    lons = -72.5 + rng.uniform(-0.006, 0.006, 3000)
+    points = list(zip(lats.tolist(), lons.tolist()))
+    for separation, max_keep in [(75, 0), (75, 20), (10, 0), (300, 5)]:
+        assert decluster_indices(lats, lons, separation, max_keep) == _pairwise_decluster(points, separation, max_keep)
+    assert decluster_indices(lats, lons, 0, 4) == [0, 1, 2, 3]
+
+
+def test_decluster_keeps_higher_ranked_neighbour():
+    lats = [44.0, 44.0 + 50 / 111000, 44.0 + 100 / 111000]
+    assert decluster_indices(lats, [-72.0] * 3, 75) == [0, 2]
+    assert decluster_indices(lats[1:], [-72.0] * 2, 75) == [0]
+
+
+def test_predictor_declusters_scored_candidates():
+    predictor = EnhancedBeddingZonePredictor.__new__(EnhancedBeddingZonePredictor)
+    candidates = predictor._generate_dense_lidar_candidates(44.004, -72.495, 300, 2000)
+    scored = [{"candidate": c, "terrain_score": 100 - c["distance_m"] / 10} for c in candidates]
+    scored.sort(key=lambda entry: entry["terrain_score"], reverse=True)
+
+    shortlist = predictor._decluster_candidates(scored, min_separation_m=75, max_keep=20)
+    assert len(shortlist) == 20
+    assert shortlist[0] is scored[0]
+    points = [(e["candidate"]["lat"], e["candidate"]["lon"]) for e in shortlist]
+    for i, (lat, lon) in enumerate(points):
+        for other_lat, other_lon in points[:i]:
+            assert ((lat - other_lat) ** 2 + (lon - other_lon) ** 2) ** 0.5 * 111000 >= 75
+    assert predictor._decluster_candidates([], 75, 20) == []
+    assert predictor._decluster_candidates(scored, 0, 3) == scored[:3]
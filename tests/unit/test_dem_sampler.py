@@ -0,0 +1,115 @@
+"""Tests for vectorised DEM sampling over cached windows."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import List, Tuple
+
+import numpy as np
+import pytest
+
+from backend.performance import BoundedCache
+from backend.services import lidar_processor as lidar_module
+from backend.services.lidar_processor import (
+    RASTERIO_AVAILABLE,
+    BatchLIDARProcessor,
+    DEMFileManager,
+    DEMSampler,
+    TerrainExtractor,
+)
+from enhanced_bedding_zone_predictor import EnhancedBeddingZonePredictor
+
+pytestmark = pytest.mark.skipif(not RASTERIO_AVAILABLE, reason="Rasterio not available")
+
+POINTS: List[Tuple[float, float]] = [
+    (44.001, -72.499), (44.004, -72.495), (44.0075, -72.4905), (44.0049, -72.4951), (44.0051, -72.4949),
+]
+
+
+@pytest.fixture()
+def dem_dir(tmp_path: Path) -> Path:
+    rasterio = pytest.importorskip("rasterio")
+    from rasterio.transform import from_origin
+    from rasterio.warp import transform
+
+    # 2 m UTM 18N raster around (44.004, -72.495) with a tilted, bumpy surface.
+    xs, ys = transform("EPSG:4326", "EPSG:32618", [-72.495], [44.004])
+    size = 1200
+    origin_x, origin_y = xs[0] - size, ys[0] + size
+    rows, cols = np.mgrid[0:size, 0:size]
+    elevation = (300.0 + rows * 0.15 + np.sin(cols / 25.0) * 4.0 + np.cos(rows / 40.0) * 3.0).astype("float32")
+    with rasterio.open(
+        tmp_path / "tile_DEMHF.tif", "w", driver="GTiff", height=size, width=size, count=1,
+        dtype="float32", crs="EPSG:32618", transform=from_origin(origin_x, origin_y, 2.0, 2.0),
+    ) as dst:
+        dst.write(elevation, 1)
+    return tmp_path
+
+
+def test_vectorised_terrain_matches_point_reads(dem_dir: Path):
+    manager = DEMFileManager(data_dir=str(dem_dir))
+    sampler = DEMSampler(manager)
+    lats, lons = zip(*POINTS)
+
+    terrain = sampler.sample_terrain(lats, lons)
+    elevations = sampler.sample_elevations(lats, lons)
+    assert terrain["valid"].all()
+    for k, (lat, lon) in enumerate(POINTS):
+        expected = TerrainExtractor.extract_point_terrain(lat, lon, manager.get_files())
+        assert terrain["elevation"][k] == elevations[k] == expected["elevation"]
+        assert terrain["slope"][k] == pytest.approx(expected["slope"], abs=1e-9)
+        assert terrain["aspect"][k] == pytest.approx(expected["aspect"], abs=1e-9)
+
+    outside = sampler.sample_terrain([45.0], [-71.0])
+    assert not outside["valid"][0] and np.isnan(outside["slope"][0])
+    assert np.isnan(sampler.sample_elevations([45.0], [-71.0])[0])
+
+
+def test_batch_extract_serves_covered_points_without_file_reads(dem_dir: Path, monkeypatch: pytest.MonkeyPatch):
+    manager = DEMFileManager(data_dir=str(dem_dir))
+    plain = BatchLIDARProcessor(manager, TerrainExtractor()).batch_extract(POINTS)
+
+    sampler = DEMSampler(manager)
+    sampler.sample_elevations(*zip(*POINTS))  # warm the tile windows
+    opened = []
+    real_open = lidar_module.rasterio.open
+    monkeypatch.setattr(lidar_module.rasterio, "open", lambda *a, **k: opened.append(a) or real_open(*a, **k))
+
+    sampled = BatchLIDARProcessor(manager, TerrainExtractor(), sampler=sampler).batch_extract(POINTS)
+    assert opened == []
+    assert sampled.keys() == plain.keys()
+    for key, expected in plain.items():
+        for field in ("elevation", "source", "file", "coverage", "bench_score", "ridge_score",
+                      "saddle_score", "corridor_strength"):
+            assert sampled[key][field] == expected[field]
+        assert sampled[key]["slope"] == pytest.approx(expected["slope"], abs=1e-9)
+
+
+def test_window_cache_is_bounded(dem_dir: Path):
+    manager = DEMFileManager(data_dir=str(dem_dir))
+    window = manager.read_window(44.0, -72.5, 44.005, -72.495)
+    one_window = window.elevation.nbytes
+    sampler = DEMSampler(manager, max_bytes=int(one_window * 1.5), tile_deg=0.005)
+
+    sampler.sample_elevations([44.001], [-72.499])
+    sampler.sample_elevations([44.006], [-72.499])
+    sampler.sample_elevations([44.001], [-72.499])
+    stats = sampler.windows.stats()
+    assert stats["entries"] == 1
+    assert stats["bytes"] <= one_window * 1.5
+    assert stats["evictions"] >= 2
+
+
+def test_predictor_samples_windows_first_and_falls_back_per_point(dem_dir: Path):
+    predictor = EnhancedBeddingZonePredictor.__new__(EnhancedBeddingZonePredictor)
+    predictor._elevation_cache = BoundedCache(max_entries=16)
+    sampler = DEMSampler(DEMFileManager(data_dir=str(dem_dir)))
+    predictor.lidar_batch_processor = BatchLIDARProcessor(sampler.dem_manager, TerrainExtractor(), sampler=sampler)
+    remote: List[Tuple[float, float]] = []
+    predictor.get_elevation_data = lambda lat, lon: remote.append((lat, lon)) or {"elevation": 123.0}
+
+    elevations = predictor.sample_elevations([44.004, 45.0, 45.0], [-72.495, -71.0, -71.0])
+    assert elevations[0] == sampler.sample_elevations([44.004], [-72.495])[0]
+    assert list(elevations[1:]) == [123.0, 123.0]
+    assert remote == [(45.0, -71.0)]
+    assert predictor._lookup_elevation(46.0, -70.0) == 123.0
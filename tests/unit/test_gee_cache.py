@@ -0,0 +1,178 @@
+"""Tests for the persistent GEE sample cache and the fixture provider."""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import pytest
+
+import optimized_biological_integration as integration_module
+from backend.services import gee_cache as gee_cache_module
+from backend.services.gee_cache import FixtureGEEProvider, GEEResultCache
+from enhanced_bedding_zone_predictor import EnhancedBeddingZonePredictor
+from optimized_biological_integration import OptimizedBiologicalIntegration
+
+FIXTURE = Path(__file__).resolve().parents[1] / "fixtures" / "gee_fixture.json"
+
+
+class CountingProvider:
+    products = ("ndvi", "canopy")
+    data_source = "dynamic_gee_enhanced"
+    cacheable = True
+
+    def __init__(self, fail_at: Tuple[float, float] = None) -> None:
+        self.calls: List[Tuple[str, float, float]] = []
+        self.fail_at = fail_at
+
+    def fetch(self, product: str, lat: float, lon: float) -> Dict[str, Any]:
+        self.calls.append((product, lat, lon))
+        if self.fail_at and (round(lat, 4), round(lon, 4)) == self.fail_at:
+            raise RuntimeError("quota")
+        if product == "ndvi":
+            return {"ndvi_value": 0.65}
+        return {"treecover2000": 90.0}
+
+
+@pytest.fixture()
+def cache(tmp_path: Path) -> GEEResultCache:
+    c = GEEResultCache(tmp_path / "gee.sqlite3", cell_deg=0.001)
+    yield c
+    c.close()
+
+
+def _integration(provider: Any = None) -> OptimizedBiologicalIntegration:
+    integration = OptimizedBiologicalIntegration.__new__(OptimizedBiologicalIntegration)
+    integration.logger = integration_module.logger
+    integration.gee_authenticated = False
+    integration.gee_provider = provider
+    return integration
+
+
+def test_nearby_points_share_a_cell_and_survive_reopen(cache: GEEResultCache, tmp_path: Path):
+    cache.set("ndvi", 44.26001, -72.58001, {"ndvi_value": 0.7})
+    assert cache.get("ndvi", 44.26095, -72.58095) == {"ndvi_value": 0.7}
+    assert cache.get("ndvi", 44.2611, -72.5801) is None
+    assert cache.get("ndvi", 44.2601, -72.5799) is None
+    assert cache.get("canopy", 44.26001, -72.58001) is None
+    assert cache.cell_center(44.26001, -72.58001) == (44.2605, -72.5805)
+
+    reopened = GEEResultCache(tmp_path / "gee.sqlite3", cell_deg=0.001)
+    try:
+        assert reopened.get("ndvi", 44.2604, -72.5804) == {"ndvi_value": 0.7}
+    finally:
+        reopened.close()
+    other_grid = GEEResultCache(tmp_path / "gee.sqlite3", cell_deg=0.002)
+    try:
+        assert other_grid.get("ndvi", 44.2604, -72.5804) is None
+    finally:
+        other_grid.close()
+
+
+def test_products_have_their_own_ttl(cache: GEEResultCache, monkeypatch: pytest.MonkeyPatch):
+    cache.set("ndvi", 44.0, -72.0, {"ndvi_value": 0.5})
+    cache.set("canopy", 44.0, -72.0, {"treecover2000": 70.0})
+    later = time.time() + 60 * 86400
+    monkeypatch.setattr(gee_cache_module.time, "time", lambda: later)
+    assert cache.get("ndvi", 44.0, -72.0) is None
+    assert cache.get("canopy", 44.0, -72.0) == {"treecover2000": 70.0}
+    assert cache.clear_expired() == 1
+    with pytest.raises(ValueError):
+        cache.get("soil", 44.0, -72.0)
+
+
+def test_prefetch_fills_box_and_skips_fresh_cells(cache: GEEResultCache):
+    provider = CountingProvider(fail_at=(44.0025, -72.0005))
+    progress: List[Tuple[int, int]] = []
+    summary = cache.prefetch_bbox(44.0, -72.003, 44.0029, -72.0, provider, batch_size=4,
+                                  progress_callback=lambda done, total: progress.append((done, total)))
+    assert summary["ndvi"] == {"cells": 12, "cached": 0, "fetched": 11, "failed": 1}
+    assert summary["canopy"]["fetched"] == 11
+    assert progress[-1] == (24, 24)
+
+    provider.calls.clear()
+    provider.fail_at = None
+    again = cache.prefetch_bbox(44.0, -72.003, 44.0029, -72.0, provider)
+    assert again["ndvi"] == {"cells": 12, "cached": 11, "fetched": 1, "failed": 0}
+    assert len(provider.calls) == 2
+    assert cache.stats()["products"]["canopy"]["entries"] == 12
+
+    with pytest.raises(ValueError):
+        cache.prefetch_bbox(43.0, -73.0, 45.0, -71.0, provider)
+
+
+def test_integration_serves_prefetched_cells_without_earth_engine(cache: GEEResultCache,
+                                                                  monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(integration_module, "get_gee_cache", lambda: cache)
+    cache.prefetch_bbox(44.26, -72.581, 44.261, -72.58, CountingProvider())
+    cache.set("osm_disturbance", 44.2605, -72.5805, {"high_disturbance": True, "osm_disturbance_success": True})
+
+    data = _integration().get_dynamic_gee_data(44.2603, -72.5803)
+    assert data["cached"] and data["query_success"]
+    assert data["ndvi_value"] == 0.65
+    assert data["canopy_coverage"] == pytest.approx(0.9 * 0.8)
+    assert data["data_source"] == "dynamic_gee_enhanced"
+
+    assert _integration().get_dynamic_gee_data(44.30, -72.58)["data_source"] == "fallback"
+
+
+def test_misses_are_fetched_at_cell_centre_and_cached(cache: GEEResultCache, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(integration_module, "get_gee_cache", lambda: cache)
+    provider = CountingProvider()
+    integration = _integration(provider)
+    monkeypatch.setattr(integration, "get_osm_disturbance_for_gee",
+                        lambda lat, lon: {"high_disturbance": False, "osm_disturbance_success": True})
+
+    first = integration.get_dynamic_gee_data(44.26001, -72.58001)
+    second = integration.get_dynamic_gee_data(44.26049, -72.58095)
+    assert (first["cached"], second["cached"]) == (False, True)
+    assert first["canopy_coverage"] == second["canopy_coverage"] == pytest.approx(0.9)
+    assert provider.calls == [("ndvi", 44.2605, -72.5805), ("canopy", 44.2605, -72.5805)]
+
+
+def test_failed_fetch_backs_off_without_caching(cache: GEEResultCache, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(integration_module, "get_gee_cache", lambda: cache)
+    monkeypatch.setattr(integration_module, "_gee_retry_at", 0.0)
+    monkeypatch.setattr(integration_module.time, "sleep", lambda s: None)
+    provider = CountingProvider(fail_at=(44.2605, -72.5805))
+    integration = _integration(provider)
+
+    assert integration.get_dynamic_gee_data(44.2603, -72.5803)["data_source"] == "fallback"
+    assert len(provider.calls) == 3
+    # Backing off: other cells fall back without querying the provider
+    assert integration.get_dynamic_gee_data(44.2703, -72.5803)["data_source"] == "fallback"
+    assert len(provider.calls) == 3
+    assert cache.get("ndvi", 44.2603, -72.5803) is None
+
+    monkeypatch.setattr(integration_module, "_gee_retry_at", 0.0)
+    monkeypatch.setattr(integration, "get_osm_disturbance_for_gee",
+                        lambda lat, lon: {"high_disturbance": False, "osm_disturbance_success": True})
+    assert integration.get_dynamic_gee_data(44.2703, -72.5803)["data_source"] == "dynamic_gee_enhanced"
+
+
+def test_fixture_provider_nearest_point_then_defaults():
+    provider = FixtureGEEProvider.from_file(FIXTURE)
+    assert provider.fetch("canopy", 43.311, -73.2155) == {"treecover2000": 95.0}
+    assert provider.fetch("canopy", 44.5, -72.5) == {"treecover2000": 82.0}
+    assert "osm_disturbance" in provider.products
+    with pytest.raises(KeyError):
+        FixtureGEEProvider({"defaults": {}}).fetch("ndvi", 44.0, -72.0)
+
+
+def test_enhanced_bedding_path_runs_on_fixture(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    monkeypatch.setenv("GEE_FIXTURE_PATH", str(FIXTURE))
+    monkeypatch.setenv("GEE_CACHE_DB", str(tmp_path / "unused.sqlite3"))
+    predictor = EnhancedBeddingZonePredictor()
+    assert isinstance(predictor.gee_provider, FixtureGEEProvider)
+    assert not predictor.gee_authenticated
+
+    result = predictor.run_enhanced_biological_analysis(
+        43.31, -73.215, time_of_day=6, season="fall", hunting_pressure="medium"
+    )
+    gee_data = result["gee_data"]
+    assert gee_data["data_source"].startswith("gee_fixture")
+    assert gee_data["ndvi_value"] == pytest.approx(0.38)
+    assert gee_data["osm_disturbance"]["total_disturbance_features"] == 1
+    assert isinstance(result["bedding_zones"], dict)
+    assert not (tmp_path / "unused.sqlite3").exists()
@@ -1,5 +1,6 @@
 """Tests for backend.utils.geo shared geographic utilities."""
 
+import numpy as np
 import pytest
 from backend.utils.geo import (
     angular_diff,
@@ -7,6 +8,7 @@ from backend.utils.geo import (
     bearing_to_cardinal,
     haversine,
     point_in_polygon,
+    points_in_polygon_mask,
 )
 
 
@@ -97,3 +99,38 @@ class TestPointInPolygon:
         polygon = [(0, 0), (10, 5), (0, 10)]
         assert point_in_polygon(3, 5, polygon) is True
         assert point_in_polygon(0, 15, polygon) is False
+
+
+class TestPointsInPolygonMask:
+    CONCAVE = [(44.0, -72.5), (44.01, -72.5), (44.01, -72.49), (44.005, -72.495), (44.0, -72.49)]
+
+    def test_matches_scalar_ray_casting_off_boundary(self):
+        rng = np.random.default_rng(3)
+        lats = rng.uniform(43.998, 44.012, 2000)
+        lons = rng.uniform(-72.502, -72.488, 2000)
+        mask = points_in_polygon_mask(lats, lons, self.CONCAVE)
+        expected = [point_in_polygon(a, b, self.CONCAVE) for a, b in zip(lats, lons)]
+        assert mask.tolist() == expected
+
+    def test_edges_and_vertices_count_as_inside(self):
+        lats = [44.0, 44.005, 44.0025, 44.01, 44.005, 44.011]
+        lons = [-72.5, -72.5, -72.4925, -72.495, -72.495, -72.495]
+        assert points_in_polygon_mask(lats, lons, self.CONCAVE).tolist() == [True, True, True, True, True, False]
+
+    def test_keeps_input_shape(self):
+        lat_grid, lon_grid = np.meshgrid(np.linspace(43.99, 44.02, 7), np.linspace(-72.51, -72.48, 5), indexing="ij")
+        assert points_in_polygon_mask(lat_grid, lon_grid, self.CONCAVE).shape == (7, 5)
+
+    def test_degenerate_polygon_excludes_nothing(self):
+        assert points_in_polygon_mask([1.0, 50.0], [2.0, 60.0], [(0.0, 0.0), (1.0, 1.0)]).all()
+
+    def test_matches_shapely_contains_or_touches(self):
+        shapely_geometry = pytest.importorskip("shapely.geometry")
+        polygon = shapely_geometry.Polygon([(lon, lat) for lat, lon in self.CONCAVE])
+        lat_grid, lon_grid = np.meshgrid(np.linspace(44.0, 44.01, 43), np.linspace(-72.5, -72.49, 43), indexing="ij")
+        mask = points_in_polygon_mask(lat_grid, lon_grid, self.CONCAVE)
+        expected = [
+            polygon.covers(shapely_geometry.Point(lon, lat))
+            for lat, lon in zip(lat_grid.ravel().tolist(), lon_grid.ravel().tolist())
+        ]
+        assert mask.ravel().tolist() == expected
@@ -16,11 +16,16 @@ from backend.services.hotspot.polygon import (
     generate_grid_points_in_polygon,
 )
 from backend.services.hotspot.clustering import (
+    StandContextStore,
+    StandRecord,
     extract_stand_points,
+    extract_stand_records,
     stand_summary_for_report,
     best_site_score_0_200,
     cluster_stands,
 )
+from backend.services.hotspot import clustering as clustering_module
+from backend.utils.geo import haversine
 
 
 # ---------------------------------------------------------------------------
@@ -197,6 +202,49 @@ class TestExtractStandPoints:
         assert stands[0]["wind_thermal"]["wind_direction"] == 270
 
 
+class TestExtractStandRecords:
+    PRED = {
+        "wind_thermal_analysis": {"wind_direction": 270, "wind_speed": 8.0},
+        "context_summary": {"situation": "rut"},
+        "optimized_points": {"stand_sites": [{"lat": 44.0, "lon": -72.5, "score": 6.0, "strategy": "bench"}]},
+        "mature_buck_analysis": {
+            "stand_recommendations": [{"lat": 44.001, "lon": -72.501, "score": 7.0, "type": "ambush", "reason": "saddle"}]
+        },
+    }
+
+    def test_fields_match_extract_stand_points(self):
+        contexts = StandContextStore()
+        records = extract_stand_records(self.PRED, contexts)
+        dicts = extract_stand_points(self.PRED)
+        assert len(records) == len(dicts) == 2
+        for record, stand in zip(records, dicts):
+            for key in ("lat", "lon", "score", "strategy", "source", "description", "confidence"):
+                assert record[key] == stand[key]
+            assert contexts.get(record.context_id)["wind_thermal"] == stand["wind_thermal"]
+
+    def test_records_are_slotted_and_share_one_context(self):
+        contexts = StandContextStore()
+        first = extract_stand_records(self.PRED, contexts)
+        second = extract_stand_records(dict(self.PRED), contexts)
+        assert not hasattr(first[0], "__dict__")
+        assert len(contexts) == 1
+        assert {r.context_id for r in first + second} == {0}
+
+    def test_prediction_without_context_has_no_context_id(self):
+        contexts = StandContextStore()
+        records = extract_stand_records({"optimized_points": {"stand_sites": [{"lat": 44.0, "lon": -72.5}]}}, contexts)
+        assert records[0].context_id is None
+        assert len(contexts) == 0
+        assert contexts.get(None) == {"wind_thermal": None, "wind_overall": None, "context_summary": None}
+
+    def test_record_mapping_access(self):
+        record = StandRecord(lat=44.0, lon=-72.5, score=5.0, strategy="a", source="s")
+        assert record["lat"] == 44.0
+        assert record.get("missing", "x") == "x"
+        with pytest.raises(KeyError):
+            record["missing"]
+
+
 class TestStandSummaryForReport:
     def test_basic(self):
         stand = {"lat": 44.0, "lon": -72.5, "score": 7.5, "strategy": "bench"}
@@ -205,6 +253,12 @@ class TestStandSummaryForReport:
         assert summary["score"] == 7.5
         assert "raw" not in summary
 
+    def test_record_references_context_by_id(self):
+        record = StandRecord(lat=44.0, lon=-72.5, score=7.5, strategy="bench", source="s", context_id=3)
+        summary = stand_summary_for_report(record)
+        assert summary["context_id"] == 3
+        assert "wind_thermal" not in summary
+
     def test_missing_optional_fields(self):
         summary = stand_summary_for_report({"lat": 44.0, "lon": -72.5})
         assert summary["score"] == 0.0
@@ -252,3 +306,46 @@ class TestClusterStands:
         ]
         clusters = cluster_stands(points, epsilon_m=50, min_samples=2)
         assert len(clusters) == 0
+
+    def test_points_without_coordinates_are_ignored(self):
+        points = [
+            {"lat": 44.0000, "lon": -72.5000, "score": 5.0},
+            {"lat": None, "lon": None, "score": 0.0, "strategy": "prediction_error"},
+            {"lat": 44.0001, "lon": -72.5001, "score": 6.0},
+        ]
+        clusters = cluster_stands(points, epsilon_m=100, min_samples=2)
+        assert len(clusters) == 1
+        assert clusters[0]["size"] == 2
+
+    @pytest.mark.parametrize("chunk_cells", [4_000_000, 7])
+    def test_aggregates_match_scalar_reference(self, monkeypatch, chunk_cells):
+        import random
+
+        monkeypatch.setattr(clustering_module, "_MEDOID_CHUNK_CELLS", chunk_cells)
+        rng = random.Random(11)
+        points = []
+        for base_lat, base_lon in [(44.0, -72.5), (44.01, -72.49), (44.02, -72.52)]:
+            for _ in range(rng.randint(5, 40)):
+                points.append(
+                    {
+                        "lat": base_lat + rng.uniform(-0.0004, 0.0004),
+                        "lon": base_lon + rng.uniform(-0.0004, 0.0004),
+                        "score": round(rng.uniform(0.0, 10.0), 1),
+                        "strategy": rng.choice(["a", "b"]),
+                    }
+                )
+
+        clusters = cluster_stands(points, epsilon_m=80, min_samples=3)
+
+        assert clusters
+        for cluster in clusters:
+            members = [p for p in points if (p["lat"], p["lon"]) in {(q["lat"], q["lon"]) for q in cluster["points"]}]
+            assert len(members) == cluster["size"]
+            assert cluster["centroid"]["lat"] == pytest.approx(sum(p["lat"] for p in members) / len(members))
+            assert cluster["avg_score"] == pytest.approx(sum(p["score"] for p in members) / len(members))
+            assert cluster["best_score"] == max(p["score"] for p in members)
+            sums = [sum(haversine(p["lat"], p["lon"], q["lat"], q["lon"]) for q in members) for p in members]
+            medoid = members[sums.index(min(sums))]
+            assert cluster["medoid"] == {"lat": medoid["lat"], "lon": medoid["lon"]}
+        sizes = [c["size"] for c in clusters]
+        assert sizes == sorted(sizes, reverse=True)
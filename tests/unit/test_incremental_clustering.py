@@ -0,0 +1,220 @@
+"""Tests for incremental stand clustering and provisional hotspot snapshots."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+from backend.services.hotspot import job_service as job_service_module
+from backend.services.hotspot.clustering import cluster_stands, clusters_from_labels
+from backend.services.hotspot.incremental_clustering import IncrementalStandClusterer, TopClusterTracker
+from backend.services.hotspot.job_service import HotspotJobService
+from backend.services.hotspot.property_context import PropertyContext
+from backend.services.job_registry import get_job_registry
+
+CORNERS = [(44.000, -72.500), (44.000, -72.490), (44.008, -72.490), (44.008, -72.500)]
+
+
+def _random_points(seed: int, n: int) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    centres = [(44.001, -72.499), (44.004, -72.495), (44.007, -72.491)]
+    points = []
+    for _ in range(n):
+        if rng.random() < 0.8:
+            lat, lon = rng.choice(centres)
+            lat += rng.uniform(-0.0006, 0.0006)
+            lon += rng.uniform(-0.0008, 0.0008)
+        else:
+            lat, lon = rng.uniform(44.0, 44.008), rng.uniform(-72.5, -72.49)
+        points.append({"lat": lat, "lon": lon, "score": round(rng.uniform(0, 10), 2), "strategy": "s"})
+    return points
+
+
+def _core_partition(clusters: List[Dict[str, Any]]) -> set:
+    return {frozenset((p["lat"], p["lon"]) for p in c["points"]) for c in clusters}
+
+
+class TestIncrementalStandClusterer:
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_matches_batch_dbscan_after_all_inserts(self, seed: int):
+        points = _random_points(seed, 120)
+        clusterer = IncrementalStandClusterer(epsilon_m=60.0, min_samples=3)
+        for p in points:
+            clusterer.add(p)
+
+        batch = cluster_stands(points, 60.0, 3)
+        incremental = clusterer.clusters()
+
+        assert [c["size"] for c in incremental] == [c["size"] for c in batch]
+        assert _core_partition(incremental) == _core_partition(batch)
+
+    def test_insert_order_does_not_change_cluster_sizes(self):
+        points = _random_points(5, 80)
+        forward = IncrementalStandClusterer(60.0, 3)
+        backward = IncrementalStandClusterer(60.0, 3)
+        forward.extend(points)
+        backward.extend(list(reversed(points)))
+        assert sorted(c["size"] for c in forward.clusters()) == sorted(c["size"] for c in backward.clusters())
+
+    def test_points_without_coordinates_are_skipped(self):
+        clusterer = IncrementalStandClusterer(50.0, 2)
+        assert clusterer.extend([{"lat": None, "lon": None}, {"lat": 44.0, "lon": -72.5, "score": 1.0}]) == 1
+        assert len(clusterer) == 1
+        assert clusterer.labels() == [-1]
+        assert clusterer.clusters() == []
+
+    def test_noise_point_joins_cluster_when_neighbours_arrive(self):
+        clusterer = IncrementalStandClusterer(50.0, 3)
+        clusterer.add({"lat": 44.0, "lon": -72.5, "score": 1.0})
+        clusterer.add({"lat": 44.0001, "lon": -72.5, "score": 2.0})
+        assert clusterer.labels() == [-1, -1]
+        clusterer.add({"lat": 44.0002, "lon": -72.5, "score": 3.0})
+        assert clusterer.labels() == [0, 0, 0]
+        assert clusterer.clusters()[0]["avg_score"] == pytest.approx(2.0)
+
+    def test_only_changed_clusters_are_summarised_again(self, monkeypatch: pytest.MonkeyPatch):
+        from backend.services.hotspot import incremental_clustering as incremental_module
+
+        points = _random_points(4, 150)
+        clusterer = IncrementalStandClusterer(60.0, 3)
+        summarised: List[int] = []
+
+        def _counting(cluster_points, labels):
+            summarised.append(len(cluster_points))
+            return clusters_from_labels(cluster_points, labels)
+
+        monkeypatch.setattr(incremental_module, "clusters_from_labels", _counting)
+        for p in points:
+            clusterer.add(p)
+            assert clusterer.clusters() == clusters_from_labels(clusterer.points, clusterer.labels())
+        # A point lands in one neighbourhood, so most updates touch one cluster.
+        assert len(summarised) < 2 * len(points)
+
+        before = {c["medoid"]["lat"]: c for c in clusterer.clusters()}
+        summarised.clear()
+        clusterer.add({"lat": 44.0075, "lon": -72.4995, "score": 1.0})
+        assert summarised == []
+        for cluster in clusterer.clusters():
+            assert cluster["points"] is before[cluster["medoid"]["lat"]]["points"]
+
+
+class TestTopClusterTracker:
+    def test_counts_consecutive_stable_medoids(self):
+        tracker = TopClusterTracker(tolerance_m=20.0)
+        here = [{"medoid": {"lat": 44.0, "lon": -72.5}}]
+        nearby = [{"medoid": {"lat": 44.0001, "lon": -72.5}}]
+        far = [{"medoid": {"lat": 44.01, "lon": -72.5}}]
+        assert tracker.update([]) == 0
+        assert tracker.update(here) == 0
+        assert tracker.update(nearby) == 1
+        assert tracker.update(here) == 2
+        assert tracker.update(far) == 0
+
+
+class _FakePredictionService:
+    """Returns the same stand site for every query so one cluster dominates."""
+
+    def __init__(self) -> None:
+        self.predictor = object()
+        self.calls = 0
+
+    async def predict(self, **kwargs: Any) -> Dict[str, Any]:
+        self.calls += 1
+        offset = (self.calls % 3) * 0.00005
+        if self.calls == 2:
+            raise RuntimeError("prediction blew up")
+        return {
+            "wind_thermal_analysis": {"wind_direction": 270, "wind_speed": 6.0},
+            "optimized_points": {
+                "stand_sites": [{"lat": 44.004 + offset, "lon": -72.495, "score": 7.0, "strategy": "ridge"}]
+            },
+        }
+
+
+def _run(service: HotspotJobService, job_id: str, num_points: int) -> None:
+    asyncio.run(
+        service.run_job(
+            job_id,
+            corners=CORNERS,
+            mode="sample_predict",
+            num_sample_points=num_points,
+            lidar_grid_points=0,
+            lidar_top_k=0,
+            lidar_sample_radius_m=30,
+            epsilon_meters=50.0,
+            min_samples=2,
+            date_time="2026-11-10T06:30:00",
+            season="fall",
+            hunting_pressure="medium",
+        )
+    )
+
+
+@pytest.fixture()
+def fake_service(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> _FakePredictionService:
+    monkeypatch.setenv("HOTSPOT_JOBS_DIR", str(tmp_path))
+    monkeypatch.setenv("HOTSPOT_PREDICTION_CONCURRENCY", "1")
+    service = _FakePredictionService()
+    monkeypatch.setattr("backend.services.prediction_service.get_prediction_service", lambda: service)
+    monkeypatch.setattr(
+        job_service_module,
+        "build_property_context",
+        lambda corners, **kwargs: PropertyContext(bbox=(0, 0, 0, 0), center=(0, 0), season="fall"),
+    )
+    return service
+
+
+class TestProvisionalSnapshots:
+    def test_provisional_best_site_published_per_prediction(self, tmp_path: Path, fake_service, monkeypatch):
+        service = HotspotJobService()
+        job = service.create_job(total=0, message="queued")
+        snapshots: List[Dict[str, Any]] = []
+        real_update = service.update_job
+
+        def _spy(job_id: str, **kwargs: Any) -> None:
+            if "provisional" in kwargs:
+                snapshots.append(kwargs["provisional"])
+            real_update(job_id, **kwargs)
+
+        monkeypatch.setattr(service, "update_job", _spy)
+        _run(service, job.job_id, 6)
+
+        assert [s["completed"] for s in snapshots] == [1, 2, 3, 4, 5, 6]
+        assert snapshots[0]["best_stand_site"]["sources"] != ["cluster_medoid"]
+        assert snapshots[-1]["best_stand_site"]["sources"] == ["cluster_medoid"]
+        assert snapshots[-1]["top_clusters"][0]["size"] == 5
+        assert "points" not in snapshots[-1]["top_clusters"][0]
+        assert snapshots[-1]["best_stand_site"]["wind_thermal"] == {"wind_direction": 270, "wind_speed": 6.0}
+
+        state = get_job_registry().get(job.job_id, kind="hotspot")
+        assert state["provisional"]["completed"] == 6
+        report = json.loads((tmp_path / job.job_id / "hotspot_report.json").read_text(encoding="utf-8"))
+        assert report["early_stop"] is None
+        assert fake_service.calls == 6
+        assert report["stand_points_count"] == 5
+        assert report["prediction_errors"] == [{"error": "prediction blew up"}]
+        # Five predictions share one interned context blob, referenced by id.
+        assert report["stand_contexts"] == {"0": {"wind_thermal": {"wind_direction": 270, "wind_speed": 6.0},
+                                                  "wind_overall": None, "context_summary": None}}
+        assert report["clusters"][0]["medoid_point"]["context_id"] == 0
+        assert "wind_thermal" not in report["clusters"][0]["medoid_point"]
+        assert report["best_stand_site"]["wind_thermal"]["wind_direction"] == 270
+
+    def test_early_stop_once_top_cluster_is_stable(self, tmp_path: Path, fake_service, monkeypatch):
+        monkeypatch.setenv("HOTSPOT_EARLY_STOP_STABLE_UPDATES", "2")
+        monkeypatch.setenv("HOTSPOT_EARLY_STOP_MIN_FRACTION", "0.3")
+        service = HotspotJobService()
+        job = service.create_job(total=0, message="queued")
+
+        _run(service, job.job_id, 10)
+
+        report = json.loads((tmp_path / job.job_id / "hotspot_report.json").read_text(encoding="utf-8"))
+        assert report["early_stop"] == {"completed": 5, "total": 10, "stable_updates": 2}
+        assert report["clusters"][0]["size"] == 4
+        assert report["best_stand_site"]["sources"] == ["cluster_medoid"]
+        assert service.get_job(job.job_id).status == "completed"
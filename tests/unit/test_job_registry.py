@@ -0,0 +1,185 @@
+"""Tests for the SQLite job registry and the status boards backed by it."""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import time
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.services.job_registry import JobRegistry, get_job_registry, reset_job_registries
+from backend.services.job_status_store import JobStatusStore
+
+
+@pytest.fixture()
+def registry(tmp_path: Path) -> JobRegistry:
+    reg = JobRegistry(tmp_path / "jobs.sqlite3")
+    yield reg
+    reg.close()
+
+
+class TestJobRegistry:
+    def test_upsert_and_get_round_trip(self, registry: JobRegistry):
+        registry.upsert("max_accuracy", "a", {"job_id": "a", "state": "running", "payload": {"row": 3}})
+        assert registry.get("a") == {"job_id": "a", "state": "running", "payload": {"row": 3}}
+        assert registry.get("a", kind="hotspot") is None
+        assert registry.get("missing") is None
+
+    def test_upsert_keeps_created_at_and_updates_state(self, registry: JobRegistry):
+        registry.upsert_many("hotspot", [("h", {"status": "queued"}, 100.0)])
+        registry.upsert_many("hotspot", [("h", {"status": "completed"}, 200.0)])
+        [row] = registry.list_recent()
+        assert row == {"job_id": "h", "kind": "hotspot", "state": "completed", "created_at": 100.0, "updated_at": 200.0}
+
+    def test_list_recent_filters_and_orders_newest_first(self, registry: JobRegistry):
+        registry.upsert_many("max_accuracy", [("m1", {"state": "completed"}, 1.0), ("m2", {"state": "running"}, 3.0)])
+        registry.upsert_many("hotspot", [("h1", {"status": "completed"}, 2.0)])
+        assert [r["job_id"] for r in registry.list_recent()] == ["m2", "h1", "m1"]
+        assert [r["job_id"] for r in registry.list_recent(kind="max_accuracy")] == ["m2", "m1"]
+        assert [r["job_id"] for r in registry.list_recent(states=["completed"])] == ["h1", "m1"]
+        assert [r["job_id"] for r in registry.list_recent(limit=1)] == ["m2"]
+
+    def test_delete_older_than_returns_removed_jobs(self, registry: JobRegistry):
+        now = time.time()
+        registry.upsert_many("max_accuracy", [("old", {"state": "completed"}, now - 10 * 86400), ("new", {"state": "running"})])
+        registry.upsert_many("hotspot", [("old-h", {"status": "completed"}, now - 9 * 86400)])
+        assert sorted(registry.delete_older_than(7 * 86400)) == [("old", "max_accuracy"), ("old-h", "hotspot")]
+        assert [r["job_id"] for r in registry.list_recent()] == ["new"]
+
+    def test_legacy_import_runs_once(self, registry: JobRegistry, tmp_path: Path):
+        jobs_dir = tmp_path / "max_accuracy_jobs"
+        (jobs_dir / "a").mkdir(parents=True)
+        (jobs_dir / "a" / "status.json").write_text(json.dumps({"job_id": "a", "state": "completed"}))
+        (jobs_dir / "b").mkdir()
+        os.utime(jobs_dir / "a", (1000.0, 1000.0))
+
+        assert registry.import_legacy_jobs("max_accuracy", jobs_dir, "status.json") == 2
+        assert registry.get("a")["state"] == "completed"
+        assert registry.get("b")["state"] == "unknown"
+        assert {r["job_id"]: r["updated_at"] for r in registry.list_recent()}["a"] == 1000.0
+
+        (jobs_dir / "c").mkdir()
+        assert registry.import_legacy_jobs("max_accuracy", jobs_dir, "status.json") == 0
+        assert registry.get("c") is None
+
+    def test_get_job_registry_follows_env(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setenv("JOB_REGISTRY_DB", str(tmp_path / "one.sqlite3"))
+        first = get_job_registry()
+        assert get_job_registry() is first
+        monkeypatch.setenv("JOB_REGISTRY_DB", str(tmp_path / "two.sqlite3"))
+        assert get_job_registry() is not first
+        assert first.path == tmp_path / "one.sqlite3"
+
+    def test_reset_closes_cached_registries(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setenv("JOB_REGISTRY_DB", str(tmp_path / "one.sqlite3"))
+        first = get_job_registry()
+        reset_job_registries()
+        with pytest.raises(sqlite3.ProgrammingError):
+            first.get("a")
+        assert get_job_registry() is not first
+
+
+class TestRegistryBackedStatusStore:
+    def test_throttled_progress_and_batched_flush(self, registry: JobRegistry):
+        store = JobStatusStore(registry_for=lambda: registry, kind="max_accuracy", flush_interval_s=60.0)
+        store.put("a", {"state": "queued"})
+        store.put("b", {"state": "queued"})
+        for i in range(50):
+            store.put("a", {"state": "running", "payload": {"row": i}})
+            store.put("b", {"state": "running", "payload": {"row": i}})
+        assert registry.get("a")["state"] == "queued"
+        assert store.get("a")["payload"]["row"] == 49
+
+        # A terminal write flushes every dirty job in the same transaction.
+        store.put("a", {"state": "completed"})
+        assert registry.get("a")["state"] == "completed"
+        assert registry.get("b")["payload"]["row"] == 49
+
+    def test_falls_back_to_legacy_status_file(self, registry: JobRegistry, tmp_path: Path):
+        (tmp_path / "old").mkdir()
+        (tmp_path / "old" / "status.json").write_text(json.dumps({"state": "completed"}))
+        store = JobStatusStore(
+            lambda job_id: tmp_path / job_id / "status.json",
+            registry_for=lambda: registry,
+            kind="max_accuracy",
+        )
+        assert store.get("old") == {"state": "completed"}
+        assert store.get("missing") is None
+        store.put("new", {"state": "queued"})
+        assert not (tmp_path / "new").exists()
+
+    def test_requires_a_backend(self):
+        with pytest.raises(ValueError):
+            JobStatusStore()
+
+
+class TestHotspotJobsInRegistry:
+    def test_recovers_job_from_registry_in_fresh_service(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        from backend.services.hotspot.job_service import HotspotJobService
+
+        monkeypatch.setenv("HOTSPOT_JOBS_DIR", str(tmp_path / "hotspot_jobs"))
+        owner = HotspotJobService()
+        running = owner.create_job(total=4, message="queued")
+        owner.update_job(running.job_id, status="running", completed=2)
+        done = owner.create_job(total=1, message="queued")
+        owner.update_job(done.job_id, status="completed", report_path="/tmp/report.json")
+
+        fresh = HotspotJobService()
+        assert fresh.get_job(done.job_id).status == "completed"
+        # The owner's throttled progress write never landed; a job with no
+        # report is reported as interrupted after a restart.
+        recovered = fresh.get_job(running.job_id)
+        assert recovered.status == "interrupted"
+        assert recovered.total == 4
+        assert not (tmp_path / "hotspot_jobs").exists()
+
+
+class TestCleanupAndListing:
+    def test_cleanup_deletes_expired_jobs_and_their_directories(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        from backend.routers import max_accuracy_router as router_mod
+        from backend.services.hotspot import job_service as hotspot_module
+
+        ma_dir = tmp_path / "max_accuracy_jobs"
+        hs_dir = tmp_path / "hotspot_jobs"
+        monkeypatch.setattr(router_mod, "_resolve_jobs_dir", lambda: ma_dir)
+        monkeypatch.setenv("HOTSPOT_JOBS_DIR", str(hs_dir))
+        hotspot_service = hotspot_module.HotspotJobService()
+        monkeypatch.setattr(hotspot_module, "_hotspot_job_service", hotspot_service)
+        hotspot_job = hotspot_service.create_job(total=1, message="queued")
+        hotspot_service.update_job(hotspot_job.job_id, status="completed", report_path=str(hs_dir / "x.json"))
+        for d in (ma_dir / ("a" * 32), ma_dir / ("b" * 32), hs_dir / hotspot_job.job_id):
+            d.mkdir(parents=True)
+        registry = get_job_registry()
+        old = time.time() - 30 * 86400
+        registry.upsert_many("max_accuracy", [("a" * 32, {"state": "completed"}, old), ("b" * 32, {"state": "completed"})])
+        registry.upsert_many("hotspot", [(hotspot_job.job_id, {"status": "completed"}, old)])
+
+        router_mod._cleanup_old_jobs()
+
+        assert not (ma_dir / ("a" * 32)).exists()
+        assert not (hs_dir / hotspot_job.job_id).exists()
+        assert (ma_dir / ("b" * 32)).exists()
+        assert [r["job_id"] for r in registry.list_recent()] == ["b" * 32]
+        assert hotspot_service.get_job(hotspot_job.job_id) is None
+
+    def test_list_jobs_endpoint(self):
+        from backend.routers.jobs_router import jobs_router
+
+        registry = get_job_registry()
+        registry.upsert_many("max_accuracy", [("a" * 32, {"state": "running"}, 2.0)])
+        registry.upsert_many("hotspot", [("h1", {"status": "completed"}, 1.0)])
+        app = FastAPI()
+        app.include_router(jobs_router)
+        client = TestClient(app)
+
+        data = client.get("/jobs").json()
+        assert data["count"] == 2
+        assert [j["job_id"] for j in data["jobs"]] == ["a" * 32, "h1"]
+        assert [j["job_id"] for j in client.get("/jobs", params={"kind": "hotspot"}).json()["jobs"]] == ["h1"]
+        assert client.get("/jobs", params={"state": ["running"]}).json()["count"] == 1
+        assert client.get("/jobs", params={"kind": "other"}).status_code == 422
@@ -0,0 +1,69 @@
+"""Tests for backend.services.job_status_store.JobStatusStore."""
+
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+
+from backend.services.job_status_store import JobStatusStore
+
+
+def _store(tmp_path: Path, interval: float = 60.0) -> JobStatusStore:
+    return JobStatusStore(lambda job_id: tmp_path / job_id / "status.json", flush_interval_s=interval)
+
+
+def _on_disk(tmp_path: Path, job_id: str) -> dict:
+    return json.loads((tmp_path / job_id / "status.json").read_text(encoding="utf-8"))
+
+
+class TestJobStatusStore:
+    def test_first_write_is_persisted(self, tmp_path):
+        store = _store(tmp_path)
+        store.put("a", {"job_id": "a", "state": "queued"})
+        assert _on_disk(tmp_path, "a")["state"] == "queued"
+
+    def test_progress_updates_are_throttled_but_served_from_memory(self, tmp_path):
+        store = _store(tmp_path)
+        store.put("a", {"state": "queued"})
+        for i in range(200):
+            store.put("a", {"state": "running", "stage": "terrain_tile", "payload": {"tile": i}})
+        assert _on_disk(tmp_path, "a")["state"] == "queued"
+        assert store.get("a")["payload"]["tile"] == 199
+
+    def test_terminal_state_flushes_immediately(self, tmp_path):
+        store = _store(tmp_path)
+        store.put("a", {"state": "queued"})
+        store.put("a", {"state": "running"})
+        store.put("a", {"state": "completed", "stage": "complete"})
+        assert _on_disk(tmp_path, "a")["state"] == "completed"
+
+    def test_deferred_flush_reaches_disk(self, tmp_path):
+        store = _store(tmp_path, interval=0.05)
+        store.put("a", {"state": "queued"})
+        store.put("a", {"state": "running", "stage": "grid_progress"})
+        deadline = time.monotonic() + 2.0
+        while time.monotonic() < deadline and _on_disk(tmp_path, "a")["state"] != "running":
+            time.sleep(0.01)
+        assert _on_disk(tmp_path, "a")["stage"] == "grid_progress"
+
+    def test_recovers_from_disk_in_fresh_store(self, tmp_path):
+        _store(tmp_path).put("a", {"state": "completed", "stage": "complete"})
+        fresh = _store(tmp_path)
+        assert fresh.get("a")["state"] == "completed"
+        assert fresh.get("missing") is None
+
+    def test_live_status_from_other_process_is_not_cached(self, tmp_path):
+        _store(tmp_path).put("a", {"state": "running", "stage": "one"})
+        reader = _store(tmp_path)
+        assert reader.get("a")["stage"] == "one"
+        # Owner process writes a newer status to disk
+        (tmp_path / "a" / "status.json").write_text(json.dumps({"state": "running", "stage": "two"}))
+        assert reader.get("a")["stage"] == "two"
+
+    def test_forget_drops_memory(self, tmp_path):
+        store = _store(tmp_path)
+        store.put("a", {"state": "running"})
+        store.forget("a")
+        (tmp_path / "a" / "status.json").unlink()
+        assert store.get("a") is None
@@ -0,0 +1,115 @@
+"""Tests for the /jobs/{job_id}/events progress stream."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.routers.jobs_router import jobs_router
+from backend.routers.max_accuracy_router import max_accuracy_router
+from backend.services.job_status_store import JobUpdateNotifier
+
+
+@pytest.fixture()
+def client(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> TestClient:
+    jobs_dir = tmp_path / "max_accuracy_jobs"
+    jobs_dir.mkdir()
+    monkeypatch.setattr("backend.routers.max_accuracy_router._resolve_jobs_dir", lambda: jobs_dir)
+    monkeypatch.setenv("HOTSPOT_JOBS_DIR", str(tmp_path / "hotspot_jobs"))
+    monkeypatch.setattr("backend.routers.max_accuracy_router._INFLIGHT_BY_FINGERPRINT", {})
+    monkeypatch.setattr("backend.routers.max_accuracy_router._RECENT_RESULTS", OrderedDict())
+    app = FastAPI()
+    app.include_router(max_accuracy_router)
+    app.include_router(jobs_router)
+    return TestClient(app)
+
+
+def _read_events(client: TestClient, job_id: str) -> List[Dict[str, Any]]:
+    events: List[Dict[str, Any]] = []
+    with client.stream("GET", f"/jobs/{job_id}/events") as resp:
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/event-stream")
+        for line in resp.iter_lines():
+            if line.startswith("data:"):
+                events.append(json.loads(line[5:]))
+    return events
+
+
+def _payload() -> Dict[str, Any]:
+    return {
+        "corners": [
+            {"lat": 44.1, "lon": -72.6},
+            {"lat": 44.1, "lon": -72.5},
+            {"lat": 44.0, "lon": -72.5},
+        ],
+        "date_time": "2025-10-15T10:30:00Z",
+    }
+
+
+class TestJobEventsStream:
+    def test_max_accuracy_progress_is_pushed_until_completion(self, client: TestClient):
+        release = threading.Event()
+
+        def _run(corners, progress_callback=None, **kwargs):
+            release.wait(5)
+            progress_callback("grid_generated", {"points": 100})
+            progress_callback("terrain_scored", {"candidates": 10})
+            progress_callback("complete", {"stands": 1})
+            return {"stands": [{"lat": 44.05, "lon": -72.55, "score": 80.0}]}
+
+        with patch("backend.routers.max_accuracy_router.MaxAccuracyPipeline") as MockPipeline:
+            MockPipeline.return_value.run.side_effect = _run
+            job_id = client.post("/property-hotspots/max-accuracy/run", json=_payload()).json()["job_id"]
+            threading.Timer(0.2, release.set).start()
+            events = _read_events(client, job_id)
+
+        assert events[0]["state"] == "queued"
+        assert events[-1]["state"] == "completed"
+        assert events[-1]["payload"]["report_path"].endswith("max_accuracy_report.json")
+        # The pipeline's own 'complete' must not end the stream before the report exists
+        assert all(ev["state"] != "completed" for ev in events[:-1])
+        assert Path(events[-1]["payload"]["report_path"]).exists()
+
+    def test_unknown_job_returns_404(self, client: TestClient):
+        assert client.get("/jobs/" + "b" * 32 + "/events").status_code == 404
+        assert client.get("/jobs/not-a-job/events").status_code == 404
+
+    def test_hotspot_job_stream(self, client: TestClient):
+        from backend.services.hotspot import HotspotJobService
+
+        service = HotspotJobService()
+        job = service.create_job(total=3, message="Queued")
+        service.update_job(job.job_id, status="completed", completed=3, message="Completed")
+        with patch("backend.routers.jobs_router.get_hotspot_job_service", return_value=service):
+            events = _read_events(client, job.job_id)
+
+        assert len(events) == 1
+        assert events[0]["kind"] == "hotspot"
+        assert events[0]["state"] == "completed"
+        assert events[0]["payload"]["completed"] == 3
+
+
+class TestJobUpdateNotifier:
+    def test_notify_from_worker_thread_wakes_subscriber(self):
+        notifier = JobUpdateNotifier()
+
+        async def _wait() -> bool:
+            event = notifier.subscribe("job")
+            threading.Timer(0.05, notifier.notify, args=("job",)).start()
+            try:
+                await asyncio.wait_for(event.wait(), timeout=2)
+                return True
+            finally:
+                notifier.unsubscribe("job", event)
+
+        assert asyncio.run(_wait()) is True
+        assert notifier._subscribers == {}
@@ -0,0 +1,177 @@
+"""Parity tests for the vectorised hotspot LiDAR shortlist scoring.
+
+The reference below is the original per-point implementation (window slices
+plus np.nan* reductions). The vectorised version must rank and score every
+grid point the same way.
+"""
+
+from __future__ import annotations
+
+import math
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pytest
+
+rasterio = pytest.importorskip("rasterio")
+from rasterio.transform import from_origin  # noqa: E402
+from rasterio.warp import transform  # noqa: E402
+
+from backend.services import lidar_processor  # noqa: E402
+from backend.services.hotspot.lidar_scoring import lidar_shortlist_points, nan_box_stats  # noqa: E402
+from backend.services.hotspot.polygon import generate_grid_points_in_polygon  # noqa: E402
+from backend.utils.terrain_scoring import ridge_proximity_preference, slope_preference  # noqa: E402
+
+CORNERS = [(44.000, -72.500), (44.000, -72.494), (44.005, -72.494), (44.005, -72.500)]
+NODATA = -9999.0
+
+
+@pytest.fixture()
+def dem_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    xs, ys = transform("EPSG:4326", "EPSG:32618", [-72.497], [44.0025])
+    size = 700
+    rows, cols = np.mgrid[0:size, 0:size]
+    elevation = (
+        420.0
+        + rows * 0.08
+        + np.sin(cols / 19.0) * 6.0
+        + np.cos((rows + cols) / 33.0) * 3.0
+    ).astype("float32")
+    elevation[300:320, 340:365] = NODATA  # hole in the DEM
+    with rasterio.open(
+        tmp_path / "tile_DEMHF.tif", "w", driver="GTiff", height=size, width=size, count=1,
+        dtype="float32", crs="EPSG:32618", nodata=NODATA,
+        transform=from_origin(xs[0] - size, ys[0] + size, 2.0, 2.0),
+    ) as dst:
+        dst.write(elevation, 1)
+
+    real_manager = lidar_processor.DEMFileManager
+    monkeypatch.setattr(lidar_processor, "DEMFileManager", lambda: real_manager(data_dir=str(tmp_path)))
+    return tmp_path
+
+
+def _reference_scores(dem_path: Path, points: List[Tuple[float, float]], sample_radius_m: int) -> List[Dict[str, float]]:
+    """Original scalar implementation (without the candidate pool cap).
+
+    Box reductions run in float64; the old float32 nan-reductions drifted by
+    up to ~1e-3 score points, which is what the vectorised version fixes.
+    """
+    from rasterio.windows import from_bounds
+
+    lats = [c[0] for c in CORNERS]
+    lons = [c[1] for c in CORNERS]
+    with rasterio.open(dem_path) as src:
+        xs, ys = transform("EPSG:4326", src.crs, [min(lons), max(lons)], [min(lats), max(lats)])
+        pad = float(sample_radius_m) * 2.0
+        window = from_bounds(min(xs) - pad, min(ys) - pad, max(xs) + pad, max(ys) + pad, transform=src.transform)
+        elev = src.read(1, window=window, masked=True).astype("float32").filled(np.nan)
+        xres, yres = float(abs(src.res[0])), float(abs(src.res[1]))
+        gy, gx = np.gradient(elev, yres, xres)
+        slope_deg = np.degrees(np.arctan(np.sqrt(gx * gx + gy * gy)))
+        dgy_dy, _ = np.gradient(gy, yres, xres)
+        _, dgx_dx = np.gradient(gx, yres, xres)
+        curvature = dgy_dy + dgx_dx
+        elev_min = float(np.nanmin(elev))
+        elev_range = max(1e-6, float(np.nanmax(elev)) - elev_min)
+        w_transform = src.window_transform(window)
+        crs = src.crs
+
+    cell_m = max(xres, yres)
+    lr = max(1, min(6, int((float(sample_radius_m) / cell_m) * 0.15)))
+    gr = max(lr + 2, min(18, int((float(sample_radius_m) / cell_m) * 0.6)))
+
+    def clamp01(v: float) -> float:
+        return max(0.0, min(1.0, v))
+
+    out = []
+    for lat, lon in points:
+        x2, y2 = transform("EPSG:4326", crs, [lon], [lat])
+        row, col = rasterio.transform.rowcol(w_transform, x2[0], y2[0])
+        if row < 0 or col < 0 or row >= elev.shape[0] or col >= elev.shape[1]:
+            continue
+        e, s = float(elev[row, col]), float(slope_deg[row, col])
+        if not (math.isfinite(e) and math.isfinite(s)):
+            continue
+        box = (slice(max(0, row - lr), row + lr + 1), slice(max(0, col - lr), col + lr + 1))
+        le, ls, lc = elev[box].astype(np.float64), slope_deg[box].astype(np.float64), curvature[box]
+        local_mean = float(np.nanmean(le))
+        local_relief = max(1e-6, float(np.nanmax(le)) - float(np.nanmin(le)))
+        slope_mean = float(np.nanmean(ls))
+        slope_std = float(np.nanstd(ls))
+        roughness = float(np.nanstd(le))
+        curv_mean = float(np.nanmean(np.abs(lc))) if np.isfinite(lc).any() else 0.0
+        tpi_norm = (e - local_mean) / local_relief
+        big = elev[max(0, row - gr):row + gr + 1, max(0, col - gr):col + gr + 1].astype(np.float64)
+        large_relief = max(1e-6, float(np.nanmax(big)) - float(np.nanmin(big)))
+        tpi_large_norm = (e - float(np.nanmean(big))) / large_relief
+
+        score = (
+            slope_preference(s) * 30.0
+            + ridge_proximity_preference(e, elev_min, elev_min + elev_range) * 20.0
+            + clamp01(1.0 - slope_mean / 12.0) * clamp01(1.0 - abs(tpi_norm) * 2.0) * 12.0
+            + clamp01(local_relief / 12.0) * clamp01(1.0 - abs(tpi_norm) * 2.0) * clamp01(slope_std / 5.0) * 8.0
+            + clamp01(1.0 - abs(slope_mean - 8.0) / 8.0) * clamp01(local_relief / 10.0) * 8.0
+            + clamp01(roughness / 6.0) * 8.0
+            + clamp01(curv_mean / 0.08) * 4.0
+            + clamp01(-tpi_norm * 1.5) * clamp01(local_relief / 15.0) * clamp01(1.0 - abs(slope_mean - 10.0) / 12.0) * 6.0
+            + clamp01(1.0 - abs(tpi_large_norm) * 2.0) * 4.0
+        )
+        out.append({"lat": lat, "lon": lon, "lidar_score": score, "local_roughness": roughness})
+    return out
+
+
+class TestNanBoxStats:
+    def test_matches_nan_reductions_with_edges_and_holes(self):
+        rng = np.random.default_rng(7)
+        data = rng.normal(100.0, 5.0, size=(40, 50)).astype("float32")
+        data[10:14, 20:25] = np.nan
+        data[0, :] = np.nan
+        rows = np.array([0, 1, 12, 39, 20, 11])
+        cols = np.array([0, 49, 22, 25, 0, 21])
+        radius = 3
+
+        stats = nan_box_stats(data, radius, rows, cols, std=True, extrema=True)
+
+        for i, (r, c) in enumerate(zip(rows, cols)):
+            box = data[max(0, r - radius):r + radius + 1, max(0, c - radius):c + radius + 1]
+            assert stats["count"][i] == np.isfinite(box).sum()
+            assert stats["mean"][i] == pytest.approx(float(np.nanmean(box)), abs=1e-4)
+            assert stats["std"][i] == pytest.approx(float(np.nanstd(box)), abs=1e-3)
+            assert stats["min"][i] == pytest.approx(float(np.nanmin(box)))
+            assert stats["max"][i] == pytest.approx(float(np.nanmax(box)))
+
+    def test_all_nan_box_reports_zero_count(self):
+        data = np.full((5, 5), np.nan, dtype="float32")
+        stats = nan_box_stats(data, 1, np.array([2]), np.array([2]), std=True, extrema=True)
+        assert stats["count"][0] == 0
+        assert np.isnan(stats["mean"][0]) and np.isnan(stats["min"][0])
+
+
+class TestLidarShortlistParity:
+    def test_scores_and_ranking_match_reference(self, dem_dir: Path):
+        points = generate_grid_points_in_polygon(CORNERS, 400)
+        reference = _reference_scores(dem_dir / "tile_DEMHF.tif", points, sample_radius_m=30)
+
+        top, meta = lidar_shortlist_points(CORNERS, points, sample_radius_m=30, top_k=len(points))
+
+        assert meta["lidar_available"] is True
+        assert meta["scored_points"] == len(reference)
+        by_point = {(r["lat"], r["lon"]): r for r in reference}
+        assert len(top) == len(reference)
+        for row in top:
+            ref = by_point[(row["lat"], row["lon"])]
+            assert row["lidar_score"] == pytest.approx(ref["lidar_score"], abs=1e-3)
+            assert row["local_roughness"] == pytest.approx(ref["local_roughness"], abs=1e-3)
+        scores = [row["lidar_score"] for row in top]
+        assert scores == sorted(scores, reverse=True)
+
+    def test_top_k_is_taken_from_every_point(self, dem_dir: Path):
+        points = generate_grid_points_in_polygon(CORNERS, 400)
+        reference = _reference_scores(dem_dir / "tile_DEMHF.tif", points, sample_radius_m=30)
+        best = max(reference, key=lambda r: r["lidar_score"])
+
+        top, _ = lidar_shortlist_points(CORNERS, points, sample_radius_m=30, top_k=3)
+
+        assert len(top) == 3
+        assert (top[0]["lat"], top[0]["lon"]) == (best["lat"], best["lon"])
@@ -314,3 +314,361 @@ class TestPipelineIntegration:
             )
         assert "started" in events
         assert "error" in events
+
+
+# ---------------------------------------------------------------------------
+# Streaming top-K
+# ---------------------------------------------------------------------------
+
+def _write_synthetic_dem(path, size=400):
+    """Write a small EPSG:32618 GeoTIFF with hills and a saddle."""
+    import rasterio
+    from rasterio.transform import from_origin
+
+    yy, xx = np.mgrid[0:size, 0:size].astype("float32")
+    elev = (
+        400.0
+        + 40.0 * np.sin(xx / 35.0)
+        + 25.0 * np.cos(yy / 50.0)
+        + 0.05 * xx
+    ).astype("float32")
+    transform = from_origin(640000.0, 4875000.0, 1.0, 1.0)
+    with rasterio.open(
+        path, "w", driver="GTiff", height=size, width=size, count=1,
+        dtype="float32", crs="EPSG:32618", transform=transform,
+    ) as dst:
+        dst.write(elev, 1)
+
+
+class TestStreamingTopK:
+    def test_buffer_matches_full_sort(self):
+        from backend.max_accuracy.streaming import TopKBuffer
+
+        rng = np.random.default_rng(7)
+        batches = [np.round(rng.random(500), 2) for _ in range(6)]  # many ties
+        buf = TopKBuffer(120)
+        everything = []
+        for batch in batches:
+            base = len(everything)
+            everything.extend({"score": float(v), "i": base + j} for j, v in enumerate(batch))
+            buf.offer(batch, lambda idx, base=base: [everything[base + i] for i in idx.tolist()])
+
+        expected = sorted(everything, key=lambda r: r["score"], reverse=True)[:120]
+        assert [r["i"] for r in buf.items()] == [r["i"] for r in expected]
+        assert buf.seen == 3000
+
+    def test_buffer_skips_non_finite(self):
+        from backend.max_accuracy.streaming import TopKBuffer
+
+        buf = TopKBuffer(5)
+        buf.offer(np.array([np.nan, 0.3, np.inf]), lambda idx: [{"i": int(i)} for i in idx])
+        assert [r["i"] for r in buf.items()] == [1]
+
+    def test_reservoir_bounded(self):
+        from backend.max_accuracy.streaming import Reservoir
+
+        res = Reservoir(256, seed=1)
+        for _ in range(40):
+            res.add_many(np.arange(1000, dtype=float))
+        assert len(res) == 256
+        assert res.seen == 40000
+        summary = res.summary()
+        assert summary["min"] == 0.0 and summary["max"] == 999.0
+        assert 350.0 < summary["p50"] < 650.0
+
+    @pytest.mark.skipif(
+        not __import__("backend.services.lidar_processor", fromlist=["RASTERIO_AVAILABLE"]).RASTERIO_AVAILABLE,
+        reason="rasterio not installed",
+    )
+    def test_streaming_matches_full_list(self, tmp_path):
+        from backend.max_accuracy.pipeline import MaxAccuracyPipeline
+        from rasterio.warp import transform
+
+        dem_path = tmp_path / "dem.tif"
+        _write_synthetic_dem(str(dem_path))
+        lons, lats = transform("EPSG:32618", "EPSG:4326", [640020.0, 640380.0], [4874980.0, 4874620.0])
+        corners = [
+            (lats[1], lons[0]), (lats[1], lons[1]), (lats[0], lons[1]), (lats[0], lons[0]),
+        ]
+        points = generate_dense_grid(corners, 5)
+
+        cfg = dict(max_candidates=500, tile_size_px=256, tpi_small_m=10, tpi_large_m=40)
+        full = MaxAccuracyPipeline(MaxAccuracyConfig(streaming_top_k=False, **cfg))
+        stream = MaxAccuracyPipeline(MaxAccuracyConfig(streaming_top_k=True, **cfg))
+        expected = full._score_terrain(points, str(dem_path))
+        got = stream._score_terrain(points, str(dem_path))
+
+        assert len(got) == len(expected) == 500
+        assert [(r["lat"], r["lon"]) for r in got] == [(r["lat"], r["lon"]) for r in expected]
+        assert stream._terrain_stats["points_scored"] == full._terrain_stats["points_scored"]
+        assert stream._terrain_stats["elevation_m"]["max"] >= got[0]["elevation_m"] - 1e-6
+
+
+# ---------------------------------------------------------------------------
+# Terrain pyramid
+# ---------------------------------------------------------------------------
+
+@pytest.mark.skipif(
+    not __import__("backend.services.lidar_processor", fromlist=["RASTERIO_AVAILABLE"]).RASTERIO_AVAILABLE,
+    reason="rasterio not installed",
+)
+class TestTerrainPyramid:
+    CFG = dict(tpi_small_m=10, tpi_large_m=40, grid_spacing_m=5, max_candidates=500)
+
+    def _corners(self):
+        from rasterio.warp import transform
+
+        lons, lats = transform("EPSG:32618", "EPSG:4326", [640020.0, 640380.0], [4874980.0, 4874620.0])
+        return [(lats[1], lons[0]), (lats[1], lons[1]), (lats[0], lons[1]), (lats[0], lons[0])]
+
+    def _build(self, tmp_path, block_px=64, levels=(10, 5)):
+        from backend.max_accuracy.pyramid import build_pyramid
+
+        dem_path = tmp_path / "dem.tif"
+        if not dem_path.exists():
+            _write_synthetic_dem(str(dem_path))
+        out = tmp_path / f"pyramid_{block_px}"
+        build_pyramid(
+            str(dem_path), out, levels=levels,
+            tpi_small_m=10, tpi_large_m=40,
+            weights=MaxAccuracyConfig().weights, block_px=block_px,
+        )
+        return dem_path, out
+
+    def test_blocks_are_seamless(self, tmp_path):
+        import rasterio
+
+        _, small = self._build(tmp_path, block_px=24, levels=(5,))
+        _, whole = self._build(tmp_path, block_px=4096, levels=(5,))
+        with rasterio.open(small / "terrain_5m.tif") as a, rasterio.open(whole / "terrain_5m.tif") as b:
+            assert a.descriptions[0] == "score"
+            # Band 1 (score) uses the block-local elevation range by design;
+            # every metric band must be independent of the block layout.
+            np.testing.assert_allclose(a.read()[1:], b.read()[1:], rtol=1e-4, atol=1e-3, equal_nan=True)
+
+    def test_select_level(self):
+        from backend.max_accuracy.pyramid import select_level
+
+        assert select_level([5, 10, 20], 20) == 20
+        assert select_level([5, 10, 20], 12) == 10
+        assert select_level([5, 10, 20], 3) == 5
+        assert select_level([], 10) is None
+
+    def test_pipeline_samples_pyramid(self, tmp_path):
+        import rasterio
+        from backend.max_accuracy.pipeline import MaxAccuracyPipeline
+
+        dem_path, out = self._build(tmp_path)
+        pipe = MaxAccuracyPipeline(MaxAccuracyConfig(terrain_source="pyramid", pyramid_dir=str(out), **self.CFG))
+        level_path = pipe._get_pyramid_path()
+        assert level_path is not None and level_path.endswith("terrain_5m.tif")
+
+        points = generate_dense_grid(self._corners(), 5)
+        got = pipe._score_terrain_from_pyramid(points, level_path)
+        assert 0 < len(got) <= 500
+        assert got[0]["score"] >= got[-1]["score"]
+        assert pipe._terrain_stats["source"] == "pyramid"
+
+        # Sampled elevation agrees with the source DEM to within a 5 m cell's relief
+        from rasterio.warp import transform
+        with rasterio.open(dem_path) as src:
+            xs, ys = transform("EPSG:4326", src.crs, [got[0]["lon"]], [got[0]["lat"]])
+            dem_elev = next(src.sample(list(zip(xs, ys))))[0]
+        assert abs(got[0]["elevation_m"] - float(dem_elev)) < 2.0
+
+    def test_mismatched_tpi_falls_back_to_dem(self, tmp_path):
+        from backend.max_accuracy.pipeline import MaxAccuracyPipeline
+
+        _, out = self._build(tmp_path)
+        cfg = dict(self.CFG, tpi_large_m=200)
+        pipe = MaxAccuracyPipeline(MaxAccuracyConfig(terrain_source="pyramid", pyramid_dir=str(out), **cfg))
+        assert pipe._get_pyramid_path() is None
+        pipe = MaxAccuracyPipeline(MaxAccuracyConfig(terrain_source="pyramid", pyramid_dir=str(tmp_path / "none")))
+        assert pipe._get_pyramid_path() is None
+
+
+# ---------------------------------------------------------------------------
+# Cancellation
+# ---------------------------------------------------------------------------
+
+class TestCancellation:
+    RUN_KW = dict(
+        corners=[(44.0, -73.0), (44.0, -72.99), (44.01, -72.99)],
+        date_time="2025-11-01T07:00:00",
+        season="rut",
+        hunting_pressure="medium",
+    )
+
+    def test_token_deadline(self):
+        import time
+
+        from backend.max_accuracy.cancellation import CancellationToken, RunCancelled
+
+        token = CancellationToken(deadline_s=1e-6)
+        time.sleep(0.01)
+        assert token.cancelled
+        assert token.reason == "deadline_exceeded"
+        with pytest.raises(RunCancelled):
+            token.raise_if_cancelled()
+        assert not CancellationToken().cancelled
+        assert not CancellationToken(deadline_s=0).cancelled
+
+    def test_cancelled_run_stops_during_grid(self):
+        from backend.max_accuracy.cancellation import CancellationToken
+        from backend.max_accuracy.pipeline import MaxAccuracyPipeline
+
+        token = CancellationToken()
+        token.cancel("cancelled_by_user")
+        stages = []
+        with patch("backend.max_accuracy.pipeline.RASTERIO_AVAILABLE", True), \
+             patch.object(MaxAccuracyPipeline, "_get_dem_path", return_value="/nonexistent.tif"), \
+             patch.object(MaxAccuracyPipeline, "_score_terrain") as score_terrain:
+            result = MaxAccuracyPipeline(MaxAccuracyConfig(grid_spacing_m=10)).run(
+                **self.RUN_KW,
+                progress_callback=lambda stage, payload: stages.append(stage),
+                cancel_token=token,
+            )
+        assert result == {"error": "cancelled_by_user", "cancelled": True}
+        assert stages[-1] == "cancelled"
+        score_terrain.assert_not_called()
+
+    def test_gee_cancellation_drops_pending_lookups(self):
+        import threading
+
+        from backend.max_accuracy.cancellation import CancellationToken, RunCancelled
+        from backend.max_accuracy.pipeline import MaxAccuracyPipeline
+
+        token = CancellationToken()
+        calls = []
+        lock = threading.Lock()
+
+        def slow_gee(lat, lon, radius_km=0.25):
+            with lock:
+                calls.append(lat)
+            token.cancel()
+            return {"gee_canopy": 75.0, "gee_ndvi": 0.65}
+
+        candidates = [{"lat": 44.0 + i * 0.001, "lon": -73.0, "score": 0.5} for i in range(200)]
+        pipe = MaxAccuracyPipeline(MaxAccuracyConfig(enable_gee=True, gee_sample_k=200))
+        pipe._cancel_token = token
+        with patch("backend.max_accuracy.pipeline.get_gee_summary", side_effect=slow_gee):
+            with pytest.raises(RunCancelled):
+                pipe._enrich_with_gee(candidates)
+        assert len(calls) < 200
+
+    def test_corridor_routing_honours_cancel_check(self):
+        from backend.corridor.pathfinder import accumulate_corridors
+
+        class Stop(Exception):
+            pass
+
+        checks = []
+
+        def cancel_check():
+            checks.append(1)
+            if len(checks) > 1:
+                raise Stop()
+
+        cost = np.ones((50, 50))
+        nodes = [(0, 0), (49, 49), (0, 49), (49, 0)]
+        with pytest.raises(Stop):
+            accumulate_corridors(cost, nodes, cancel_check=cancel_check)
+        density, paths = accumulate_corridors(cost, nodes)
+        assert len(paths) == 6
+
+
+# ---------------------------------------------------------------------------
+# Process worker pool
+# ---------------------------------------------------------------------------
+
+class TestProcessJobRunner:
+    def test_runs_in_worker_and_relays_progress(self):
+        from backend.max_accuracy.worker import ProcessJobRunner
+
+        runner = ProcessJobRunner(max_workers=1, max_jobs_per_worker=1)
+        try:
+            results = []
+            for _ in range(2):  # second run needs a recycled worker
+                stages = []
+                token = runner.new_token()
+                token.cancel("cancelled_by_user")
+                report = runner.run(
+                    MaxAccuracyConfig(grid_spacing_m=50),
+                    [(44.0, -73.0), (44.0, -72.99), (44.01, -72.99)],
+                    date_time="2025-11-01T07:00:00",
+                    season="rut",
+                    hunting_pressure="medium",
+                    progress_callback=lambda stage, payload: stages.append(stage),
+                    cancel_token=token,
+                )
+                results.append(report)
+                assert stages[0] == "started"
+                assert stages[-1] in {"cancelled", "error"}
+            # Cancelled at the first checkpoint, or earlier when this host
+            # has no DEM/rasterio — either way the worker reported back.
+            for report in results:
+                assert report.get("cancelled") or report.get("error") in {
+                    "no_lidar_files", "rasterio_not_available",
+                }
+        finally:
+            runner.shutdown()
+
+    def test_pool_is_recycled_without_max_tasks_per_child(self, monkeypatch):
+        import queue
+        from concurrent.futures import Future
+
+        from backend.max_accuracy import worker as worker_module
+        from backend.max_accuracy.worker import ProcessJobRunner
+
+        pools = []
+
+        class FakePool:
+            def __init__(self, **kwargs):
+                self.kwargs = kwargs
+                self.submitted = 0
+                self.shut_down = False
+                pools.append(self)
+
+            def submit(self, fn, *args, **kwargs):
+                self.submitted += 1
+                kwargs["progress_queue"].put((worker_module._DONE, {}))
+                future = Future()
+                future.set_result({"pool": len(pools)})
+                return future
+
+            def shutdown(self, wait=True, cancel_futures=False):
+                self.shut_down = True
+
+        class FakeManager:
+            Queue = queue.Queue
+
+            def Event(self):
+                import threading
+                return threading.Event()
+
+        monkeypatch.setattr(worker_module, "_NATIVE_WORKER_RECYCLING", False)
+        monkeypatch.setattr(worker_module, "ProcessPoolExecutor", FakePool)
+        runner = ProcessJobRunner(max_workers=1, max_jobs_per_worker=2)
+        runner._manager = FakeManager()
+
+        reports = [
+            runner.run(MaxAccuracyConfig(), [(44.0, -73.0)], date_time="2025-11-01T07:00:00",
+                       season="rut", hunting_pressure="medium")
+            for _ in range(5)
+        ]
+        assert [r["pool"] for r in reports] == [1, 1, 2, 2, 3]
+        assert all("max_tasks_per_child" not in pool.kwargs for pool in pools)
+        assert [pool.submitted for pool in pools] == [2, 2, 1]
+        assert [pool.shut_down for pool in pools] == [True, True, False]
+
+    def test_token_event_is_shared(self):
+        from backend.max_accuracy.cancellation import CancellationToken
+
+        import threading
+
+        event = threading.Event()
+        parent = CancellationToken(event=event)
+        child = CancellationToken(event=event)
+        parent.cancel("cancelled_by_user")
+        assert child.cancelled
+        assert child.reason is None
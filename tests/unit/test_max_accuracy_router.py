@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Dict, Optional
 from unittest.mock import MagicMock, patch
@@ -12,6 +13,7 @@ from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 from backend.routers.max_accuracy_router import max_accuracy_router
+from backend.services.job_registry import get_job_registry
 
 
 # ---------------------------------------------------------------------------
@@ -31,6 +33,9 @@ def client(jobs_dir: Path, monkeypatch: pytest.MonkeyPatch) -> TestClient:
         "backend.routers.max_accuracy_router._resolve_jobs_dir",
         lambda: jobs_dir,
     )
+    # Isolate request coalescing state between tests
+    monkeypatch.setattr("backend.routers.max_accuracy_router._INFLIGHT_BY_FINGERPRINT", {})
+    monkeypatch.setattr("backend.routers.max_accuracy_router._RECENT_RESULTS", OrderedDict())
     app = FastAPI()
     app.include_router(max_accuracy_router)
     c = TestClient(app)
@@ -161,9 +166,8 @@ class TestRunEndpoint:
 
         resp = client.post("/property-hotspots/max-accuracy/run", json=_default_payload())
         job_id = resp.json()["job_id"]
-        status_path = client.jobs_dir / job_id / "status.json"  # type: ignore[attr-defined]
-        assert status_path.exists()
-        status = json.loads(status_path.read_text(encoding="utf-8"))
+        status = get_job_registry().get(job_id, kind="max_accuracy")
+        assert status is not None
         assert status["job_id"] == job_id
 
     def test_too_few_corners_returns_error(self, client: TestClient):
@@ -199,3 +203,337 @@ class TestReportEndpoint:
         data = resp.json()
         assert data["success"] is False
         assert "not found" in data["error"].lower() or "Report not found" in data["error"]
+
+
+# ---------------------------------------------------------------------------
+# Status board
+# ---------------------------------------------------------------------------
+
+class TestStatusBoard:
+    def test_progress_served_from_memory_and_flushed_on_completion(self, client: TestClient):
+        import threading
+        import time
+
+        from backend.routers import max_accuracy_router as router_mod
+
+        job_id = "a" * 32
+        registry = get_job_registry()
+        release = threading.Event()
+        seen: Dict[str, Any] = {}
+
+        def _run(corners, progress_callback=None, **kwargs):
+            for row in range(0, 500, 25):
+                progress_callback("grid_progress", {"row": row})
+            seen["memory"] = router_mod._read_status(job_id)
+            seen["disk"] = registry.get(job_id)
+            release.wait(5)
+            return _fake_report(corners)
+
+        with patch("backend.routers.max_accuracy_router.MaxAccuracyPipeline") as MockPipeline, \
+             patch("backend.routers.max_accuracy_router.uuid.uuid4") as mock_uuid, \
+             patch.object(router_mod._STATUS_STORE, "flush_interval_s", 60.0):
+            MockPipeline.return_value.run.side_effect = _run
+            mock_uuid.return_value.hex = job_id
+            resp = client.post("/property-hotspots/max-accuracy/run", json=_default_payload())
+            assert resp.json()["job_id"] == job_id
+            deadline = time.monotonic() + 5
+            while "disk" not in seen and time.monotonic() < deadline:
+                time.sleep(0.01)
+            release.set()
+            future = router_mod._INFLIGHT_FUTURES.get(job_id)
+            if future is not None:
+                future.result(5)
+
+        try:
+            assert seen["memory"]["payload"]["row"] == 475
+            # Throttled: no progress update reached the registry before completion
+            assert seen["disk"]["state"] == "queued"
+            assert registry.get(job_id)["state"] == "completed"
+        finally:
+            router_mod._STATUS_STORE.forget(job_id)
+
+
+# ---------------------------------------------------------------------------
+# Request coalescing
+# ---------------------------------------------------------------------------
+
+class TestRequestCoalescing:
+    def _fingerprint(self, **overrides: Any) -> str:
+        from backend.routers.max_accuracy_router import MaxAccuracyRequest, _request_fingerprint
+
+        return _request_fingerprint(MaxAccuracyRequest(**_default_payload(**overrides)))
+
+    def test_fingerprint_normalizes_equivalent_requests(self):
+        corners = _default_payload()["corners"]
+        base = self._fingerprint()
+        assert self._fingerprint(corners=corners[2:] + corners[:2]) == base
+        assert self._fingerprint(corners=corners[::-1]) == base
+        assert self._fingerprint(corners=corners + [corners[0]]) == base
+        assert self._fingerprint(date_time="2025-10-15T06:30:00-04:00") == base
+        assert self._fingerprint(season=" RUT ") == base
+
+    def test_fingerprint_distinguishes_inputs(self):
+        base = self._fingerprint()
+        assert self._fingerprint(date_time="2025-10-15T11:30:00Z") != base
+        assert self._fingerprint(hunting_pressure="high") != base
+        assert self._fingerprint(config={"grid_spacing_m": 15}) != base
+
+    def test_identical_inflight_request_attaches_to_job(self, client: TestClient):
+        import threading
+
+        from backend.routers import max_accuracy_router as router_mod
+
+        release = threading.Event()
+
+        def _run(corners, progress_callback=None, **kwargs):
+            release.wait(5)
+            return _fake_report(corners)
+
+        with patch("backend.routers.max_accuracy_router.MaxAccuracyPipeline") as MockPipeline:
+            MockPipeline.return_value.run.side_effect = _run
+            first = client.post("/property-hotspots/max-accuracy/run", json=_default_payload()).json()
+            second = client.post("/property-hotspots/max-accuracy/run", json=_default_payload()).json()
+            release.set()
+            future = router_mod._INFLIGHT_FUTURES.get(first["job_id"])
+            if future is not None:
+                future.result(5)
+
+        assert second["success"] is True
+        assert second["job_id"] == first["job_id"]
+        assert second["reused"] == "in_flight"
+        assert MockPipeline.return_value.run.call_count == 1
+
+    def test_inflight_status_is_read_outside_the_lock(self, client: TestClient, monkeypatch: pytest.MonkeyPatch):
+        from backend.routers import max_accuracy_router as router_mod
+
+        fingerprint = self._fingerprint()
+        stale_id = "e" * 32
+        router_mod._INFLIGHT_BY_FINGERPRINT[fingerprint] = stale_id
+        locked_reads = []
+        real_read = router_mod._read_status
+
+        def _read(job_id):
+            locked_reads.append(router_mod._INFLIGHT_LOCK.locked())
+            return real_read(job_id)
+
+        monkeypatch.setattr(router_mod, "_read_status", _read)
+        router_mod._write_status(stale_id, {"job_id": stale_id, "state": "running",
+                                            "updated_at": "2020-01-01T00:00:00+00:00"})
+        with patch("backend.routers.max_accuracy_router.MaxAccuracyPipeline") as MockPipeline:
+            MockPipeline.return_value.run.side_effect = _fake_report
+            resp = client.post("/property-hotspots/max-accuracy/run", json=_default_payload()).json()
+            future = router_mod._INFLIGHT_FUTURES.get(resp["job_id"])
+            if future is not None:
+                future.result(5)
+
+        try:
+            # The stale job does not capture the resubmission
+            assert resp["job_id"] != stale_id and resp["reused"] is None
+            assert locked_reads and not any(locked_reads)
+        finally:
+            router_mod._STATUS_STORE.forget(stale_id)
+            router_mod._STATUS_STORE.forget(resp["job_id"])
+
+    @patch("backend.routers.max_accuracy_router.MaxAccuracyPipeline")
+    def test_recent_result_is_reused(self, MockPipeline, client: TestClient):
+        MockPipeline.return_value.run.return_value = _fake_report([])
+
+        first = client.post("/property-hotspots/max-accuracy/analyze", json=_default_payload()).json()
+        second = client.post("/property-hotspots/max-accuracy/run", json=_default_payload()).json()
+
+        assert second["reused"] == "cached"
+        assert second["job_id"] == first["job_id"]
+        assert second["report"]["stands"][0]["score"] == 85.2
+        assert MockPipeline.return_value.run.call_count == 1
+
+    @patch("backend.routers.max_accuracy_router.MaxAccuracyPipeline")
+    def test_reuse_disabled_with_zero_window(self, MockPipeline, client: TestClient, monkeypatch):
+        monkeypatch.setattr("backend.routers.max_accuracy_router.REUSE_WINDOW_MINUTES", 0)
+        MockPipeline.return_value.run.return_value = _fake_report([])
+
+        first = client.post("/property-hotspots/max-accuracy/analyze", json=_default_payload()).json()
+        second = client.post("/property-hotspots/max-accuracy/analyze", json=_default_payload()).json()
+
+        assert second["job_id"] != first["job_id"]
+        assert second.get("reused") is None
+        assert MockPipeline.return_value.run.call_count == 2
+
+
+# ---------------------------------------------------------------------------
+# Columnar candidates
+# ---------------------------------------------------------------------------
+
+def _candidates(n: int) -> list:
+    return [
+        {
+            "lat": 44.0 + i * 0.001,
+            "lon": -72.6 + i * 0.001,
+            "score": float(100 - i),
+            "combined_score": 1.0 - i / n,
+            "quadrant": "NE" if i % 2 else "SW",
+            "is_probable_bedding": i % 3 == 0,
+            "bedding_criteria_met": 6 if i % 3 == 0 else None,
+            "wind_options": [{"bearing": 90}] if i == 0 else None,
+        }
+        for i in range(n)
+    ]
+
+
+class TestCandidatesEndpoint:
+    @patch("backend.routers.max_accuracy_router.MaxAccuracyPipeline")
+    def test_report_manifest_excludes_candidates(self, MockPipeline, client: TestClient):
+        report = _fake_report([])
+        report["terrain_candidates"] = _candidates(50)
+        MockPipeline.return_value.run.return_value = report
+
+        data = client.post("/property-hotspots/max-accuracy/analyze", json=_default_payload()).json()
+        job_id = data["job_id"]
+        assert "terrain_candidates" not in data["report"]
+        assert data["report"]["terrain_candidates_total"] == 50
+        url = data["report"]["terrain_candidates_url"]
+        assert url == f"/property-hotspots/max-accuracy/report/{job_id}/candidates"
+        assert "terrain_candidates_path" not in data["report"]
+        assert client.get(url).json()["total"] == 50
+        # Caller's report is untouched
+        assert len(report["terrain_candidates"]) == 50
+
+        report_file = client.jobs_dir / job_id / "max_accuracy_report.json"  # type: ignore[attr-defined]
+        stored = json.loads(report_file.read_text(encoding="utf-8"))
+        assert "terrain_candidates" not in stored
+
+    @patch("backend.routers.max_accuracy_router.MaxAccuracyPipeline")
+    def test_pagination_and_filters(self, MockPipeline, client: TestClient):
+        report = _fake_report([])
+        report["terrain_candidates"] = _candidates(50)
+        MockPipeline.return_value.run.return_value = report
+        job_id = client.post("/property-hotspots/max-accuracy/analyze", json=_default_payload()).json()["job_id"]
+        url = f"/property-hotspots/max-accuracy/report/{job_id}/candidates"
+
+        page = client.get(url, params={"offset": 10, "limit": 5}).json()
+        assert page["total"] == 50
+        assert [c["score"] for c in page["candidates"]] == [90.0, 89.0, 88.0, 87.0, 86.0]
+        first = client.get(url, params={"limit": 1}).json()["candidates"][0]
+        assert first["quadrant"] == "SW"
+        assert first["is_probable_bedding"] is True
+        assert first["bedding_criteria_met"] == 6.0
+        assert "wind_options" not in first
+        assert client.get(url, params={"offset": 1, "limit": 1}).json()["candidates"][0]["bedding_criteria_met"] is None
+
+        boxed = client.get(url, params={"bbox": "44.0095,-72.6,44.0195,-72.0"}).json()
+        assert [c["score"] for c in boxed["candidates"]] == [float(100 - i) for i in range(10, 20)]
+
+        scored = client.get(url, params={"min_score": 0.9, "offset": 2, "limit": 100}).json()
+        assert scored["total"] == 6
+        assert len(scored["candidates"]) == 4
+
+    def test_missing_job_and_bad_bbox(self, client: TestClient):
+        url = "/property-hotspots/max-accuracy/report/" + "c" * 32 + "/candidates"
+        assert client.get(url).status_code == 404
+        (client.jobs_dir / ("c" * 32) / "terrain_candidates").mkdir(parents=True)  # type: ignore[attr-defined]
+        assert client.get(url, params={"bbox": "1,2,3"}).status_code == 400
+        assert client.get("/property-hotspots/max-accuracy/report/bad-id/candidates").status_code == 400
+
+
+# ---------------------------------------------------------------------------
+# DELETE /property-hotspots/max-accuracy/{job_id}
+# ---------------------------------------------------------------------------
+
+class TestCancelEndpoint:
+    def test_cancel_releases_capacity_and_stops_run(self, client: TestClient):
+        import threading
+        import time
+
+        from backend.max_accuracy.cancellation import RunCancelled
+        from backend.routers import max_accuracy_router as router_mod
+
+        started = threading.Event()
+        finished = threading.Event()
+
+        def _run(corners, progress_callback=None, cancel_token=None, **kwargs):
+            started.set()
+            try:
+                while True:
+                    cancel_token.raise_if_cancelled()
+                    progress_callback("terrain_tile", {"tile": 1})
+                    time.sleep(0.01)
+            except RunCancelled as exc:
+                progress_callback("cancelled", {"reason": exc.reason})
+                return {"error": exc.reason, "cancelled": True}
+            finally:
+                finished.set()
+
+        with patch("backend.routers.max_accuracy_router.MaxAccuracyPipeline") as MockPipeline:
+            MockPipeline.return_value.run.side_effect = _run
+            job_id = client.post("/property-hotspots/max-accuracy/run", json=_default_payload()).json()["job_id"]
+            assert started.wait(5)
+
+            resp = client.delete(f"/property-hotspots/max-accuracy/{job_id}")
+            assert resp.status_code == 200
+            assert resp.json()["success"] is True
+            # Capacity is released immediately, before the worker unwinds
+            assert job_id not in router_mod._INFLIGHT_FUTURES
+            assert router_mod._read_status(job_id)["state"] == "cancelled"
+            assert finished.wait(5)
+
+        assert router_mod._read_status(job_id)["state"] == "cancelled"
+        again = client.delete(f"/property-hotspots/max-accuracy/{job_id}").json()
+        assert again["success"] is False
+        router_mod._STATUS_STORE.forget(job_id)
+
+    @staticmethod
+    def _wait_terminal(router_mod: Any, job_id: str) -> Dict[str, Any]:
+        import time
+
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            status = router_mod._read_status(job_id) or {}
+            if status.get("state") in {"completed", "cancelled", "error"}:
+                return status
+            time.sleep(0.01)
+        raise AssertionError(f"job {job_id} never reached a terminal state")
+
+    def test_deadline_after_pipeline_returns_publishes_cancelled(self, client: TestClient):
+        from backend.max_accuracy.cancellation import DEADLINE_EXCEEDED
+        from backend.routers import max_accuracy_router as router_mod
+
+        def _run(corners, progress_callback=None, cancel_token=None, **kwargs):
+            cancel_token.cancel(DEADLINE_EXCEEDED)
+            return _fake_report(corners)
+
+        with patch("backend.routers.max_accuracy_router.MaxAccuracyPipeline") as MockPipeline:
+            MockPipeline.return_value.run.side_effect = _run
+            job_id = client.post("/property-hotspots/max-accuracy/run", json=_default_payload()).json()["job_id"]
+            status = self._wait_terminal(router_mod, job_id)
+
+        try:
+            assert status["state"] == "cancelled"
+            assert status["payload"] == {"reason": DEADLINE_EXCEEDED}
+            assert not router_mod._report_path(job_id).exists()
+            assert not router_mod._RECENT_RESULTS
+        finally:
+            router_mod._STATUS_STORE.forget(job_id)
+
+    def test_cancel_while_persisting_still_completes(self, client: TestClient):
+        from backend.routers import max_accuracy_router as router_mod
+
+        real_persist = router_mod._persist_report
+
+        def _persist(report, job_id=None):
+            router_mod._CANCEL_TOKENS[job_id].cancel("cancelled_by_user")
+            return real_persist(report, job_id=job_id)
+
+        with patch("backend.routers.max_accuracy_router.MaxAccuracyPipeline") as MockPipeline, \
+             patch("backend.routers.max_accuracy_router._persist_report", side_effect=_persist):
+            MockPipeline.return_value.run.side_effect = _fake_report
+            job_id = client.post("/property-hotspots/max-accuracy/run", json=_default_payload()).json()["job_id"]
+            status = self._wait_terminal(router_mod, job_id)
+
+        try:
+            assert status["state"] == "completed"
+            assert router_mod._report_path(job_id).exists()
+        finally:
+            router_mod._STATUS_STORE.forget(job_id)
+
+    def test_cancel_unknown_job(self, client: TestClient):
+        assert client.delete("/property-hotspots/max-accuracy/" + "d" * 32).status_code == 404
+        assert client.delete("/property-hotspots/max-accuracy/not-a-job").status_code == 400
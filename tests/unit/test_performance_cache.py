@@ -0,0 +1,136 @@
+"""Tests for the bounded result cache in backend.performance."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+import pytest
+
+from backend.performance import (
+    BoundedCache,
+    cache_result,
+    canonical_cache_key,
+    clear_cache,
+    get_cache_stats,
+    get_performance_monitor,
+)
+
+
+class TestCanonicalKey:
+    def test_dict_order_and_float_noise_do_not_change_key(self):
+        a = canonical_cache_key("f", (44.1 + 1e-12, {"b": 1, "a": [1.0, 2.0]}), {"season": "rut", "x": 1})
+        b = canonical_cache_key("f", (44.1, OrderedDict([("a", [1.0, 2.0]), ("b", 1)])), {"x": 1, "season": "rut"})
+        assert a == b
+        assert a != canonical_cache_key("f", (44.2, {"a": [1.0, 2.0], "b": 1}), {"season": "rut", "x": 1})
+        assert a != canonical_cache_key("g", (44.1, {"a": [1.0, 2.0], "b": 1}), {"season": "rut", "x": 1})
+
+    def test_arrays_are_keyed_by_contents(self):
+        grid = np.arange(12, dtype=float).reshape(3, 4)
+        key = canonical_cache_key("f", (grid,), {})
+        assert key == canonical_cache_key("f", (grid.copy(),), {})
+        assert key != canonical_cache_key("f", (grid.T,), {})
+        assert key != canonical_cache_key("f", (grid.astype(np.float32),), {})
+        changed = grid.copy()
+        changed[2, 3] += 1
+        assert key != canonical_cache_key("f", (changed,), {})
+        assert canonical_cache_key("f", (np.float64(1.5),), {}) == canonical_cache_key("f", (1.5,), {})
+
+
+class TestBoundedCache:
+    def test_entry_limit_evicts_least_recently_used(self):
+        cache = BoundedCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1
+        cache.set("c", 3)
+        assert cache.get("b") is None
+        assert (cache.get("a"), cache.get("c")) == (1, 3)
+        assert cache.stats()["evictions"] == 1
+
+    def test_byte_limit(self):
+        cache = BoundedCache(max_entries=100, max_bytes=30_000)
+        cache.set("a", np.zeros(1000))
+        cache.set("b", np.zeros(1000))
+        cache.set("c", np.zeros(1000))
+        stats = cache.stats()
+        assert stats["entries"] == 3
+        cache.set("d", np.zeros(2000))
+        stats = cache.stats()
+        assert stats["bytes"] <= 30_000
+        assert cache.get("a") is None and cache.get("d") is not None
+        assert cache.set("huge", np.zeros(10_000)) is False
+        assert cache.stats()["rejected"] == 1
+
+    def test_ttl_expiry(self):
+        cache = BoundedCache(default_ttl_s=0.05)
+        cache.set("a", 1)
+        cache.set("b", 2, ttl_s=60)
+        time.sleep(0.08)
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+        assert cache.stats()["expirations"] == 1
+
+    def test_single_flight(self):
+        cache = BoundedCache()
+        calls = []
+        started = threading.Event()
+        release = threading.Event()
+
+        def compute():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return "value"
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(cache.get_or_compute("k", compute)))
+                   for _ in range(8)]
+        threads[0].start()
+        started.wait(5)
+        for t in threads[1:]:
+            t.start()
+        while cache.stats()["coalesced"] < 7:
+            time.sleep(0.005)
+        release.set()
+        for t in threads:
+            t.join(5)
+
+        assert calls == [1]
+        assert results == ["value"] * 8
+        assert cache.stats()["inflight"] == 0
+
+    def test_errors_reach_waiters_and_are_not_cached(self):
+        cache = BoundedCache()
+
+        def boom():
+            raise RuntimeError("nope")
+
+        with pytest.raises(RuntimeError):
+            cache.get_or_compute("k", boom)
+        assert cache.get_or_compute("k", lambda: 5) == 5
+
+
+class TestCacheResultDecorator:
+    def test_memoises_and_reports_through_monitor(self):
+        calls = []
+
+        @cache_result(ttl_hours=1, max_entries=2)
+        def score(lat: float, lon: float, opts: dict) -> float:
+            calls.append((lat, lon))
+            return lat + lon
+
+        assert score(44.0, -72.5, {"b": 1, "a": 2}) == score(44.0, -72.5, {"a": 2, "b": 1})
+        score(45.0, -72.5, {})
+        score(46.0, -72.5, {})
+        assert len(calls) == 3
+
+        name = f"{score.__module__}.{score.__qualname__}"
+        stats = get_performance_monitor().get_cache_stats()[name]
+        assert (stats["hits"], stats["misses"], stats["evictions"], stats["entries"]) == (1, 3, 1, 2)
+        assert get_cache_stats()["caches"][name]["entries"] == 2
+
+        clear_cache()
+        assert len(score.cache) == 0
@@ -0,0 +1,114 @@
+"""Tests for the SQLite-backed prediction cache."""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from backend import prediction_cache as cache_module
+from backend.prediction_cache import PredictionCache
+
+
+@pytest.fixture()
+def cache(tmp_path: Path) -> PredictionCache:
+    c = PredictionCache(str(tmp_path / "cache"), ttl_hours=6, max_bytes=10_000_000)
+    yield c
+    c.close()
+
+
+def test_round_trip_uses_rounded_coordinates(cache: PredictionCache):
+    cache.set(44.26001, -72.58001, "rut", 6, {"score": 7.5, "when": time.gmtime(0)})
+    data = cache.get(44.26004, -72.58004, "rut", 6)
+    assert data["score"] == 7.5
+    assert data["cache_key"] == "44.26_-72.58_rut_6"
+    assert cache.get(44.26, -72.58, "rut", 7) is None
+    assert cache.stats()["entries"] == 1
+
+
+def test_expired_entries_are_not_returned(tmp_path: Path):
+    cache = PredictionCache(str(tmp_path / "cache"), ttl_hours=0.01 / 3600)
+    try:
+        cache.set(44.0, -72.0, "rut", 6, {"score": 1})
+        cache.set(44.1, -72.0, "rut", 6, {"score": 2})
+        time.sleep(0.02)
+        assert cache.get(44.0, -72.0, "rut", 6) is None
+        assert cache.clear_expired() == 1
+        assert cache.stats()["entries"] == 0
+    finally:
+        cache.close()
+
+
+def test_least_recently_used_entries_evicted_to_budget(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(cache_module, "_ACCESS_REFRESH_SECONDS", 0.0)
+    cache = PredictionCache(str(tmp_path / "cache"), max_bytes=3_000)
+    try:
+        blob = {"grid": os.urandom(600).hex()}  # incompressible, ~700 bytes stored
+        for hour in range(3):
+            cache.set(44.0, -72.0, "rut", hour, blob)
+            time.sleep(0.01)
+        assert cache.get(44.0, -72.0, "rut", 0) is not None  # now most recently used
+        time.sleep(0.01)
+        cache.set(44.0, -72.0, "rut", 3, blob)
+        cache.set(44.0, -72.0, "rut", 4, blob)
+
+        stats = cache.stats()
+        assert stats["bytes"] <= 3_000
+        assert cache.get(44.0, -72.0, "rut", 1) is None
+        assert cache.get(44.0, -72.0, "rut", 0) is not None
+        assert cache.get(44.0, -72.0, "rut", 4) is not None
+    finally:
+        cache.close()
+
+
+def test_migrates_json_directory_once(tmp_path: Path):
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    (cache_dir / "44.0_-72.0_rut_6.json").write_text(json.dumps({"score": 3, "cache_key": "44.0_-72.0_rut_6"}))
+    stale = cache_dir / "44.1_-72.0_rut_6.json"
+    stale.write_text(json.dumps({"score": 4}))
+    os.utime(stale, (time.time() - 7 * 3600,) * 2)
+    (cache_dir / "broken.json").write_text("{not json")
+
+    cache = PredictionCache(str(cache_dir), ttl_hours=6)
+    try:
+        assert cache.get(44.0, -72.0, "rut", 6)["score"] == 3
+        assert cache.get(44.1, -72.0, "rut", 6) is None
+        assert sorted(p.name for p in cache_dir.iterdir() if p.suffix == ".json") == ["broken.json"]
+    finally:
+        cache.close()
+
+    (cache_dir / "44.2_-72.0_rut_6.json").write_text(json.dumps({"score": 5}))
+    again = PredictionCache(str(cache_dir), ttl_hours=6)
+    try:
+        assert again.get(44.2, -72.0, "rut", 6) is None
+    finally:
+        again.close()
+
+
+def test_concurrent_writers_keep_size_accounting_exact(tmp_path: Path):
+    caches = [PredictionCache(str(tmp_path / "cache"), max_bytes=20_000) for _ in range(3)]
+    try:
+        def write(c: PredictionCache, offset: int) -> None:
+            for i in range(60):
+                c.set(44.0 + i * 0.001, -72.0, "rut", offset, {"grid": os.urandom(200).hex()})
+
+        threads = [threading.Thread(target=write, args=(c, n)) for n, c in enumerate(caches)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        with sqlite3.connect(caches[0].db_path) as conn:
+            actual = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        stats = caches[1].stats()
+        assert stats["bytes"] == actual
+        assert 0 < actual <= 20_000
+    finally:
+        for c in caches:
+            c.close()
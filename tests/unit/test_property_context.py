@@ -0,0 +1,228 @@
+"""Tests for the shared per-job PropertyContext used by hotspot runs."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+from typing import Any, Dict, List
+
+import numpy as np
+import pytest
+
+from backend.services.hotspot import job_service as job_service_module
+from backend.services.hotspot import property_context as property_context_module
+from backend.services.hotspot.job_service import HotspotJobService
+from backend.services.hotspot.property_context import PropertyContext, build_property_context
+from backend.services.lidar_processor import RASTERIO_AVAILABLE, DEMFileManager, TerrainExtractor
+from optimized_biological_integration import OptimizedBiologicalIntegration
+
+CORNERS = [(44.000, -72.500), (44.000, -72.490), (44.008, -72.490), (44.008, -72.500)]
+
+
+def _integration() -> OptimizedBiologicalIntegration:
+    # Skip __init__ so no Earth Engine authentication is attempted.
+    integration = OptimizedBiologicalIntegration.__new__(OptimizedBiologicalIntegration)
+    integration.logger = property_context_module.logger
+    return integration
+
+
+class TestDEMWindow:
+    @pytest.fixture()
+    def dem_dir(self, tmp_path: Path) -> Path:
+        rasterio = pytest.importorskip("rasterio")
+        from rasterio.transform import from_origin
+        from rasterio.warp import transform
+
+        # 2 m UTM 18N raster around (44.004, -72.495) with a tilted, bumpy surface.
+        xs, ys = transform("EPSG:4326", "EPSG:32618", [-72.495], [44.004])
+        size = 1200
+        origin_x, origin_y = xs[0] - size, ys[0] + size
+        rows, cols = np.mgrid[0:size, 0:size]
+        elevation = (300.0 + rows * 0.15 + np.sin(cols / 25.0) * 4.0).astype("float32")
+        with rasterio.open(
+            tmp_path / "tile_DEMHF.tif", "w", driver="GTiff", height=size, width=size, count=1,
+            dtype="float32", crs="EPSG:32618", transform=from_origin(origin_x, origin_y, 2.0, 2.0),
+        ) as dst:
+            dst.write(elevation, 1)
+        return tmp_path
+
+    @pytest.mark.skipif(not RASTERIO_AVAILABLE, reason="Rasterio not available")
+    def test_window_terrain_matches_file_reads(self, dem_dir: Path):
+        manager = DEMFileManager(data_dir=str(dem_dir))
+        window = manager.read_window(44.000, -72.500, 44.008, -72.490)
+        assert window is not None
+
+        for lat, lon in [(44.001, -72.499), (44.004, -72.495), (44.0075, -72.4905)]:
+            expected = TerrainExtractor.extract_point_terrain(lat, lon, manager.get_files())
+            assert window.terrain_at(lat, lon) == expected
+
+    @pytest.mark.skipif(not RASTERIO_AVAILABLE, reason="Rasterio not available")
+    def test_point_outside_window_returns_none(self, dem_dir: Path):
+        manager = DEMFileManager(data_dir=str(dem_dir))
+        window = manager.read_window(44.003, -72.496, 44.005, -72.494)
+        assert window is not None
+        assert window.terrain_at(44.0075, -72.4905) is None
+
+    @pytest.mark.skipif(not RASTERIO_AVAILABLE, reason="Rasterio not available")
+    def test_window_over_cell_budget_is_refused(self, dem_dir: Path):
+        manager = DEMFileManager(data_dir=str(dem_dir))
+        assert manager.read_window(44.000, -72.500, 44.008, -72.490, max_cells=100) is None
+
+
+class TestRoadProximityFromElements:
+    def test_radius_filter_matches_around_query(self):
+        integration = _integration()
+        near = {"tags": {"highway": "secondary"}, "geometry": [{"lat": 44.0045, "lon": -72.495}]}
+        far = {"tags": {"highway": "primary"}, "geometry": [{"lat": 44.05, "lon": -72.495}]}
+
+        result = integration.road_proximity_from_elements(44.004, -72.495, [near, far], radius_km=1.0)
+
+        assert result["roads_found"] == 1
+        assert result["road_types_nearby"] == ["secondary"]
+        assert result["nearest_road_distance_m"] == pytest.approx(55.6, abs=1.0)
+        assert result["osm_query_success"] is True
+
+    def test_no_roads_uses_default_distance(self):
+        result = _integration().road_proximity_from_elements(44.0, -72.5, [], radius_km=1.0)
+        assert result["nearest_road_distance_m"] == 1000
+        assert result["roads_found"] == 0
+
+
+class TestPropertyContext:
+    def test_vegetation_canopy_is_localised(self):
+        grid = [[0.9, 0.9], [0.1, 0.1]]
+        coords = {"lat": [44.000, 44.000, 44.050, 44.050], "lon": [-72.50, -72.499, -72.50, -72.499]}
+        context = PropertyContext(
+            bbox=(44.0, -72.5, 44.05, -72.499),
+            center=(44.025, -72.4995),
+            season="rut",
+            vegetation={
+                "food_sources": {"overall_food_score": 0.7},
+                "canopy_coverage_analysis": {
+                    "canopy_coverage": 0.5,
+                    "canopy_grid": grid,
+                    "grid_coordinates": coords,
+                },
+            },
+        )
+
+        north = context.vegetation_data(44.05, -72.4995)
+        south = context.vegetation_data(44.0, -72.4995)
+
+        assert north["canopy_coverage_analysis"]["canopy_coverage"] == pytest.approx(0.1)
+        assert south["canopy_coverage_analysis"]["canopy_coverage"] == pytest.approx(0.9)
+        assert context.vegetation["canopy_coverage_analysis"]["canopy_coverage"] == 0.5
+        assert north["food_sources"] == {"overall_food_score": 0.7}
+
+    def test_weather_copies_are_independent(self):
+        context = PropertyContext(bbox=(0, 0, 0, 0), center=(0, 0), season="rut", weather={"wind": {"speed": 5}})
+        first = context.weather_data()
+        first["wind"]["speed"] = 99
+        assert context.weather_data()["wind"]["speed"] == 5
+
+    def test_missing_sources_return_none(self):
+        context = PropertyContext(bbox=(0, 0, 0, 0), center=(0, 0), season="rut")
+        assert context.weather_data() is None
+        assert context.osm_data(_integration(), 0.0, 0.0) is None
+        assert context.vegetation_data(0.0, 0.0) is None
+        assert context.lidar_terrain(0.0, 0.0) is None
+
+
+class _FakePredictor:
+    def __init__(self) -> None:
+        self.weather_calls: List[tuple] = []
+        self.osm_calls: List[tuple] = []
+
+    def get_enhanced_weather_with_trends(self, lat, lon, target_datetime=None):
+        self.weather_calls.append((lat, lon, target_datetime))
+        return {"temperature": 40.0}
+
+    def get_osm_roads_in_bbox(self, min_lat, min_lon, max_lat, max_lon):
+        self.osm_calls.append((min_lat, min_lon, max_lat, max_lon))
+        raise RuntimeError("overpass down")
+
+
+class TestBuildPropertyContext:
+    def test_fetches_each_source_once_and_tolerates_failures(self, monkeypatch: pytest.MonkeyPatch):
+        vegetation_calls: List[tuple] = []
+
+        def _fake_vegetation(lat, lon, radius_km, season):
+            vegetation_calls.append((lat, lon, radius_km, season))
+            return {"canopy_coverage_analysis": {"canopy_coverage": 0.6}}
+
+        monkeypatch.setattr(property_context_module, "_load_vegetation", _fake_vegetation)
+        monkeypatch.setattr(property_context_module, "_load_dem_window", lambda bbox: None)
+        predictor = _FakePredictor()
+
+        context = build_property_context(CORNERS, season="rut", target_datetime=None, predictor=predictor)
+
+        assert len(predictor.weather_calls) == 1
+        lat, lon, target = predictor.weather_calls[0]
+        assert (lat, lon) == (pytest.approx(44.004), pytest.approx(-72.495)) and target is None
+        assert len(predictor.osm_calls) == 1
+        min_lat, min_lon, max_lat, max_lon = predictor.osm_calls[0]
+        assert min_lat < 44.0 - 0.008 and max_lat > 44.008 + 0.008
+        assert min_lon < -72.5 and max_lon > -72.49
+        assert len(vegetation_calls) == 1
+        assert vegetation_calls[0][2] > property_context_module.VEGETATION_RADIUS_KM
+
+        assert context.weather == {"temperature": 40.0}
+        assert context.osm_roads is None
+        assert context.dem_window is None
+        summary = context.summary()
+        assert summary["weather"] is True and summary["osm_roads"] is None
+        assert set(summary["load_seconds"]) == {"weather", "osm", "vegetation", "dem_window"}
+        json.dumps(summary)
+
+
+class _FakePredictionService:
+    def __init__(self) -> None:
+        self.predictor = object()
+        self.contexts: List[Any] = []
+
+    async def predict(self, **kwargs: Any) -> Dict[str, Any]:
+        self.contexts.append(kwargs.get("context"))
+        return {}
+
+
+class TestRunJobSharesContext:
+    def test_context_built_once_and_passed_to_every_prediction(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setenv("HOTSPOT_JOBS_DIR", str(tmp_path))
+        fake_service = _FakePredictionService()
+        monkeypatch.setattr("backend.services.prediction_service.get_prediction_service", lambda: fake_service)
+
+        built: List[PropertyContext] = []
+
+        def _fake_build(corners, *, season, target_datetime, predictor):
+            assert predictor is fake_service.predictor
+            context = PropertyContext(bbox=(0, 0, 0, 0), center=(0, 0), season=season, weather={"t": 1})
+            built.append(context)
+            return context
+
+        monkeypatch.setattr(job_service_module, "build_property_context", _fake_build)
+
+        service = HotspotJobService()
+        job = service.create_job(total=0, message="queued")
+        asyncio.run(
+            service.run_job(
+                job.job_id,
+                corners=CORNERS,
+                mode="sample_predict",
+                num_sample_points=5,
+                lidar_grid_points=0,
+                lidar_top_k=0,
+                lidar_sample_radius_m=30,
+                epsilon_meters=50.0,
+                min_samples=2,
+                date_time="2026-11-10T06:30:00",
+                season="rut",
+                hunting_pressure="medium",
+            )
+        )
+
+        assert len(built) == 1
+        assert len(fake_service.contexts) == 5
+        assert all(c is built[0] for c in fake_service.contexts)
+        report = json.loads((tmp_path / job.job_id / "hotspot_report.json").read_text(encoding="utf-8"))
+        assert report["property_context"]["weather"] is True
@@ -0,0 +1,292 @@
+"""Tests for the two-tier (L1 + Redis) cache, using an in-memory Redis stand-in."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from fnmatch import fnmatchcase
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from backend.services import redis_cache_service as cache_module
+from backend.services.redis_cache_service import RedisCacheService
+
+
+class _InMemoryPubSub:
+    def __init__(self, server: "InMemoryRedis") -> None:
+        self._server = server
+        self._queue: asyncio.Queue = asyncio.Queue()
+
+    async def subscribe(self, channel: str) -> None:
+        self._server.subscribers.setdefault(channel, []).append(self._queue)
+
+    async def listen(self):
+        while True:
+            yield await self._queue.get()
+
+    async def close(self) -> None:
+        for queues in self._server.subscribers.values():
+            if self._queue in queues:
+                queues.remove(self._queue)
+
+
+class InMemoryRedis:
+    """Just enough of redis.asyncio.Redis for the cache service."""
+
+    def __init__(self) -> None:
+        self.data: Dict[str, bytes] = {}
+        self.expiry: Dict[str, float] = {}
+        self.subscribers: Dict[str, List[asyncio.Queue]] = {}
+        self.calls: Dict[str, int] = {}
+        self.fail = False
+
+    def _touch(self, name: str) -> None:
+        if self.fail:
+            raise ConnectionError("redis down")
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    def _live(self, key: str) -> bool:
+        if key in self.expiry and self.expiry[key] <= time.monotonic():
+            self.data.pop(key, None)
+            self.expiry.pop(key, None)
+        return key in self.data
+
+    async def get(self, key: str) -> Optional[bytes]:
+        self._touch("get")
+        return self.data[key] if self._live(key) else None
+
+    async def set(self, key: str, value: Any, nx: bool = False, px: Optional[int] = None) -> Optional[bool]:
+        self._touch("set")
+        if nx and self._live(key):
+            return None
+        self.data[key] = value.encode() if isinstance(value, str) else value
+        if px is not None:
+            self.expiry[key] = time.monotonic() + px / 1000
+        return True
+
+    async def setex(self, key: str, ttl: int, value: bytes) -> bool:
+        self._touch("setex")
+        self.data[key] = value
+        self.expiry[key] = time.monotonic() + ttl
+        return True
+
+    async def delete(self, *keys: str) -> int:
+        self._touch("delete")
+        removed = sum(1 for k in keys if self._live(k))
+        for k in keys:
+            self.data.pop(k, None)
+            self.expiry.pop(k, None)
+        return removed
+
+    async def exists(self, key: str) -> int:
+        self._touch("exists")
+        return int(self._live(key))
+
+    async def ttl(self, key: str) -> int:
+        self._touch("ttl")
+        if not self._live(key):
+            return -2
+        return int(self.expiry[key] - time.monotonic()) if key in self.expiry else -1
+
+    async def mget(self, keys: List[str]) -> List[Optional[bytes]]:
+        self._touch("mget")
+        return [self.data[k] if self._live(k) else None for k in keys]
+
+    async def keys(self, pattern: str) -> List[str]:
+        self._touch("keys")
+        return [k for k in list(self.data) if self._live(k) and fnmatchcase(k, pattern)]
+
+    async def publish(self, channel: str, message: str) -> int:
+        self._touch("publish")
+        queues = self.subscribers.get(channel, [])
+        for q in queues:
+            q.put_nowait({"type": "message", "channel": channel, "data": message.encode()})
+        return len(queues)
+
+    def pubsub(self) -> _InMemoryPubSub:
+        return _InMemoryPubSub(self)
+
+    async def ping(self) -> bool:
+        self._touch("ping")
+        return True
+
+    async def info(self) -> Dict[str, Any]:
+        return {}
+
+    async def close(self) -> None:
+        pass
+
+
+def _service(server: Optional[InMemoryRedis], **kwargs: Any) -> RedisCacheService:
+    return RedisCacheService(client=server, l1_ttl_seconds=kwargs.pop("l1_ttl_seconds", 30), **kwargs)
+
+
+def test_l1_serves_repeat_reads_without_redis_round_trip():
+    async def scenario():
+        server = InMemoryRedis()
+        service = _service(server)
+        await service.set("k", {"score": 7})
+        reads_before = server.calls.get("get", 0)
+        for _ in range(20):
+            assert (await service.get("k")).value == {"score": 7}
+        assert server.calls.get("get", 0) == reads_before
+        stats = (await service.get_stats()).value
+        assert stats["l1_hits"] == 20
+        await service.shutdown()
+
+    asyncio.run(scenario())
+
+
+def test_writes_in_one_process_invalidate_l1_in_another():
+    async def scenario():
+        server = InMemoryRedis()
+        writer, reader = _service(server), _service(server)
+        await writer.set("k", 1)
+        assert (await reader.get("k")).value == 1  # now in reader's L1
+        await writer.set("k", 2)
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert (await reader.get("k")).value == 2
+        await writer.delete("k")
+        await asyncio.sleep(0)
+        assert (await reader.get("k", "gone")).value == "gone"
+        assert (await reader.get_stats()).value["invalidations_received"] == 2
+        await writer.shutdown()
+        await reader.shutdown()
+
+    asyncio.run(scenario())
+
+
+def test_concurrent_misses_compute_once_across_processes():
+    async def scenario():
+        server = InMemoryRedis()
+        first, second = _service(server), _service(server)
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return {"prediction": 42}
+
+        results = await asyncio.gather(
+            *[first.get_or_compute("p", compute, poll_interval_seconds=0.01) for _ in range(5)],
+            *[second.get_or_compute("p", compute, poll_interval_seconds=0.01) for _ in range(5)],
+        )
+        assert calls == [1]
+        assert all(r.is_success and r.value == {"prediction": 42} for r in results)
+        first_stats = (await first.get_stats()).value
+        second_stats = (await second.get_stats()).value
+        assert first_stats["coalesced"] == 4 and second_stats["coalesced"] == 4
+        assert second_stats["lock_waits"] == 1
+        assert "lock:p" not in server.data
+        await first.shutdown()
+        await second.shutdown()
+
+    asyncio.run(scenario())
+
+
+def test_probabilistic_early_refresh(monkeypatch: pytest.MonkeyPatch):
+    async def scenario():
+        service = _service(InMemoryRedis())
+        values = iter([1, 2, 3])
+
+        async def compute():
+            await asyncio.sleep(0.01)
+            return next(values)
+
+        assert (await service.get_or_compute("k", compute, 60)).value == 1
+        monkeypatch.setattr(cache_module.random, "random", lambda: 0.0)
+        assert (await service.get_or_compute("k", compute, 60)).value == 1  # far from expiry
+        monkeypatch.setattr(cache_module.random, "random", lambda: 1.0 - 1e-12)
+        assert (await service.get_or_compute("k", compute, 60, beta=1000.0)).value == 2
+        assert (await service.get_or_compute("k", compute, 60, beta=0.0)).value == 2
+        assert (await service.get_stats()).value["early_refreshes"] == 1
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_leader_hands_off_to_waiters():
+    async def scenario():
+        server = InMemoryRedis()
+        service = _service(server)
+        started = asyncio.Event()
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            started.set()
+            await asyncio.sleep(0.05)
+            return "v"
+
+        leader = asyncio.create_task(service.get_or_compute("k", compute))
+        await started.wait()
+        waiter = asyncio.create_task(service.get_or_compute("k", compute))
+        await asyncio.sleep(0)
+        leader.cancel()
+        result = await asyncio.wait_for(waiter, 2)
+        assert result.is_success and result.value == "v"
+        assert len(calls) == 2
+        assert leader.cancelled()
+        assert "lock:k" not in server.data and not service._inflight
+
+        # A cancelled waiter leaves the leader's computation alone.
+        calls.clear()
+        await service.delete("k")
+        leader = asyncio.create_task(service.get_or_compute("k", compute))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(service.get_or_compute("k", compute))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        assert (await leader).value == "v" and calls == [1]
+        assert waiter.cancelled()
+
+    asyncio.run(scenario())
+
+
+def test_l1_only_without_redis(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(cache_module, "REDIS_AVAILABLE", False)
+
+    async def scenario():
+        service = _service(None)
+        assert (await service.set("k", [1, 2])).is_success
+        assert (await service.get("k")).value == [1, 2]
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "v"
+
+        results = await asyncio.gather(*[service.get_or_compute("c", compute) for _ in range(4)])
+        assert [r.value for r in results] == ["v"] * 4 and calls == [1]
+        assert (await service.clear_pattern("*")).value == 2
+        assert (await service.get("k", "gone")).value == "gone"
+
+    asyncio.run(scenario())
+
+
+def test_redis_outage_falls_back_to_l1():
+    async def scenario():
+        server = InMemoryRedis()
+        service = _service(server)
+        await service.set("k", "cached")
+        server.fail = True
+        assert (await service.get("k")).value == "cached"
+        assert (await service.set("other", 1)).is_success
+        assert (await service.get("missing", "d")).value == "d"
+        assert (await service.get("other")).value == 1
+        assert (await service.get_stats()).value["redis_fallbacks"] >= 1
+
+    asyncio.run(scenario())
+
+
+def test_legacy_pickle_entries_are_deleted():
+    async def scenario():
+        server = InMemoryRedis()
+        server.data["old"] = b'{"__type__":"pickle","data":"gASV"}'
+        service = _service(server)
+        assert (await service.get("old", "default")).value == "default"
+        assert "old" not in server.data
+
+    asyncio.run(scenario())
@@ -0,0 +1,120 @@
+"""Tests for batch duplicate detection in the scouting importer."""
+
+from __future__ import annotations
+
+import random
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from backend.scouting_data_manager import ScoutingDataManager
+from backend.scouting_import import ScoutingImporter, WaypointRecord
+from backend.scouting_import.importer import DUPLICATE_IN_IMPORT, DUPLICATE_OF_EXISTING
+from backend.scouting_models import ObservationType, ScoutingObservation
+
+NOW = datetime(2025, 11, 1, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture()
+def data_manager(tmp_path: Path) -> ScoutingDataManager:
+    return ScoutingDataManager(data_file=str(tmp_path / "scouting_observations.json"))
+
+
+def _record(lat: float, lon: float, name: str, hours: float = 0.0) -> WaypointRecord:
+    return WaypointRecord(
+        lat=lat, lon=lon, elevation_m=None, time_utc=NOW + timedelta(hours=hours),
+        name=name, description=None, symbol=None, date_precision="exact",
+    )
+
+
+def _reference_accepts(manager: ScoutingDataManager, existing: List[ScoutingObservation],
+                       candidates: List[ScoutingObservation],
+                       radius: float, window: timedelta) -> List[ScoutingObservation]:
+    """Per-record scan equivalent to the old query-per-waypoint importer."""
+    kept: List[ScoutingObservation] = []
+    for obs in candidates:
+        notes = (obs.notes or "").strip().lower()
+        duplicate = any(
+            other.observation_type == obs.observation_type
+            and abs(other.timestamp - obs.timestamp) <= window
+            and manager._calculate_distance(other.lat, other.lon, obs.lat, obs.lon) <= radius
+            and ((other.notes or "").strip().lower() == notes or not notes)
+            for other in existing + kept
+        )
+        if not duplicate:
+            kept.append(obs)
+    return kept
+
+
+class TestBatchDeduplication:
+    def test_duplicates_reported_by_reason(self, data_manager: ScoutingDataManager):
+        importer = ScoutingImporter(data_manager, dedupe_radius_miles=0.15, dedupe_time_days=3650)
+        first = importer.import_records([_record(44.0, -72.5, "rub line"), _record(44.01, -72.5, "scrape")])
+        assert (first.imported, first.duplicates) == (2, 0)
+
+        second = importer.import_records([
+            _record(44.0001, -72.5, "rub line", hours=2),   # matches stored rub
+            _record(44.03, -72.5, "bedding"),
+            _record(44.0301, -72.5001, "bedding", hours=1),  # repeats the record above
+            _record(44.0, -72.5, "rub line", hours=100),     # outside the 48h window
+        ])
+        assert second.imported == 2
+        assert second.duplicates == 2
+        assert second.duplicates_by_reason == {DUPLICATE_OF_EXISTING: 1, DUPLICATE_IN_IMPORT: 1}
+        assert second.to_dict()["duplicates_by_reason"] == second.duplicates_by_reason
+
+    def test_dry_run_writes_nothing_but_still_dedupes_within_import(self, data_manager: ScoutingDataManager):
+        importer = ScoutingImporter(data_manager, dedupe_time_days=3650)
+        records = [_record(44.0, -72.5, "scrape"), _record(44.0, -72.5, "scrape")]
+        summary = importer.import_records(records, dry_run=True)
+        assert (summary.imported, summary.duplicates) == (1, 1)
+        assert data_manager.get_observations_in_bbox(43.0, 45.0) == []
+
+    @pytest.mark.parametrize("seed", [1, 2])
+    def test_matches_per_record_scan(self, data_manager: ScoutingDataManager, seed: int):
+        rng = random.Random(seed)
+        names = ["rub", "scrape", "bed", "tracks", ""]
+
+        def _random_records(n: int) -> List[WaypointRecord]:
+            return [
+                _record(44.0 + rng.uniform(0, 0.02), -72.5 + rng.uniform(0, 0.03), rng.choice(names),
+                        hours=rng.uniform(-200, 200))
+                for _ in range(n)
+            ]
+
+        importer = ScoutingImporter(data_manager, dedupe_radius_miles=0.15, dedupe_time_days=3650)
+        importer.import_records(_random_records(150))
+        existing = data_manager.get_observations_in_bbox(43.0, 45.0)
+
+        records = _random_records(300)
+        from backend.scouting_import import canonical_observation_payload
+
+        candidates = [ScoutingObservation(**canonical_observation_payload(r)) for r in records]
+        expected = _reference_accepts(data_manager, existing, candidates, 0.15, timedelta(hours=48))
+
+        summary = importer.import_records(records)
+
+        assert summary.imported == len(expected)
+        assert summary.duplicates == len(records) - len(expected)
+        stored = data_manager.get_observations_in_bbox(43.0, 45.0)
+        assert len(stored) == len(existing) + len(expected)
+        new_keys = {(o.lat, o.lon, o.notes, o.timestamp) for o in stored} - {
+            (o.lat, o.lon, o.notes, o.timestamp) for o in existing
+        }
+        assert new_keys == {(o.lat, o.lon, o.notes, o.timestamp) for o in expected}
+
+    def test_existing_observations_loaded_once(self, data_manager: ScoutingDataManager, monkeypatch):
+        calls = []
+        real = data_manager.get_observations_in_bbox
+        monkeypatch.setattr(data_manager, "get_observations_in_bbox",
+                            lambda *a, **kw: calls.append(a) or real(*a, **kw))
+        monkeypatch.setattr(data_manager, "get_observations",
+                            lambda *a, **kw: pytest.fail("per-record query"))
+
+        ScoutingImporter(data_manager).import_records([_record(44.0 + i * 0.01, -72.5, f"rub {i}") for i in range(50)])
+
+        assert len(calls) == 1
+        rub_lines = data_manager.get_observations_in_bbox(43.0, 45.0, observation_types=[ObservationType.RUB_LINE])
+        assert len(rub_lines) == 50
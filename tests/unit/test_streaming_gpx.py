@@ -0,0 +1,188 @@
+"""Streaming GPX/KML parsing must match the whole-tree parsers it replaced."""
+
+from __future__ import annotations
+
+import io
+import tracemalloc
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from backend.gpx_parser import GPXParser
+from backend.scouting_data_manager import ScoutingDataManager
+from backend.scouting_import import ImportTooLargeError, ScoutingImporter
+from backend.scouting_import import contracts
+from backend.scouting_import.contracts import (
+    iter_gpx_records,
+    iter_gpx_waypoints,
+    load_gpx_tracks_from_bytes,
+    load_gpx_waypoints_from_bytes,
+    load_kml_waypoints_from_bytes,
+)
+
+FIXTURES_DIR = Path(__file__).resolve().parents[1] / "fixtures"
+
+GPX = b"""<?xml version="1.0" encoding="UTF-8"?>
+<gpx version="1.1" creator="onX Hunt" xmlns="http://www.topografix.com/GPX/1/1"
+     xmlns:gpxx="http://www.garmin.com/xmlschemas/GpxExtensions/v3">
+  <metadata><name>Fall scouting</name><desc>Ridge</desc><time>2024-10-01T12:00:00Z</time></metadata>
+  <wpt lat="44.26" lon="-72.58"><ele>410.5</ele><time>2024-10-02T06:30:00Z</time><name>Big rub 10/3/24</name>
+    <desc>fresh</desc><sym>Flag</sym><extensions><gpxx:WaypointExtension><gpxx:Depth>1</gpxx:Depth>
+    </gpxx:WaypointExtension></extensions></wpt>
+  <trk><name>Drag out</name><desc>blood trail after the shot</desc>
+    <trkseg>
+      <trkpt lat="44.2600" lon="-72.5800"><ele>400</ele><time>2024-10-02T07:00:00Z</time>
+        <extensions><gpxx:TrackPointExtension/></extensions></trkpt>
+      <trkpt lat="44.2605" lon="-72.5802"><ele>bad</ele></trkpt>
+    </trkseg>
+    <trkseg><trkpt lat="44.2610" lon="-72.5805"/></trkseg>
+  </trk>
+  <wpt lat="44.27" lon="-72.59"><name>scrape</name></wpt>
+  <rte><rtept lat="44.0" lon="-72.0"><name>not a waypoint</name></rtept></rte>
+  <trk><name>Walk in</name><trkseg/></trk>
+</gpx>
+"""
+
+KML = b"""<?xml version="1.0" encoding="UTF-8"?>
+<kml xmlns="http://www.opengis.net/kml/2.2"><Document><name>Hunt</name>
+  <Folder><name>Sign</name>
+    <Placemark><name>Rub</name><description>big</description>
+      <TimeStamp><when>2024-11-02T10:00:00Z</when></TimeStamp>
+      <Point><coordinates>-72.58,44.26,300</coordinates></Point></Placemark>
+    <Placemark><name>No point</name><LineString><coordinates>-72,44 -72.1,44.1</coordinates></LineString></Placemark>
+  </Folder>
+  <Placemark><name>Stand</name><MultiGeometry><Point><coordinates>-72.6,44.3</coordinates></Point></MultiGeometry></Placemark>
+</Document></kml>
+"""
+
+
+def _reference_waypoints(data: bytes):
+    root = ET.fromstring(data)
+    ns = contracts._detect_namespace(root)
+    return [contracts.WaypointRecord.from_element(e) for e in root.findall(f"{ns}wpt")]
+
+
+def _reference_tracks(data: bytes):
+    root = ET.fromstring(data)
+    ns = contracts._detect_namespace(root)
+    return [
+        contracts._track_record(
+            trk,
+            tuple(contracts._track_point(p) for seg in trk.findall(f"{ns}trkseg") for p in seg.findall(f"{ns}trkpt")),
+        )
+        for trk in root.findall(f"{ns}trk")
+    ]
+
+
+def _reference_placemarks(data: bytes):
+    root = ET.fromstring(data)
+    ns = contracts._detect_namespace(root)
+    records = (contracts._placemark_record(p, ns) for p in root.findall(f".//{ns}Placemark"))
+    return [r for r in records if r is not None]
+
+
+def _large_gpx(tracks: int, points_per_track: int) -> bytes:
+    parts: List[str] = ['<gpx version="1.1" creator="t" xmlns="http://www.topografix.com/GPX/1/1">']
+    for t in range(tracks):
+        parts.append(f'<wpt lat="44.{t:04d}" lon="-72.5"><name>rub {t}</name></wpt>')
+        parts.append(f"<trk><name>walk {t}</name><trkseg>")
+        parts.extend(
+            f'<trkpt lat="44.{i:06d}" lon="-72.{i:06d}"><ele>{i % 500}</ele>'
+            f"<time>2024-10-02T07:{i % 60:02d}:00Z</time></trkpt>"
+            for i in range(points_per_track)
+        )
+        parts.append("</trkseg></trk>")
+    parts.append("</gpx>")
+    return "".join(parts).encode()
+
+
+class TestContractsEquivalence:
+    @pytest.mark.parametrize("data", [GPX, GPX.replace(b' xmlns="http://www.topografix.com/GPX/1/1"', b""),
+                                      _large_gpx(3, 200)])
+    def test_gpx_records_match_tree_parser(self, data: bytes):
+        assert load_gpx_waypoints_from_bytes(data) == _reference_waypoints(data)
+        assert load_gpx_tracks_from_bytes(data) == _reference_tracks(data)
+        mixed = list(iter_gpx_records(io.BytesIO(data)))
+        assert [r for r in mixed if isinstance(r, contracts.WaypointRecord)] == _reference_waypoints(data)
+        assert [r for r in mixed if isinstance(r, contracts.TrackRecord)] == _reference_tracks(data)
+
+    def test_track_fields(self):
+        drag, walk = load_gpx_tracks_from_bytes(GPX)
+        assert drag.name == "Drag out" and drag.description == "blood trail after the shot"
+        assert [p.elevation_m for p in drag.points] == [400.0, None, None]
+        assert walk.points == ()
+
+    def test_kml_placemarks_match_tree_parser(self):
+        records = load_kml_waypoints_from_bytes(KML)
+        assert records == _reference_placemarks(KML)
+        assert [r.name for r in records] == ["Rub", "Stand"]
+
+    def test_fixture_file_and_path_source(self):
+        path = FIXTURES_DIR / "sample_waypoints.gpx"
+        assert list(iter_gpx_waypoints(path)) == _reference_waypoints(path.read_bytes())
+
+    def test_streaming_releases_consumed_elements(self):
+        data = _large_gpx(40, 1000)
+        tracemalloc.start()
+        try:
+            for _ in iter_gpx_waypoints(io.BytesIO(data)):
+                pass
+            _, streamed_peak = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            ET.parse(io.BytesIO(data))
+            _, tree_peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert streamed_peak * 5 < tree_peak
+
+
+class TestGPXParserEquivalence:
+    @staticmethod
+    def _reference(content: str):
+        parser = GPXParser()
+        root = ET.fromstring(content)
+        ns = parser._detect_namespace(root)
+        waypoints = [w for w in (parser._parse_waypoint(e, ns) for e in root.findall(f".//{ns}wpt")) if w]
+        meta = root.find(f"{ns}metadata")
+        metadata = parser._metadata_fields(meta, ns) if meta is not None else {}
+        metadata.update(creator=root.get("creator", "Unknown"), version=root.get("version", "1.1"))
+        return waypoints, metadata
+
+    @pytest.mark.parametrize("data", [GPX, _large_gpx(2, 50)])
+    def test_matches_tree_parse(self, data: bytes):
+        content = data.decode()
+        result = GPXParser().parse_gpx_file(content)
+        waypoints, metadata = self._reference(content)
+        assert result["success"] is True
+        assert result["waypoints"] == waypoints
+        assert result["metadata"] == metadata
+        assert result["total_waypoints"] == len(waypoints)
+
+    def test_invalid_xml_reports_error(self):
+        result = GPXParser().parse_gpx_file("<gpx><wpt lat='1' lon='2'>")
+        assert result["success"] is False
+        assert result["error"].startswith("Invalid GPX file format")
+
+
+class TestStreamedImport:
+    @pytest.fixture()
+    def importer(self, tmp_path: Path) -> ScoutingImporter:
+        return ScoutingImporter(ScoutingDataManager(data_file=str(tmp_path / "obs.json")), dedupe_time_days=3650)
+
+    def test_stream_matches_bytes_import_and_reports_progress(self, importer: ScoutingImporter):
+        data = _large_gpx(5, 2000)
+        progress: List[int] = []
+        streamed = importer.import_gpx_stream(io.BytesIO(data), filename="big.gpx", dry_run=True,
+                                              progress_callback=progress.append)
+        from_bytes = importer.import_gpx_bytes(data, filename="big.gpx", dry_run=True)
+
+        assert (streamed.total_waypoints, streamed.imported) == (from_bytes.total_waypoints, from_bytes.imported) == (5, 5)
+        assert streamed.bytes_read == len(data)
+        assert progress == sorted(progress) and progress[-1] == len(data) and len(progress) > 1
+
+    def test_byte_limit_stops_before_storing(self, importer: ScoutingImporter):
+        with pytest.raises(ImportTooLargeError):
+            importer.import_gpx_stream(io.BytesIO(_large_gpx(5, 2000)), max_bytes=50_000)
+        assert importer.import_gpx_stream(io.BytesIO(GPX), max_bytes=len(GPX)).imported == 2
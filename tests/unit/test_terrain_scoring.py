@@ -8,11 +8,13 @@ from backend.utils.terrain_scoring import (
     detect_drainages,
     detect_ridgelines,
     ridge_proximity_preference,
+    ridge_proximity_preference_array,
     rut_adjusted_activity,
     scent_carry_distance,
     scent_cone_half_width,
     season_canopy_score,
     slope_preference,
+    slope_preference_array,
 )
 
 
@@ -95,6 +97,21 @@ class TestRidgeProximityPreference:
             assert 0.0 <= score <= 1.0, f"Out of bounds at elev={e}"
 
 
+class TestVectorisedPreferences:
+    def test_slope_array_matches_scalar(self):
+        slopes = np.array([-1.0, 0.0, 2.5, 4.999, 5.0, 12.0, 22.0, 22.001, 30.0, 35.0, 35.5, 80.0])
+        expected = [slope_preference(float(v)) for v in slopes]
+        assert slope_preference_array(slopes).tolist() == pytest.approx(expected, abs=1e-12)
+        assert slope_preference_array(np.array([np.nan]))[0] == 0.0
+
+    def test_ridge_array_matches_scalar(self):
+        elevations = np.linspace(95.0, 205.0, 221)
+        expected = [ridge_proximity_preference(float(e), 100.0, 200.0) for e in elevations]
+        assert ridge_proximity_preference_array(elevations, 100.0, 200.0).tolist() == pytest.approx(expected, abs=1e-12)
+        grid = ridge_proximity_preference_array(elevations.reshape(13, 17), 100.0, 200.0)
+        assert grid.shape == (13, 17)
+
+
 # ---------------------------------------------------------------------------
 # Ridgeline detection
 # ---------------------------------------------------------------------------
@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+"""Benchmark dense bedding candidate generation and declustering.
+
+Compares ``backend.services.bedding_candidates`` with the nested-loop
+lattice and pairwise decluster the alternative bedding search used
+before, for 1k to 50k candidates, and checks both give the same result.
+Candidates are shuffled before declustering so the pairwise version has
+to compare each point against many kept ones, as with real score order.
+
+Usage (from repo root):
+  python tools/bench_bedding_candidates.py
+  python tools/bench_bedding_candidates.py --sizes 1000 10000 50000 --separation 75 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from backend.services.bedding_candidates import decluster_indices, dense_candidates  # noqa: E402
+
+CENTER = (44.004, -72.495)
+RADIUS_M = 800
+
+
+def _loop_candidates(center_lat, center_lon, radius_m, target_points):
+    area_m2 = math.pi * (radius_m ** 2)
+    spacing_m = max(3.0, math.sqrt(area_m2 / max(target_points, 1)))
+    lon_to_meters = 111000 * math.cos(math.radians(center_lat))
+    max_steps = int(radius_m / spacing_m)
+    candidates = []
+    for y_step in range(-max_steps, max_steps + 1):
+        dy_m = y_step * spacing_m
+        for x_step in range(-max_steps, max_steps + 1):
+            dx_m = x_step * spacing_m
+            if (dx_m * dx_m + dy_m * dy_m) > (radius_m * radius_m):
+                continue
+            lat_offset = dy_m / 111000
+            lon_offset = dx_m / lon_to_meters
+            candidates.append({
+                "lat": center_lat + lat_offset, "lon": center_lon + lon_offset,
+                "tier": {"name": "dense_lidar"}, "lat_offset": lat_offset, "lon_offset": lon_offset,
+                "distance_m": int((dx_m * dx_m + dy_m * dy_m) ** 0.5),
+            })
+    if len(candidates) > target_points:
+        candidates = candidates[::max(1, math.ceil(len(candidates) / target_points))]
+    return candidates
+
+
+def _pairwise_decluster(points, min_separation_m, max_keep):
+    kept = []
+    for i, (lat, lon) in enumerate(points):
+        if max_keep and len(kept) >= max_keep:
+            break
+        if all(((lat - points[j][0]) ** 2 + (lon - points[j][1]) ** 2) ** 0.5 * 111000 >= min_separation_m
+               for j in kept):
+            kept.append(i)
+    return kept
+
+
+def _best_of(repeat: int, fn):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 50_000])
+    parser.add_argument("--separation", type=float, default=75.0, help="Decluster distance in metres")
+    parser.add_argument("--max-keep", type=int, default=0, help="Stop after this many kept points (0 = all)")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    ok = True
+    print(f"{'points':>8} {'stage':>10} {'loop_s':>9} {'vector_s':>9} {'speedup':>9}  match")
+    for n in args.sizes:
+        loop_s, expected = _best_of(1, lambda: _loop_candidates(*CENTER, RADIUS_M, n))
+        vector_s, actual = _best_of(args.repeat, lambda: dense_candidates(*CENTER, RADIUS_M, n))
+        match = actual == expected
+        ok &= match
+        print(f"{n:>8} {'lattice':>10} {loop_s:>9.4f} {vector_s:>9.4f} {loop_s / max(vector_s, 1e-9):>8.1f}x  {match}")
+
+        order = np.random.default_rng(n).permutation(len(actual))
+        lats = np.array([actual[i]["lat"] for i in order])
+        lons = np.array([actual[i]["lon"] for i in order])
+        points = list(zip(lats.tolist(), lons.tolist()))
+        loop_s, expected = _best_of(1, lambda: _pairwise_decluster(points, args.separation, args.max_keep))
+        vector_s, kept = _best_of(args.repeat,
+                                  lambda: decluster_indices(lats, lons, args.separation, args.max_keep))
+        match = kept == expected
+        ok &= match
+        print(f"{n:>8} {'decluster':>10} {loop_s:>9.4f} {vector_s:>9.4f} {loop_s / max(vector_s, 1e-9):>8.1f}x  {match}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+"""Benchmark the vectorised polygon mask against per-point shapely tests.
+
+Compares ``backend.utils.geo.points_in_polygon_mask`` with the scalar
+``contains or touches`` loop that hotspot and max-accuracy grid generation
+used before, on lattices of 10k and 100k points inside a concave property
+boundary, and checks both agree point for point.
+
+Usage (from repo root):
+  python tools/bench_polygon_mask.py
+  python tools/bench_polygon_mask.py --sizes 10000 100000 1000000 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from backend.services.hotspot.polygon import point_in_polygon, try_make_polygon  # noqa: E402
+from backend.utils.geo import points_in_polygon_mask  # noqa: E402
+
+# Concave, roughly 1 km x 1.5 km boundary in central Vermont.
+CORNERS = [
+    (44.000, -72.500), (44.010, -72.500), (44.010, -72.490),
+    (44.005, -72.495), (44.003, -72.482), (44.000, -72.490),
+]
+
+
+def _lattice(n: int):
+    side = int(np.ceil(np.sqrt(n)))
+    lats = np.linspace(43.999, 44.011, side)
+    lons = np.linspace(-72.501, -72.481, side)
+    lat_grid, lon_grid = np.meshgrid(lats, lons, indexing="ij")
+    return lat_grid.ravel()[:n], lon_grid.ravel()[:n]
+
+
+def _best_of(repeat: int, fn):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    polygon = try_make_polygon(CORNERS)
+    if polygon is None:
+        print("shapely is not installed; nothing to compare against")
+        return 1
+
+    ok = True
+    print(f"{'points':>10} {'scalar_s':>10} {'vector_s':>10} {'speedup':>9}  match")
+    for n in args.sizes:
+        lats, lons = _lattice(n)
+        scalar_s, scalar = _best_of(
+            1, lambda: np.fromiter((point_in_polygon(a, b, polygon) for a, b in zip(lats.tolist(), lons.tolist())),
+                                   dtype=bool, count=lats.size)
+        )
+        vector_s, vector = _best_of(args.repeat, lambda: points_in_polygon_mask(lats, lons, CORNERS))
+        match = bool(np.array_equal(scalar, vector))
+        ok &= match
+        print(f"{n:>10} {scalar_s:>10.4f} {vector_s:>10.4f} {scalar_s / max(vector_s, 1e-9):>8.1f}x  {match}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+"""Build the statewide max-accuracy terrain-score pyramid.
+
+Walks the LiDAR DEM in blocks once per level and writes tiled multi-band
+COGs (score + component metrics) at 20 m, 10 m and 5 m. Property scans with
+``terrain_source="pyramid"`` then sample these rasters instead of computing
+terrain metrics on every run.
+
+Usage (from repo root):
+  python tools/build_terrain_pyramid.py
+  python tools/build_terrain_pyramid.py --dem data/lidar/raw/vermont/STATEWIDE_2013-2017_70cm_DEMHF.tif \
+      --out data/lidar/pyramid --levels 20 10 5
+  # Partial build for one area (WGS84 bbox):
+  python tools/build_terrain_pyramid.py --bbox -73.05 43.95 -72.95 44.05
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from backend.max_accuracy.config import MaxAccuracyConfig  # noqa: E402
+from backend.max_accuracy.pyramid import (  # noqa: E402
+    PYRAMID_LEVELS_M,
+    build_pyramid,
+    resolve_pyramid_dir,
+)
+
+
+def _default_dem() -> str | None:
+    from backend.services.lidar_processor import DEMFileManager
+
+    files = DEMFileManager().get_files()
+    for name, path in files.items():
+        if "DEM" in str(name).upper():
+            return path
+    return next(iter(files.values()), None) if files else None
+
+
+def _bbox_to_dem_crs(dem_path: str, bbox: list[float]) -> tuple[float, float, float, float]:
+    import rasterio  # type: ignore
+    from rasterio.warp import transform_bounds  # type: ignore
+
+    with rasterio.open(dem_path) as src:
+        return tuple(transform_bounds("EPSG:4326", src.crs, *bbox))  # type: ignore[return-value]
+
+
+def main() -> int:
+    defaults = MaxAccuracyConfig()
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dem", help="Source DEM (default: first LiDAR DEM discovered)")
+    parser.add_argument("--out", help="Output directory (default: MAX_ACCURACY_PYRAMID_DIR or data/lidar/pyramid)")
+    parser.add_argument("--levels", type=int, nargs="+", default=list(PYRAMID_LEVELS_M), help="Cell sizes in metres")
+    parser.add_argument("--block-px", type=int, default=1024, help="Output block size per read (pixels)")
+    parser.add_argument("--tpi-small", type=int, default=defaults.tpi_small_m)
+    parser.add_argument("--tpi-large", type=int, default=defaults.tpi_large_m)
+    parser.add_argument(
+        "--bbox", type=float, nargs=4, metavar=("MIN_LON", "MIN_LAT", "MAX_LON", "MAX_LAT"),
+        help="Only build this WGS84 bounding box",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    dem_path = args.dem or _default_dem()
+    if not dem_path:
+        print("No DEM found; pass --dem", file=sys.stderr)
+        return 1
+    out_dir = resolve_pyramid_dir(args.out)
+    bounds = _bbox_to_dem_crs(dem_path, args.bbox) if args.bbox else None
+
+    last_report = [0.0]
+
+    def _progress(cell_m: int, done: int, total: int) -> None:
+        now = time.monotonic()
+        if done == total or now - last_report[0] >= 5.0:
+            last_report[0] = now
+            print(f"  {cell_m:>3} m: block {done}/{total}", flush=True)
+
+    t0 = time.monotonic()
+    print(f"Building terrain pyramid from {dem_path} -> {out_dir}")
+    manifest = build_pyramid(
+        dem_path,
+        out_dir,
+        levels=sorted(set(args.levels), reverse=True),
+        tpi_small_m=args.tpi_small,
+        tpi_large_m=args.tpi_large,
+        weights=defaults.weights,
+        block_px=args.block_px,
+        bounds=bounds,
+        progress=_progress,
+    )
+    print(f"Done in {time.monotonic() - t0:.1f}s: levels={sorted(manifest['levels'])}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())